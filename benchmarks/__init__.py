@@ -0,0 +1,11 @@
+"""
+Benchmark Package for Hangman Game
+
+Standalone performance benchmarks. Run a module from the project root,
+for example: python -m benchmarks.bench_session_store
+"""
+
+import os
+
+# Apps created with debug off refuse to start without a secret key
+os.environ.setdefault("HANGMAN_SECRET_KEY", "benchmark")
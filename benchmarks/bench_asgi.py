@@ -0,0 +1,124 @@
+"""
+WSGI vs ASGI Load Benchmark
+
+Drives N simulated players through /game/<level> and /guess on both the
+Flask WSGI app and the ASGI entry point, in process, and reports
+requests/sec and p99 latency for each path.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from src.utils.constants import VALID_LETTERS
+from src.web.app import create_app
+from src.web.asgi import create_asgi_app
+
+
+def percentile(latencies: List[float], fraction: float) -> float:
+    ordered = sorted(latencies)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def report(name: str, latencies: List[float], elapsed: float):
+    print(
+        f"{name:>5}: {len(latencies)} requests in {elapsed:.2f}s "
+        f"({len(latencies) / elapsed:,.0f} req/s), "
+        f"p50={percentile(latencies, 0.50) * 1000:.2f}ms "
+        f"p99={percentile(latencies, 0.99) * 1000:.2f}ms"
+    )
+
+
+def play_wsgi(app, player_seed: int, guesses: int) -> List[float]:
+    letters = random.Random(player_seed).sample(VALID_LETTERS, guesses)
+    client = app.test_client()
+    latencies = []
+
+    start = time.perf_counter()
+    client.get("/game/basic")
+    latencies.append(time.perf_counter() - start)
+    for letter in letters:
+        start = time.perf_counter()
+        client.post("/guess", json={"letter": letter})
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def run_wsgi(players: int, guesses: int, threads: int):
+    app = create_app(debug=False)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        results = pool.map(lambda seed: play_wsgi(app, seed, guesses), range(players))
+        latencies = [latency for player in results for latency in player]
+    report("wsgi", latencies, time.perf_counter() - start)
+
+
+async def request(app, method: str, path: str, body: bytes, cookie: bytes):
+    """Send one request to the ASGI app and return its headers."""
+    headers = [(b"content-type", b"application/json")]
+    if cookie:
+        headers.append((b"cookie", cookie))
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": b"",
+        "headers": headers,
+    }
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": body}
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    return dict(sent[0]["headers"])
+
+
+async def play_asgi(app, player_seed: int, guesses: int) -> List[float]:
+    letters = random.Random(player_seed).sample(VALID_LETTERS, guesses)
+    latencies = []
+
+    start = time.perf_counter()
+    headers = await request(app, "GET", "/game/basic", b"", b"")
+    latencies.append(time.perf_counter() - start)
+    cookie = headers[b"set-cookie"].split(b";", 1)[0]
+    for letter in letters:
+        body = json.dumps({"letter": letter}).encode()
+        start = time.perf_counter()
+        await request(app, "POST", "/guess", body, cookie)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def run_asgi(players: int, guesses: int):
+    app = create_asgi_app(create_app(debug=False))
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(play_asgi(app, seed, guesses) for seed in range(players))
+    )
+    latencies = [latency for player in results for latency in player]
+    report("asgi", latencies, time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--players", type=int, default=200)
+    parser.add_argument("--guesses", type=int, default=10)
+    parser.add_argument("--threads", type=int, default=16)
+    args = parser.parse_args()
+
+    run_wsgi(args.players, args.guesses, args.threads)
+    asyncio.run(run_asgi(args.players, args.guesses))
+
+
+if __name__ == "__main__":
+    main()
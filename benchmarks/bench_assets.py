@@ -0,0 +1,91 @@
+"""
+Static Asset Transfer Benchmark
+
+Compares the bytes and requests a browser spends on the game page's
+stylesheets and script for a first and a repeat visit: source files
+from Flask's default static handler (repeat visits revalidate each file
+and get a 304) against the built assets, plain, gzip and brotli (repeat
+visits are served from the browser cache without a request).
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+
+from src.web import assets
+from src.web.app import create_app
+
+
+def transfer_size(response) -> int:
+    """Approximate bytes on the wire: status line, headers and body."""
+    headers = sum(len(f"{key}: {value}\r\n") for key, value in response.headers)
+    return len("HTTP/1.1 200 OK\r\n\r\n") + headers + len(response.data)
+
+
+def copy_sources(static_dir: str):
+    for name in assets.ASSETS:
+        path = os.path.join(static_dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        shutil.copy(os.path.join(assets.STATIC_DIR, name), path)
+
+
+def source_visits(app):
+    """Return (first, repeat) (requests, bytes) for the unbuilt sources."""
+    client = app.test_client()
+    first = repeat = 0
+    for name in assets.ASSETS:
+        response = client.get(f"/static/{name}", headers={"Accept-Encoding": "gzip"})
+        first += transfer_size(response)
+        revalidated = client.get(
+            f"/static/{name}", headers={"If-None-Match": response.headers["ETag"]}
+        )
+        assert revalidated.status_code == 304
+        repeat += transfer_size(revalidated)
+        response.close()
+    count = len(assets.ASSETS)
+    return (count, first), (count, repeat)
+
+
+def built_visits(app, manifest, accept_encoding: str):
+    """Return (first, repeat) (requests, bytes) for the built assets."""
+    client = app.test_client()
+    first = 0
+    for name in assets.ASSETS:
+        response = client.get(
+            f"/static/{manifest[name]}", headers={"Accept-Encoding": accept_encoding}
+        )
+        assert "immutable" in response.headers["Cache-Control"]
+        first += transfer_size(response)
+        response.close()
+    # Immutable responses are reused without revalidation
+    return (len(assets.ASSETS), first), (0, 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as static_dir:
+        copy_sources(static_dir)
+        app = create_app(debug=False)
+        app.static_folder = static_dir
+        assets.init_assets(app, static_dir)
+        rows = [("source", *source_visits(app))]
+
+        manifest = assets.build(static_dir)
+        assets.init_assets(app, static_dir)
+        rows.append(("built", *built_visits(app, manifest, "")))
+        rows.append(("built+gzip", *built_visits(app, manifest, "gzip")))
+        if assets.brotli is not None:
+            rows.append(("built+br", *built_visits(app, manifest, "br, gzip")))
+
+    for name, (first_count, first), (repeat_count, repeat) in rows:
+        print(
+            f"{name:>10}: first visit {first_count} req {first:6,} B | "
+            f"repeat visit {repeat_count} req {repeat:6,} B"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Batch Guess Benchmark
+
+Compares guesses/sec when a player sends one letter per /guess request
+against sending the same letters through /guess/batch.
+"""
+
+import argparse
+import random
+import time
+
+from src.utils.constants import VALID_LETTERS
+from src.web.app import create_app
+
+
+def player_letters(seed: int, guesses: int):
+    rng = random.Random(seed)
+    return [rng.choice(VALID_LETTERS) for _ in range(guesses)]
+
+
+def run_single(app, players: int, guesses: int) -> float:
+    start = time.perf_counter()
+    for seed in range(players):
+        client = app.test_client()
+        client.get("/game/basic")
+        for letter in player_letters(seed, guesses):
+            client.post("/guess", json={"letter": letter})
+    return time.perf_counter() - start
+
+
+def run_batch(app, players: int, guesses: int, batch_size: int) -> float:
+    start = time.perf_counter()
+    for seed in range(players):
+        client = app.test_client()
+        client.get("/game/basic")
+        letters = player_letters(seed, guesses)
+        for offset in range(0, guesses, batch_size):
+            batch = letters[offset : offset + batch_size]
+            client.post("/guess/batch", json={"letters": batch})
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--players", type=int, default=100)
+    parser.add_argument("--guesses", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=25)
+    args = parser.parse_args()
+
+    app = create_app(debug=False)
+    total = args.players * args.guesses
+
+    single = run_single(app, args.players, args.guesses)
+    batch = run_batch(app, args.players, args.guesses, args.batch_size)
+    print(f"single: {total} guesses in {single:.2f}s ({total / single:,.0f}/s)")
+    print(
+        f" batch: {total} guesses in {batch:.2f}s ({total / batch:,.0f}/s), "
+        f"{args.batch_size} per request, {single / batch:.1f}x faster"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Daily Challenge Benchmark
+
+Times precomputing a week of daily schedules, the per-request check for
+whether a game plays a daily challenge, and recording solved words into
+the fixed-size stats counters, against keeping every player's result.
+"""
+
+import argparse
+import datetime
+import random
+import sys
+import time
+import timeit
+
+from src.core.daily_challenge import DailySchedule, DailyStats
+from src.core.game_engine import GameEngine
+
+
+def per_call(statement, number: int = 100_000) -> float:
+    """Return the best microseconds per call over a few repeats."""
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--players", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    schedule = DailySchedule(b"secret")
+    schedule.precompute(days=1)  # Load the dictionaries before timing
+    seconds = timeit.timeit(lambda: DailySchedule(b"other").precompute(), number=5) / 5
+    print(f"precompute 7 days:  {seconds * 1000:8.2f} ms")
+
+    daily, regular = schedule.new_game("basic"), GameEngine("basic")
+    print(f"day_of daily game:  {per_call(lambda: schedule.day_of(daily)):8.2f} us")
+    print(f"day_of other game:  {per_call(lambda: schedule.day_of(regular)):8.2f} us")
+
+    rng = random.Random(0)
+    day = datetime.date.today()
+    results = [(rng.randrange(50), rng.randrange(1, 27)) for _ in range(args.players)]
+
+    stats = DailyStats()
+    start = time.perf_counter()
+    for position, guesses in results:
+        stats.record_solved(day, "basic", position, guesses)
+    elapsed = time.perf_counter() - start
+    counters = stats._pending[(day.isoformat(), "basic")]
+    print(
+        f"streaming counters: {args.players / elapsed:10,.0f} results/s, "
+        f"{counters.itemsize * len(counters) / 1024:8.1f} KiB"
+    )
+
+    every_result = []
+    start = time.perf_counter()
+    for position, guesses in results:
+        every_result.append((day, "basic", position, guesses))
+    elapsed = time.perf_counter() - start
+    size = sys.getsizeof(every_result) + sum(map(sys.getsizeof, every_result))
+    print(
+        f"every result:       {args.players / elapsed:10,.0f} results/s, "
+        f"{size / 1024:8.1f} KiB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Dictionary Loading Benchmark
+
+Measures startup time and resident memory of the list loader against the
+memory-mapped loader (cold and with a cached sidecar index) on a large
+synthetic dictionary. Each measurement runs in a fresh interpreter.
+"""
+
+import argparse
+import json
+import os
+import random
+import string
+import subprocess
+import sys
+import tempfile
+
+_PROBE = """
+import json, random, resource, sys, time
+from src.core.mapped_words import MappedWordList
+from src.core.word_manager import WordManager
+
+path, mode = sys.argv[1], sys.argv[2]
+before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+if mode == "list":
+    words = WordManager()._load_words_from_file(path)
+else:
+    words = MappedWordList(path)
+loaded = time.perf_counter() - start
+
+start = time.perf_counter()
+for _ in range(100000):
+    words[random.randrange(len(words))].upper()
+select = (time.perf_counter() - start) / 100000
+
+after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({"load": loaded, "select": select, "rss_kb": after - before}))
+"""
+
+
+def write_dictionary(path: str, entries: int, seed: int):
+    rng = random.Random(seed)
+    letters = string.ascii_lowercase
+    with open(path, "w", encoding="utf-8") as file:
+        for _ in range(entries):
+            word = "".join(rng.choice(letters) for _ in range(rng.randint(4, 15)))
+            file.write(word + "\n")
+
+
+def probe(path: str, mode: str) -> dict:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE, path, mode],
+        cwd=root,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=2_000_000)
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "words.txt")
+        write_dictionary(path, args.entries, args.seed)
+        size_mib = os.path.getsize(path) / 2**20
+        print(f"{args.entries:,} entries, {size_mib:.0f} MiB")
+
+        runs = [
+            ("list", "list"),
+            ("mmap (cold)", "mmap"),
+            ("mmap (cached)", "mmap"),
+        ]
+        for label, mode in runs:
+            result = probe(path, mode)
+            print(
+                f"{label:>14}: load {result['load'] * 1000:8.1f} ms, "
+                f"select {result['select'] * 1e6:5.2f} us, "
+                f"RSS +{result['rss_kb'] / 1024:6.1f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Difficulty Scoring Benchmark
+
+Times scoring a synthetic dictionary from scratch in one process and
+across a process pool, and an incremental rebuild after a small edit,
+which only re-scores the length groups the edit touched.
+"""
+
+import argparse
+import os
+import random
+import string
+import time
+
+from src.core.difficulty import score_level
+
+
+def make_words(count: int, seed: int):
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choices(string.ascii_uppercase, k=rng.randint(4, 12)))
+        for _ in range(count)
+    ]
+
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--words", type=int, default=20000)
+    parser.add_argument("--processes", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    words = make_words(args.words, seed=1)
+    (scored, _), serial = timed(score_level, words, 0, processes=1)
+    _, parallel = timed(score_level, words, 0, processes=args.processes)
+
+    # Replace one word of each of two lengths
+    edited = list(words)
+    edited[0] = "Q" * len(edited[0])
+    edited[1] = "Z" * len(edited[1])
+    (_, rescored), incremental = timed(
+        score_level, edited, 0, previous=scored, processes=args.processes
+    )
+
+    print(f"{args.words:,} entries")
+    print(f"  serial:      {serial:6.2f} s  {args.words / serial:8,.0f} entries/s")
+    print(
+        f"  {args.processes} processes: {parallel:6.2f} s  "
+        f"{args.words / parallel:8,.0f} entries/s"
+    )
+    print(f"  incremental: {incremental:6.2f} s  ({rescored:,} entries re-scored)")
+
+
+if __name__ == "__main__":
+    main()
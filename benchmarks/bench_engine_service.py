@@ -0,0 +1,97 @@
+"""
+Engine Service Benchmark
+
+Drives guesses from several client processes, standing in for web
+workers, against an in-process store and against engine services with
+a growing number of shards, and reports guesses/sec for each.
+"""
+
+import argparse
+import multiprocessing
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.utils.constants import VALID_LETTERS
+from src.web.engine_service import EngineService, EngineShard
+
+LETTERS = list(VALID_LETTERS)
+
+
+def play_local(games: int, guesses: int, worker: int) -> int:
+    """Play games against a shard held in this process."""
+    shard = EngineShard()
+    for game in range(games):
+        game_id = f"{worker}-{game}"
+        shard.new_game(game_id, "basic")
+        for letter in LETTERS[:guesses]:
+            shard.guess(game_id, letter)
+    return games * guesses
+
+
+def play_service(client, games: int, guesses: int, worker: int, threads: int) -> int:
+    """Play games through an engine service from several threads."""
+
+    def play(thread: int):
+        for game in range(thread, games, threads):
+            game_id = f"{worker}-{game}"
+            client.new_game(game_id, "basic")
+            for letter in LETTERS[:guesses]:
+                client.guess(game_id, letter)
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(play, range(threads)))
+    return games * guesses
+
+
+def run(label: str, target, args):
+    start = time.perf_counter()
+    with multiprocessing.Pool(args.workers) as pool:
+        total = sum(pool.map(target, range(args.workers)))
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:>12}: {total:,} guesses in {elapsed:.2f} s ({total / elapsed:,.0f}/s)"
+    )
+
+
+def _local(worker: int) -> int:
+    return play_local(_args.games, _args.guesses, worker)
+
+
+def _service(worker: int) -> int:
+    return play_service(_client, _args.games, _args.guesses, worker, _args.threads)
+
+
+_args = None
+_client = None
+
+
+def main():
+    global _args, _client
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=4, help="client processes")
+    parser.add_argument("--threads", type=int, default=8, help="threads per client")
+    parser.add_argument("--games", type=int, default=200, help="games per client")
+    parser.add_argument("--guesses", type=int, default=10, help="guesses per game")
+    parser.add_argument("--max-shards", type=int, default=os.cpu_count() or 1)
+    _args = parser.parse_args()
+
+    print(f"{os.cpu_count()} cores, {_args.workers} client processes")
+    run("in-process", _local, _args)
+
+    shards = 1
+    while shards <= _args.max_shards:
+        service = EngineService(shards)
+        service.start()
+        # Forked clients inherit the client and open their own connections
+        _client = service.client()
+        try:
+            run(f"{shards} shard{'s' if shards > 1 else ''}", _service, _args)
+        finally:
+            service.stop()
+        shards *= 2
+
+
+if __name__ == "__main__":
+    main()
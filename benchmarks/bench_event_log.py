@@ -0,0 +1,94 @@
+"""
+Event Log Benchmark
+
+Times /guess requests with and without an event log under each fsync
+policy, the cost of appending an event, and how fast games replay from
+the log.
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from src.core.event_log import FSYNC_POLICIES, EventLog, read_log, replay
+from src.core.game_engine import EVENT_GUESS, GameEngine
+from src.utils.constants import VALID_LETTERS
+from src.web.app import create_app
+
+
+def guess_latencies(games: int, event_log_dir=None, fsync="interval"):
+    """Play games through /guess and return each request's latency."""
+    if event_log_dir:
+        os.environ["HANGMAN_EVENT_LOG"] = event_log_dir
+        os.environ["HANGMAN_EVENT_LOG_FSYNC"] = fsync
+    else:
+        os.environ.pop("HANGMAN_EVENT_LOG", None)
+    app = create_app(debug=False)
+    app.config["TESTING"] = True
+
+    latencies = []
+    for _ in range(games):
+        client = app.test_client()
+        client.get("/game/basic")
+        for letter in VALID_LETTERS[:10]:
+            start = time.perf_counter()
+            client.post("/guess", json={"letter": letter})
+            latencies.append(time.perf_counter() - start)
+
+    event_log = app.extensions.get("hangman_event_log")
+    if event_log is not None:
+        event_log.close()
+    return latencies
+
+
+def report(label: str, latencies):
+    latencies = sorted(latencies)
+    p50 = statistics.median(latencies) * 1e6
+    p99 = latencies[int(len(latencies) * 0.99)] * 1e6
+    print(f"{label:>16}: p50 {p50:7.1f} us  p99 {p99:7.1f} us")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=300)
+    parser.add_argument("--events", type=int, default=200_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        print("/guess latency")
+        report("no event log", guess_latencies(args.games))
+        for policy in FSYNC_POLICIES:
+            log_dir = os.path.join(directory, policy)
+            report(f"fsync={policy}", guess_latencies(args.games, log_dir, policy))
+
+        # Appends alone, then replay of the games they describe
+        log_dir = os.path.join(directory, "replay")
+        event_log = EventLog(log_dir)
+        engines = [GameEngine("basic", seed=game) for game in range(args.events // 10)]
+        start = time.perf_counter()
+        for game, engine in enumerate(engines):
+            game_id = f"game-{game}"
+            event_log.game_started(game_id, engine)
+            for letter in VALID_LETTERS[:9]:
+                event_log.append(game_id, EVENT_GUESS, letter)
+        append = time.perf_counter() - start
+        event_log.close()
+        print(f"\nappend: {append / args.events * 1e6:.2f} us/event")
+
+        start = time.perf_counter()
+        replayed = replay(read_log(log_dir))
+        elapsed = time.perf_counter() - start
+        print(
+            f"replay all: {args.events:,} events, {len(replayed):,} games in "
+            f"{elapsed:.2f} s ({args.events / elapsed:,.0f} events/s)"
+        )
+
+        start = time.perf_counter()
+        replay(read_log(log_dir, "game-7"), "game-7")
+        print(f"replay one game: {(time.perf_counter() - start) * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
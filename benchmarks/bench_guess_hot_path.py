@@ -0,0 +1,99 @@
+"""
+Guess Hot Path Micro-Benchmark
+
+Runs a million simulated guesses through the bitmask-based GameEngine
+and through a list-based reference of the previous implementation.
+"""
+
+import argparse
+import random
+import time
+
+from src.core.game_engine import GameEngine
+from src.utils.constants import GAME_MESSAGES, MAX_LIVES, VALID_LETTERS
+
+
+class ListGameEngine:
+    """Reference list-scan implementation the engine used before bitmasks."""
+
+    def __init__(self, word: str):
+        self.word = word
+        self.guessed_letters = []
+        self.wrong_guesses = []
+        self.lives = MAX_LIVES
+
+    def guess_letter(self, letter: str) -> dict:
+        letter = letter.upper()
+        if letter in self.guessed_letters:
+            return {"correct": False, "message": GAME_MESSAGES["duplicate_guess"]}
+        self.guessed_letters.append(letter)
+        if letter.upper() in self.word.upper():
+            return {"correct": True, "message": GAME_MESSAGES["correct_guess"]}
+        self.wrong_guesses.append(letter)
+        self.lives -= 1
+        return {"correct": False, "message": GAME_MESSAGES["wrong_guess"]}
+
+    def is_word_complete(self) -> bool:
+        for char in self.word:
+            if char != " " and char not in self.guessed_letters:
+                return False
+        return True
+
+
+def make_workload(total_guesses: int, seed: int):
+    """Build (word, letters) games totalling roughly total_guesses guesses."""
+    rng = random.Random(seed)
+    words = [GameEngine("intermediate").word for _ in range(64)]
+    games = []
+    count = 0
+    while count < total_guesses:
+        # Each game guesses every letter once, in random order
+        letters = rng.sample(VALID_LETTERS, len(VALID_LETTERS))
+        games.append((rng.choice(words), letters))
+        count += len(letters)
+    return games
+
+
+def run_reference(games) -> float:
+    start = time.perf_counter()
+    for word, letters in games:
+        engine = ListGameEngine(word)
+        for letter in letters:
+            engine.guess_letter(letter)
+            engine.is_word_complete()
+    return time.perf_counter() - start
+
+
+def run_engine(games) -> float:
+    engine = GameEngine("intermediate")
+    start = time.perf_counter()
+    for word, letters in games:
+        engine.word = word
+        engine.guessed_letters = []
+        engine.wrong_guesses = []
+        engine.lives = MAX_LIVES
+        for letter in letters:
+            engine.guess_letter(letter)
+            engine._is_word_complete()  # pylint: disable=protected-access
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--guesses", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args()
+
+    games = make_workload(args.guesses, args.seed)
+    total = sum(len(letters) for _, letters in games)
+
+    for name, runner in (("list", run_reference), ("bitmask", run_engine)):
+        elapsed = runner(games)
+        print(
+            f"{name:>8}: {total:,} guesses in {elapsed:.2f}s "
+            f"({total / elapsed:,.0f} guesses/s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Guess Timer Scaling Benchmark
+
+Keeps N live games in one worker, with a share of players guessing every
+second and the rest left to time out, and reports the cost of each
+one-second tick. The same simulation is run twice: once expiring games
+through GuessTimer's timer wheel, and once with a naive sweep that checks
+every game's deadline on every tick.
+"""
+
+import argparse
+import gc
+import random
+import time
+from typing import Callable, Dict, List
+
+from src.core.game_engine import GameEngine
+from src.web.guess_timer import GuessTimer
+from src.web.session_store import MemorySessionStore
+
+
+class SimulatedClock:
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def start_games(games: int, clock: SimulatedClock) -> Dict[str, GameEngine]:
+    rng = random.Random(0)
+    engines = {}
+    for index in range(games):
+        engine = GameEngine("basic", seed=rng.getrandbits(64))
+        # Stagger deadlines across the first guess period
+        engine.start_timer(clock() - rng.uniform(0, 15))
+        engines[f"game-{index}"] = engine
+    return engines
+
+
+def simulate(
+    engines: Dict[str, GameEngine],
+    clock: SimulatedClock,
+    expire: Callable[[], int],
+    watch: Callable[[str, GameEngine], None],
+    seconds: int,
+    active: float,
+):
+    """Run the simulation and return the tick timings and timeouts applied."""
+    rng = random.Random(1)
+    game_ids = list(engines)
+    ticks, timeouts = [], 0
+    for _ in range(seconds):
+        clock.now += 1
+        for game_id in rng.sample(game_ids, int(len(game_ids) * active)):
+            engine = engines[game_id]
+            if engine.deadline is not None:
+                engine.start_timer(clock())
+                watch(game_id, engine)
+
+        start = time.perf_counter()
+        timeouts += expire()
+        ticks.append(time.perf_counter() - start)
+    return ticks, timeouts
+
+
+def run_wheel(args) -> List[float]:
+    clock = SimulatedClock(1_700_000_000.0)
+    engines = start_games(args.games, clock)
+    store = MemorySessionStore(max_games=args.games)
+    timer = GuessTimer(store, clock=clock)
+    for game_id, engine in engines.items():
+        store.set(game_id, engine)
+        timer.watch(game_id, engine)
+    gc.freeze()
+
+    ticks, timeouts = simulate(
+        engines,
+        clock,
+        lambda: len(timer.expire()),
+        timer.watch,
+        args.seconds,
+        args.active,
+    )
+    gc.unfreeze()
+    return ticks, timeouts
+
+
+def run_sweep(args) -> List[float]:
+    clock = SimulatedClock(1_700_000_000.0)
+    engines = start_games(args.games, clock)
+    store = MemorySessionStore(max_games=args.games)
+    for game_id, engine in engines.items():
+        store.set(game_id, engine)
+    gc.freeze()
+
+    def expire() -> int:
+        expired = 0
+        for game_id, engine in engines.items():
+            if engine.deadline is not None and engine.deadline <= clock.now:
+                engine.check_timeout(clock.now)
+                store.set(game_id, engine)
+                expired += 1
+        return expired
+
+    ticks, timeouts = simulate(
+        engines, clock, expire, lambda game_id, engine: None, args.seconds, args.active
+    )
+    gc.unfreeze()
+    return ticks, timeouts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=100_000)
+    parser.add_argument("--seconds", type=int, default=60)
+    parser.add_argument(
+        "--active",
+        type=float,
+        default=0.05,
+        help="share of games that guess each second",
+    )
+    args = parser.parse_args()
+
+    print(f"{args.games} live games, {args.seconds} ticks")
+    for name, run in (("wheel", run_wheel), ("sweep", run_sweep)):
+        ticks, timeouts = run(args)
+        print(
+            f"  {name:>5}: {timeouts} timeouts, "
+            f"p50 {percentile(ticks, 0.5) * 1000:7.2f} ms/tick, "
+            f"p99 {percentile(ticks, 0.99) * 1000:7.2f} ms/tick"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Instrumentation Overhead Benchmark
+
+Compares /guess latency with instrumentation disabled, with histograms
+only and with cProfile sampling, and times the per-call cost of the
+hooks the routes run in each mode.
+"""
+
+import argparse
+import os
+import statistics
+import time
+import timeit
+
+from src.utils.constants import VALID_LETTERS
+from src.web.app import create_app
+from src.web.instrumentation import Histogram, Instrumentation, StageTimer, guess_stages
+
+
+def make_app(metrics: bool, profile_rate: float = 0.0):
+    if metrics:
+        os.environ["HANGMAN_METRICS"] = "1"
+        os.environ["HANGMAN_PROFILE_RATE"] = str(profile_rate)
+    else:
+        os.environ.pop("HANGMAN_METRICS", None)
+    app = create_app(debug=False)
+    app.config["TESTING"] = True
+    return app
+
+
+def guess_latencies(app, games: int):
+    latencies = []
+    for _ in range(games):
+        client = app.test_client()
+        client.get("/game/basic")
+        for letter in VALID_LETTERS[:10]:
+            start = time.perf_counter()
+            client.post("/guess", json={"letter": letter})
+            latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def per_call(statement, number: int = 200_000) -> float:
+    """Return the best nanoseconds per call over a few repeats."""
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=500)
+    args = parser.parse_args()
+
+    configurations = [
+        ("disabled", make_app(False)),
+        ("histograms", make_app(True)),
+        ("profile 1%", make_app(True, 0.01)),
+        ("profile 100%", make_app(True, 1.0)),
+    ]
+    # Warm up dictionaries and templates before timing
+    for _, app in configurations:
+        guess_latencies(app, 5)
+
+    print("/guess latency")
+    baseline = None
+    for label, app in configurations:
+        latencies = guess_latencies(app, args.games)
+        mean = statistics.fmean(latencies) * 1e6
+        baseline = baseline or mean
+        print(
+            f"{label:>13}: mean {mean:7.1f} us  "
+            f"p50 {statistics.median(latencies) * 1e6:7.1f} us  "
+            f"({(mean / baseline - 1) * 100:+5.1f}%)"
+        )
+
+    disabled_app = configurations[0][1]
+    histogram = Histogram()
+    timer = StageTimer(Instrumentation())
+    print("\nper call")
+    print(f"  disabled check:   {per_call(lambda: guess_stages(disabled_app)):6.0f} ns")
+    print(f"  Histogram.record: {per_call(lambda: histogram.record(0.0003)):6.0f} ns")
+    print(f"  StageTimer.mark:  {per_call(lambda: timer.mark('parse')):6.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Leaderboard Benchmark
+
+Records millions of seeded final scores and measures write throughput
+and the latency of reading the top 100, against keeping every result
+and selecting the top with heapq.nlargest on each read. Also times a
+snapshot of every board to SQLite.
+"""
+
+import argparse
+import heapq
+import os
+import random
+import tempfile
+import time
+import timeit
+
+from benchmarks.bench_asgi import percentile
+from src.core.leaderboard import Leaderboard
+from src.utils.constants import DIFFICULTY_LEVELS
+
+LEVELS = list(DIFFICULTY_LEVELS)
+
+
+def random_results(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    start = time.time()
+    # Scores are mostly small, a few players go on for a long time
+    return [
+        (
+            f"{index:032x}",
+            LEVELS[index % len(LEVELS)],
+            1 + int(rng.expovariate(0.2)),
+            start + index * 0.001,
+        )
+        for index in range(count)
+    ]
+
+
+def read_latencies(read, reads: int):
+    latencies = []
+    for _ in range(reads):
+        start = time.perf_counter()
+        read()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=2_000_000)
+    parser.add_argument("--reads", type=int, default=1000)
+    args = parser.parse_args()
+
+    results = random_results(args.games)
+    print(f"{args.games:,} games")
+
+    leaderboard = Leaderboard()
+    start = time.perf_counter()
+    for game_id, level, score, recorded_at in results:
+        leaderboard.record(game_id, level, score, recorded_at)
+    elapsed = time.perf_counter() - start
+    print(f"  top-K record:      {args.games / elapsed:12,.0f} games/s")
+
+    every_result = {level: [] for level in LEVELS}
+    start = time.perf_counter()
+    for game_id, level, score, recorded_at in results:
+        every_result[level].append((score, -recorded_at, game_id))
+    elapsed = time.perf_counter() - start
+    print(f"  append all:        {args.games / elapsed:12,.0f} games/s")
+
+    for label, read in (
+        ("top-K top 100", lambda: leaderboard.top("basic", "all", 100)),
+        ("nlargest top 100", lambda: heapq.nlargest(100, every_result["basic"])),
+    ):
+        reads = args.reads if label.startswith("top-K") else max(args.reads // 100, 5)
+        latencies = read_latencies(read, reads)
+        print(
+            f"  {label + ':':<18} p50 {percentile(latencies, 0.50) * 1e6:10.1f} us"
+            f"  p99 {percentile(latencies, 0.99) * 1e6:10.1f} us"
+        )
+
+    with tempfile.TemporaryDirectory() as directory:
+        snapshotting = Leaderboard(os.path.join(directory, "leaderboard.db"))
+        for game_id, level, score, recorded_at in results[-100_000:]:
+            snapshotting.record(game_id, level, score, recorded_at)
+        seconds = timeit.timeit(snapshotting.snapshot, number=1)
+        print(f"  snapshot:          {seconds * 1000:12.1f} ms")
+        snapshotting.close()
+
+
+if __name__ == "__main__":
+    main()
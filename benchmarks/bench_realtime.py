@@ -0,0 +1,184 @@
+"""
+Realtime Connection Benchmark
+
+Starts the ASGI app under Uvicorn and opens N simultaneous games over
+loopback, then measures the latency of each guess from send to the
+server's reply: once over one WebSocket per player, and once as a
+POST /guess per letter on a keep-alive HTTP connection per player.
+
+Needs uvicorn and websockets (pip install "uvicorn[standard]").
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+import websockets
+
+from benchmarks.bench_asgi import percentile
+from src.utils.constants import VALID_LETTERS
+
+
+def report(name: str, latencies: List[float], elapsed: float):
+    print(
+        f"{name:>9}: {len(latencies)} guesses in {elapsed:.2f}s "
+        f"({len(latencies) / elapsed:,.0f} guesses/s), "
+        f"p50={percentile(latencies, 0.50) * 1000:.2f}ms "
+        f"p99={percentile(latencies, 0.99) * 1000:.2f}ms"
+    )
+
+
+def start_server(port: int) -> subprocess.Popen:
+    env = dict(os.environ, HANGMAN_DEBUG="0")
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "--factory",
+            "src.web.asgi:create_asgi_app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+            "--backlog",
+            "4096",
+        ],
+        env=env,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return server
+        except OSError:
+            time.sleep(0.1)
+    server.kill()
+    raise SystemExit("Uvicorn did not start")
+
+
+class Barrier:
+    """Releases every waiting player once all of them have connected."""
+
+    def __init__(self, parties: int):
+        self.parties = parties
+        self.released_at = 0.0
+        self._event = asyncio.Event()
+
+    async def wait(self):
+        self.parties -= 1
+        if not self.parties:
+            self.released_at = time.perf_counter()
+            self._event.set()
+        await self._event.wait()
+
+
+class HTTPConnection:
+    """Minimal keep-alive HTTP/1.1 client for the benchmark's requests."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.cookie = ""
+
+    @classmethod
+    async def open(cls, port: int) -> "HTTPConnection":
+        return cls(*await asyncio.open_connection("127.0.0.1", port))
+
+    async def request(self, method: str, path: str, body: bytes = b"") -> bytes:
+        head = (
+            f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+        )
+        if self.cookie:
+            head += f"Cookie: {self.cookie}\r\n"
+        self.writer.write(head.encode("latin-1") + b"\r\n" + body)
+        await self.writer.drain()
+
+        raw_headers = await self.reader.readuntil(b"\r\n\r\n")
+        headers: Dict[str, str] = {}
+        for line in raw_headers.decode("latin-1").split("\r\n")[1:]:
+            if line:
+                name, _, value = line.partition(":")
+                headers[name.lower()] = value.strip()
+        if "set-cookie" in headers:
+            self.cookie = headers["set-cookie"].split(";", 1)[0]
+        return await self.reader.readexactly(int(headers["content-length"]))
+
+    def close(self):
+        self.writer.close()
+
+
+async def play_socket(port: int, letters: str, ready: Barrier) -> List[float]:
+    http = await HTTPConnection.open(port)
+    await http.request("GET", "/game/basic")
+
+    latencies = []
+    async with websockets.connect(
+        f"ws://127.0.0.1:{port}/ws", additional_headers={"Cookie": http.cookie}
+    ) as ws:
+        await ws.recv()  # initial state
+        await ready.wait()
+        for letter in letters:
+            start = time.perf_counter()
+            await ws.send(json.dumps({"type": "guess", "letter": letter}))
+            while json.loads(await ws.recv())["type"] == "tick":
+                continue
+            latencies.append(time.perf_counter() - start)
+    http.close()
+    return latencies
+
+
+async def play_http(port: int, letters: str, ready: Barrier) -> List[float]:
+    http = await HTTPConnection.open(port)
+    await http.request("GET", "/game/basic")
+    await ready.wait()
+
+    latencies = []
+    for letter in letters:
+        body = json.dumps({"letter": letter}).encode()
+        start = time.perf_counter()
+        await http.request("POST", "/guess", body)
+        latencies.append(time.perf_counter() - start)
+    http.close()
+    return latencies
+
+
+async def run(port: int, connections: int, guesses: int):
+    rng = random.Random(0)
+    letters = [
+        "".join(rng.choices(VALID_LETTERS, k=guesses)) for _ in range(connections)
+    ]
+
+    for name, play in (("websocket", play_socket), ("http", play_http)):
+        # Every player connects and starts a game before anyone guesses
+        ready = Barrier(connections)
+        results = await asyncio.gather(*(play(port, word, ready) for word in letters))
+        elapsed = time.perf_counter() - ready.released_at
+        report(name, [latency for player in results for latency in player], elapsed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--connections", type=int, default=500)
+    parser.add_argument("--guesses", type=int, default=20)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    server = start_server(args.port)
+    try:
+        asyncio.run(run(args.port, args.connections, args.guesses))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
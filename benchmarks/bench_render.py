@@ -0,0 +1,62 @@
+"""
+Page Render Benchmark
+
+Compares page render time and request throughput with the render cache
+disabled (every hit renders its full template) and enabled (static
+pages from memory, game page from a cached shell plus board fragment).
+"""
+
+import argparse
+import time
+
+from src.core.game_engine import GameEngine
+from src.web.app import create_app
+from src.web.routes import render_game_page
+
+PATHS = ("/", "/select-level", "/game/basic")
+
+
+def make_app(cached: bool):
+    app = create_app(debug=False)
+    app.extensions["hangman_render_cache"].enabled = cached
+    return app
+
+
+def time_render(app, number: int) -> float:
+    """Return the mean time to render a new game's page, in seconds."""
+    game_state = GameEngine("basic").get_game_state()
+    with app.test_request_context("/game/basic"):
+        render_game_page("basic", game_state)
+        start = time.perf_counter()
+        for _ in range(number):
+            render_game_page("basic", game_state)
+        return (time.perf_counter() - start) / number
+
+
+def time_requests(app, path: str, number: int) -> float:
+    """Return requests/sec for GETs of path through the test client."""
+    client = app.test_client()
+    client.get(path)
+    start = time.perf_counter()
+    for _ in range(number):
+        client.get(path)
+    return number / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    for name, cached in (("uncached", False), ("cached", True)):
+        app = make_app(cached)
+        render_us = time_render(app, args.number) * 1e6
+        rates = ", ".join(
+            f"{path} {time_requests(app, path, args.number):,.0f} req/s"
+            for path in PATHS
+        )
+        print(f"{name:>8}: game render {render_us:7.1f} us | {rates}")
+
+
+if __name__ == "__main__":
+    main()
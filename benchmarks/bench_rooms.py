@@ -0,0 +1,116 @@
+"""
+Room Broadcast Benchmark
+
+Fills a room with spectators whose connections accept messages
+immediately, then measures how long a player's guess takes to reach
+every member, for growing room sizes. Compares the room's fan-out,
+which serializes each update once and queues it on every member's
+writer, with sending each member its own json.dumps of the update in
+turn, as one GameConnection per member would.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import List
+
+from benchmarks.bench_asgi import percentile
+from src.web.rooms import Room
+
+
+class Delivery:
+    """Counts sends and notes when the last member has been reached."""
+
+    def __init__(self):
+        self.expected = 0
+        self.done = asyncio.Event()
+
+    async def send(self, message):
+        self.expected -= 1
+        if not self.expected:
+            self.done.set()
+
+
+def guess_letters(room: Room) -> str:
+    """Every letter once, starting with the ones in the word."""
+    letters = dict.fromkeys(char for char in room.engine.word if char.isalpha())
+    return "".join(letters) + "".join(
+        letter for letter in "ETAOINSHRDLUCMFWYPVBGKQJXZ" if letter not in letters
+    )
+
+
+async def fan_out(size: int, guesses: int) -> List[float]:
+    room = Room("bench", "basic", seed=0)
+    delivery = Delivery()
+    player = room.join("Ann")
+    members = [player] + [room.join("", "spectator") for _ in range(size - 1)]
+    writers = [asyncio.ensure_future(m.run_writer(delivery.send)) for m in members]
+    # Let the writers send the initial state before timing
+    delivery.expected = size
+    await delivery.done.wait()
+
+    latencies = []
+    for letter in guess_letters(room)[:guesses]:
+        if room.engine.check_game_over():
+            break
+        delivery.expected = size
+        delivery.done.clear()
+        start = time.perf_counter()
+        room.handle_message(player, {"type": "guess", "letter": letter})
+        await delivery.done.wait()
+        latencies.append(time.perf_counter() - start)
+
+    for writer in writers:
+        writer.cancel()
+    return latencies
+
+
+async def per_member(size: int, guesses: int) -> List[float]:
+    room = Room("bench", "basic", seed=0)
+    delivery = Delivery()
+    player = room.join("Ann")
+    for _ in range(size - 1):
+        room.join("", "spectator")
+
+    latencies = []
+    for letter in guess_letters(room)[:guesses]:
+        if room.engine.check_game_over():
+            break
+        delivery.expected = size
+        start = time.perf_counter()
+        since = room.engine.revision
+        result = room.engine.guess_letter(letter)
+        update = {
+            "type": "guess",
+            "player": player.name,
+            "letter": letter,
+            "result": result,
+            "word_completion": room.engine.process_word_completion(),
+            "delta": room.engine.get_state_delta(since),
+        }
+        for _ in range(size):
+            await delivery.send({"type": "websocket.send", "text": json.dumps(update)})
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10_000])
+    parser.add_argument("--guesses", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'members':>8}  {'fan-out p50':>12}  {'p99':>9}  {'per member p50':>15}")
+    for size in args.sizes:
+        shared = asyncio.run(fan_out(size, args.guesses))
+        separate = asyncio.run(per_member(size, args.guesses))
+        print(
+            f"{size:>8}  {percentile(shared, 0.50) * 1000:>9.3f} ms  "
+            f"{percentile(shared, 0.99) * 1000:>6.3f} ms  "
+            f"{percentile(separate, 0.50) * 1000:>12.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
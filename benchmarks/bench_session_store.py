@@ -0,0 +1,77 @@
+"""
+Session Store Load Benchmark
+
+Drives N simulated players concurrently through /guess and checks that
+no game state leaks between them.
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.utils.constants import VALID_LETTERS
+from src.web.app import create_app
+from src.web.session_store import MemorySessionStore, SQLiteSessionStore
+
+
+def play(app, player_seed: int, guesses: int) -> int:
+    """Play one player's guesses and return how many leaks were seen."""
+    rng = random.Random(player_seed)
+    letters = list(VALID_LETTERS)
+    rng.shuffle(letters)
+
+    client = app.test_client()
+    client.get("/game/basic")
+
+    leaks = 0
+    my_guesses = set()
+    for letter in letters[:guesses]:
+        my_guesses.add(letter)
+        state = client.post("/guess", json={"letter": letter}).get_json()
+        if not set(state["game_state"]["guessed_letters"]) <= my_guesses:
+            leaks += 1
+    return leaks
+
+
+def run(store_name: str, players: int, guesses: int, threads: int):
+    if store_name == "sqlite":
+        db_path = os.path.join(tempfile.mkdtemp(), "sessions.db")
+        store = SQLiteSessionStore(db_path)
+    else:
+        store = MemorySessionStore()
+
+    app = create_app(session_store=store)
+    app.config["TESTING"] = True
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        leaks = sum(pool.map(lambda seed: play(app, seed, guesses), range(players)))
+    elapsed = time.perf_counter() - start
+
+    total = players * guesses
+    print(
+        f"{store_name:>7}: {players} players x {guesses} guesses "
+        f"in {elapsed:.2f}s ({total / elapsed:,.0f} guesses/s), leaks={leaks}"
+    )
+    return leaks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--players", type=int, default=200)
+    parser.add_argument("--guesses", type=int, default=10)
+    parser.add_argument("--threads", type=int, default=16)
+    args = parser.parse_args()
+
+    leaks = 0
+    for store_name in ("memory", "sqlite"):
+        leaks += run(store_name, args.players, args.guesses, args.threads)
+    if leaks:
+        raise SystemExit(f"State leaked between players {leaks} times")
+
+
+if __name__ == "__main__":
+    main()
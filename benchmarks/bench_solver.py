@@ -0,0 +1,83 @@
+"""
+Solver Candidate Filtering Benchmark
+
+Compares narrowing a dictionary to the words matching a word display by
+scanning every word against the display with narrowing the same
+dictionary through the solver's bitset CandidateIndex. The static
+dictionaries are small, so a synthetic dictionary is generated.
+"""
+
+import argparse
+import random
+import string
+import time
+
+from src.core.solver import CandidateIndex
+from src.utils.constants import UNDERSCORE_PLACEHOLDER
+
+
+def make_words(count: int, seed: int):
+    rng = random.Random(seed)
+    letters = string.ascii_uppercase
+    weights = [len(letters) - rank for rank in range(len(letters))]
+    return [
+        "".join(rng.choices(letters, weights, k=rng.randint(4, 12)))
+        for _ in range(count)
+    ]
+
+
+def make_display(word: str, guessed: str) -> str:
+    return "".join(char if char in guessed else UNDERSCORE_PLACEHOLDER for char in word)
+
+
+def scan(words, display: str, wrong: str):
+    """Reference filter: test every word against the display."""
+    revealed = set(display) - {UNDERSCORE_PLACEHOLDER}
+    matches = []
+    for word in words:
+        if len(word) != len(display) or any(letter in word for letter in wrong):
+            continue
+        if all(
+            char == shown if shown != UNDERSCORE_PLACEHOLDER else char not in revealed
+            for char, shown in zip(word, display)
+        ):
+            matches.append(word)
+    return matches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--words", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    words = make_words(args.words, seed=1)
+    rng = random.Random(2)
+    queries = []
+    for word in rng.sample(words, args.queries):
+        guessed = "".join(rng.sample(string.ascii_uppercase, 6))
+        wrong = "".join(letter for letter in guessed if letter not in word)
+        queries.append((make_display(word, guessed), wrong))
+
+    start = time.perf_counter()
+    index = CandidateIndex(words)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = [scan(words, display, wrong) for display, wrong in queries]
+    scan_time = (time.perf_counter() - start) / args.queries
+
+    start = time.perf_counter()
+    found = [index.candidates(display, wrong) for display, wrong in queries]
+    index_time = (time.perf_counter() - start) / args.queries
+
+    for matches, candidates in zip(expected, found):
+        assert sorted(set(matches)) == sorted(candidates.words())
+
+    print(f"{args.words:,} words, index built in {build:.2f} s")
+    print(f"  scan:   {scan_time * 1e3:8.3f} ms/query")
+    print(f"  bitset: {index_time * 1e3:8.3f} ms/query")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+State Delta Benchmark
+
+Compares the /guess payload size and JSON serialization time of the full
+game state against the delta since the client's previous revision, over
+a stream of guesses that includes word completions.
+"""
+
+import argparse
+import json
+import random
+import time
+
+from src.core.game_engine import GameEngine
+from src.utils.constants import VALID_LETTERS
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--guesses", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for level in ("basic", "intermediate"):
+        rng = random.Random(args.seed)
+        game = GameEngine(level, seed=args.seed)
+        totals = {"full": [0, 0.0], "delta": [0, 0.0]}
+
+        for _ in range(args.guesses):
+            since = game.revision
+            game.guess_letter(rng.choice(VALID_LETTERS))
+            game.process_word_completion()
+            if game.lives <= 0:
+                game.lives = 6
+
+            start = time.perf_counter()
+            full = json.dumps(game.get_game_state())
+            totals["full"][1] += time.perf_counter() - start
+            totals["full"][0] += len(full.encode("utf-8"))
+
+            start = time.perf_counter()
+            delta = json.dumps(game.get_state_delta(since))
+            totals["delta"][1] += time.perf_counter() - start
+            totals["delta"][0] += len(delta.encode("utf-8"))
+
+        print(f"[{level}] {args.guesses} guesses")
+        for name, (size, elapsed) in totals.items():
+            print(
+                f"  {name:>5}: {size / args.guesses:6.1f} bytes/response, "
+                f"{elapsed / args.guesses * 1e6:6.2f} us/response"
+            )
+
+
+if __name__ == "__main__":
+    main()
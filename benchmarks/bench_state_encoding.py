@@ -0,0 +1,73 @@
+"""
+Game State Encoding Benchmark
+
+Compares state size and encode/decode latency of GameEngine.to_bytes()
+against pickle and JSON of the same game.
+"""
+
+import argparse
+import json
+import pickle
+import timeit
+
+from src.core.game_engine import GameEngine
+
+
+def make_game(level: str) -> GameEngine:
+    game = GameEngine(level)
+    for letter in "ETAOIN":
+        game.guess_letter(letter)
+    game.score = 12
+    return game
+
+
+def game_to_json(game: GameEngine) -> str:
+    return json.dumps(
+        {
+            "level": game.level,
+            "word": game.word,
+            "guessed_letters": game.guessed_letters,
+            "wrong_guesses": game.wrong_guesses,
+            "lives": game.lives,
+            "score": game.score,
+            "game_over": game.game_over,
+        }
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    for level in ("basic", "intermediate"):
+        game = make_game(level)
+        encoded = {
+            "bytes": game.to_bytes(),
+            "pickle": pickle.dumps(game),
+            "json": game_to_json(game).encode("utf-8"),
+        }
+        encoders = {
+            "bytes": game.to_bytes,
+            "pickle": lambda: pickle.dumps(game),
+            "json": lambda: game_to_json(game),
+        }
+        decoders = {
+            "bytes": lambda: GameEngine.from_bytes(encoded["bytes"]),
+            "pickle": lambda: pickle.loads(encoded["pickle"]),
+            "json": lambda: json.loads(encoded["json"]),
+        }
+
+        print(f"[{level}] word={game.word!r}")
+        for name, data in encoded.items():
+            encode_us = timeit.timeit(encoders[name], number=args.number)
+            decode_us = timeit.timeit(decoders[name], number=args.number)
+            print(
+                f"  {name:>6}: {len(data):4d} bytes, "
+                f"encode {encode_us / args.number * 1e6:6.2f} us, "
+                f"decode {decode_us / args.number * 1e6:6.2f} us"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Word Display Benchmark
+
+Compares the previous string-concatenation rebuild, the join-based
+format_word_display and the engine's incremental display buffer over
+the longest intermediate phrases.
+"""
+
+import argparse
+import random
+import time
+
+from src.core.game_engine import GameEngine
+from src.core.word_manager import WordManager
+from src.utils.constants import UNDERSCORE_PLACEHOLDER, VALID_LETTERS
+from src.utils.display_formatter import format_word_display
+
+
+def concat_word_display(word, guessed_letters):
+    """Reference implementation the formatter used before join."""
+    guessed_upper = [letter.upper() for letter in guessed_letters]
+    result = ""
+    for char in word:
+        if char == " ":
+            result += " "
+        elif char.upper() in guessed_upper:
+            result += char
+        else:
+            result += UNDERSCORE_PLACEHOLDER
+    return result
+
+
+def full_rebuild(phrases, orders, formatter) -> float:
+    start = time.perf_counter()
+    for phrase, letters in zip(phrases, orders):
+        guessed = []
+        for letter in letters:
+            guessed.append(letter)
+            formatter(phrase, guessed)
+    return time.perf_counter() - start
+
+
+def incremental(phrases, orders) -> float:
+    engine = GameEngine("intermediate")
+    start = time.perf_counter()
+    for phrase, letters in zip(phrases, orders):
+        engine.word = phrase
+        engine.guessed_letters = []
+        engine.wrong_guesses = []
+        for letter in letters:
+            engine.guess_letter(letter)
+            "".join(engine._display)  # pylint: disable=protected-access
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    phrases = sorted(
+        (phrase.upper() for phrase in WordManager().get_intermediate_phrases()),
+        key=len,
+        reverse=True,
+    )[:10]
+    games = [rng.choice(phrases) for _ in range(args.games)]
+    orders = [rng.sample(VALID_LETTERS, len(VALID_LETTERS)) for _ in games]
+    renders = args.games * len(VALID_LETTERS)
+
+    results = {
+        "concat": full_rebuild(games, orders, concat_word_display),
+        "join": full_rebuild(games, orders, format_word_display),
+        "incremental": incremental(games, orders),
+    }
+    average_length = sum(map(len, games)) / len(games)
+    print(f"{renders:,} renders of phrases averaging {average_length:.0f} chars")
+    for name, elapsed in results.items():
+        print(f"{name:>12}: {elapsed:.2f}s ({renders / elapsed:,.0f} renders/s)")
+
+
+if __name__ == "__main__":
+    main()
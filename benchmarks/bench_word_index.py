@@ -0,0 +1,68 @@
+"""
+Word Index Benchmark
+
+Builds a WordIndex over a synthetic dictionary and compares constrained
+word selection against filtering the flat word list on every draw.
+"""
+
+import argparse
+import random
+import resource
+import string
+import time
+import timeit
+
+from src.core.word_manager import WordIndex
+
+
+def synthetic_words(count: int, seed: int):
+    rng = random.Random(seed)
+    letters = string.ascii_lowercase
+    for _ in range(count):
+        yield "".join(rng.choice(letters) for _ in range(rng.randint(3, 15)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=1_000_000)
+    parser.add_argument("--draws", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args()
+
+    words = list(synthetic_words(args.entries, args.seed))
+
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    index = WordIndex(words)
+    build_seconds = time.perf_counter() - start
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(
+        f"index build: {len(index):,} entries in {build_seconds:.2f}s, "
+        f"peak RSS +{(rss_after - rss_before) / 1024:.0f} MiB"
+    )
+
+    constraints = {"min_length": 6, "max_length": 8, "max_distinct_letters": 6}
+    start = time.perf_counter()
+    pool = index.pool(**constraints)
+    print(f"pool build: {len(pool):,} matches in {time.perf_counter() - start:.2f}s")
+
+    def filtered_draw():
+        matches = [
+            word for word in words if 6 <= len(word) <= 8 and len(set(word)) <= 6
+        ]
+        return random.choice(matches).upper()
+
+    def indexed_draw():
+        return index.random_word(**constraints)
+
+    # Filtering is orders of magnitude slower, so it gets fewer draws
+    for name, draw, draws in (
+        ("filter", filtered_draw, max(1, args.draws // 1000)),
+        ("index", indexed_draw, args.draws),
+    ):
+        seconds = timeit.timeit(draw, number=draws) / draws
+        print(f"{name:>7} draw: {seconds * 1e6:12,.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Word Pack Cold-Start Benchmark
+
+Measures the latency of the first word selection in a fresh interpreter
+when dictionaries load from text files versus a prebuilt word pack.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.bench_dictionary_loading import write_dictionary
+from src.core.word_manager import WordManager
+
+_PROBE = """
+import json, sys, time
+from src.core.word_manager import WordManager
+
+start = time.perf_counter()
+manager = WordManager(dictionary_dir=sys.argv[1], use_pack=sys.argv[2] == "pack")
+manager.get_random_word("basic")
+print(json.dumps({"first_word": time.perf_counter() - start}))
+"""
+
+
+def probe(directory: str, mode: str) -> float:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE, directory, mode],
+        cwd=root,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)["first_word"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        write_dictionary(
+            os.path.join(directory, "basic_words.txt"), args.entries, args.seed
+        )
+        with open(
+            os.path.join(directory, "intermediate_phrases.txt"), "w", encoding="utf-8"
+        ) as file:
+            file.write("break a leg\n")
+        pack_path = WordManager(dictionary_dir=directory, use_pack=False).build_pack()
+        pack_mib = os.path.getsize(pack_path) / 2**20
+        print(f"{args.entries:,} entries, pack {pack_mib:.1f} MiB")
+
+        for mode in ("text", "pack"):
+            best = min(probe(directory, mode) for _ in range(args.repeat))
+            print(f"{mode:>5}: first word selected after {best * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
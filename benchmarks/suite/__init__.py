@@ -0,0 +1,13 @@
+"""
+Benchmark Suite
+
+pytest-benchmark suite over seeded workloads for the game engine, the
+display formatter, dictionary loading and selection, and the web routes.
+Save a baseline, then compare later runs against it; the comparison fails
+when any benchmark's mean regressed by more than the threshold:
+
+    python -m benchmarks.suite save
+    python -m benchmarks.suite compare --threshold 10
+
+Pass --large to include the 10M-entry dictionary benchmarks.
+"""
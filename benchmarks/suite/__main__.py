@@ -0,0 +1,87 @@
+"""
+Run the benchmark suite, save a baseline or compare against one.
+
+Usage: python -m benchmarks.suite {run,save,compare} [options]
+"""
+
+import argparse
+import glob
+import os
+import sys
+
+import pytest
+
+SUITE_DIR = os.path.dirname(os.path.abspath(__file__))
+# Baselines are per machine (pytest-benchmark files them by platform and
+# Python version) and are not committed
+STORAGE_DIR = os.path.join(os.path.dirname(SUITE_DIR), ".baselines")
+
+
+def find_baseline(name: str) -> str:
+    """Return the most recently saved baseline called name."""
+    paths = glob.glob(os.path.join(STORAGE_DIR, "*", f"*_{name}.json"))
+    if not paths:
+        raise SystemExit(f"No saved baseline named {name!r} in {STORAGE_DIR}")
+    return max(paths, key=os.path.getmtime)
+
+
+def pytest_args(args) -> list:
+    """Build the pytest command line for a suite command."""
+    command = [
+        SUITE_DIR,
+        "--benchmark-only",
+        f"--benchmark-storage=file://{STORAGE_DIR}",
+        "--benchmark-sort=name",
+        "--benchmark-columns=min,mean,stddev,rounds",
+    ]
+    if args.keyword:
+        command += ["-k", args.keyword]
+    if args.command == "save":
+        command.append(f"--benchmark-save={args.name}")
+    elif args.command == "compare":
+        command += [
+            f"--benchmark-compare={find_baseline(args.name)}",
+            f"--benchmark-compare-fail={args.stat}:{args.threshold}%",
+        ]
+    return command
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.suite",
+        description="Run the pytest-benchmark suite.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("run", help="run the suite without saving results")
+    save = commands.add_parser("save", help="run the suite and save a baseline")
+    compare = commands.add_parser(
+        "compare", help="run the suite and fail on regressions against a baseline"
+    )
+    compare.add_argument(
+        "--threshold",
+        type=int,
+        default=10,
+        help="largest allowed increase, in whole percent (default 10)",
+    )
+    compare.add_argument(
+        "--stat",
+        choices=("min", "mean", "median"),
+        default="mean",
+        help="statistic compared against the baseline (default mean)",
+    )
+    for command in (save, compare):
+        command.add_argument("--name", default="baseline", help="baseline name")
+    for command in commands.choices.values():
+        command.add_argument("-k", dest="keyword", help="only run matching benchmarks")
+        command.add_argument(
+            "--large", action="store_true", help="include 10M-entry dictionaries"
+        )
+    args = parser.parse_args(argv)
+
+    if args.large:
+        os.environ["HANGMAN_BENCHMARK_LARGE"] = "1"
+    return pytest.main(pytest_args(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+"""
+Shared seeded workloads for the benchmark suite.
+"""
+
+import os
+import random
+import string
+
+import pytest
+
+SEED = 1234
+
+# Dictionary sizes; the 10M entry dictionaries take minutes and several
+# GB of memory to load, so they only run when asked for
+ENTRY_COUNTS = [1_000, 100_000]
+if os.environ.get("HANGMAN_BENCHMARK_LARGE") == "1":
+    ENTRY_COUNTS.append(10_000_000)
+
+
+def random_words(count: int, seed: int):
+    rng = random.Random(seed)
+    letters = string.ascii_lowercase
+    return ["".join(rng.choices(letters, k=rng.randint(4, 15))) for _ in range(count)]
+
+
+@pytest.fixture(scope="session")
+def dictionary_dirs(tmp_path_factory):
+    """Return a function making (once) a dictionary directory of a size."""
+    made = {}
+
+    def make(entries: int) -> str:
+        if entries not in made:
+            directory = tmp_path_factory.mktemp(f"dictionary-{entries}")
+            words = random_words(entries, SEED)
+            (directory / "basic_words.txt").write_text("\n".join(words) + "\n")
+            phrases = [" ".join(words[i : i + 3]) for i in range(0, 3000, 3)]
+            (directory / "intermediate_phrases.txt").write_text(
+                "\n".join(phrases) + "\n"
+            )
+            made[entries] = str(directory)
+        return made[entries]
+
+    return make
@@ -0,0 +1,60 @@
+"""
+Benchmarks for GameEngine guess sequences.
+"""
+
+import random
+
+from src.core.game_engine import GameEngine
+from src.utils.constants import VALID_LETTERS
+
+from .conftest import SEED
+
+GAMES = 200
+
+
+def make_games():
+    """Return (word bag seed, guess order) pairs for GAMES games."""
+    rng = random.Random(SEED)
+    return [
+        (rng.getrandbits(64), rng.sample(VALID_LETTERS, len(VALID_LETTERS)))
+        for _ in range(GAMES)
+    ]
+
+
+def play(level: str, games) -> int:
+    completed = 0
+    for seed, letters in games:
+        engine = GameEngine(level, seed)
+        for letter in letters:
+            engine.guess_letter(letter)
+            completed += engine.process_word_completion()["word_completed"]
+            if engine.check_game_over():
+                break
+    return completed
+
+
+def test_guess_sequence_basic(benchmark):
+    games = make_games()
+    benchmark(play, "basic", games)
+
+
+def test_guess_sequence_intermediate(benchmark):
+    games = make_games()
+    benchmark(play, "intermediate", games)
+
+
+def test_guess_letters_batch(benchmark):
+    games = make_games()
+
+    def play_batches():
+        for seed, letters in games:
+            GameEngine("intermediate", seed).guess_letters(letters)
+
+    benchmark(play_batches)
+
+
+def test_state_round_trip(benchmark):
+    engine = GameEngine("intermediate", SEED)
+    engine.guess_letters("ETAOIN")
+
+    benchmark(lambda: GameEngine.from_bytes(engine.to_bytes()).get_game_state())
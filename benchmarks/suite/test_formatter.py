@@ -0,0 +1,22 @@
+"""
+Benchmarks for the display formatter on long phrases.
+"""
+
+import random
+
+import pytest
+from src.utils.display_formatter import format_lives_display, format_word_display
+
+from .conftest import SEED, random_words
+
+
+@pytest.mark.parametrize("words", [10, 100])
+def test_format_word_display(benchmark, words):
+    phrase = " ".join(random_words(words, SEED)).upper()
+    guessed = random.Random(SEED).sample(sorted(set(phrase) - {" "}), 13)
+
+    benchmark(format_word_display, phrase, guessed)
+
+
+def test_format_lives_display(benchmark):
+    benchmark(lambda: [format_lives_display(lives) for lives in range(7)])
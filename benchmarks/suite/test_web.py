@@ -0,0 +1,53 @@
+"""
+Benchmarks for the web routes through the Flask test client.
+"""
+
+import pytest
+from src.utils.constants import VALID_LETTERS
+from src.web.app import create_app
+from src.web.session_store import MemorySessionStore
+
+
+@pytest.fixture
+def client():
+    app = create_app(session_store=MemorySessionStore(), debug=False)
+    app.config["TESTING"] = True
+    return app.test_client()
+
+
+def test_guess(benchmark, client):
+    """One /guess request, starting a new game once one ends."""
+    letters = iter(())
+
+    def guess():
+        nonlocal letters
+        letter = next(letters, None)
+        if letter is None:
+            client.get("/game/basic")
+            letters = iter(VALID_LETTERS)
+            letter = next(letters)
+        response = client.post("/guess", json={"letter": letter})
+        if response.get_json()["game_state"]["game_over"]:
+            letters = iter(())
+
+    benchmark(guess)
+
+
+def test_guess_with_delta(benchmark, client):
+    """A full game of /guess requests asking for state deltas."""
+
+    def play():
+        since = 0
+        client.get("/game/basic")
+        for letter in VALID_LETTERS:
+            response = client.post("/guess", json={"letter": letter, "since": since})
+            delta = response.get_json()["delta"]
+            since = delta["revision"]
+            if delta["state"]["game_over"] if delta["reset"] else delta["game_over"]:
+                break
+
+    benchmark(play)
+
+
+def test_new_game_page(benchmark, client):
+    benchmark(client.get, "/game/intermediate")
@@ -0,0 +1,40 @@
+"""
+Benchmarks for loading dictionaries and selecting words at several sizes.
+"""
+
+import pytest
+from src.core.word_manager import WordManager
+
+from .conftest import ENTRY_COUNTS
+
+
+def load(directory: str, use_pack: bool):
+    manager = WordManager(dictionary_dir=directory, use_pack=use_pack)
+    manager.get_index("basic")
+    return manager
+
+
+@pytest.mark.parametrize("entries", ENTRY_COUNTS)
+def test_load_text(benchmark, dictionary_dirs, entries):
+    directory = dictionary_dirs(entries)
+    benchmark.pedantic(load, args=(directory, False), rounds=3, iterations=1)
+
+
+@pytest.mark.parametrize("entries", ENTRY_COUNTS)
+def test_load_pack(benchmark, dictionary_dirs, entries):
+    directory = dictionary_dirs(entries)
+    WordManager(dictionary_dir=directory).build_pack()
+    benchmark.pedantic(load, args=(directory, True), rounds=3, iterations=1)
+
+
+@pytest.mark.parametrize("entries", ENTRY_COUNTS)
+def test_random_word(benchmark, dictionary_dirs, entries):
+    manager = load(dictionary_dirs(entries), use_pack=False)
+    benchmark(manager.get_random_word, "basic")
+
+
+@pytest.mark.parametrize("entries", ENTRY_COUNTS)
+def test_shuffle_bag_draw(benchmark, dictionary_dirs, entries):
+    manager = load(dictionary_dirs(entries), use_pack=False)
+    bag = manager.new_shuffle_bag("basic", seed=1)
+    benchmark(manager.get_word_from_bag, "basic", bag)
@@ -0,0 +1,37 @@
+"""
+Gunicorn Configuration
+
+Production runner settings with debug mode off. HANGMAN_SECRET_KEY must
+be set. Games in the default in-process store are only visible to the
+worker that started them, so one worker runs unless games are shared
+through HANGMAN_SESSION_DB, HANGMAN_SESSION_STORE=cookie or engine
+shards at HANGMAN_ENGINE_SOCKET_DIR.
+
+WSGI:  gunicorn -c gunicorn.conf.py
+ASGI:  gunicorn -c gunicorn.conf.py -k uvicorn.workers.UvicornWorker \
+           "src.web.asgi:create_asgi_app()"
+"""
+
+import multiprocessing
+import os
+
+shared_games = bool(
+    os.environ.get("HANGMAN_SESSION_DB")
+    or os.environ.get("HANGMAN_SESSION_STORE") == "cookie"
+    or os.environ.get("HANGMAN_ENGINE_SOCKET_DIR")
+)
+
+wsgi_app = "src.web.app:create_app()"
+bind = os.environ.get("HANGMAN_BIND", "0.0.0.0:3001")
+workers = int(
+    os.environ.get(
+        "HANGMAN_WORKERS", multiprocessing.cpu_count() * 2 + 1 if shared_games else 1
+    )
+)
+if workers > 1 and not shared_games:
+    raise RuntimeError(
+        "Several workers need a shared game store: set HANGMAN_SESSION_DB, "
+        "HANGMAN_SESSION_STORE=cookie or HANGMAN_ENGINE_SOCKET_DIR"
+    )
+threads = int(os.environ.get("HANGMAN_THREADS", 4))
+raw_env = ["HANGMAN_DEBUG=0"]
@@ -17,4 +17,4 @@ if __name__ == "__main__":
     print("🎯 Starting Hangman Web Application...")
     print("🌐 Open your browser and go to: http://localhost:3001")
     print("🛑 Press Ctrl+C to stop the server")
-    app.run(debug=True, host='0.0.0.0', port=3001)
+    app.run(debug=app.debug, host='0.0.0.0', port=3001)
@@ -0,0 +1,89 @@
+"""
+Background Flushing
+
+Buffered writers flushed from a background thread. Each process gets its
+own thread, locks and buffer, so a writer created before a server forks
+its workers is safe to use in them.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import weakref
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+_flushers: "weakref.WeakSet[BackgroundFlusher]" = weakref.WeakSet()
+
+
+def connect_wal(db_path: str, schema: str) -> sqlite3.Connection:
+    """Open a database in WAL mode, so readers do not wait for writers."""
+    conn = sqlite3.connect(db_path, timeout=30.0)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(schema)
+    return conn
+
+
+class BackgroundFlusher:
+    """
+    Base for objects whose flush() runs every flush interval on a thread.
+
+    Subclasses guard their buffer with _lock, call _start_flusher() with
+    it held when buffering a change and _stop_flusher() when closing, and
+    extend _reset_after_fork() to drop the state their parent buffered.
+    """
+
+    def __init__(self, flush_interval: float, thread_name: str):
+        self._flush_interval = flush_interval
+        self._thread_name = thread_name
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        _flushers.add(self)
+
+    def flush(self):
+        raise NotImplementedError
+
+    def _start_flusher(self):
+        """Start this process's flush thread unless running or closed."""
+        if self._thread is None and not self._closed:
+            self._thread = threading.Thread(
+                target=self._run, name=self._thread_name, daemon=True
+            )
+            self._thread.start()
+
+    def _stop_flusher(self):
+        """Stop the flush thread and wait for its last flush."""
+        with self._lock:
+            self._closed = True
+            thread, self._thread = self._thread, None
+        self._wake.set()
+        if thread is not None:
+            thread.join()
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self._flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:  # Logged so one failed flush cannot stop the thread
+                logger.exception("%s flush failed", self._thread_name)
+
+    def _reset_after_fork(self):
+        # The parent's thread, and any lock it held, stay with the parent
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+
+
+def _reset_after_fork():
+    for flusher in list(_flushers):
+        flusher._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
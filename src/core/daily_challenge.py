@@ -0,0 +1,394 @@
+"""
+Daily Challenge
+
+Every player of a level gets the same words on the same UTC date, drawn
+from a shuffle bag seeded with a keyed hash of the date and level, plus
+fixed-size stats of how the day's players did with each word.
+
+Usage: python -m src.core.daily_challenge schedule basic --days 7
+"""
+
+import argparse
+import datetime
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .background import BackgroundFlusher, connect_wal
+from .game_engine import EVENT_GUESS, EVENT_WORD_COMPLETED, GameEngine, Recorder
+from .word_manager import get_word_from_bag, get_word_manager, new_shuffle_bag
+from ..utils.constants import DIFFICULTY_LEVELS, VALID_LETTERS
+
+# Scheduled words per level and day; stats are kept for these
+SCHEDULE_LENGTH = 50
+
+# Days of schedules computed ahead of time, starting today
+PRECOMPUTE_DAYS = 7
+
+# Counters per word: solved, failed, then players who solved it in n
+# guesses for n = 0..26
+_SOLVED = 0
+_FAILED = 1
+_GUESS_BINS = len(VALID_LETTERS) + 1
+_WORD_COUNTERS = 2 + _GUESS_BINS
+
+StatsKey = Tuple[str, str]
+
+
+def challenge_day(timestamp: float) -> datetime.date:
+    """Return the UTC date whose challenge is played at timestamp."""
+    return datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc).date()
+
+
+def daily_seed(day: datetime.date, level: str, secret: bytes = b"") -> int:
+    """Return the word bag seed of a level's challenge on day."""
+    # Keyed with the app's secret so upcoming words cannot be worked out
+    key = hashlib.blake2b(secret, digest_size=32).digest()
+    digest = hashlib.blake2b(
+        f"{day.isoformat()}:{level}".encode(), digest_size=8, key=key
+    ).digest()
+    return int.from_bytes(digest, "little")
+
+
+class DailySchedule:
+    """The words of each day's challenge, cached per dictionary generation."""
+
+    def __init__(
+        self,
+        secret: bytes = b"",
+        length: int = SCHEDULE_LENGTH,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.secret = secret
+        self.length = length
+        self.clock = clock
+        self._seeds: Dict[Tuple[datetime.date, str], int] = {}
+        self._words: Dict[Tuple[datetime.date, str, int], Tuple[str, ...]] = {}
+        self._lock = threading.Lock()
+        self.precomputed_on: Optional[datetime.date] = None
+
+    def today(self) -> datetime.date:
+        return challenge_day(self.clock())
+
+    def seed(self, day: datetime.date, level: str) -> int:
+        seed = self._seeds.get((day, level))
+        if seed is None:
+            seed = self._seeds[(day, level)] = daily_seed(day, level, self.secret)
+        return seed
+
+    def todays_seed(self, level: str) -> int:
+        """Return the seed of today's challenge, precomputing once a day."""
+        today = self.today()
+        if self.precomputed_on != today:
+            self.precompute()
+        return self.seed(today, level)
+
+    def new_game(self, level: str, day: Optional[datetime.date] = None) -> GameEngine:
+        """Start a game playing the level's challenge for day (default today)."""
+        return GameEngine(level, self.seed(day or self.today(), level))
+
+    def day_of(self, engine: GameEngine) -> Optional[datetime.date]:
+        """Return the day of the challenge engine plays, if it plays one."""
+        today = self.today()
+        # A game started before midnight carries on into the next day
+        for day in (today, today - datetime.timedelta(days=1)):
+            if engine.word_bag.seed == self.seed(day, engine.level):
+                return day
+        return None
+
+    def words(self, day: datetime.date, level: str) -> Tuple[str, ...]:
+        """Return the words a level's challenge draws on day, in order."""
+        checksum = get_word_manager().get_index(level).checksum
+        key = (day, level, checksum)
+        words = self._words.get(key)
+        if words is None:
+            bag = new_shuffle_bag(level, self.seed(day, level))
+            words = tuple(get_word_from_bag(level, bag) for _ in range(self.length))
+            with self._lock:
+                self._words[key] = words
+        return words
+
+    def precompute(self, days: int = PRECOMPUTE_DAYS):
+        """Compute the coming days' schedules and drop those already past."""
+        today = self.today()
+        yesterday = today - datetime.timedelta(days=1)
+        with self._lock:
+            for key in [key for key in self._words if key[0] < yesterday]:
+                del self._words[key]
+            self._seeds = {
+                key: seed for key, seed in self._seeds.items() if key[0] >= yesterday
+            }
+        for offset in range(days):
+            for level in DIFFICULTY_LEVELS:
+                self.words(today + datetime.timedelta(days=offset), level)
+        self.precomputed_on = today
+
+
+class DailyStats(BackgroundFlusher):
+    """
+    Per-word counters of the recent challenges.
+
+    Without db_path the counters only live in memory. With it, changes
+    are added into the database every flush_interval seconds.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        length: int = SCHEDULE_LENGTH,
+        flush_interval: float = 5.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.db_path = db_path
+        self.length = length
+        self.flush_interval = flush_interval
+        self.clock = clock
+        super().__init__(flush_interval, "daily-stats")
+        # Counters not yet added into the database, or all of them without one
+        self._pending: Dict[StatsKey, array] = {}
+        self._flush_lock = threading.Lock()
+
+        if db_path:
+            directory = os.path.dirname(os.path.abspath(db_path))
+            os.makedirs(directory, exist_ok=True)
+            self._connect().close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return connect_wal(
+            self.db_path,
+            "CREATE TABLE IF NOT EXISTS daily_stats ("
+            "day TEXT NOT NULL, level TEXT NOT NULL, counters BLOB NOT NULL, "
+            "PRIMARY KEY (day, level))",
+        )
+
+    def _new_counters(self) -> array:
+        return array("Q", bytes(8 * self.length * _WORD_COUNTERS))
+
+    def record_solved(
+        self, day: datetime.date, level: str, position: int, guesses: int
+    ):
+        self._add(day, level, position, _SOLVED, min(guesses, _GUESS_BINS - 1))
+
+    def record_failed(self, day: datetime.date, level: str, position: int):
+        self._add(day, level, position, _FAILED)
+
+    def _add(
+        self,
+        day: datetime.date,
+        level: str,
+        position: int,
+        outcome: int,
+        guesses: Optional[int] = None,
+    ):
+        if not 0 <= position < self.length:
+            return
+        key = (day.isoformat(), level)
+        offset = position * _WORD_COUNTERS
+        with self._lock:
+            if self.db_path:
+                self._start_flusher()
+            counters = self._pending.get(key)
+            if counters is None:
+                self._prune(day)
+                counters = self._pending[key] = self._new_counters()
+            counters[offset + outcome] += 1
+            if guesses is not None:
+                counters[offset + 2 + guesses] += 1
+
+    def _prune(self, day: datetime.date):
+        """Drop counters older than the day before day."""
+        if self.db_path:
+            # Buffered counters are flushed, not dropped
+            return
+        oldest = (day - datetime.timedelta(days=1)).isoformat()
+        for key in [key for key in self._pending if key[0] < oldest]:
+            del self._pending[key]
+
+    def flush(self):
+        """Add the buffered counters into the database."""
+        if not self.db_path:
+            return
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            if not pending:
+                return
+
+            try:
+                self._add_into_database(pending)
+            except Exception:
+                # Keep the counters for the next flush
+                with self._lock:
+                    for key, counters in pending.items():
+                        current = self._pending.get(key)
+                        if current is None:
+                            self._pending[key] = counters
+                        else:
+                            for index, count in enumerate(counters):
+                                current[index] += count
+                raise
+
+    def _add_into_database(self, pending: Dict[StatsKey, array]):
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                for (day, level), counters in pending.items():
+                    totals = self._stored(conn, day, level)
+                    for index, count in enumerate(counters):
+                        totals[index] += count
+                    conn.execute(
+                        "INSERT OR REPLACE INTO daily_stats VALUES (?, ?, ?)",
+                        (day, level, totals.tobytes()),
+                    )
+        finally:
+            conn.close()
+
+    def _stored(self, conn: sqlite3.Connection, day: str, level: str) -> array:
+        row = conn.execute(
+            "SELECT counters FROM daily_stats WHERE day = ? AND level = ?",
+            (day, level),
+        ).fetchone()
+        counters = self._new_counters()
+        if row is not None:
+            stored = array("Q")
+            stored.frombytes(row[0])
+            counters[: len(stored)] = stored[: len(counters)]
+        return counters
+
+    def counters(self, day: datetime.date, level: str) -> array:
+        """Return every counter of a level's challenge on day."""
+        key = (day.isoformat(), level)
+        if self.db_path:
+            conn = self._connect()
+            try:
+                totals = self._stored(conn, *key)
+            finally:
+                conn.close()
+        else:
+            totals = self._new_counters()
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is not None:
+                for index, count in enumerate(pending):
+                    totals[index] += count
+        return totals
+
+    def summary(self, day: datetime.date, level: str) -> List[Dict[str, Any]]:
+        """Return each scheduled word's players, solve rate and guesses."""
+        counters = self.counters(day, level)
+        words = []
+        for position in range(self.length):
+            offset = position * _WORD_COUNTERS
+            solved, failed = counters[offset + _SOLVED], counters[offset + _FAILED]
+            if not solved + failed:
+                break
+            guesses = counters[offset + 2 : offset + _WORD_COUNTERS]
+            words.append(
+                {
+                    "position": position,
+                    "players": solved + failed,
+                    "solved": solved,
+                    "solve_rate": solved / (solved + failed),
+                    "guesses": {
+                        count: players
+                        for count, players in enumerate(guesses)
+                        if players
+                    },
+                }
+            )
+        return words
+
+    def close(self):
+        """Stop the flush thread and add what is left into the database."""
+        self._stop_flusher()
+        self.flush()
+
+    def _reset_after_fork(self):
+        # The parent's counters are the parent's to add
+        super()._reset_after_fork()
+        self._pending = {}
+        self._flush_lock = threading.Lock()
+
+
+class DailyTracker:
+    """
+    Counts a daily game's solved and failed words as it is played.
+
+    Installed as the engine's recorder while a request or connection
+    plays the game, passing every event on to the recorder it replaced.
+    """
+
+    __slots__ = (
+        "stats",
+        "day",
+        "engine",
+        "forward",
+        "position",
+        "guesses",
+        "finished",
+    )
+
+    def __init__(self, stats: DailyStats, day: datetime.date, engine: GameEngine):
+        self.stats = stats
+        self.day = day
+        self.engine = engine
+        self.forward: Optional[Recorder] = engine.recorder
+        # The bag has drawn one word per word played
+        self.position = engine.word_bag.cursor - 1
+        self.guesses = len(engine.guessed_letters)
+        self.finished = engine.check_game_over()
+        engine.recorder = self
+
+    def __call__(self, event: int, value: Any):
+        if self.forward is not None:
+            self.forward(event, value)
+        if event == EVENT_GUESS:
+            self.guesses += 1
+        elif event == EVENT_WORD_COMPLETED:
+            self.stats.record_solved(
+                self.day, self.engine.level, self.position, self.guesses
+            )
+            self.position += 1
+            self.guesses = 0
+
+    def check(self):
+        """Count the current word as failed if the game has just been lost."""
+        if not self.finished and self.engine.check_game_over():
+            self.stats.record_failed(self.day, self.engine.level, self.position)
+            self.finished = True
+
+    def detach(self):
+        """Check the game once more and restore the replaced recorder."""
+        self.check()
+        self.engine.recorder = self.forward
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m src.core.daily_challenge",
+        description="Show the words of upcoming daily challenges.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    schedule = commands.add_parser("schedule", help="print a level's daily words")
+    schedule.add_argument("level", choices=list(DIFFICULTY_LEVELS))
+    schedule.add_argument("--days", type=int, default=1)
+    schedule.add_argument("--words", type=int, default=5, help="words per day")
+    args = parser.parse_args(argv)
+
+    # Schedules are keyed with the app's secret, as in the web app
+    secret = os.environ.get("HANGMAN_SECRET_KEY", "dev").encode()
+    daily = DailySchedule(secret)
+    today = daily.today()
+    for offset in range(args.days):
+        day = today + datetime.timedelta(days=offset)
+        words = daily.words(day, args.level)[: args.words]
+        print(f"{day.isoformat()}: {', '.join(words)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Dictionary Watcher
+
+Background polling of dictionary files so edits are picked up without
+restarting workers. A single daemon thread compares file modification
+times and sizes, and asks the WordManager to rebuild and swap in the
+index of any level whose file changed. A file that fails to load, for
+example while it is being written, keeps the previous dictionary in
+service until the file changes again.
+"""
+
+import logging
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from .word_manager import ReloadStats, WordManager
+
+logger = logging.getLogger(__name__)
+
+
+class DictionaryWatcher:
+    def __init__(self, word_manager: WordManager, interval: float = 2.0):
+        self.word_manager = word_manager
+        self.interval = interval
+        self._signatures: Dict[str, Optional[Tuple[int, int]]] = {
+            level: self._signature(path)
+            for level, path in word_manager.dictionary_paths.items()
+        }
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _signature(path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def check(self) -> List[ReloadStats]:
+        """
+        Reload every level whose dictionary changed since the last check.
+
+        Errors from a reload are raised after the file's new signature is
+        recorded, so a broken file is only retried once it changes again.
+        """
+        reloaded = []
+        for level, path in self.word_manager.dictionary_paths.items():
+            signature = self._signature(path)
+            if signature is None or signature == self._signatures.get(level):
+                # Missing files keep serving the last good dictionary
+                continue
+
+            self._signatures[level] = signature
+            reloaded.append(self.word_manager.reload(level))
+        return reloaded
+
+    def start(self):
+        if self._thread is not None:
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="dictionary-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.check()
+            except Exception:  # Logged so one bad file cannot stop the thread
+                logger.exception("Dictionary reload failed")
@@ -0,0 +1,238 @@
+"""
+Difficulty Scoring
+
+Offline pipeline scoring every dictionary entry by how hard it is for
+the reference solver (src.core.solver): the wrong guesses it makes
+before the word is solved, which folds in letter rarity, repeated
+letters and how many other entries share the word's pattern.
+
+Entries are scored in parallel across a process pool. A solver's
+candidates only ever come from entries of the same length, so a rebuild
+keeps the previous score of every entry whose length group is unchanged
+and re-scores the rest.
+
+Usage: python -m src.core.difficulty build
+"""
+
+import argparse
+import multiprocessing
+import os
+import time
+import zlib
+from array import array
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from .difficulty_scores import ScoredLevel, read_scores, word_hash, write_scores
+from .solver import CandidateIndex, HangmanSolver
+from .word_manager import WordManager
+from .word_pack import to_little_endian
+from ..utils.constants import DIFFICULTY_LEVELS, UNDERSCORE_PLACEHOLDER, VALID_LETTERS
+
+# Charged per guess on top of the wrong guesses; at most 26 guesses keeps
+# the total below one, so it only orders words with equal misses
+_GUESS_WEIGHT = 1 / (len(VALID_LETTERS) + 1)
+
+# Entries handed to a worker at a time
+_CHUNK_SIZE = 256
+
+
+class ScoreStats(NamedTuple):
+    """Summary reported for each level after a build."""
+
+    level: str
+    entries: int
+    rescored: int  # entries scored in this build rather than kept
+    duration: float  # seconds
+
+
+def score_word(solver: HangmanSolver, word: str) -> float:
+    """
+    Return how hard word is for solver.
+
+    The score is the number of wrong guesses the solver makes before every
+    letter is revealed, plus a fraction per guess so that, among words with
+    equally many misses, those needing more guesses rank harder.
+    """
+    word = word.upper()
+    display = [" " if char == " " else UNDERSCORE_PLACEHOLDER for char in word]
+    hidden = set(word) & set(VALID_LETTERS)
+    candidates = solver.candidates("".join(display))
+    guessed: List[str] = []
+    wrong_guesses = 0
+    while hidden:
+        letter = solver.next_guess(candidates, guessed)
+        guessed.append(letter)
+        if letter in hidden:
+            hidden.discard(letter)
+            for position, char in enumerate(word):
+                if char == letter:
+                    display[position] = char
+        else:
+            wrong_guesses += 1
+        candidates = candidates.refine(letter, "".join(display))
+    return wrong_guesses + len(guessed) * _GUESS_WEIGHT
+
+
+def _group_digests(words: Sequence[str], hashes: array) -> Dict[int, int]:
+    """Return a digest of the distinct entries of each word length."""
+    groups: Dict[int, set] = {}
+    for word, hashed in zip(words, hashes):
+        groups.setdefault(len(word), set()).add(hashed)
+    return {
+        length: zlib.crc32(to_little_endian(array("I", sorted(group))))
+        for length, group in groups.items()
+    }
+
+
+# Solver and entries of the level being scored, set in each worker
+_worker_solver: Optional[HangmanSolver] = None
+_worker_words: Sequence[str] = ()
+
+
+def _init_worker(solver: HangmanSolver, words: Sequence[str]):
+    global _worker_solver, _worker_words
+    _worker_solver = solver
+    _worker_words = words
+
+
+def _score_chunk(positions: List[int]) -> List[Tuple[int, float]]:
+    return [
+        (position, score_word(_worker_solver, _worker_words[position]))
+        for position in positions
+    ]
+
+
+def _score_positions(
+    words: List[str], positions: List[int], processes: int
+) -> Iterator[Tuple[int, float]]:
+    chunks = [
+        positions[start : start + _CHUNK_SIZE]
+        for start in range(0, len(positions), _CHUNK_SIZE)
+    ]
+    if not chunks:
+        return
+
+    # Built once here; forked workers inherit it instead of rebuilding it
+    solver = HangmanSolver(CandidateIndex(words))
+    if processes == 1 or len(chunks) == 1:
+        _init_worker(solver, words)
+        results = map(_score_chunk, chunks)
+    else:
+        with multiprocessing.Pool(
+            processes, initializer=_init_worker, initargs=(solver, words)
+        ) as pool:
+            results = list(pool.imap_unordered(_score_chunk, chunks))
+    for chunk in results:
+        yield from chunk
+
+
+def score_level(
+    words: Sequence[str],
+    checksum: int,
+    previous: Optional[ScoredLevel] = None,
+    processes: Optional[int] = None,
+) -> Tuple[ScoredLevel, int]:
+    """
+    Score every entry of a dictionary.
+
+    Scores from previous are kept for entries whose length group has the
+    same entries as before. Returns the scored level and the number of
+    entries that had to be scored.
+    """
+    words = [word.upper() for word in words]
+    hashes = array("I", (word_hash(word) for word in words))
+    digests = _group_digests(words, hashes)
+
+    kept_scores: Dict[int, float] = {}
+    unchanged = set()
+    if previous is not None:
+        unchanged = {
+            length
+            for length, digest in zip(previous.group_lengths, previous.group_digests)
+            if digests.get(length) == digest
+        }
+        kept_scores = dict(zip(previous.hashes, previous.scores))
+
+    scores = array("f", bytes(4 * len(words)))
+    pending = []
+    for position, word in enumerate(words):
+        kept = kept_scores.get(hashes[position])
+        if kept is not None and len(word) in unchanged:
+            scores[position] = kept
+        else:
+            pending.append(position)
+
+    processes = processes or os.cpu_count() or 1
+    for position, score in _score_positions(words, pending, processes):
+        scores[position] = score
+
+    lengths = sorted(digests)
+    scored = ScoredLevel(
+        checksum=checksum,
+        group_lengths=array("H", lengths),
+        group_digests=array("I", (digests[length] for length in lengths)),
+        hashes=hashes,
+        scores=scores,
+    )
+    return scored, len(pending)
+
+
+def build_scores(
+    manager: WordManager,
+    output_path: Optional[str] = None,
+    processes: Optional[int] = None,
+) -> List[ScoreStats]:
+    """
+    Score every level's dictionary and write the scores file.
+
+    An existing file at the output path (by default manager.scores_path)
+    is used to skip entries whose scores are still valid.
+    """
+    output_path = output_path or manager.scores_path
+    try:
+        previous = read_scores(output_path)
+    except (OSError, ValueError):
+        previous = {}
+
+    levels = {}
+    stats = []
+    for level in DIFFICULTY_LEVELS:
+        start = time.perf_counter()
+        index = manager.get_index(level)
+        levels[level], rescored = score_level(
+            index.words, index.checksum, previous.get(level), processes
+        )
+        stats.append(
+            ScoreStats(level, len(index), rescored, time.perf_counter() - start)
+        )
+
+    write_scores(output_path, levels)
+    return stats
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m src.core.difficulty",
+        description="Score dictionary entries by solver difficulty.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser(
+        "build", help="score every entry and write the difficulty scores file"
+    )
+    build.add_argument("--dictionary-dir", help="directory holding the dictionaries")
+    build.add_argument("--output", help="scores file to write")
+    build.add_argument("--processes", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        manager = WordManager(dictionary_dir=args.dictionary_dir)
+        for stats in build_scores(manager, args.output, args.processes):
+            print(
+                f"{stats.level}: {stats.entries} entries, "
+                f"{stats.rescored} scored in {stats.duration:.2f} s"
+            )
+        print(f"Wrote {args.output or manager.scores_path}")
+
+
+if __name__ == "__main__":
+    main()
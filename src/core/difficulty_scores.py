@@ -0,0 +1,147 @@
+"""
+Difficulty Scores
+
+Binary sidecar holding a difficulty score for every dictionary entry,
+built offline by src.core.difficulty, and the ranking used to draw words
+from a range of score percentiles.
+
+Layout (little-endian): a header with magic, version, level count and a
+CRC-32 of the body, then one section per level with its name, the
+checksum and entry count of the dictionary it was scored against, a
+digest per word length of the entries with that length, and per entry
+(in dictionary order) the CRC-32 of the word and its float32 score.
+The hashes and digests let a rebuild keep the scores that are still
+valid after the dictionary changes.
+"""
+
+import math
+import random
+import struct
+import zlib
+from array import array
+from typing import Dict, NamedTuple, Tuple
+
+from .word_pack import from_little_endian, to_little_endian
+
+SCORES_FILENAME = "difficulty.scores"
+_SCORES_MAGIC = b"HGDS"
+_SCORES_VERSION = 1
+_SCORES_HEADER = struct.Struct("<4sHHI")
+_LEVEL_HEADER = struct.Struct("<III")
+_NAME_LENGTH = struct.Struct("<H")
+
+
+class ScoredLevel(NamedTuple):
+    """One level's per-entry difficulty scores."""
+
+    checksum: int  # WordIndex.checksum of the scored dictionary
+    group_lengths: array  # word lengths present in the dictionary
+    group_digests: array  # digest of the entries of each of those lengths
+    hashes: array  # CRC-32 of each entry
+    scores: array  # float32 score of each entry, higher is harder
+
+
+def write_scores(path: str, levels: Dict[str, ScoredLevel]):
+    """Write levels to a scores file at path."""
+    body = bytearray()
+    for name, level in levels.items():
+        encoded_name = name.encode("utf-8")
+        body += _NAME_LENGTH.pack(len(encoded_name)) + encoded_name
+        body += _LEVEL_HEADER.pack(
+            level.checksum, len(level.scores), len(level.group_lengths)
+        )
+        for values in (
+            level.group_lengths,
+            level.group_digests,
+            level.hashes,
+            level.scores,
+        ):
+            body += to_little_endian(values)
+
+    header = _SCORES_HEADER.pack(
+        _SCORES_MAGIC, _SCORES_VERSION, len(levels), zlib.crc32(body)
+    )
+    with open(path, "wb") as file:
+        file.write(header)
+        file.write(body)
+
+
+def read_scores(path: str) -> Dict[str, ScoredLevel]:
+    """Read and verify a scores file, raising ValueError if it is invalid."""
+    with open(path, "rb") as file:
+        data = file.read()
+
+    if len(data) < _SCORES_HEADER.size:
+        raise ValueError(f"Truncated difficulty scores: {path}")
+    magic, version, level_count, checksum = _SCORES_HEADER.unpack_from(data)
+    if magic != _SCORES_MAGIC or version != _SCORES_VERSION:
+        raise ValueError(f"Unsupported difficulty scores: {path}")
+    body = memoryview(data)[_SCORES_HEADER.size :]
+    if zlib.crc32(body) != checksum:
+        raise ValueError(f"Corrupt difficulty scores: {path}")
+
+    levels = {}
+    offset = 0
+    for _ in range(level_count):
+        (name_length,) = _NAME_LENGTH.unpack_from(body, offset)
+        offset += _NAME_LENGTH.size
+        name = bytes(body[offset : offset + name_length]).decode("utf-8")
+        offset += name_length
+
+        level_checksum, count, group_count = _LEVEL_HEADER.unpack_from(body, offset)
+        offset += _LEVEL_HEADER.size
+
+        arrays = []
+        for typecode, length in (
+            ("H", group_count),
+            ("I", group_count),
+            ("I", count),
+            ("f", count),
+        ):
+            end = offset + length * array(typecode).itemsize
+            arrays.append(from_little_endian(typecode, body[offset:end]))
+            offset = end
+
+        levels[name] = ScoredLevel(level_checksum, *arrays)
+    return levels
+
+
+def word_hash(word: str) -> int:
+    return zlib.crc32(word.encode("utf-8"))
+
+
+class DifficultyRanking:
+    """
+    A level's selection pool ordered from easiest to hardest entry.
+
+    The order is built once per dictionary, so drawing a word from any
+    percentile range is a single random index into it.
+    """
+
+    def __init__(self, scores: array, pool: array):
+        self.scores = scores
+        self.ranked = array("I", sorted(pool, key=scores.__getitem__))
+
+    def __len__(self) -> int:
+        return len(self.ranked)
+
+    def percentile_slice(self, low: float, high: float) -> Tuple[int, int]:
+        """Return the [start, end) range of ranked covering low-high percent."""
+        if not 0 <= low < high <= 100:
+            raise ValueError(
+                f"Invalid percentile range: {low}-{high}. "
+                "Must be 0 <= low < high <= 100"
+            )
+        if not self.ranked:
+            raise ValueError("No dictionary entries to rank")
+
+        size = len(self.ranked)
+        start = min(int(low * size / 100), size - 1)
+        # Narrow ranges still hold at least one entry
+        end = max(math.ceil(high * size / 100), start + 1)
+        return start, end
+
+    def random_position(self, low: float = 0, high: float = 100) -> int:
+        """Return the dictionary position of a random entry in the range."""
+        start, end = self.percentile_slice(low, high)
+        return self.ranked[random.randrange(start, end)]
@@ -0,0 +1,330 @@
+"""
+Event Log
+
+Append-only record of every game's history, one segment file per writing
+process. Replaying a game's events rebuilds its state.
+
+Usage: python -m src.core.event_log replay /var/log/hangman --game-id ID
+"""
+
+import argparse
+import functools
+import glob
+import heapq
+import json
+import os
+import struct
+import sys
+import threading
+import time
+import zlib
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from .background import BackgroundFlusher
+from .game_engine import (
+    EVENT_GUESS,
+    EVENT_TIMEOUT,
+    EVENT_WORD_COMPLETED,
+    GameEngine,
+    Recorder,
+)
+from ..utils.constants import DIFFICULTY_LEVELS
+
+EVENT_GAME_STARTED = 0
+
+# When written records are forced to disk: after every batch, at most
+# once per fsync interval, or whenever the OS flushes them
+FSYNC_POLICIES = ("batch", "interval", "never")
+
+# A segment is a header then records of payload length and CRC-32, event
+# type, timestamp and game id; reading stops at a torn or corrupt record
+SEGMENT_PATTERN = "events-{}.log"
+_LOG_MAGIC = b"HGEL"
+_LOG_VERSION = 1
+_LOG_HEADER = struct.Struct("<4sHH")
+_RECORD_HEADER = struct.Struct("<II")
+_EVENT_HEADER = struct.Struct("<BdB")
+_GAME_STARTED = struct.Struct("<BQ")
+_TIMEOUTS = struct.Struct("<B")
+_LEVELS = list(DIFFICULTY_LEVELS)
+
+
+class Event(NamedTuple):
+    """One change to one game."""
+
+    event: int  # EVENT_* type
+    timestamp: float  # Unix seconds
+    game_id: str
+    # (level, word bag seed, word) for a started game, the guessed letter,
+    # the next word after a completed one, or the number of timeouts
+    value: Any
+
+
+def encode_event(event: Event) -> bytes:
+    """Encode an event as one length-prefixed record."""
+    if event.event == EVENT_GAME_STARTED:
+        level, seed, word = event.value
+        value = _GAME_STARTED.pack(_LEVELS.index(level), seed) + word.encode("utf-8")
+    elif event.event == EVENT_TIMEOUT:
+        value = _TIMEOUTS.pack(event.value)
+    else:
+        value = event.value.encode("utf-8")
+
+    game_id = event.game_id.encode("utf-8")
+    payload = (
+        _EVENT_HEADER.pack(event.event, event.timestamp, len(game_id)) + game_id + value
+    )
+    return _RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def decode_event(payload: bytes) -> Event:
+    """Decode the payload of a record written by encode_event()."""
+    event, timestamp, id_length = _EVENT_HEADER.unpack_from(payload)
+    offset = _EVENT_HEADER.size
+    game_id = bytes(payload[offset : offset + id_length]).decode("utf-8")
+    offset += id_length
+
+    if event == EVENT_GAME_STARTED:
+        level_id, seed = _GAME_STARTED.unpack_from(payload, offset)
+        word = bytes(payload[offset + _GAME_STARTED.size :]).decode("utf-8")
+        value: Any = (_LEVELS[level_id], seed, word)
+    elif event == EVENT_TIMEOUT:
+        (value,) = _TIMEOUTS.unpack_from(payload, offset)
+    else:
+        value = bytes(payload[offset:]).decode("utf-8")
+    return Event(event, timestamp, game_id, value)
+
+
+def read_segment(path: str, game_id: Optional[str] = None) -> Iterator[Event]:
+    """
+    Yield the events of one segment in the order they were written.
+
+    With game_id set, only that game's events are decoded and yielded.
+    Raises ValueError if the file is not an event log segment.
+    """
+    with open(path, "rb") as file:
+        data = memoryview(file.read())
+
+    # The header goes out with the first batch, so a shorter file was cut
+    # off before any event was written
+    if len(data) < _LOG_HEADER.size:
+        return
+    magic, version, _ = _LOG_HEADER.unpack_from(data)
+    if magic != _LOG_MAGIC or version != _LOG_VERSION:
+        raise ValueError(f"Unsupported event log segment: {path}")
+
+    wanted = None if game_id is None else game_id.encode("utf-8")
+    id_start = _EVENT_HEADER.size
+    offset = _LOG_HEADER.size
+    while offset + _RECORD_HEADER.size <= len(data):
+        length, checksum = _RECORD_HEADER.unpack_from(data, offset)
+        start = offset + _RECORD_HEADER.size
+        offset = start + length
+        payload = data[start:offset]
+        if offset > len(data) or zlib.crc32(payload) != checksum:
+            return
+        if wanted is not None and (
+            payload[id_start - 1] != len(wanted)
+            or payload[id_start : id_start + len(wanted)] != wanted
+        ):
+            continue
+        yield decode_event(payload)
+
+
+def read_log(directory: str, game_id: Optional[str] = None) -> Iterator[Event]:
+    """Yield the events of every segment in a log, merged by timestamp."""
+    paths = sorted(glob.glob(os.path.join(directory, SEGMENT_PATTERN.format("*"))))
+    return heapq.merge(
+        *(read_segment(path, game_id) for path in paths),
+        key=lambda event: event.timestamp,
+    )
+
+
+def apply_event(engine: GameEngine, event: int, value: Any):
+    """Apply one recorded change to a game."""
+    if event == EVENT_GUESS:
+        engine.guess_letter(value)
+    elif event == EVENT_WORD_COMPLETED:
+        engine.process_word_completion()
+        # Drawn from a dictionary that has since changed
+        if engine.word != value:
+            engine.word = value
+    elif event == EVENT_TIMEOUT:
+        for _ in range(value):
+            engine.apply_timeout()
+
+
+def replay(
+    events: Iterable[Event], game_id: Optional[str] = None
+) -> Dict[str, GameEngine]:
+    """
+    Rebuild games from their events, or only game_id's game when given.
+
+    Games whose start is not among the events, such as those begun before
+    the oldest segment kept, are left out.
+    """
+    games: Dict[str, GameEngine] = {}
+    for event in events:
+        if game_id is not None and event.game_id != game_id:
+            continue
+
+        if event.event == EVENT_GAME_STARTED:
+            level, seed, word = event.value
+            engine = GameEngine(level, seed)
+            if engine.word != word:
+                engine.word = word
+            games[event.game_id] = engine
+            continue
+
+        engine = games.get(event.game_id)
+        if engine is not None:
+            apply_event(engine, event.event, event.value)
+    return games
+
+
+class EventLog(BackgroundFlusher):
+    """
+    Buffered writer appending game events to a log directory.
+
+    The buffer is written out every flush_interval seconds, or once it
+    holds max_buffer bytes, and forced to disk as the fsync policy says.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        fsync: str = "interval",
+        flush_interval: float = 0.05,
+        fsync_interval: float = 1.0,
+        max_buffer: int = 1 << 16,
+        clock: Callable[[], float] = time.time,
+    ):
+        if fsync not in FSYNC_POLICIES:
+            choices = ", ".join(FSYNC_POLICIES)
+            raise ValueError(f"Invalid fsync policy: {fsync}. Must be one of {choices}")
+
+        self.directory = directory
+        self.fsync = fsync
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+        self.max_buffer = max_buffer
+        self.clock = clock
+        self.path: Optional[str] = None
+
+        # _write_lock orders whole batches; _lock guards the buffer
+        super().__init__(flush_interval, "event-log")
+        self._write_lock = threading.Lock()
+        self._buffer: List[bytes] = []
+        self._buffered = 0
+        self._file = None
+        self._last_fsync = 0.0
+
+    def append(self, game_id: str, event: int, value: Any):
+        """Buffer an event for writing."""
+        with self._lock:
+            # Stamped under the lock, so each segment is in timestamp order
+            record = encode_event(Event(event, self.clock(), game_id, value))
+            self._start_flusher()
+            self._buffer.append(record)
+            self._buffered += len(record)
+            if self._buffered >= self.max_buffer:
+                self._wake.set()
+
+    def game_started(self, game_id: str, engine: GameEngine):
+        """Record a new game with what is needed to rebuild it."""
+        self.append(
+            game_id,
+            EVENT_GAME_STARTED,
+            (engine.level, engine.word_bag.seed, engine.word),
+        )
+
+    def recorder(self, game_id: str) -> Recorder:
+        """Return a GameEngine.recorder appending the game's events."""
+        return functools.partial(self.append, game_id)
+
+    def record_timeout(self, game_id: str, engine: GameEngine, result: Dict[str, Any]):
+        """GuessTimer listener recording timeouts of games not being recorded."""
+        # Games with a recorder already recorded each lost life
+        if engine.recorder is None:
+            self.append(game_id, EVENT_TIMEOUT, result["timeouts"])
+
+    def flush(self):
+        """Write out everything buffered so far."""
+        with self._write_lock:
+            with self._lock:
+                records, self._buffer, self._buffered = self._buffer, [], 0
+            if not records:
+                return
+
+            if self._file is None:
+                os.makedirs(self.directory, exist_ok=True)
+                name = SEGMENT_PATTERN.format(f"{time.time_ns()}-{os.getpid()}")
+                self.path = os.path.join(self.directory, name)
+                self._file = open(self.path, "ab")
+                records.insert(0, _LOG_HEADER.pack(_LOG_MAGIC, _LOG_VERSION, 0))
+            self._file.write(b"".join(records))
+            self._file.flush()
+
+            now = time.monotonic()
+            if self.fsync == "batch" or (
+                self.fsync == "interval"
+                and now - self._last_fsync >= self.fsync_interval
+            ):
+                os.fsync(self._file.fileno())
+                self._last_fsync = now
+
+    def close(self):
+        """Stop the writer thread, then write and sync what is left."""
+        self._stop_flusher()
+        self.flush()
+        with self._write_lock:
+            if self._file is not None:
+                if self.fsync != "never":
+                    os.fsync(self._file.fileno())
+                self._file.close()
+                self._file = None
+
+    def _reset_after_fork(self):
+        # The parent's buffer and segment stay with the parent
+        super()._reset_after_fork()
+        self._buffer, self._buffered = [], 0
+        self._file = None
+        self.path = None
+        self._write_lock = threading.Lock()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m src.core.event_log",
+        description="Inspect and replay the game event log.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    replay_command = commands.add_parser(
+        "replay", help="rebuild games from the log and print their state"
+    )
+    replay_command.add_argument("directory", help="event log directory")
+    replay_command.add_argument("--game-id", help="only rebuild this game")
+    args = parser.parse_args(argv)
+
+    if args.command == "replay":
+        start = time.perf_counter()
+        events = 0
+
+        def counted(log: Iterable[Event]) -> Iterator[Event]:
+            nonlocal events
+            for event in log:
+                events += 1
+                yield event
+
+        games = replay(counted(read_log(args.directory, args.game_id)), args.game_id)
+        duration = time.perf_counter() - start
+        for game_id, engine in games.items():
+            print(json.dumps({"game_id": game_id, **engine.get_game_state()}))
+        print(
+            f"Replayed {events} events into {len(games)} games in {duration:.3f} s",
+            file=sys.stderr,
+        )
+
+
+if __name__ == "__main__":
+    main()
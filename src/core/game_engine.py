@@ -4,35 +4,133 @@ Game Engine
 Core hangman game mechanics and state management.
 """
 
-from typing import Dict, Any
-from .word_manager import get_random_word
-from ..utils.constants import MAX_LIVES, GAME_MESSAGES
-from ..utils.display_formatter import format_word_display, format_lives_display
+import math
+import struct
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from .word_manager import (
+    get_word_at,
+    get_word_from_bag,
+    locate_word,
+    new_shuffle_bag,
+)
+from ..utils.constants import (
+    MAX_LIVES,
+    GAME_MESSAGES,
+    TIMER_SECONDS,
+    DIFFICULTY_LEVELS,
+    UNDERSCORE_PLACEHOLDER,
+)
+from ..utils.display_formatter import format_lives_display
+from ..utils.letter_mask import (
+    LETTER_BITS,
+    letter_bit,
+    letters_to_mask,
+)
+
+# Serialized state layout: version, level, lives, flags, score, revision,
+# word bag seed and cursor, dictionary checksum, guess deadline in whole
+# Unix seconds (0 when no timer is running). Followed by a u32 dictionary
+# index, or a u16 length and the word itself when the word is not in the
+# dictionary, and then the guessed letters in the order they were guessed,
+# with a separator where delta tracking last restarted within the word.
+STATE_FORMAT_VERSION = 5
+_STATE_HEADER = struct.Struct("<BBBBIIQIII")
+_WORD_INDEX = struct.Struct("<I")
+_WORD_LENGTH = struct.Struct("<H")
+_FLAG_GAME_OVER = 0x01
+_FLAG_INLINE_WORD = 0x02
+_REBASE_SEPARATOR = "|"
+_LEVELS = list(DIFFICULTY_LEVELS)
+
+# Events passed to GameEngine.recorder as (event, value): a guessed letter,
+# the next word after a completed one, and a life lost to the guess timer
+EVENT_GUESS = 1
+EVENT_WORD_COMPLETED = 2
+EVENT_TIMEOUT = 3
+
+Recorder = Callable[[int, Any], None]
 
 
 class GameEngine:
-    def __init__(self, level: str):
-        if level not in ["basic", "intermediate"]:
-            raise ValueError(
-                f"Invalid level: {level}. Must be 'basic' or 'intermediate'"
-            )
+    # Called with every state change when set; not part of the saved state
+    recorder: Optional[Recorder] = None
+
+    def __init__(self, level: str, seed: Optional[int] = None):
+        if level not in DIFFICULTY_LEVELS:
+            choices = " or ".join(f"'{name}'" for name in DIFFICULTY_LEVELS)
+            raise ValueError(f"Invalid level: {level}. Must be {choices}")
 
         # Game configuration
         self.level = level
-        self.word = get_random_word(level)
+        self.revision = 0
+
+        # Words are drawn without repeats from a bag reproducible from seed
+        self.word_bag = new_shuffle_bag(level, seed)
+        self.word = get_word_from_bag(level, self.word_bag)
 
         # Player progress
         self.guessed_letters = []
         self.wrong_guesses = []
         self.lives = MAX_LIVES
+        if self.recorder is not None:
+            self.recorder(EVENT_WORD_COMPLETED, self.word)
 
         # Game status - continuous play with scoring
         self.game_over = False
         self.score = 0
 
+        # Wall-clock time the next guess is due by; None while no timer runs
+        self.deadline: Optional[float] = None
+
+    # Letters are tracked as 26-bit masks alongside the ordered lists the
+    # API returns, so duplicate, hit and completion checks are integer ops.
+
+    @property
+    def word(self) -> str:
+        return self._word
+
+    @word.setter
+    def word(self, word: str):
+        self._word = word
+        self._rebase()
+        self._word_mask = letters_to_mask(word)
+
+        # Index where each letter occurs so a correct guess only touches
+        # the positions it reveals in the display buffer
+        self._letter_positions: Dict[str, List[int]] = {}
+        for position, char in enumerate(word):
+            if char != " ":
+                self._letter_positions.setdefault(char.upper(), []).append(position)
+        self._rebuild_display()
+
+    @property
+    def guessed_letters(self) -> List[str]:
+        return self._guessed_letters
+
+    @guessed_letters.setter
+    def guessed_letters(self, letters: Iterable[str]):
+        self._guessed_letters = list(letters)
+        self._guessed_mask = letters_to_mask(self._guessed_letters)
+        self._rebuild_display()
+        self._rebase()
+
+    @property
+    def wrong_guesses(self) -> List[str]:
+        return self._wrong_guesses
+
+    @wrong_guesses.setter
+    def wrong_guesses(self, letters: Iterable[str]):
+        self._wrong_guesses = list(letters)
+        self._wrong_mask = letters_to_mask(self._wrong_guesses)
+
+    @property
+    def word_display(self) -> str:
+        """The word with unguessed letters shown as placeholders."""
+        return "".join(self._display)
+
     def get_game_state(self) -> Dict[str, Any]:
         self.game_over = self.check_game_over()
-        word_display = format_word_display(self.word, self.guessed_letters)
+        word_display = self.word_display
         lives_display = format_lives_display(self.lives)
 
         return {
@@ -45,29 +143,262 @@ class GameEngine:
             "level": self.level,
             "word": self.word,  # For answer reveal when game over
             "lives_display": lives_display,
+            "revision": self.revision,
+        }
+
+    def get_state_delta(self, since: int) -> Dict[str, Any]:
+        """
+        Describe what changed since revision `since`.
+
+        Within the current word the delta lists the newly guessed and wrong
+        letters, the positions they revealed and the lives and score deltas.
+        When the client's revision predates the current word (or is unknown)
+        the delta is a reset carrying the full game state instead.
+        """
+        self.game_over = self.check_game_over()
+        if not self._base_revision <= since <= self.revision:
+            return {
+                "revision": self.revision,
+                "since": since,
+                "reset": True,
+                "state": self.get_game_state(),
+            }
+
+        # Each guess since the base advanced the revision by exactly one
+        new_letters = self._guessed_letters[
+            self._base_count + since - self._base_revision :
+        ]
+        wrong = [
+            letter
+            for letter in new_letters
+            if not self._word_mask & LETTER_BITS.get(letter, 0)
+        ]
+        revealed = sorted(
+            (position, self._word[position])
+            for letter in new_letters
+            for position in self._letter_positions.get(letter, ())
+        )
+
+        delta = {
+            "revision": self.revision,
+            "since": since,
+            "reset": False,
+            "guessed": new_letters,
+            "wrong": wrong,
+            "revealed": [[position, char] for position, char in revealed],
+            "lives_delta": -len(wrong),
+            "score_delta": self.score - self._base_score,
+            "game_over": self.game_over,
         }
+        if wrong:
+            delta["lives_display"] = format_lives_display(self.lives)
+        if self.game_over:
+            delta["word"] = self.word  # For answer reveal when game over
+        return delta
 
     def guess_letter(self, letter: str) -> Dict[str, Any]:
         # Convert to uppercase for consistency
         letter = letter.upper()
 
+        # A lost game takes no more guesses
+        if self.lives <= 0:
+            return {
+                "correct": False,
+                "message": GAME_MESSAGES["game_over"].format(self.score),
+            }
+
+        bit = LETTER_BITS.get(letter, 0)
+
         # Check for duplicate guess
-        if letter in self.guessed_letters:
+        if self._guessed_mask & bit or (not bit and letter in self._guessed_letters):
             return {"correct": False, "message": GAME_MESSAGES["duplicate_guess"]}
 
         # Add to guessed letters
-        self.guessed_letters.append(letter)
+        self._guessed_letters.append(letter)
+        self._guessed_mask |= bit
+        self.revision += 1
+        if self.recorder is not None:
+            self.recorder(EVENT_GUESS, letter)
 
         # Check if letter is in word
-        if self._is_letter_in_word(letter):
-            # Correct guess
+        if self._word_mask & bit:
+            # Correct guess - reveal only the positions holding the letter
+            for position in self._letter_positions[letter]:
+                self._display[position] = self._word[position]
             return {"correct": True, "message": GAME_MESSAGES["correct_guess"]}
         else:
-            self.wrong_guesses.append(letter)
-            self.lives -= 1
+            self._wrong_guesses.append(letter)
+            self._wrong_mask |= bit
+            self.lives = max(self.lives - 1, 0)
 
             return {"correct": False, "message": GAME_MESSAGES["wrong_guess"]}
 
+    def guess_letters(self, letters: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Apply a sequence of guesses, processing word completions in between.
+
+        Returns one compact step per applied guess with the letter, whether
+        it was correct or a duplicate, the lives left and, when the guess
+        finished a word, the completed word. Guessing stops once the game
+        is over.
+        """
+        steps = []
+        for letter in letters:
+            if self.lives <= 0:
+                break
+
+            letter = letter.upper()
+            bit = LETTER_BITS.get(letter, 0)
+            duplicate = bool(
+                self._guessed_mask & bit
+                or (not bit and letter in self._guessed_letters)
+            )
+            correct = self.guess_letter(letter)["correct"]
+            step = {
+                "letter": letter,
+                "correct": correct,
+                "duplicate": duplicate,
+                "lives": self.lives,
+            }
+
+            if correct and self._is_word_complete():
+                step["completed_word"] = self.word
+                self.process_word_completion()
+            steps.append(step)
+
+        self.game_over = self.check_game_over()
+        return steps
+
+    def apply_timeout(self) -> Dict[str, Any]:
+        """Charge a life for a guess that was not made in time."""
+        self.lives = max(self.lives - 1, 0)
+        # A lost life with no guessed letter cannot be expressed as a delta
+        self._rebase()
+        if self.recorder is not None:
+            self.recorder(EVENT_TIMEOUT, 1)
+        return {"correct": False, "message": GAME_MESSAGES["timeout"]}
+
+    def start_timer(self, now: float):
+        """Give the player TIMER_SECONDS from now to make the next guess."""
+        self.deadline = None if self.check_game_over() else now + TIMER_SECONDS
+
+    def check_timeout(self, now: float) -> Optional[Dict[str, Any]]:
+        """
+        Charge a life for every guess period that ended by now.
+
+        Returns the timeout result with the number of periods charged, or
+        None if the deadline has not passed. The timer keeps running from
+        the last missed deadline and stops once the game is over.
+        """
+        if self.deadline is None or now < self.deadline:
+            return None
+
+        missed = int((now - self.deadline) // TIMER_SECONDS) + 1
+        timeouts = min(missed, max(self.lives, 0))
+        result = {"correct": False, "message": GAME_MESSAGES["timeout"]}
+        for _ in range(timeouts):
+            result = self.apply_timeout()
+
+        if self.check_game_over():
+            self.deadline = None
+        else:
+            self.deadline += missed * TIMER_SECONDS
+        return {**result, "timeouts": timeouts}
+
+    def to_bytes(self) -> bytes:
+        """
+        Encode the game as a compact byte string.
+
+        The guessed letters are stored in guess order after the word; wrong
+        guesses are derived from them on decode.
+        """
+        flags = _FLAG_GAME_OVER if self.game_over else 0
+        word_index, checksum = locate_word(self.level, self.word)
+        if word_index is None:
+            flags |= _FLAG_INLINE_WORD
+
+        header = _STATE_HEADER.pack(
+            STATE_FORMAT_VERSION,
+            _LEVELS.index(self.level),
+            self.lives,
+            flags,
+            self.score,
+            self.revision,
+            self.word_bag.seed,
+            self.word_bag.cursor,
+            checksum,
+            0 if self.deadline is None else math.ceil(self.deadline),
+        )
+        guesses = "".join(self._guessed_letters)
+        if self._base_count:
+            base = self._base_count
+            guesses = guesses[:base] + _REBASE_SEPARATOR + guesses[base:]
+        guesses = guesses.encode("utf-8")
+        if word_index is not None:
+            return header + _WORD_INDEX.pack(word_index) + guesses
+
+        word = self.word.encode("utf-8")
+        return header + _WORD_LENGTH.pack(len(word)) + word + guesses
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "GameEngine":
+        """Rebuild a game previously encoded with to_bytes()."""
+        version = data[0] if data else None
+        if version != STATE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported game state version: {version}")
+
+        (
+            _,
+            level_id,
+            lives,
+            flags,
+            score,
+            revision,
+            seed,
+            cursor,
+            checksum,
+            deadline,
+        ) = _STATE_HEADER.unpack_from(data)
+        offset = _STATE_HEADER.size
+        level = _LEVELS[level_id]
+        if flags & _FLAG_INLINE_WORD:
+            (length,) = _WORD_LENGTH.unpack_from(data, offset)
+            offset += _WORD_LENGTH.size
+            word = data[offset : offset + length].decode("utf-8")
+            offset += length
+        else:
+            (word_index,) = _WORD_INDEX.unpack_from(data, offset)
+            offset += _WORD_INDEX.size
+            word = get_word_at(level, word_index, checksum)
+        before, _, after = data[offset:].decode("utf-8").rpartition(_REBASE_SEPARATOR)
+        guessed_letters = list(before + after)
+
+        # Bypass __init__ so no random word is drawn
+        engine = cls.__new__(cls)
+        engine.level = level
+        engine.revision = 0
+        engine.word_bag = new_shuffle_bag(level, seed)
+        engine.word_bag.cursor = cursor
+        engine.word = word
+        engine.guessed_letters = guessed_letters
+        engine.wrong_guesses = [
+            letter
+            for letter in guessed_letters
+            if not engine._word_mask & LETTER_BITS.get(letter, 0)
+        ]
+        engine.lives = lives
+        engine.game_over = bool(flags & _FLAG_GAME_OVER)
+        engine.score = score
+        engine.deadline = float(deadline) if deadline else None
+
+        # Guesses after the rebase point are one revision apart, so deltas
+        # keep working across a round trip through bytes
+        engine.revision = revision
+        engine._base_revision = revision - len(after)
+        engine._base_count = len(before)
+        engine._base_score = score
+        return engine
+
     def check_game_over(self) -> bool:
         return self.lives <= 0
 
@@ -89,18 +420,36 @@ class GameEngine:
         if letter == " ":
             return False
 
-        return letter.upper() in self.word.upper()
+        return bool(self._word_mask & letter_bit(letter))
 
     def _is_word_complete(self) -> bool:
         """Check if current word is fully guessed."""
-        for char in self.word:
-            if char != " " and char not in self.guessed_letters:
-                return False
-        return True
+        return not self._word_mask & ~self._guessed_mask
+
+    def _rebuild_display(self):
+        """Rebuild the display buffer from the word and guessed letters."""
+        # During construction the word is set before any guesses exist
+        guessed_mask = getattr(self, "_guessed_mask", 0)
+        self._display = [
+            " " if char == " " else UNDERSCORE_PLACEHOLDER for char in self._word
+        ]
+        for letter, positions in self._letter_positions.items():
+            if guessed_mask & letter_bit(letter):
+                for position in positions:
+                    self._display[position] = self._word[position]
+
+    def _rebase(self):
+        """Bump the revision and start delta tracking from the current state."""
+        self.revision += 1
+        self._base_revision = self.revision
+        self._base_count = len(getattr(self, "_guessed_letters", ()))
+        self._base_score = getattr(self, "score", 0)
 
     def _reset_for_new_word(self):
         """Reset game state for a new word while keeping score."""
-        self.word = get_random_word(self.level)
+        self.word = get_word_from_bag(self.level, self.word_bag)
         self.guessed_letters = []
         self.wrong_guesses = []
         self.lives = MAX_LIVES
+        if self.recorder is not None:
+            self.recorder(EVENT_WORD_COMPLETED, self.word)
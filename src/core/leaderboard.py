@@ -0,0 +1,326 @@
+"""
+Leaderboard
+
+Best final scores per level, all time and for the current day and week
+(UTC), kept in bounded top-K boards and snapshotted to SQLite.
+
+Usage: python -m src.core.leaderboard top leaderboard.db basic --window day
+"""
+
+import argparse
+import bisect
+import functools
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from .background import BackgroundFlusher, connect_wal
+from ..utils.constants import DIFFICULTY_LEVELS
+
+# Results kept per board
+LEADERBOARD_SIZE = 100
+
+# Time windows, each ranking the scores recorded in its current period
+WINDOWS = ("all", "week", "day")
+
+_PERIOD_FORMATS = {"all": "", "week": "%G-W%V", "day": "%Y-%m-%d"}
+_DAY = 24 * 60 * 60
+
+BoardKey = Tuple[str, str, str]
+_SortKey = Tuple[int, float, str]
+
+
+class Result(NamedTuple):
+    """One game's place on a board."""
+
+    score: int
+    recorded_at: float
+    game_id: str
+
+
+@functools.lru_cache(maxsize=64)
+def _periods(day: int) -> Tuple[str, ...]:
+    """Every window's period on a day, counted in days since the epoch."""
+    date = time.gmtime(day * _DAY)
+    return tuple(time.strftime(_PERIOD_FORMATS[window], date) for window in WINDOWS)
+
+
+def period_key(window: str, timestamp: float) -> str:
+    """Return the period of window that timestamp falls in, e.g. 2024-W07."""
+    if window not in _PERIOD_FORMATS:
+        raise ValueError(
+            f"Invalid window: {window}. Must be one of {', '.join(WINDOWS)}"
+        )
+    return _periods(int(timestamp // _DAY))[WINDOWS.index(window)]
+
+
+class TopK:
+    """
+    The best results recorded, sorted best first, up to capacity.
+
+    Each game holds at most one place, so recording the same result
+    again changes nothing.
+    """
+
+    __slots__ = ("capacity", "_keys", "_games", "_results")
+
+    def __init__(self, capacity: int = LEADERBOARD_SIZE):
+        self.capacity = capacity
+        # (-score, recorded_at, game_id), ascending is best first
+        self._keys: List[_SortKey] = []
+        self._games: Dict[str, _SortKey] = {}
+        # The board as Results, built by the first read after a change
+        self._results: Optional[List[Result]] = None
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, score: int, recorded_at: float, game_id: str) -> bool:
+        """Place a result, returning whether the board changed."""
+        keys = self._keys
+        if len(keys) >= self.capacity and -score > keys[-1][0]:
+            # Below the lowest score on a full board
+            return False
+
+        key = (-score, recorded_at, game_id)
+        previous = self._games.get(game_id)
+        if previous is not None:
+            if previous <= key:
+                return False
+            del self._keys[bisect.bisect_left(self._keys, previous)]
+        elif len(self._keys) >= self.capacity and key >= self._keys[-1]:
+            return False
+
+        bisect.insort(self._keys, key)
+        self._games[game_id] = key
+        if len(self._keys) > self.capacity:
+            del self._games[self._keys.pop()[2]]
+        self._results = None
+        return True
+
+    def top(self, limit: Optional[int] = None) -> List[Result]:
+        if self._results is None:
+            self._results = [
+                Result(-negated, recorded_at, game_id)
+                for negated, recorded_at, game_id in self._keys
+            ]
+        return self._results[:limit]
+
+
+class Leaderboard(BackgroundFlusher):
+    """
+    Top scores for every level and window, snapshotted to SQLite.
+
+    Without db_path the boards only live in memory. With it, they are
+    loaded on creation and merged into the database every
+    snapshot_interval seconds, so workers sharing it converge.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        size: int = LEADERBOARD_SIZE,
+        snapshot_interval: float = 30.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.db_path = db_path
+        self.size = size
+        self.snapshot_interval = snapshot_interval
+        self.clock = clock
+
+        super().__init__(snapshot_interval, "leaderboard-snapshot")
+        # Orders whole snapshots, which run outside _lock
+        self._snapshot_lock = threading.Lock()
+        self._boards: Dict[BoardKey, TopK] = {}
+        self._dirty: Set[BoardKey] = set()
+
+        if db_path:
+            directory = os.path.dirname(os.path.abspath(db_path))
+            os.makedirs(directory, exist_ok=True)
+            self.load()
+
+    def _connect(self) -> sqlite3.Connection:
+        return connect_wal(
+            self.db_path,
+            "CREATE TABLE IF NOT EXISTS scores ("
+            "level TEXT NOT NULL, time_window TEXT NOT NULL, period TEXT NOT NULL, "
+            "score INTEGER NOT NULL, recorded_at REAL NOT NULL, "
+            "game_id TEXT NOT NULL, "
+            "PRIMARY KEY (level, time_window, period, game_id))",
+        )
+
+    def record(
+        self, game_id: str, level: str, score: int, recorded_at: Optional[float] = None
+    ) -> bool:
+        """
+        Rank a game's final score on every window's board for its level.
+
+        Games that never completed a word are not ranked. Returns whether
+        any board changed.
+        """
+        if score <= 0:
+            return False
+        if recorded_at is None:
+            recorded_at = self.clock()
+
+        changed = False
+        with self._lock:
+            if self.db_path:
+                self._start_flusher()
+
+            periods = _periods(int(recorded_at // _DAY))
+            for window, period in zip(WINDOWS, periods):
+                key = (level, window, period)
+                board = self._boards.get(key)
+                if board is None:
+                    self._prune(recorded_at)
+                    board = self._boards[key] = TopK(self.size)
+                if board.add(score, recorded_at, game_id):
+                    self._dirty.add(key)
+                    changed = True
+        return changed
+
+    def top(
+        self, level: str, window: str = "all", limit: Optional[int] = None
+    ) -> List[Result]:
+        """Return the best results of the window's current period."""
+        key = (level, window, period_key(window, self.clock()))
+        with self._lock:
+            board = self._boards.get(key)
+            return board.top(limit) if board is not None else []
+
+    def load(self):
+        """Read the stored boards of the current periods."""
+        now = self.clock()
+        conn = self._connect()
+        try:
+            rows = []
+            for window in WINDOWS:
+                rows += conn.execute(
+                    "SELECT level, time_window, period, score, recorded_at, game_id "
+                    "FROM scores WHERE time_window = ? AND period = ?",
+                    (window, period_key(window, now)),
+                ).fetchall()
+        finally:
+            conn.close()
+
+        with self._lock:
+            for level, window, period, score, recorded_at, game_id in rows:
+                key = (level, window, period)
+                board = self._boards.get(key)
+                if board is None:
+                    board = self._boards[key] = TopK(self.size)
+                board.add(score, recorded_at, game_id)
+
+    def snapshot(self):
+        """Merge the boards changed since the last snapshot into the database."""
+        if not self.db_path:
+            return
+        with self._snapshot_lock:
+            with self._lock:
+                changed = {key: self._boards[key].top() for key in self._dirty}
+                self._dirty.clear()
+            if not changed:
+                return
+
+            try:
+                merged = self._merge_into_database(changed)
+            except Exception:
+                # Keep the changed boards for the next snapshot
+                with self._lock:
+                    for key, results in changed.items():
+                        board = self._boards.get(key)
+                        if board is None:
+                            board = self._boards[key] = TopK(self.size)
+                        for result in results:
+                            board.add(*result)
+                        self._dirty.add(key)
+                raise
+
+            # Pick up what other workers recorded
+            with self._lock:
+                for key, board in merged.items():
+                    current = self._boards.get(key)
+                    if current is not None:
+                        for result in board.top():
+                            current.add(*result)
+                self._prune(self.clock())
+
+    def _merge_into_database(
+        self, changed: Dict[BoardKey, List[Result]]
+    ) -> Dict[BoardKey, TopK]:
+        """Merge boards with their stored rows, returning the merged boards."""
+        merged: Dict[BoardKey, TopK] = {}
+        conn = self._connect()
+        try:
+            with conn:
+                # Hold the write lock across read and rewrite, so
+                # snapshots from other workers cannot interleave
+                conn.execute("BEGIN IMMEDIATE")
+                for key, results in changed.items():
+                    board = merged[key] = TopK(self.size)
+                    stored = conn.execute(
+                        "SELECT score, recorded_at, game_id FROM scores "
+                        "WHERE level = ? AND time_window = ? AND period = ?",
+                        key,
+                    )
+                    for result in list(stored) + results:
+                        board.add(*result)
+                    conn.execute(
+                        "DELETE FROM scores "
+                        "WHERE level = ? AND time_window = ? AND period = ?",
+                        key,
+                    )
+                    conn.executemany(
+                        "INSERT INTO scores VALUES (?, ?, ?, ?, ?, ?)",
+                        [key + tuple(result) for result in board.top()],
+                    )
+        finally:
+            conn.close()
+        return merged
+
+    def close(self):
+        """Stop the snapshot thread and write a final snapshot."""
+        self._stop_flusher()
+        self.snapshot()
+
+    def _prune(self, now: float):
+        """Drop boards of past periods once they have been snapshotted."""
+        for key in list(self._boards):
+            _, window, period = key
+            if key not in self._dirty and period != period_key(window, now):
+                del self._boards[key]
+
+    def flush(self):
+        self.snapshot()
+
+    def _reset_after_fork(self):
+        super()._reset_after_fork()
+        self._snapshot_lock = threading.Lock()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m src.core.leaderboard",
+        description="Show the leaderboard stored in a snapshot database.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    top = commands.add_parser("top", help="print the best scores of a level")
+    top.add_argument("db_path", help="leaderboard SQLite database")
+    top.add_argument("level", choices=list(DIFFICULTY_LEVELS))
+    top.add_argument("--window", choices=WINDOWS, default="all")
+    top.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    leaderboard = Leaderboard(args.db_path)
+    for rank, result in enumerate(
+        leaderboard.top(args.level, args.window, args.limit), 1
+    ):
+        recorded = time.strftime("%Y-%m-%d %H:%M", time.gmtime(result.recorded_at))
+        print(f"{rank:>4}  {result.score:>6}  {recorded}  {result.game_id}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Memory-Mapped Word List
+
+Read-only, random-access view over a one-entry-per-line dictionary file.
+The file is memory-mapped and only an array of line offsets is kept, so
+forked workers share the same pages and selecting an entry is one seek.
+The offsets are cached in a sidecar index file next to the dictionary.
+A mapped file must be replaced by renaming a new file over it: edited in
+place, its new content shows through at the old offsets.
+"""
+
+import mmap
+import os
+import struct
+from array import array
+from collections.abc import Sequence
+from typing import Iterator, Optional
+
+# Sidecar layout: 32-byte header (magic, version, source size, source mtime
+# in ns, entry count) followed by one native-endian u64 start offset per
+# non-blank line. The header size keeps the offsets 8-byte aligned.
+INDEX_SUFFIX = ".idx"
+_INDEX_MAGIC = b"HGIX"
+_INDEX_VERSION = 1
+_INDEX_HEADER = struct.Struct("<4sH2xQQQ")
+
+
+class MappedWordList(Sequence):
+    """Sequence of the stripped, uppercased entries of a dictionary file."""
+
+    def __init__(self, file_path: str, index_path: Optional[str] = None):
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"Dictionary file not found: {file_path}")
+
+        self.file_path = file_path
+        self.index_path = index_path or file_path + INDEX_SUFFIX
+
+        with open(file_path, "rb") as file:
+            stat = os.fstat(file.fileno())
+            self._stat = (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+            # Empty files cannot be mapped
+            self._data = (
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                if stat.st_size
+                else b""
+            )
+
+        self._offsets = self._load_offsets(stat.st_size, stat.st_mtime_ns)
+
+    def _load_offsets(self, size: int, mtime_ns: int):
+        """Return line offsets from the sidecar, rebuilding it if stale."""
+        offsets = self._read_index(size, mtime_ns)
+        if offsets is not None:
+            return offsets
+
+        offsets = self._scan_offsets()
+        self._write_index(offsets, size, mtime_ns)
+        return offsets
+
+    def _read_index(self, size: int, mtime_ns: int):
+        try:
+            with open(self.index_path, "rb") as file:
+                header = file.read(_INDEX_HEADER.size)
+                if len(header) < _INDEX_HEADER.size:
+                    return None
+                magic, version, index_size, index_mtime, count = _INDEX_HEADER.unpack(
+                    header
+                )
+                if (magic, version, index_size, index_mtime) != (
+                    _INDEX_MAGIC,
+                    _INDEX_VERSION,
+                    size,
+                    mtime_ns,
+                ):
+                    return None
+                if count == 0:
+                    return array("Q")
+
+                # Map the offsets too, so they are shared between workers
+                index_map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+        offsets = memoryview(index_map)[_INDEX_HEADER.size :].cast("Q")
+        if len(offsets) != count:
+            return None
+        return offsets
+
+    def _scan_offsets(self) -> array:
+        """Stream the file once, recording where each non-blank line starts."""
+        offsets = array("Q")
+        position = 0
+        with open(self.file_path, "rb") as file:
+            for line in file:
+                if line.strip():
+                    offsets.append(position)
+                position += len(line)
+        return offsets
+
+    def _write_index(self, offsets: array, size: int, mtime_ns: int):
+        header = _INDEX_HEADER.pack(
+            _INDEX_MAGIC, _INDEX_VERSION, size, mtime_ns, len(offsets)
+        )
+        temp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "wb") as file:
+                file.write(header)
+                file.write(offsets.tobytes())
+            os.replace(temp_path, self.index_path)
+        except OSError:
+            # Read-only locations simply rebuild the offsets on each start
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def edited_in_place(self) -> bool:
+        """Return whether the mapped file has changed without being replaced."""
+        try:
+            stat = os.stat(self.file_path)
+        except OSError:
+            return False
+        dev, ino, size, mtime_ns = self._stat
+        return (stat.st_dev, stat.st_ino) == (dev, ino) and (
+            stat.st_size,
+            stat.st_mtime_ns,
+        ) != (size, mtime_ns)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        start = self._offsets[index]
+        end = self._data.find(b"\n", start)
+        if end == -1:
+            end = len(self._data)
+        return self._data[start:end].decode("utf-8").strip().upper()
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(len(self._offsets)):
+            yield self[index]
@@ -0,0 +1,448 @@
+"""
+Hangman Solver
+
+Headless guesser and simulation harness over GameEngine. A CandidateIndex
+groups a level's word pool by length and stores, per length, one bitset
+of words for every letter and for every (position, character) pair.
+Narrowing the candidates to a word display and its wrong letters is then
+a handful of big-integer AND operations, and letter frequencies are
+popcounts, with no per-word Python loop after the index is built.
+
+Usage:
+    python -m src.core.solver simulate --games 100000
+    python -m src.core.solver guess basic "_O____" --wrong E
+"""
+
+import argparse
+import math
+import multiprocessing
+import os
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from .game_engine import GameEngine
+from .word_manager import WordManager, get_level_constraints, get_word_manager
+from ..utils.constants import DIFFICULTY_LEVELS, UNDERSCORE_PLACEHOLDER
+
+STRATEGIES = ("frequency", "entropy")
+
+# Guess order used when no dictionary word fits the display
+ENGLISH_LETTER_ORDER = "ETAOINSHRDLCUMWFGYPBVKJXQZ"
+
+# Words a simulated game may complete before it is stopped; a solver that
+# never loses would otherwise play forever
+DEFAULT_MAX_WORDS = 20
+
+
+def _bitset(members: Sequence[int]) -> int:
+    """Return an integer with the bits at the given positions set."""
+    if not members:
+        return 0
+    bits = bytearray(members[-1] // 8 + 1)
+    for member in members:
+        bits[member >> 3] |= 1 << (member & 7)
+    return int.from_bytes(bits, "little")
+
+
+class _LengthGroup:
+    """Words of one length, numbered 0..n-1 within the group."""
+
+    __slots__ = ("words", "all", "contains", "at", "letters")
+
+    def __init__(self, words: List[str]):
+        contains: Dict[str, List[int]] = {}
+        at: List[Dict[str, List[int]]] = [{} for _ in words[0]]
+        for number, word in enumerate(words):
+            for char in set(word):
+                contains.setdefault(char, []).append(number)
+            for position, char in enumerate(word):
+                at[position].setdefault(char, []).append(number)
+
+        self.words = words
+        self.all = (1 << len(words)) - 1
+        self.contains = {char: _bitset(m) for char, m in contains.items()}
+        self.at = [{char: _bitset(m) for char, m in chars.items()} for chars in at]
+        # Guessable letters in English frequency order, so ties between
+        # equally common letters go to the generally more common one
+        self.letters = [
+            (letter, self.contains[letter])
+            for letter in ENGLISH_LETTER_ORDER
+            if letter in self.contains
+        ]
+
+
+class CandidateSet:
+    """Words still consistent with a game, as a bitset over a length group."""
+
+    __slots__ = ("_group", "bits")
+
+    def __init__(self, group: Optional[_LengthGroup], bits: int):
+        self._group = group
+        self.bits = bits
+
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+
+    def words(self) -> List[str]:
+        words = []
+        bits = self.bits
+        while bits:
+            low = bits & -bits
+            words.append(self._group.words[low.bit_length() - 1])
+            bits ^= low
+        return words
+
+    def refine(self, letter: str, display: str) -> "CandidateSet":
+        """Narrow the set after letter was guessed, given the new display."""
+        group, bits = self._group, self.bits
+        if not bits:
+            return self
+
+        if letter in display:
+            # A hit reveals every occurrence, so hidden positions exclude it
+            for position, char in enumerate(display):
+                if char == letter:
+                    bits &= group.at[position].get(letter, 0)
+                elif char == UNDERSCORE_PLACEHOLDER:
+                    bits &= ~group.at[position].get(letter, 0)
+        else:
+            bits &= ~group.contains.get(letter, 0)
+        return CandidateSet(group, bits)
+
+    def letter_counts(self, exclude: Iterable[str] = ()) -> Dict[str, int]:
+        """
+        Return how many candidates contain each letter not in exclude.
+
+        Letters no candidate contains are left out, and the rest are in
+        ENGLISH_LETTER_ORDER.
+        """
+        bits = self.bits
+        if not bits:
+            return {}
+        excluded = set(exclude)
+        counts = {}
+        for letter, letter_bits in self._group.letters:
+            if letter not in excluded:
+                count = (bits & letter_bits).bit_count()
+                if count:
+                    counts[letter] = count
+        return counts
+
+    def guess_entropy(self, letter: str) -> float:
+        """
+        Return the information, in bits, revealed by guessing letter.
+
+        Candidates are partitioned by the positions the letter would
+        reveal; a miss is one more partition.
+        """
+        group, bits = self._group, self.bits
+        if not bits:
+            return 0.0
+
+        hits = bits & group.contains.get(letter, 0)
+        partitions = [hits] if hits else []
+        for chars in group.at:
+            positions = chars.get(letter)
+            if positions is None:
+                continue
+            split = []
+            for partition in partitions:
+                inside = partition & positions
+                if inside:
+                    split.append(inside)
+                if inside != partition:
+                    split.append(partition ^ inside)
+            partitions = split
+        if hits != bits:
+            partitions.append(bits ^ hits)
+
+        total = bits.bit_count()
+        entropy = 0.0
+        for partition in partitions:
+            share = partition.bit_count() / total
+            entropy -= share * math.log2(share)
+        return entropy
+
+
+class CandidateIndex:
+    """Bitset index over a word list for filtering by a word display."""
+
+    def __init__(self, words: Iterable[str]):
+        by_length: Dict[int, List[str]] = {}
+        for word in dict.fromkeys(word.upper() for word in words):
+            by_length.setdefault(len(word), []).append(word)
+        self._groups = {
+            length: _LengthGroup(group) for length, group in by_length.items()
+        }
+
+    @classmethod
+    def for_level(
+        cls, level: str, manager: Optional[WordManager] = None
+    ) -> "CandidateIndex":
+        """Index the pool of words GameEngine draws from for level."""
+        index = (manager or get_word_manager()).get_index(level)
+        pool = index.pool(**get_level_constraints(level))
+        return cls(index.words[position] for position in pool)
+
+    def __len__(self) -> int:
+        return sum(len(group.words) for group in self._groups.values())
+
+    def candidates(
+        self, display: str, wrong_letters: Iterable[str] = ()
+    ) -> CandidateSet:
+        """
+        Return the words matching a word display and its wrong letters.
+
+        display is GameEngine.word_display: revealed letters in place,
+        placeholders for hidden characters and spaces between words.
+        """
+        display = display.upper()
+        group = self._groups.get(len(display))
+        if group is None:
+            return CandidateSet(None, 0)
+
+        bits = group.all
+        for letter in set(wrong_letters):
+            bits &= ~group.contains.get(letter.upper(), 0)
+
+        revealed = set(display) - {UNDERSCORE_PLACEHOLDER, " "}
+        for position, char in enumerate(display):
+            chars = group.at[position]
+            if char == UNDERSCORE_PLACEHOLDER:
+                # Hidden characters are neither spaces nor guessed letters
+                hidden = chars.get(" ", 0)
+                for letter in revealed:
+                    hidden |= chars.get(letter, 0)
+                bits &= ~hidden
+            else:
+                bits &= chars.get(char, 0)
+            if not bits:
+                break
+        return CandidateSet(group, bits)
+
+
+class HangmanSolver:
+    """
+    Picks the next letter from the words still consistent with the game.
+
+    The frequency strategy guesses the letter found in the most candidates;
+    the entropy strategy guesses the letter whose outcome best splits them.
+    """
+
+    def __init__(self, index: CandidateIndex, strategy: str = "frequency"):
+        if strategy not in STRATEGIES:
+            choices = " or ".join(f"'{name}'" for name in STRATEGIES)
+            raise ValueError(f"Invalid strategy: {strategy}. Must be {choices}")
+
+        self.index = index
+        self.strategy = strategy
+
+    @classmethod
+    def for_level(cls, level: str, strategy: str = "frequency") -> "HangmanSolver":
+        return cls(CandidateIndex.for_level(level), strategy)
+
+    def candidates(
+        self, display: str, wrong_letters: Iterable[str] = ()
+    ) -> CandidateSet:
+        return self.index.candidates(display, wrong_letters)
+
+    def next_guess(self, candidates: CandidateSet, guessed: Iterable[str]) -> str:
+        """Return the best letter not in guessed."""
+        guessed = set(guessed)
+        counts = candidates.letter_counts(guessed)
+        if not counts:
+            # No known word fits: fall back to plain English frequency
+            for letter in ENGLISH_LETTER_ORDER:
+                if letter not in guessed:
+                    return letter
+            raise ValueError("Every letter has already been guessed")
+
+        if self.strategy == "entropy" and len(candidates) > 2:
+            return max(
+                counts,
+                key=lambda letter: (candidates.guess_entropy(letter), counts[letter]),
+            )
+        # max keeps the first of equal counts, the more common English letter
+        return max(counts, key=counts.__getitem__)
+
+
+class GameResult(NamedTuple):
+    """Outcome of one simulated game."""
+
+    score: int  # words completed
+    guesses: int
+    wrong_guesses: int
+    lost: bool  # False when the game was stopped at max_words
+
+
+def play_game(
+    solver: HangmanSolver,
+    level: str,
+    seed: Optional[int] = None,
+    max_words: int = DEFAULT_MAX_WORDS,
+) -> GameResult:
+    """Play one game with solver until it is lost or max_words are solved."""
+    engine = GameEngine(level, seed)
+    guesses = wrong_guesses = 0
+    candidates = solver.candidates(engine.word_display)
+    while not engine.check_game_over() and engine.score < max_words:
+        letter = solver.next_guess(candidates, engine.guessed_letters)
+        guesses += 1
+        if not engine.guess_letter(letter)["correct"]:
+            wrong_guesses += 1
+        elif engine.process_word_completion()["word_completed"]:
+            candidates = solver.candidates(engine.word_display)
+            continue
+        candidates = candidates.refine(letter, engine.word_display)
+
+    return GameResult(engine.score, guesses, wrong_guesses, engine.check_game_over())
+
+
+class SimulationStats(NamedTuple):
+    """Totals for a batch of simulated games on one level."""
+
+    level: str
+    games: int
+    words_won: int
+    words_lost: int
+    guesses: int
+    wrong_guesses: int
+    duration: float  # wall-clock seconds
+
+    @property
+    def words(self) -> int:
+        return self.words_won + self.words_lost
+
+    @property
+    def win_rate(self) -> float:
+        return self.words_won / self.words if self.words else 0.0
+
+    @property
+    def guesses_per_word(self) -> float:
+        return self.guesses / self.words if self.words else 0.0
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.duration if self.duration else 0.0
+
+
+# Solvers built in this process, shared by every batch it plays. Built in
+# the parent before the pool starts, so forked workers inherit them.
+_solvers: Dict[Tuple[str, str], HangmanSolver] = {}
+
+
+def _get_solver(level: str, strategy: str) -> HangmanSolver:
+    solver = _solvers.get((level, strategy))
+    if solver is None:
+        solver = _solvers[level, strategy] = HangmanSolver.for_level(level, strategy)
+    return solver
+
+
+def _play_batch(batch: Tuple[str, str, int, int, int]) -> Tuple[int, ...]:
+    level, strategy, first_seed, games, max_words = batch
+    solver = _get_solver(level, strategy)
+    won = lost = guesses = wrong_guesses = 0
+    for seed in range(first_seed, first_seed + games):
+        result = play_game(solver, level, seed, max_words)
+        won += result.score
+        lost += result.lost
+        guesses += result.guesses
+        wrong_guesses += result.wrong_guesses
+    return games, won, lost, guesses, wrong_guesses
+
+
+def simulate(
+    level: str,
+    games: int,
+    strategy: str = "frequency",
+    processes: Optional[int] = None,
+    seed: int = 0,
+    max_words: int = DEFAULT_MAX_WORDS,
+) -> SimulationStats:
+    """
+    Play games with seeds seed..seed+games-1 across a process pool.
+
+    Results are reproducible for a given seed, whatever the process count.
+    processes=1 plays in the calling process.
+    """
+    processes = processes or os.cpu_count() or 1
+    batch_size = max(1, min(1000, games // (processes * 4)))
+    batches = [
+        (level, strategy, seed + start, min(batch_size, games - start), max_words)
+        for start in range(0, games, batch_size)
+    ]
+
+    _get_solver(level, strategy)
+    start = time.perf_counter()
+    if processes == 1:
+        results = list(map(_play_batch, batches))
+    else:
+        with multiprocessing.Pool(processes) as pool:
+            results = list(pool.imap_unordered(_play_batch, batches))
+    duration = time.perf_counter() - start
+
+    totals = [sum(column) for column in zip(*results)] or [0] * 5
+    return SimulationStats(level, *totals, duration=duration)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m src.core.solver",
+        description="Play hangman headlessly with the solver.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    simulate_parser = commands.add_parser(
+        "simulate", help="play many games and report win rate and throughput"
+    )
+    simulate_parser.add_argument(
+        "--levels", nargs="+", choices=list(DIFFICULTY_LEVELS), default=None
+    )
+    simulate_parser.add_argument("--games", type=int, default=10000)
+    simulate_parser.add_argument("--strategy", choices=STRATEGIES, default="frequency")
+    simulate_parser.add_argument("--processes", type=int, default=None)
+    simulate_parser.add_argument("--seed", type=int, default=0)
+    simulate_parser.add_argument("--max-words", type=int, default=DEFAULT_MAX_WORDS)
+
+    guess_parser = commands.add_parser(
+        "guess", help="suggest the next letter for a word display"
+    )
+    guess_parser.add_argument("level", choices=list(DIFFICULTY_LEVELS))
+    guess_parser.add_argument(
+        "display", help=f"word display, {UNDERSCORE_PLACEHOLDER} for hidden letters"
+    )
+    guess_parser.add_argument("--wrong", default="", help="wrong letters so far")
+    guess_parser.add_argument("--strategy", choices=STRATEGIES, default="frequency")
+    args = parser.parse_args(argv)
+
+    if args.command == "simulate":
+        for level in args.levels or list(DIFFICULTY_LEVELS):
+            stats = simulate(
+                level,
+                args.games,
+                args.strategy,
+                args.processes,
+                args.seed,
+                args.max_words,
+            )
+            print(
+                f"{level}: {stats.games:,} games, {stats.words:,} words, "
+                f"win rate {stats.win_rate:.1%}, "
+                f"{stats.guesses_per_word:.2f} guesses/word, "
+                f"{stats.games_per_second:,.0f} games/s"
+            )
+    elif args.command == "guess":
+        solver = HangmanSolver.for_level(args.level, args.strategy)
+        display = args.display.upper()
+        wrong = args.wrong.upper()
+        candidates = solver.candidates(display, wrong)
+        guessed = set(wrong) | set(display)
+        print(f"{len(candidates)} candidates")
+        if len(candidates) <= 10:
+            for word in candidates.words():
+                print(f"  {word}")
+        print(f"Next guess: {solver.next_guess(candidates, guessed)}")
+
+
+if __name__ == "__main__":
+    main()
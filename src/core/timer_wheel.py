@@ -0,0 +1,112 @@
+"""
+Timer Wheel
+
+Hierarchical timing wheel for expiring large numbers of deadlines from a
+single clock. Each level is a ring of slots; level 0 slots are one tick
+wide and every higher level's slots span a full rotation of the level
+below. Scheduling and cancelling are O(1), and advancing the wheel costs
+O(1) per tick plus the entries that expire or cascade down a level.
+"""
+
+import math
+from typing import Dict, Hashable, List, Tuple
+
+
+class TimerWheel:
+    """
+    Deadlines keyed by an arbitrary hashable, expired in deadline order.
+
+    Times are in the caller's clock units (seconds by default); deadlines
+    are rounded up to whole ticks, so nothing expires early.
+    """
+
+    def __init__(
+        self, tick: float = 1.0, slot_bits: int = 6, levels: int = 4, now: float = 0.0
+    ):
+        if tick <= 0:
+            raise ValueError("Tick must be positive")
+
+        self.tick = tick
+        self._slot_bits = slot_bits
+        self._slot_mask = (1 << slot_bits) - 1
+        self._levels = levels
+        self._wheels: List[List[Dict[Hashable, int]]] = [
+            [{} for _ in range(1 << slot_bits)] for _ in range(levels)
+        ]
+        # Where each key lives, so cancel and reschedule never search
+        self._locations: Dict[Hashable, Tuple[int, int]] = {}
+        self._current = math.floor(now / tick)
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._locations
+
+    def schedule(self, key: Hashable, deadline: float):
+        """Expire key at deadline, replacing any deadline it already had."""
+        self.cancel(key)
+        # A deadline that already passed fires on the next tick
+        target = max(math.ceil(deadline / self.tick), self._current + 1)
+        self._place(key, target)
+
+    def cancel(self, key: Hashable):
+        location = self._locations.pop(key, None)
+        if location is not None:
+            level, slot = location
+            del self._wheels[level][slot][key]
+
+    def advance(self, now: float) -> List[Hashable]:
+        """Move the wheel to now and return the keys whose deadlines passed."""
+        target = math.floor(now / self.tick)
+        expired: List[Hashable] = []
+        while self._current < target:
+            if not self._locations:
+                # Nothing scheduled, so idle ticks can be skipped outright
+                self._current = target
+                break
+
+            self._current += 1
+            self._cascade()
+            index = self._current & self._slot_mask
+            slot = self._wheels[0][index]
+            if slot:
+                self._wheels[0][index] = {}
+                for key, deadline_tick in slot.items():
+                    del self._locations[key]
+                    if deadline_tick > self._current:
+                        # Parked beyond a single-level wheel's range
+                        self._place(key, deadline_tick)
+                    else:
+                        expired.append(key)
+        return expired
+
+    def _place(self, key: Hashable, target: int):
+        slot_target = target
+        delta = target - self._current
+        for level in range(self._levels):
+            if delta < 1 << (self._slot_bits * (level + 1)):
+                break
+        else:
+            # Beyond the wheel's range: park in the furthest top-level slot
+            # and place it again when that slot cascades
+            slot_target = self._current + (1 << (self._slot_bits * self._levels)) - 1
+            level = self._levels - 1
+
+        slot = (slot_target >> (self._slot_bits * level)) & self._slot_mask
+        self._wheels[level][slot][key] = target
+        self._locations[key] = (level, slot)
+
+    def _cascade(self):
+        """Redistribute higher-level slots that start at the current tick."""
+        for level in range(1, self._levels):
+            shift = self._slot_bits * level
+            if self._current & ((1 << shift) - 1):
+                return
+
+            slot = (self._current >> shift) & self._slot_mask
+            entries = self._wheels[level][slot]
+            if entries:
+                self._wheels[level][slot] = {}
+                for key, target in entries.items():
+                    self._place(key, target)
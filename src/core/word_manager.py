@@ -5,24 +5,361 @@ Class-based word dictionary management for hangman game.
 Provides caching and optimized word selection based on difficulty level.
 """
 
+import argparse
+import heapq
+import logging
 import os
 import random
-from typing import List, Optional
+import sys
+import threading
+import time
+import zlib
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from .difficulty_scores import (
+    SCORES_FILENAME,
+    DifficultyRanking,
+    ScoredLevel,
+    read_scores,
+)
+from .mapped_words import MappedWordList
+from .word_pack import PACK_FILENAME, PackedLevel, read_pack, write_pack
+from .word_sampler import ShuffleBag
+
+from ..utils.constants import DIFFICULTY_LEVELS
+from ..utils.letter_mask import letters_to_mask
+
+logger = logging.getLogger(__name__)
+
+# Constraint keys a WordIndex pool can be filtered on, in cache-key order
+POOL_CONSTRAINTS = (
+    "min_length",
+    "max_length",
+    "min_words",
+    "max_words",
+    "min_distinct_letters",
+    "max_distinct_letters",
+    "required_letters",
+    "excluded_letters",
+)
+
+# Pools cached per index; the least recently used is dropped beyond this
+MAX_CACHED_POOLS = 64
+
+# Upper bound used for open-ended pool constraints
+_UNBOUNDED = 1 << 32
+
+# DIFFICULTY_LEVELS keys mapped to WordIndex pool constraints
+_LEVEL_CONSTRAINTS = {
+    "min_word_length": "min_length",
+    "max_word_length": "max_length",
+    "min_words": "min_words",
+    "max_words": "max_words",
+}
+
+
+# Random lines tried before a memory-mapped level falls back to its index
+_MAPPED_SAMPLE_ATTEMPTS = 32
+
+
+class ReloadStats(NamedTuple):
+    """Instrumentation reported after a dictionary reload."""
+
+    level: str
+    entries: int
+    duration: float  # seconds spent loading and indexing
+    peak_rss_kb: int  # process memory high-water mark after the reload, or 0
+
+
+def _invalid_level_error(level: str) -> ValueError:
+    choices = " or ".join(f"'{name}'" for name in DIFFICULTY_LEVELS)
+    return ValueError(f"Invalid level: {level}. Must be {choices}")
+
+
+def _peak_rss_kb() -> int:
+    """Return the process memory high-water mark in KiB, or 0 if unknown."""
+    try:
+        import resource
+    except ImportError:  # Not available on Windows
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS and in KiB elsewhere
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+class WordIndex:
+    """
+    Precomputed index over one dictionary, built once at load.
+
+    Entries are stored uppercased in file order. Per-entry attributes live
+    in compact typed arrays (a few bytes per entry) and entries are
+    bucketed by length, word count and distinct-letter count, so a pool
+    of entries matching a constraint is built from the matching buckets
+    only, then cached and sampled in O(1).
+
+    With shared=True, words must be a random-access sequence of uppercased
+    entries (such as a MappedWordList); it is referenced instead of copied.
+    """
+
+    def __init__(self, words: Iterable[str], shared: bool = False):
+        self.words: Sequence[str] = words if shared else []
+        self.masks = array("I")
+        self.lengths = array("H")
+        self.word_counts = array("B")
+        self.distinct_letters = array("B")
+        self._buckets: Dict[str, Dict[int, array]] = {}
+        self._pools: "OrderedDict[Tuple, array]" = OrderedDict()
+        self._pools_lock = threading.Lock()
+        self.checksum = 0
+        self._sorted_hashes: Optional[array] = None
+        self._hash_positions: Optional[array] = None
+
+        if shared:
+            for index, word in enumerate(self.words):
+                self._add(index, word)
+        else:
+            for index, word in enumerate(words):
+                word = word.upper()
+                self.words.append(word)
+                self._add(index, word)
+
+    def _add(self, index: int, word: str):
+        # Identifies this exact dictionary content across reloads
+        self.checksum = zlib.crc32(word.encode() + b"\n", self.checksum)
+        mask = letters_to_mask(word)
+        length = len(word)
+        word_count = len(word.split())
+        distinct = bin(mask).count("1")
+
+        self.masks.append(mask)
+        self.lengths.append(length)
+        self.word_counts.append(word_count)
+        self.distinct_letters.append(distinct)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        words: Sequence[str],
+        masks: array,
+        lengths: array,
+        word_counts: array,
+        distinct_letters: array,
+        checksum: int,
+    ) -> "WordIndex":
+        """Rebuild an index from precomputed per-entry arrays."""
+        index = cls([], shared=True)
+        index.words = words
+        index.masks = masks
+        index.lengths = lengths
+        index.word_counts = word_counts
+        index.distinct_letters = distinct_letters
+        index.checksum = checksum
+        return index
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def position_of(self, word: str) -> Optional[int]:
+        """Return the first position of word, or None if not present."""
+        if self._sorted_hashes is None:
+            # Positions sorted by word hash: 8 bytes per entry instead of a
+            # dict holding every word, and still O(log n) per lookup
+            hashes = array("I", (zlib.crc32(entry.encode()) for entry in self.words))
+            order = sorted(range(len(hashes)), key=hashes.__getitem__)
+            self._hash_positions = array("I", order)
+            self._sorted_hashes = array("I", (hashes[i] for i in order))
+
+        word = word.upper()
+        target = zlib.crc32(word.encode())
+        slot = bisect_left(self._sorted_hashes, target)
+        while slot < len(self._sorted_hashes) and self._sorted_hashes[slot] == target:
+            position = self._hash_positions[slot]
+            if self.words[position] == word:
+                return position
+            slot += 1
+        return None
+
+    def bucket(self, attribute: str, value: int) -> array:
+        """Return the positions of entries with the given attribute value."""
+        return self._get_buckets(attribute).get(value, array("I"))
+
+    def bucket_sizes(self, attribute: str) -> Dict[int, int]:
+        """Return entry counts per bucket for length, words or letters."""
+        buckets = self._get_buckets(attribute)
+        return {key: len(indexes) for key, indexes in sorted(buckets.items())}
+
+    def _get_buckets(self, attribute: str) -> Dict[int, array]:
+        # Buckets are grouped on first use so loading stays a plain copy
+        buckets = self._buckets.get(attribute)
+        if buckets is None:
+            values = {
+                "length": self.lengths,
+                "words": self.word_counts,
+                "letters": self.distinct_letters,
+            }[attribute]
+            buckets = {}
+            for position, value in enumerate(values):
+                buckets.setdefault(value, array("I")).append(position)
+            self._buckets[attribute] = buckets
+        return buckets
+
+    def pool(self, **constraints) -> array:
+        """
+        Return the positions of entries matching every constraint.
+
+        Supported constraints are listed in POOL_CONSTRAINTS; letter
+        constraints take 26-bit masks. The MAX_CACHED_POOLS most recently
+        used pools are cached.
+        """
+        key = tuple(constraints.get(name) for name in POOL_CONSTRAINTS)
+        pool = self._pools.get(key)
+        if pool is not None:
+            try:
+                self._pools.move_to_end(key)
+            except KeyError:
+                # Dropped by another thread since the lookup
+                pass
+            return pool
+
+        unknown = set(constraints) - set(POOL_CONSTRAINTS)
+        if unknown:
+            raise ValueError(f"Unknown word constraints: {sorted(unknown)}")
+        pool = self._build_pool(**constraints)
+        self._cache_pool(key, pool)
+        return pool
+
+    def set_pool(self, pool: array, **constraints):
+        """Install a precomputed pool for a constraint set."""
+        key = tuple(constraints.get(name) for name in POOL_CONSTRAINTS)
+        self._cache_pool(key, pool)
+
+    def _cache_pool(self, key: Tuple, pool: array):
+        with self._pools_lock:
+            self._pools[key] = pool
+            self._pools.move_to_end(key)
+            while len(self._pools) > MAX_CACHED_POOLS:
+                self._pools.popitem(last=False)
+
+    def _build_pool(
+        self,
+        min_length: int = 0,
+        max_length: Optional[int] = None,
+        min_words: int = 0,
+        max_words: Optional[int] = None,
+        min_distinct_letters: int = 0,
+        max_distinct_letters: Optional[int] = None,
+        required_letters: int = 0,
+        excluded_letters: int = 0,
+    ) -> array:
+        max_length = _UNBOUNDED if max_length is None else max_length
+        max_words = _UNBOUNDED if max_words is None else max_words
+        if max_distinct_letters is None:
+            max_distinct_letters = _UNBOUNDED
+
+        # Only the entries of the bounded attribute with the fewest
+        # matching entries are checked against the other constraints
+        candidates: Optional[List[array]] = None
+        fewest = 0
+        for attribute, low, high in (
+            ("length", min_length, max_length),
+            ("words", min_words, max_words),
+            ("letters", min_distinct_letters, max_distinct_letters),
+        ):
+            if low <= 0 and high >= _UNBOUNDED:
+                continue
+            matching = [
+                positions
+                for value, positions in self._get_buckets(attribute).items()
+                if low <= value <= high
+            ]
+            count = sum(len(positions) for positions in matching)
+            if candidates is None or count < fewest:
+                candidates, fewest = matching, count
+
+        positions: Iterable[int] = (
+            range(len(self.lengths))
+            if candidates is None
+            # Buckets hold positions in file order, so the pool does too
+            else heapq.merge(*candidates)
+        )
+        lengths, word_counts = self.lengths, self.word_counts
+        distinct_letters, masks = self.distinct_letters, self.masks
+        return array(
+            "I",
+            (
+                position
+                for position in positions
+                if min_length <= lengths[position] <= max_length
+                and min_words <= word_counts[position] <= max_words
+                and min_distinct_letters
+                <= distinct_letters[position]
+                <= max_distinct_letters
+                and masks[position] & required_letters == required_letters
+                and not masks[position] & excluded_letters
+            ),
+        )
+
+    def random_word(self, **constraints) -> str:
+        pool = self.pool(**constraints)
+        if not pool:
+            raise ValueError(f"No dictionary entries match {constraints}")
+        return self.words[pool[random.randrange(len(pool))]]
 
 
 class WordManager:
-    def __init__(self):
-        """Initialize the word manager with empty caches."""
-        self._basic_words_cache: Optional[List[str]] = None
-        self._intermediate_phrases_cache: Optional[List[str]] = None
+    def __init__(
+        self,
+        use_mmap: bool = False,
+        dictionary_dir: Optional[str] = None,
+        use_pack: bool = True,
+    ):
+        """
+        Initialize the word manager with empty caches.
+
+        Dictionaries are read from dictionary_dir, by default the project's
+        static/ folder. When a word pack built from the current text files
+        is present there (see build_pack), levels load from it directly;
+        otherwise the text files are parsed. With use_mmap=True text
+        dictionaries are memory-mapped instead of read into lists: words
+        are drawn by seeking to a random line offset, and the full
+        WordIndex is only built if a caller asks for it. Mapped files must
+        be replaced by renaming a new file over them; one edited in place
+        is read into memory when it is reloaded.
+        """
+        self.use_mmap = use_mmap
+        self.use_pack = use_pack
+        self._word_cache: Dict[str, Sequence[str]] = {}
+        self._index_cache: Dict[str, WordIndex] = {}
+        # Previous generation per level, kept for games encoded against it
+        self._retired_indexes: Dict[str, WordIndex] = {}
+        self._reload_listeners: List[Callable[[ReloadStats], None]] = []
 
         # Get paths relative to the project root
-        current_dir = os.path.dirname(__file__)
-        project_root = os.path.join(current_dir, "..", "..")
-        self._basic_words_path = os.path.join(project_root, "static", "basic_words.txt")
-        self._intermediate_phrases_path = os.path.join(
-            project_root, "static", "intermediate_phrases.txt"
-        )
+        if dictionary_dir is None:
+            current_dir = os.path.dirname(__file__)
+            project_root = os.path.join(current_dir, "..", "..")
+            dictionary_dir = os.path.join(project_root, "static")
+        self._paths = {
+            level: os.path.join(dictionary_dir, config["source"])
+            for level, config in DIFFICULTY_LEVELS.items()
+        }
+        self.pack_path = os.path.join(dictionary_dir, PACK_FILENAME)
+        self._pack: Optional[Dict[str, PackedLevel]] = None
+        self.scores_path = os.path.join(dictionary_dir, SCORES_FILENAME)
+        self._scores: Optional[Dict[str, ScoredLevel]] = None
+        self._ranking_cache: Dict[str, DifficultyRanking] = {}
 
     def _load_words_from_file(self, file_path: str) -> List[str]:
         if not os.path.exists(file_path):
@@ -33,39 +370,392 @@ class WordManager:
 
         return words
 
-    def get_basic_words(self) -> List[str]:
-        if self._basic_words_cache is None:
-            self._basic_words_cache = self._load_words_from_file(self._basic_words_path)
+    @property
+    def dictionary_paths(self) -> Dict[str, str]:
+        return dict(self._paths)
+
+    def _read_level_words(self, level: str) -> Sequence[str]:
+        if self.use_mmap:
+            return MappedWordList(self._paths[level])
+        return self._load_words_from_file(self._paths[level])
+
+    def _read_packed_level(
+        self, level: str, refresh: bool = False
+    ) -> Optional[WordIndex]:
+        """Return the level's index from the word pack, if it is current."""
+        if not self.use_pack:
+            return None
+
+        if self._pack is None or refresh:
+            try:
+                self._pack = read_pack(self.pack_path)
+            except (OSError, ValueError):
+                # Missing or corrupt pack, use the text files
+                self._pack = {}
+
+        packed = self._pack.get(level)
+        if packed is None:
+            return None
+        try:
+            stat = os.stat(self._paths[level])
+        except OSError:
+            return None
+        if (stat.st_size, stat.st_mtime_ns) != (
+            packed.source_size,
+            packed.source_mtime_ns,
+        ):
+            # The text file was edited after the pack was built
+            return None
+
+        index = WordIndex.from_arrays(
+            packed.words,
+            packed.masks,
+            packed.lengths,
+            packed.word_counts,
+            packed.distinct_letters,
+            packed.checksum,
+        )
+        constraints = get_level_constraints(level)
+        if packed.pool_constraints == constraints:
+            index.set_pool(packed.pool, **constraints)
+        return index
+
+    def _read_level(
+        self, level: str, refresh: bool = False
+    ) -> Tuple[Sequence[str], Optional[WordIndex]]:
+        """Load a level from the word pack, or from its text file."""
+        index = self._read_packed_level(level, refresh)
+        if index is not None:
+            return index.words, index
+        return self._read_level_words(level), None
+
+    def _get_level_words(self, level: str) -> Sequence[str]:
+        if level not in self._paths:
+            raise _invalid_level_error(level)
+
+        if level not in self._word_cache:
+            words, index = self._read_level(level)
+            if index is not None:
+                self._index_cache[level] = index
+            self._word_cache[level] = words
+
+        return self._word_cache[level]
 
-        return self._basic_words_cache
+    def _get_level_list(self, level: str) -> List[str]:
+        words = self._get_level_words(level)
+        return words if isinstance(words, list) else list(words)
+
+    def get_basic_words(self) -> List[str]:
+        return self._get_level_list("basic")
 
     def get_intermediate_phrases(self) -> List[str]:
-        if self._intermediate_phrases_cache is None:
-            self._intermediate_phrases_cache = self._load_words_from_file(
-                self._intermediate_phrases_path
+        return self._get_level_list("intermediate")
+
+    def get_index(self, level: str) -> WordIndex:
+        """Return the level's dictionary index, building it on first use."""
+        index = self._index_cache.get(level)
+        if index is None:
+            words = self._get_level_words(level)
+            # Packed levels are indexed as they are loaded
+            index = self._index_cache.get(level) or WordIndex(
+                words, shared=isinstance(words, MappedWordList)
             )
+            # Warm the level's own pool so game selection never filters
+            index.pool(**get_level_constraints(level))
+            self._index_cache[level] = index
 
-        return self._intermediate_phrases_cache
+        return index
 
-    def get_random_word(self, level: str) -> str:
-        if level == "basic":
-            words = self.get_basic_words()
-            return random.choice(words).upper()
-        elif level == "intermediate":
-            phrases = self.get_intermediate_phrases()
-            return random.choice(phrases).upper()
-        else:
-            raise ValueError(
-                f"Invalid level: {level}. Must be 'basic' or 'intermediate'"
+    def get_difficulty_ranking(self, level: str) -> Optional[DifficultyRanking]:
+        """
+        Return the level's pool ranked by difficulty score.
+
+        Scores come from the file written by `python -m src.core.difficulty
+        build`; None is returned when it is missing or was built against a
+        different version of the dictionary.
+        """
+        ranking = self._ranking_cache.get(level)
+        if ranking is not None:
+            return ranking
+
+        index = self.get_index(level)
+        if self._scores is None:
+            try:
+                self._scores = read_scores(self.scores_path)
+            except (OSError, ValueError):
+                self._scores = {}
+        scored = self._scores.get(level)
+        if scored is None or (scored.checksum, len(scored.scores)) != (
+            index.checksum,
+            len(index),
+        ):
+            return None
+
+        ranking = DifficultyRanking(
+            scored.scores, index.pool(**get_level_constraints(level))
+        )
+        self._ranking_cache[level] = ranking
+        return ranking
+
+    def get_random_word(
+        self, level: str, percentile: Optional[Tuple[float, float]] = None
+    ) -> str:
+        """
+        Return a random word for the level.
+
+        With percentile=(low, high) the word is drawn from that range of
+        the level's entries ordered by difficulty score, e.g. (90, 100)
+        for the hardest tenth.
+        """
+        constraints = get_level_constraints(level)
+        if percentile is not None:
+            ranking = self.get_difficulty_ranking(level)
+            if ranking is None:
+                raise ValueError(f"No current difficulty scores for level {level}")
+            return self.get_index(level).words[ranking.random_position(*percentile)]
+
+        if self.use_mmap and level not in self._index_cache:
+            word = self._sample_mapped_word(level, constraints)
+            if word is not None:
+                return word
+
+        return self.get_index(level).random_word(**constraints)
+
+    def _sample_mapped_word(
+        self, level: str, constraints: Dict[str, int]
+    ) -> Optional[str]:
+        """Draw random lines until one fits the level, without an index."""
+        words = self._get_level_words(level)
+        if not words:
+            return None
+
+        for _ in range(_MAPPED_SAMPLE_ATTEMPTS):
+            word = words[random.randrange(len(words))]
+            length = len(word)
+            word_count = len(word.split())
+            if (
+                constraints.get("min_length", 0) <= length
+                and length <= constraints.get("max_length", length)
+                and constraints.get("min_words", 0) <= word_count
+                and word_count <= constraints.get("max_words", word_count)
+            ):
+                return word
+
+        # Constraints reject most entries, fall back to the full index
+        return None
+
+    def new_shuffle_bag(self, level: str, seed: Optional[int] = None) -> ShuffleBag:
+        """Return a non-repeating sampler over the level's word pool."""
+        pool = self.get_index(level).pool(**get_level_constraints(level))
+        return ShuffleBag(len(pool), seed)
+
+    def get_word_from_bag(self, level: str, bag: ShuffleBag) -> str:
+        """Draw the next word from a bag made by new_shuffle_bag."""
+        index = self.get_index(level)
+        pool = index.pool(**get_level_constraints(level))
+        # A dictionary of a different size restarts the bag
+        bag.resize(len(pool))
+        return index.words[pool[bag.next_index()]]
+
+    def get_word_index(self, level: str, word: str) -> Optional[int]:
+        """Return the dictionary position of word, or None if not present."""
+        return self.get_index(level).position_of(word)
+
+    def locate_word(self, level: str, word: str) -> Tuple[Optional[int], int]:
+        """Return the position of word and the checksum of the dictionary."""
+        index = self.get_index(level)
+        return index.position_of(word), index.checksum
+
+    def get_word_at(
+        self, level: str, position: int, checksum: Optional[int] = None
+    ) -> str:
+        """
+        Return the word at a dictionary position.
+
+        When checksum is given the position is resolved against that
+        dictionary generation, so words located before a reload still
+        resolve to the same word afterwards.
+        """
+        if checksum is None:
+            if level in self._index_cache:
+                return self._index_cache[level].words[position]
+            return self._get_level_words(level)[position].upper()
+
+        index = self.get_index(level)
+        if index.checksum != checksum:
+            index = self._retired_indexes.get(level)
+            if index is None or index.checksum != checksum:
+                raise ValueError(f"Dictionary for level {level} has changed")
+        return index.words[position]
+
+    def add_reload_listener(self, listener: Callable[[ReloadStats], None]):
+        """Register a callback receiving ReloadStats after each reload."""
+        self._reload_listeners.append(listener)
+
+    def reload(self, level: str) -> ReloadStats:
+        """
+        Re-read a level's dictionary and atomically swap in the new index.
+
+        The new words and index are fully built before being published, so
+        concurrent requests see either the old or the new dictionary. A
+        dictionary without any playable word, such as an empty or partly
+        written file, raises ValueError and the previous one is kept.
+        """
+        if level not in self._paths:
+            raise _invalid_level_error(level)
+
+        previous = self._index_cache.get(level)
+        # The mapping of a file edited in place shows the new content at
+        # the old offsets, so its positions no longer resolve
+        edited_in_place = (
+            previous is not None
+            and isinstance(previous.words, MappedWordList)
+            and previous.words.edited_in_place()
+        )
+
+        start = time.perf_counter()
+        words, index = self._read_level(level, refresh=True)
+        if edited_in_place and isinstance(words, MappedWordList):
+            logger.warning(
+                "The %s dictionary was edited in place; replace memory-mapped "
+                "dictionaries by renaming a new file over them",
+                level,
             )
+            words = self._load_words_from_file(self._paths[level])
+        if index is None:
+            index = WordIndex(words, shared=isinstance(words, MappedWordList))
+        if not index.pool(**get_level_constraints(level)):
+            raise ValueError(f"No playable words in the {level} dictionary")
+        duration = time.perf_counter() - start
+
+        if (
+            previous is not None
+            and previous.checksum != index.checksum
+            and not edited_in_place
+        ):
+            self._retired_indexes[level] = previous
+        self._index_cache[level] = index
+        self._word_cache[level] = words
+        # Scores are matched against the new dictionary on next use
+        self._ranking_cache.pop(level, None)
+        self._scores = None
+
+        stats = ReloadStats(
+            level=level,
+            entries=len(index),
+            duration=duration,
+            peak_rss_kb=_peak_rss_kb(),
+        )
+        for listener in self._reload_listeners:
+            listener(stats)
+        return stats
+
+    def build_pack(self, output_path: Optional[str] = None) -> str:
+        """
+        Compile every level's text dictionary into a word pack.
+
+        Entries are indexed exactly as when loading the text file, so a
+        level has the same checksum and word positions whichever way it
+        is loaded. Returns the path written, by default pack_path.
+        """
+        output_path = output_path or self.pack_path
+        levels = {}
+        for level, path in self._paths.items():
+            stat = os.stat(path)
+            index = WordIndex(self._load_words_from_file(path))
+            constraints = get_level_constraints(level)
+            levels[level] = PackedLevel(
+                words=index.words,
+                masks=index.masks,
+                lengths=index.lengths,
+                word_counts=index.word_counts,
+                distinct_letters=index.distinct_letters,
+                checksum=index.checksum,
+                source_size=stat.st_size,
+                source_mtime_ns=stat.st_mtime_ns,
+                pool=index.pool(**constraints),
+                pool_constraints=constraints,
+            )
+
+        write_pack(output_path, levels)
+        return output_path
 
     def clear_cache(self):
-        self._basic_words_cache = None
-        self._intermediate_phrases_cache = None
+        self._word_cache = {}
+        self._index_cache = {}
+        self._retired_indexes = {}
+        self._pack = None
+        self._scores = None
+        self._ranking_cache = {}
+
+
+def get_level_constraints(level: str) -> Dict[str, int]:
+    """Return the WordIndex pool constraints declared for a level."""
+    if level not in DIFFICULTY_LEVELS:
+        raise _invalid_level_error(level)
+
+    config = DIFFICULTY_LEVELS[level]
+    return {
+        constraint: config[key]
+        for key, constraint in _LEVEL_CONSTRAINTS.items()
+        if key in config
+    }
+
+
+_word_manager = WordManager(use_mmap=os.environ.get("HANGMAN_MMAP_DICTIONARIES") == "1")
+
+
+def get_random_word(
+    level: str, percentile: Optional[Tuple[float, float]] = None
+) -> str:
+    return _word_manager.get_random_word(level, percentile)
+
+
+def get_word_index(level: str, word: str) -> Optional[int]:
+    return _word_manager.get_word_index(level, word)
+
+
+def new_shuffle_bag(level: str, seed: Optional[int] = None) -> ShuffleBag:
+    return _word_manager.new_shuffle_bag(level, seed)
+
+
+def get_word_from_bag(level: str, bag: ShuffleBag) -> str:
+    return _word_manager.get_word_from_bag(level, bag)
+
+
+def locate_word(level: str, word: str) -> Tuple[Optional[int], int]:
+    return _word_manager.locate_word(level, word)
+
+
+def get_word_at(level: str, position: int, checksum: Optional[int] = None) -> str:
+    return _word_manager.get_word_at(level, position, checksum)
+
+
+def get_word_manager() -> WordManager:
+    """Return the shared WordManager used by game engines."""
+    return _word_manager
+
 
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m src.core.word_manager",
+        description="Manage hangman word dictionaries.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser(
+        "build", help="compile the text dictionaries into a binary word pack"
+    )
+    build.add_argument("--dictionary-dir", help="directory holding the dictionaries")
+    build.add_argument("--output", help="pack file to write")
+    args = parser.parse_args(argv)
 
-_word_manager = WordManager()
+    if args.command == "build":
+        manager = WordManager(dictionary_dir=args.dictionary_dir, use_pack=False)
+        path = manager.build_pack(args.output)
+        for level, packed in read_pack(path).items():
+            print(f"{level}: {len(packed.words)} entries")
+        print(f"Wrote {path}")
 
 
-def get_random_word(level: str) -> str:
-    return _word_manager.get_random_word(level)
+if __name__ == "__main__":
+    main()
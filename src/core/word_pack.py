@@ -0,0 +1,192 @@
+"""
+Word Pack
+
+Precompiled binary dictionary format. A pack holds every level's
+uppercased entries, in file order, together with their per-entry index
+arrays, so workers load dictionaries without parsing text files.
+
+Layout (little-endian): a header with magic, version, level count and a
+CRC-32 of the body, then one section per level with its name, the size
+and mtime of the text file it was built from, entry count, dictionary
+checksum, word offsets, letter masks, lengths, word counts,
+distinct-letter counts, the concatenated UTF-8 words and the level's
+precomputed selection pool with the constraints it was built for.
+"""
+
+import json
+import struct
+import sys
+import zlib
+from array import array
+from collections.abc import Sequence
+from typing import Any, Dict, Iterator, NamedTuple
+
+PACK_FILENAME = "words.pack"
+_PACK_MAGIC = b"HGWP"
+_PACK_VERSION = 2
+_PACK_HEADER = struct.Struct("<4sHHI")
+_LEVEL_HEADER = struct.Struct("<QQIII")
+_NAME_LENGTH = struct.Struct("<H")
+_POOL_HEADER = struct.Struct("<II")
+
+
+class PackedLevel(NamedTuple):
+    """One level's entries and precomputed index arrays."""
+
+    words: Sequence
+    masks: array
+    lengths: array
+    word_counts: array
+    distinct_letters: array
+    checksum: int
+    source_size: int
+    source_mtime_ns: int
+    pool: array
+    pool_constraints: Dict[str, Any]
+
+
+class PackedWordList(Sequence):
+    """Sequence of entries decoded on access from a packed word blob."""
+
+    def __init__(self, blob: bytes, offsets: array):
+        self._blob = blob
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("word index out of range")
+        start, end = self._offsets[index], self._offsets[index + 1]
+        return self._blob[start:end].decode("utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        blob, offsets = self._blob, self._offsets
+        for index in range(len(offsets) - 1):
+            yield blob[offsets[index] : offsets[index + 1]].decode("utf-8")
+
+
+def to_little_endian(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def from_little_endian(typecode: str, data: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def write_pack(path: str, levels: Dict[str, PackedLevel]):
+    """Write levels to a pack file at path."""
+    body = bytearray()
+    for name, level in levels.items():
+        encoded_words = [word.encode("utf-8") for word in level.words]
+        offsets = array("I", [0])
+        for word in encoded_words:
+            offsets.append(offsets[-1] + len(word))
+        blob = b"".join(encoded_words)
+
+        encoded_name = name.encode("utf-8")
+        body += _NAME_LENGTH.pack(len(encoded_name)) + encoded_name
+        body += _LEVEL_HEADER.pack(
+            level.source_size,
+            level.source_mtime_ns,
+            len(encoded_words),
+            level.checksum,
+            len(blob),
+        )
+        for values in (
+            offsets,
+            level.masks,
+            level.lengths,
+            level.word_counts,
+            level.distinct_letters,
+        ):
+            body += to_little_endian(values)
+        body += blob
+
+        constraints = json.dumps(level.pool_constraints, sort_keys=True).encode()
+        body += _POOL_HEADER.pack(len(constraints), len(level.pool))
+        body += constraints + to_little_endian(level.pool)
+
+    header = _PACK_HEADER.pack(
+        _PACK_MAGIC, _PACK_VERSION, len(levels), zlib.crc32(body)
+    )
+    with open(path, "wb") as file:
+        file.write(header)
+        file.write(body)
+
+
+def read_pack(path: str) -> Dict[str, PackedLevel]:
+    """Read and verify a pack file, raising ValueError if it is invalid."""
+    with open(path, "rb") as file:
+        data = file.read()
+
+    if len(data) < _PACK_HEADER.size:
+        raise ValueError(f"Truncated word pack: {path}")
+    magic, version, level_count, checksum = _PACK_HEADER.unpack_from(data)
+    if magic != _PACK_MAGIC or version != _PACK_VERSION:
+        raise ValueError(f"Unsupported word pack: {path}")
+    body = memoryview(data)[_PACK_HEADER.size :]
+    if zlib.crc32(body) != checksum:
+        raise ValueError(f"Corrupt word pack: {path}")
+
+    levels = {}
+    offset = 0
+    for _ in range(level_count):
+        (name_length,) = _NAME_LENGTH.unpack_from(body, offset)
+        offset += _NAME_LENGTH.size
+        name = bytes(body[offset : offset + name_length]).decode("utf-8")
+        offset += name_length
+
+        size, mtime_ns, count, level_checksum, blob_length = _LEVEL_HEADER.unpack_from(
+            body, offset
+        )
+        offset += _LEVEL_HEADER.size
+
+        arrays = []
+        for typecode, length in (
+            ("I", count + 1),
+            ("I", count),
+            ("H", count),
+            ("B", count),
+            ("B", count),
+        ):
+            end = offset + length * array(typecode).itemsize
+            arrays.append(from_little_endian(typecode, body[offset:end]))
+            offset = end
+        blob = bytes(body[offset : offset + blob_length])
+        offset += blob_length
+
+        constraints_length, pool_length = _POOL_HEADER.unpack_from(body, offset)
+        offset += _POOL_HEADER.size
+        constraints = json.loads(bytes(body[offset : offset + constraints_length]))
+        offset += constraints_length
+        end = offset + pool_length * array("I").itemsize
+        pool = from_little_endian("I", body[offset:end])
+        offset = end
+
+        offsets, masks, lengths, word_counts, distinct_letters = arrays
+        levels[name] = PackedLevel(
+            words=PackedWordList(blob, offsets),
+            masks=masks,
+            lengths=lengths,
+            word_counts=word_counts,
+            distinct_letters=distinct_letters,
+            checksum=level_checksum,
+            source_size=size,
+            source_mtime_ns=mtime_ns,
+            pool=pool,
+            pool_constraints=constraints,
+        )
+    return levels
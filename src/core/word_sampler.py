@@ -0,0 +1,88 @@
+"""
+Word Sampler
+
+Shuffle-bag sampling of dictionary positions without repeats.
+A bag walks a seeded pseudo-random permutation of range(size), so its
+whole state is a seed and a cursor rather than a shuffled copy of the
+pool. Every position is drawn once before any repeats, then the bag
+moves on to a fresh permutation.
+"""
+
+import random
+from typing import List, Optional
+
+_MASK_64 = (1 << 64) - 1
+_FEISTEL_ROUNDS = 4
+
+
+def _mix64(value: int) -> int:
+    """SplitMix64 finaliser, used to derive well-spread round keys."""
+    value = (value + 0x9E3779B97F4A7C15) & _MASK_64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK_64
+    return value ^ (value >> 31)
+
+
+class ShuffleBag:
+    """
+    Non-repeating sampler over range(size), reproducible from its seed.
+
+    Positions come from a small Feistel network over the next even power
+    of two, cycle-walking past values >= size, so next_index() is O(1)
+    expected and no per-bag list is ever built.
+    """
+
+    def __init__(self, size: int, seed: Optional[int] = None, cursor: int = 0):
+        if size <= 0:
+            raise ValueError("Cannot sample from an empty pool")
+
+        self.size = size
+        self.seed = random.getrandbits(64) if seed is None else seed & _MASK_64
+        self.cursor = cursor
+
+        self._half_bits = max(1, ((size - 1).bit_length() + 1) // 2)
+        self._half_mask = (1 << self._half_bits) - 1
+        self._epoch = -1
+        self._keys: List[int] = []
+
+    def _round_keys(self, epoch: int) -> List[int]:
+        if epoch != self._epoch:
+            base = _mix64(self.seed ^ _mix64(epoch))
+            self._keys = [_mix64(base + n) for n in range(_FEISTEL_ROUNDS)]
+            self._epoch = epoch
+        return self._keys
+
+    def _permute(self, value: int, keys: List[int]) -> int:
+        bits, mask = self._half_bits, self._half_mask
+        left, right = value >> bits, value & mask
+        for key in keys:
+            left, right = right, left ^ (_mix64(right ^ key) & mask)
+        return (left << bits) | right
+
+    def position(self, draw: int) -> int:
+        """Return the position drawn at cursor value draw."""
+        epoch, offset = divmod(draw, self.size)
+        keys = self._round_keys(epoch)
+
+        # Cycle-walk until the permuted value lands inside the pool
+        value = self._permute(offset, keys)
+        while value >= self.size:
+            value = self._permute(value, keys)
+        return value
+
+    def next_index(self) -> int:
+        index = self.position(self.cursor)
+        self.cursor += 1
+        return index
+
+    def resize(self, size: int):
+        """Restart the bag over a pool of a different size, keeping the seed."""
+        if size != self.size:
+            self.__init__(size, self.seed)
+
+    def __getstate__(self):
+        # Only the seed and cursor matter; round keys are re-derived
+        return {"size": self.size, "seed": self.seed, "cursor": self.cursor}
+
+    def __setstate__(self, state):
+        self.__init__(state["size"], state["seed"], state["cursor"])
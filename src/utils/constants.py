@@ -29,16 +29,20 @@ UNDERSCORE_PLACEHOLDER = "_"
 LETTER_SEPARATOR = " "
 
 # Difficulty Levels
+# Each level draws from its "source" dictionary in static/, filtered by the
+# optional min/max word length and word count limits.
 DIFFICULTY_LEVELS = {
     "basic": {
         "name": "Basic Level",
         "description": "Single words only",
+        "source": "basic_words.txt",
         "max_word_length": 15,
         "min_word_length": 4,
     },
     "intermediate": {
         "name": "Intermediate Level",
         "description": "Complete phrases",
+        "source": "intermediate_phrases.txt",
         "max_words": 4,
         "min_words": 2,
     },
@@ -46,3 +50,6 @@ DIFFICULTY_LEVELS = {
 
 # Valid input characters
 VALID_LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# Upper bound on letters accepted by one /guess/batch request
+MAX_BATCH_GUESSES = 1000
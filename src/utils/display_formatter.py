@@ -9,23 +9,14 @@ from .constants import UNDERSCORE_PLACEHOLDER, MAX_LIVES
 
 
 def format_word_display(word: str, guessed_letters: List[str]) -> str:
-    # Convert guessed letters to uppercase for comparison
-    guessed_upper = [letter.upper() for letter in guessed_letters]
-
-    result = ""
-
-    for char in word:
-        if char == " ":
-            # Preserve spaces as-is
-            result += " "
-        elif char.upper() in guessed_upper:
-            # Show guessed letters
-            result += char
-        else:
-            # Show underscore for unguessed letters
-            result += UNDERSCORE_PLACEHOLDER
-
-    return result
+    # Convert guessed letters to an uppercase set for comparison
+    guessed_upper = {letter.upper() for letter in guessed_letters}
+
+    # Preserve spaces, show guessed letters, underscore the rest
+    return "".join(
+        char if char == " " or char.upper() in guessed_upper else UNDERSCORE_PLACEHOLDER
+        for char in word
+    )
 
 
 def format_lives_display(lives: int, max_lives: int = MAX_LIVES) -> str:
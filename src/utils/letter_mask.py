@@ -0,0 +1,30 @@
+"""
+Letter Mask
+
+Pure utility functions for representing sets of letters A-Z as
+26-bit integer masks (bit 0 = A, bit 25 = Z).
+"""
+
+from typing import Iterable, List
+from .constants import VALID_LETTERS
+
+# Bit for each uppercase letter, for callers that have already normalised case
+LETTER_BITS = {letter: 1 << index for index, letter in enumerate(VALID_LETTERS)}
+_ANY_CASE_BITS = {**LETTER_BITS, **{k.lower(): v for k, v in LETTER_BITS.items()}}
+
+
+def letter_bit(letter: str) -> int:
+    # Non-letters (spaces, punctuation) have no bit
+    return _ANY_CASE_BITS.get(letter, 0)
+
+
+def letters_to_mask(letters: Iterable[str]) -> int:
+    mask = 0
+    for letter in set(letters):
+        mask |= _ANY_CASE_BITS.get(letter, 0)
+    return mask
+
+
+def mask_to_letters(mask: int) -> List[str]:
+    # Letters are returned in alphabetical order
+    return [letter for letter, bit in LETTER_BITS.items() if mask & bit]
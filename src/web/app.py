@@ -5,24 +5,155 @@ Creates and configures the Flask application instance.
 This follows the application factory pattern for better organization.
 """
 
+import os
+from typing import Optional
+
 from flask import Flask
+from src.core.dictionary_watcher import DictionaryWatcher
+from src.core.word_manager import get_word_manager
+from .assets import init_assets
+from .daily import init_daily_challenge, record_daily_timeout
+from .engine_service import init_engine_service
+from .game_events import init_event_log
+from .game_scores import init_leaderboard, record_final_score
+from .guess_timer import GuessTimer
+from .instrumentation import init_instrumentation
+from .render_cache import RenderCache
+from .rooms import init_rooms
 from .routes import hangman_bp
+from .session_store import (
+    CookieSessionStore,
+    MemorySessionStore,
+    SessionStore,
+    SQLiteSessionStore,
+)
 
 
-def create_app() -> Flask:
+def create_app(
+    session_store: Optional[SessionStore] = None, debug: Optional[bool] = None
+) -> Flask:
     """
     Create and configure Flask application.
+
+    Games are kept in session_store, keyed by a per-player game id.
+    When no store is given, HANGMAN_SESSION_STORE=cookie keeps games in the
+    signed session cookie, HANGMAN_SESSION_DB selects a SQLite store shared
+    across worker processes, and otherwise an in-process store is used.
+    HANGMAN_DICTIONARY_RELOAD_INTERVAL (seconds) enables dictionary hot
+    reload. HANGMAN_GUESS_TIMER=1 enforces the per-guess time limit on the
+    server. HANGMAN_ENGINE_SHARDS or HANGMAN_ENGINE_SOCKET_DIR runs games
+    in engine shard processes instead (see engine_service).
+    HANGMAN_EVENT_LOG records every game to an event log directory (see
+    game_events). HANGMAN_LEADERBOARD_DB snapshots the leaderboard to a
+    SQLite file (see game_scores) and HANGMAN_DAILY_STATS_DB collects
+    daily challenge stats in one (see daily). HANGMAN_METRICS=1 records
+    request timings served at /metrics (see instrumentation). Debug mode
+    defaults to on unless HANGMAN_DEBUG=0, and with it off
+    HANGMAN_SECRET_KEY must be set.
     """
     app = Flask(
         __name__, template_folder="../../templates", static_folder="../../static"
     )
 
     # Configure app
-    app.config["DEBUG"] = True
+    if debug is None:
+        debug = os.environ.get("HANGMAN_DEBUG", "1") != "0"
+    app.config["DEBUG"] = debug
+    # The key signs session cookies, authenticates engine shards and seeds
+    # the daily challenges, so the development default is never served
+    secret_key = os.environ.get("HANGMAN_SECRET_KEY")
+    if not secret_key:
+        if not debug:
+            raise RuntimeError("HANGMAN_SECRET_KEY must be set when debug is off")
+        secret_key = "dev"
+    app.config["SECRET_KEY"] = secret_key
+    app.config["GUESS_TIMER"] = os.environ.get("HANGMAN_GUESS_TIMER") == "1"
+
+    # Configure game session storage
+    if session_store is None:
+        db_path = os.environ.get("HANGMAN_SESSION_DB")
+        if os.environ.get("HANGMAN_SESSION_STORE") == "cookie":
+            session_store = CookieSessionStore()
+        elif db_path:
+            session_store = SQLiteSessionStore(db_path)
+        else:
+            session_store = MemorySessionStore()
+    app.extensions["hangman_session_store"] = session_store
+
+    # Serve static pages and the game page shell from memory unless
+    # templates are being edited (debug mode reloads them)
+    app.extensions["hangman_render_cache"] = RenderCache(enabled=not debug)
+
+    # Reload edited dictionaries in the background when enabled
+    reload_interval = os.environ.get("HANGMAN_DICTIONARY_RELOAD_INTERVAL")
+    if reload_interval:
+        word_manager = get_word_manager()
+        word_manager.add_reload_listener(
+            lambda stats: app.logger.info(
+                "Reloaded %s dictionary: %d entries in %.3fs, peak RSS %d KiB",
+                stats.level,
+                stats.entries,
+                stats.duration,
+                stats.peak_rss_kb,
+            )
+        )
+        watcher = DictionaryWatcher(word_manager, interval=float(reload_interval))
+        watcher.start()
+        app.extensions["hangman_dictionary_watcher"] = watcher
+
+    # Run games in engine shard processes when configured
+    init_engine_service(app)
+
+    # Append every game's history to the event log when configured
+    init_event_log(app)
+
+    # Rank finished games, snapshotting the boards when configured
+    init_leaderboard(app)
+
+    # Schedule the daily challenges and count how players fare
+    init_daily_challenge(app)
+
+    # Expire idle games from one timer wheel per worker. Cookie games can
+    # only be checked when their player's next request arrives, and engine
+    # shards run their own timers.
+    if (
+        app.config["GUESS_TIMER"]
+        and not isinstance(session_store, CookieSessionStore)
+        and "hangman_engine_service" not in app.extensions
+    ):
+        guess_timer = GuessTimer(session_store)
+        guess_timer.add_listener(
+            lambda game_id, engine, result: app.logger.info(
+                "Game %s timed out %d time(s), %d lives left",
+                game_id,
+                result["timeouts"],
+                engine.lives,
+            )
+        )
+        event_log = app.extensions.get("hangman_event_log")
+        if event_log is not None:
+            guess_timer.add_listener(event_log.record_timeout)
+        guess_timer.add_listener(
+            lambda game_id, engine, result: record_final_score(app, game_id, engine)
+        )
+        guess_timer.add_listener(
+            lambda game_id, engine, result: record_daily_timeout(app, engine)
+        )
+        guess_timer.start()
+        app.extensions["hangman_guess_timer"] = guess_timer
 
     # Register blueprints
     app.register_blueprint(hangman_bp)
 
+    # Host multiplayer rooms, played over the ASGI app's WebSockets
+    init_rooms(app)
+
+    # Serve fingerprinted, precompressed assets once they have been built
+    init_assets(app)
+
+    # Time requests and serve /metrics when enabled
+    init_instrumentation(app)
+
     return app
 
 
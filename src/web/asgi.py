@@ -0,0 +1,378 @@
+"""
+ASGI Application
+
+ASGI entry point for the hangman game, for async servers such as Uvicorn.
+/guess and /game/<level> are served natively with non-blocking session
+store access; every other route is handed to the Flask app through a
+WSGI bridge running in a worker thread. Sessions use the same signed
+cookie as the Flask app, so both entry points can serve the same player.
+/ws upgrades a started game to a realtime WebSocket connection, and
+/rooms/<room_id>/ws joins a multiplayer room.
+
+Run with: uvicorn --factory src.web.asgi:create_asgi_app
+"""
+
+import asyncio
+import io
+import json
+import sys
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from flask import Flask
+from itsdangerous import BadSignature
+from werkzeug.http import dump_cookie, parse_cookie
+
+from src.core.game_engine import GameEngine
+from src.utils.constants import DIFFICULTY_LEVELS, VALID_LETTERS
+from .app import create_app
+from .daily import track_daily_game
+from .game_events import record_game_events
+from .game_scores import record_final_score
+from .guess_timer import check_guess_timer, hold_game_lock, restart_guess_timer
+from .instrumentation import guess_stages, record_request_time
+from .realtime import CLOSE_NO_ACTIVE_GAME, CLOSE_POLICY_VIOLATION, GameConnection
+from .routes import parse_since, play_guess, render_game_page
+from .session_store import CookieSessionStore
+
+Headers = List[Tuple[bytes, bytes]]
+
+
+class HangmanASGIApp:
+    def __init__(
+        self,
+        flask_app: Flask,
+        tick_interval: float = 1.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.flask_app = flask_app
+        self.tick_interval = tick_interval
+        self.clock = clock
+        self.store = flask_app.extensions["hangman_session_store"]
+        self.engine_service = flask_app.extensions.get("hangman_engine_service")
+        self.rooms = flask_app.extensions["hangman_rooms"]
+        self._serializer = flask_app.session_interface.get_signing_serializer(flask_app)
+        self._cookie_name = flask_app.config["SESSION_COOKIE_NAME"]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] == "websocket":
+            path = scope["path"]
+            if path == "/ws":
+                await self._websocket(scope, receive, send)
+            elif path.startswith("/rooms/") and path.endswith("/ws"):
+                room_id = path[len("/rooms/") : -len("/ws")]
+                await self.rooms.serve(room_id, scope, receive, send)
+            else:
+                await send({"type": "websocket.close"})
+            return
+        if scope["type"] != "http":
+            return
+
+        path, method = scope["path"], scope["method"]
+        if self.engine_service is not None:
+            # Engine work already runs outside this process
+            await self._wsgi(scope, receive, send)
+        elif path == "/guess" and method == "POST":
+            start = time.perf_counter()
+            await self._guess(scope, receive, send)
+            record_request_time(self.flask_app, "hangman.guess_letter", start)
+        elif (
+            path.startswith("/game/")
+            and method == "GET"
+            and path[len("/game/") :] in DIFFICULTY_LEVELS
+        ):
+            start = time.perf_counter()
+            await self._game(scope, path[len("/game/") :], send)
+            record_request_time(self.flask_app, "hangman.game", start)
+        else:
+            await self._wsgi(scope, receive, send)
+
+    @staticmethod
+    async def _lifespan(receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    # Session cookie and store helpers
+
+    def _load_session(self, scope) -> Dict[str, Any]:
+        cookie_header = b"; ".join(
+            value for name, value in scope["headers"] if name == b"cookie"
+        )
+        cookie = parse_cookie(cookie_header.decode("latin-1")).get(self._cookie_name)
+        if not cookie or self._serializer is None:
+            return {}
+        max_age = int(self.flask_app.permanent_session_lifetime.total_seconds())
+        try:
+            return self._serializer.loads(cookie, max_age=max_age)
+        except BadSignature:
+            return {}
+
+    def _session_header(self, session_data: Dict[str, Any]) -> Tuple[bytes, bytes]:
+        config = self.flask_app.config
+        cookie = dump_cookie(
+            self._cookie_name,
+            self._serializer.dumps(session_data),
+            path=config["SESSION_COOKIE_PATH"] or "/",
+            httponly=config["SESSION_COOKIE_HTTPONLY"],
+            secure=config["SESSION_COOKIE_SECURE"],
+            samesite=config["SESSION_COOKIE_SAMESITE"],
+        )
+        return b"set-cookie", cookie.encode("latin-1")
+
+    async def load_engine(
+        self, session_data: Dict[str, Any], game_id: str
+    ) -> Optional[GameEngine]:
+        if isinstance(self.store, CookieSessionStore):
+            return self.store.load(session_data, game_id)
+        if self.store.blocking:
+            return await asyncio.to_thread(self.store.get, game_id)
+        return self.store.get(game_id)
+
+    async def save_engine(
+        self, session_data: Dict[str, Any], game_id: str, engine: GameEngine
+    ):
+        session_data["game_id"] = game_id
+        if isinstance(self.store, CookieSessionStore):
+            self.store.save(session_data, game_id, engine)
+        elif self.store.blocking:
+            await asyncio.to_thread(self.store.set, game_id, engine)
+        else:
+            self.store.set(game_id, engine)
+
+    # Native routes
+
+    async def _guess(self, scope, receive, send):
+        stages = guess_stages(self.flask_app)
+        body = await _read_body(receive)
+        try:
+            data = json.loads(body or b"{}")
+        except ValueError:
+            data = None
+        if not isinstance(data, dict):
+            await _send_json(send, 400, {"error": "Invalid JSON body"})
+            return
+
+        letter = str(data.get("letter", "")).upper()
+        if not letter or letter not in VALID_LETTERS:
+            await _send_json(send, 400, {"error": "Invalid letter"})
+            return
+        try:
+            since = parse_since(data)
+        except ValueError as error:
+            await _send_json(send, 400, {"error": str(error)})
+            return
+        if stages is not None:
+            stages.mark("parse")
+
+        session_data = self._load_session(scope)
+        game_id = session_data.get("game_id")
+        if not game_id:
+            await _send_json(send, 404, {"error": "No active game"})
+            return
+        async with hold_game_lock(self.flask_app, game_id):
+            engine = await self.load_engine(session_data, game_id)
+            if stages is not None:
+                stages.mark("load")
+            if engine is None:
+                await _send_json(send, 404, {"error": "No active game"})
+                return
+
+            record_game_events(self.flask_app, game_id, engine)
+            daily = track_daily_game(self.flask_app, engine)
+            timeout = check_guess_timer(self.flask_app, engine)
+            response = play_guess(engine, letter, since, timeout, stages)
+            if daily is not None:
+                daily.detach()
+            record_final_score(self.flask_app, game_id, engine)
+            restart_guess_timer(self.flask_app, game_id, engine)
+            await self.save_engine(session_data, game_id, engine)
+            if stages is not None:
+                stages.mark("save")
+
+        headers = [(b"content-type", b"application/json")]
+        if isinstance(self.store, CookieSessionStore):
+            headers.append(self._session_header(session_data))
+        body = json.dumps(response).encode("utf-8")
+        if stages is not None:
+            stages.mark("jsonify")
+        await _send_response(send, 200, body, headers)
+
+    async def _game(self, scope, level: str, send):
+        session_data = self._load_session(scope)
+        # Rank the game being left before its score is dropped
+        previous_id = session_data.get("game_id")
+        if previous_id:
+            previous = await self.load_engine(session_data, previous_id)
+            if previous is not None:
+                record_final_score(self.flask_app, previous_id, previous, replaced=True)
+
+        game_id = uuid.uuid4().hex
+        engine = GameEngine(level)
+        record_game_events(self.flask_app, game_id, engine, started=True)
+        restart_guess_timer(self.flask_app, game_id, engine)
+        await self.save_engine(session_data, game_id, engine)
+
+        html = await asyncio.to_thread(
+            self._render_game, scope["path"], level, engine.get_game_state()
+        )
+        await _send_response(
+            send,
+            200,
+            html.encode("utf-8"),
+            [
+                (b"content-type", b"text/html; charset=utf-8"),
+                self._session_header(session_data),
+            ],
+        )
+
+    def _render_game(self, path: str, level: str, game_state: Dict[str, Any]) -> str:
+        with self.flask_app.test_request_context(path):
+            return render_game_page(level, game_state)
+
+    async def _websocket(self, scope, receive, send):
+        message = await receive()
+        if message["type"] != "websocket.connect":
+            return
+
+        # Cookie-only sessions cannot be updated over a WebSocket, and
+        # engine shards do not stream game updates
+        if isinstance(self.store, CookieSessionStore) or self.engine_service:
+            await send({"type": "websocket.close", "code": CLOSE_POLICY_VIOLATION})
+            return
+
+        session_data = self._load_session(scope)
+        game_id = session_data.get("game_id")
+        engine = await self.load_engine(session_data, game_id) if game_id else None
+        if engine is None:
+            await send({"type": "websocket.close", "code": CLOSE_NO_ACTIVE_GAME})
+            return
+        record_game_events(self.flask_app, game_id, engine)
+        daily = track_daily_game(self.flask_app, engine)
+
+        async def save(engine: GameEngine):
+            if daily is not None:
+                daily.check()
+            record_final_score(self.flask_app, game_id, engine)
+            await self.save_engine(session_data, game_id, engine)
+            timer = self.flask_app.extensions.get("hangman_guess_timer")
+            if timer is not None:
+                timer.watch(game_id, engine)
+
+        await send({"type": "websocket.accept"})
+        connection = GameConnection(
+            engine,
+            send,
+            save,
+            self.tick_interval,
+            self.clock,
+            lock=lambda: hold_game_lock(self.flask_app, game_id),
+        )
+        try:
+            await connection.run(receive)
+        finally:
+            if daily is not None:
+                daily.detach()
+
+    # WSGI bridge for every other route
+
+    async def _wsgi(self, scope, receive, send):
+        body = await _read_body(receive)
+        status, headers, content = await asyncio.to_thread(self._call_wsgi, scope, body)
+        await _send_response(send, status, content, headers)
+
+    def _call_wsgi(self, scope, body: bytes) -> Tuple[int, Headers, bytes]:
+        server = scope.get("server") or ("localhost", 80)
+        client = scope.get("client") or ("", 0)
+        environ = {
+            "REQUEST_METHOD": scope["method"],
+            "SCRIPT_NAME": scope.get("root_path", ""),
+            "PATH_INFO": scope["path"],
+            "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+            "SERVER_NAME": server[0],
+            "SERVER_PORT": str(server[1]),
+            "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+            "REMOTE_ADDR": client[0],
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": scope.get("scheme", "http"),
+            "wsgi.input": io.BytesIO(body),
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": True,
+            "wsgi.run_once": False,
+        }
+        for name, value in scope["headers"]:
+            key = name.decode("latin-1").upper().replace("-", "_")
+            value = value.decode("latin-1")
+            if key not in ("CONTENT_TYPE", "CONTENT_LENGTH"):
+                key = f"HTTP_{key}"
+            environ[key] = f"{environ[key]},{value}" if key in environ else value
+
+        response: Dict[str, Any] = {}
+
+        def start_response(status, response_headers, exc_info=None):
+            response["status"] = int(status.split(" ", 1)[0])
+            response["headers"] = [
+                (name.lower().encode("latin-1"), value.encode("latin-1"))
+                for name, value in response_headers
+            ]
+
+        result = self.flask_app.wsgi_app(environ, start_response)
+        try:
+            content = b"".join(result)
+        finally:
+            if hasattr(result, "close"):
+                result.close()
+        return response["status"], response["headers"], content
+
+
+async def _read_body(receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body"):
+            return b"".join(chunks)
+
+
+async def _send_response(send, status: int, body: bytes, headers: Headers):
+    if not any(name == b"content-length" for name, _ in headers):
+        headers = headers + [(b"content-length", str(len(body)).encode("latin-1"))]
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _send_json(
+    send, status: int, payload: Dict[str, Any], headers: Optional[Headers] = None
+):
+    body = json.dumps(payload).encode("utf-8")
+    await _send_response(
+        send,
+        status,
+        body,
+        [(b"content-type", b"application/json")] + (headers or []),
+    )
+
+
+def create_asgi_app(
+    flask_app: Optional[Flask] = None,
+    tick_interval: float = 1.0,
+    clock: Callable[[], float] = time.time,
+) -> HangmanASGIApp:
+    """
+    Create the ASGI application.
+
+    Wraps flask_app, or a new app from create_app() when none is given,
+    sharing its session store, templates and session cookie. WebSocket
+    games send a timer tick every tick_interval seconds and measure guess
+    deadlines with clock.
+    """
+    return HangmanASGIApp(flask_app or create_app(), tick_interval, clock)
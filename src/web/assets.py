@@ -0,0 +1,191 @@
+"""
+Static Asset Pipeline
+
+Build step for the web layer's CSS and JavaScript. Each asset is
+minified (CSS only), fingerprinted with a hash of its content and
+written to static/dist together with gzip and, when the brotli package
+is installed, brotli variants. A manifest maps source names to built
+names; with it present, url_for("static", ...) emits the fingerprinted
+URL and /static/dist serves the best precompressed variant with
+immutable cache headers.
+
+Usage: python -m src.web.assets build
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+from typing import Dict, List, NamedTuple, Optional
+
+from flask import Flask, Response, abort, request, send_from_directory
+
+try:
+    import brotli
+except ImportError:  # Optional; only gzip variants are built without it
+    brotli = None
+
+STATIC_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "static")
+DIST_DIRNAME = "dist"
+MANIFEST_FILENAME = "manifest.json"
+ASSETS = ("css/style.css", "css/game.css", "js/game.js")
+
+# One year; safe because a content change produces a new file name
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+_CSS_STRING = re.compile(r"(\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*')")
+
+
+def minify_css(css: str) -> str:
+    """Strip comments and insignificant whitespace from a stylesheet."""
+    # Odd-numbered parts are quoted strings, which are kept verbatim
+    parts = _CSS_STRING.split(css)
+    for index in range(0, len(parts), 2):
+        code = re.sub(r"/\*.*?\*/", "", parts[index], flags=re.S)
+        code = re.sub(r"\s+", " ", code)
+        code = re.sub(r"\s*([{};,>])\s*", r"\1", code)
+        # Only after a colon: "a :hover" and "a:hover" are different selectors
+        parts[index] = re.sub(r":\s+", ":", code)
+    return "".join(parts).replace(";}", "}").strip()
+
+
+def fingerprint(name: str, content: bytes) -> str:
+    """Return name with a short content hash before its extension."""
+    root, ext = os.path.splitext(name)
+    return f"{root}.{hashlib.sha256(content).hexdigest()[:12]}{ext}"
+
+
+def build(static_dir: str = STATIC_DIR) -> Dict[str, str]:
+    """Build every asset into static_dir/dist and write the manifest."""
+    dist_dir = os.path.join(static_dir, DIST_DIRNAME)
+    manifest = {}
+    for name in ASSETS:
+        with open(os.path.join(static_dir, name), encoding="utf-8") as file:
+            source = file.read()
+        if name.endswith(".css"):
+            source = minify_css(source)
+        content = source.encode("utf-8")
+
+        built_name = fingerprint(name, content)
+        path = os.path.join(dist_dir, built_name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as file:
+            file.write(content)
+        # mtime=0 keeps gzip output reproducible between builds
+        with open(path + ".gz", "wb") as file:
+            file.write(gzip.compress(content, compresslevel=9, mtime=0))
+        if brotli is not None:
+            with open(path + ".br", "wb") as file:
+                file.write(brotli.compress(content))
+
+        manifest[name] = f"{DIST_DIRNAME}/{built_name}"
+
+    with open(os.path.join(dist_dir, MANIFEST_FILENAME), "w") as file:
+        json.dump(manifest, file, indent=2, sort_keys=True)
+    return manifest
+
+
+def load_manifest(static_dir: str = STATIC_DIR) -> Optional[Dict[str, str]]:
+    path = os.path.join(static_dir, DIST_DIRNAME, MANIFEST_FILENAME)
+    try:
+        with open(path) as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return None
+
+
+class BuiltAssets(NamedTuple):
+    manifest: Dict[str, str]
+    dist_dir: str
+
+
+def init_assets(app: Flask, static_dir: Optional[str] = None):
+    """
+    Serve built assets on app when a manifest exists.
+
+    url_for("static", filename=...) is rewritten to the fingerprinted file,
+    which is served from /static/dist with immutable caching and the best
+    precompressed variant the client accepts. Without a manifest (no build
+    has run) the source files are served as before. Calling this again
+    reloads the manifest, e.g. after a rebuild.
+    """
+    static_dir = static_dir or app.static_folder
+    manifest = load_manifest(static_dir)
+    if manifest is None:
+        app.extensions.pop("hangman_assets", None)
+    else:
+        dist_dir = os.path.join(static_dir, DIST_DIRNAME)
+        app.extensions["hangman_assets"] = BuiltAssets(manifest, dist_dir)
+
+    if manifest is None or "static_dist" in app.view_functions:
+        return
+
+    @app.url_defaults
+    def fingerprinted_static_url(endpoint, values):
+        built = app.extensions.get("hangman_assets")
+        if endpoint == "static" and built is not None:
+            filename = values.get("filename")
+            values["filename"] = built.manifest.get(filename, filename)
+
+    def serve_dist(filename: str) -> Response:
+        built = app.extensions.get("hangman_assets")
+        if built is None or filename == MANIFEST_FILENAME:
+            abort(404)
+        path = os.path.join(built.dist_dir, filename)
+        if not os.path.isfile(path):
+            abort(404)
+
+        accepted = request.headers.get("Accept-Encoding", "")
+        encoding = None
+        for name, suffix in _ENCODINGS:
+            if name in accepted and os.path.isfile(path + suffix):
+                encoding = name
+                filename += suffix
+                break
+
+        response = send_from_directory(built.dist_dir, filename, conditional=True)
+        if encoding is not None:
+            # Keep the original type rather than one guessed from .gz/.br
+            response.content_type = _content_type(path)
+            response.headers["Content-Encoding"] = encoding
+        response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        response.vary.add("Accept-Encoding")
+        return response
+
+    app.add_url_rule(
+        f"{app.static_url_path}/{DIST_DIRNAME}/<path:filename>",
+        endpoint="static_dist",
+        view_func=serve_dist,
+    )
+
+
+def _content_type(path: str) -> str:
+    if path.endswith(".css"):
+        return "text/css; charset=utf-8"
+    if path.endswith(".js"):
+        return "text/javascript; charset=utf-8"
+    return "application/octet-stream"
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Build the static assets.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build_parser = subparsers.add_parser(
+        "build", help="minify, fingerprint and precompress the static assets"
+    )
+    build_parser.add_argument("--static-dir", default=STATIC_DIR)
+    args = parser.parse_args(argv)
+
+    manifest = build(args.static_dir)
+    for name, built_name in sorted(manifest.items()):
+        print(f"{name} -> {built_name}")
+    if brotli is None:
+        print("brotli is not installed; built gzip variants only")
+
+
+if __name__ == "__main__":
+    main()
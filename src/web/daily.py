@@ -0,0 +1,85 @@
+"""
+Daily Challenge Routes
+
+Serves the daily challenge (src.core.daily_challenge): /daily/<level>
+starts a game on the day's words and /daily/<level>/stats reports how
+players fared with each of them, revealing the words of past days only.
+HANGMAN_DAILY_STATS_DB names a SQLite database the stats of every
+worker are added up in; without it each worker counts its own players.
+
+Games run in engine shards play the same words but are not counted.
+"""
+
+import atexit
+import datetime
+import os
+from typing import Optional
+
+from flask import Flask, abort, jsonify, request
+
+from src.core.daily_challenge import DailySchedule, DailyStats, DailyTracker
+from src.core.game_engine import GameEngine
+from src.utils.constants import DIFFICULTY_LEVELS
+
+
+def init_daily_challenge(app: Flask):
+    """Precompute the coming challenges and register /daily/<level>/stats."""
+    schedule = DailySchedule(app.config["SECRET_KEY"].encode())
+    schedule.precompute()
+    db_path = os.environ.get("HANGMAN_DAILY_STATS_DB")
+    stats = DailyStats(db_path)
+    if db_path:
+        atexit.register(stats.close)
+    app.extensions["hangman_daily_schedule"] = schedule
+    app.extensions["hangman_daily_stats"] = stats
+
+    def daily_stats(level: str):
+        if level not in DIFFICULTY_LEVELS:
+            abort(404)
+        today = schedule.today()
+        try:
+            day = datetime.date.fromisoformat(request.args.get("date", ""))
+        except ValueError:
+            day = today
+        if day > today:
+            return jsonify({"error": "Invalid date"}), 400
+
+        words = stats.summary(day, level)
+        if day < today:
+            scheduled = schedule.words(day, level)
+            for word in words:
+                word["word"] = scheduled[word["position"]]
+        return jsonify({"level": level, "date": day.isoformat(), "words": words})
+
+    app.add_url_rule(
+        "/daily/<level>/stats", endpoint="daily_stats", view_func=daily_stats
+    )
+
+
+def track_daily_game(app, engine: GameEngine) -> Optional[DailyTracker]:
+    """
+    Start counting the game's words if it plays a daily challenge.
+
+    Call detach() on the returned tracker once the request is done with
+    the game.
+    """
+    schedule = app.extensions.get("hangman_daily_schedule")
+    if schedule is None:
+        return None
+    day = schedule.day_of(engine)
+    if day is None:
+        return None
+    return DailyTracker(app.extensions["hangman_daily_stats"], day, engine)
+
+
+def record_daily_timeout(app, engine: GameEngine):
+    """Count a daily game lost to the guess timer between requests."""
+    # Games being played count their own losses
+    if isinstance(engine.recorder, DailyTracker) or not engine.check_game_over():
+        return
+    schedule = app.extensions.get("hangman_daily_schedule")
+    day = schedule.day_of(engine) if schedule is not None else None
+    if day is not None:
+        app.extensions["hangman_daily_stats"].record_failed(
+            day, engine.level, engine.word_bag.cursor - 1
+        )
@@ -0,0 +1,461 @@
+"""
+Engine Service
+
+Optional mode that moves GameEngine work out of the web workers, so it
+no longer competes with request handling for their GIL. A pool of shard
+processes each owns the games whose id hashes to it, kept in an
+in-memory store, and executes batches of game operations received over a
+local Unix socket. Web workers keep one connection per shard; requests
+from concurrent threads for the same shard are coalesced into a single
+round trip.
+
+HANGMAN_ENGINE_SHARDS=4 starts four shards together with the app. For
+several web workers, start the shards once and point every worker at
+them with HANGMAN_ENGINE_SOCKET_DIR:
+
+    python -m src.web.engine_service --socket-dir /run/hangman --shards 4
+"""
+
+import argparse
+import atexit
+import glob
+import multiprocessing
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import zlib
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from flask import Flask, jsonify
+
+from src.core.game_engine import GameEngine
+from .guess_timer import GuessTimer
+from .routes import play_guess, play_guesses
+from .session_store import MemorySessionStore
+
+SOCKET_PATTERN = "shard-{}.sock"
+_SOCKET_INDEX = re.compile(r"shard-(\d+)\.sock$")
+
+# Seconds to wait for a shard process to start listening
+_START_TIMEOUT = 30.0
+
+Request = Tuple[str, Tuple[Any, ...]]
+Result = Tuple[bool, Any]
+
+
+class EngineServiceError(Exception):
+    """Raised when a shard fails an operation or cannot be reached."""
+
+
+class EngineShard:
+    """The games owned by one shard process and the operations on them."""
+
+    def __init__(
+        self, guess_timer: bool = False, clock: Callable[[], float] = time.time
+    ):
+        self.store = MemorySessionStore()
+        self.clock = clock
+        self.guess_timer = GuessTimer(self.store, clock=clock) if guess_timer else None
+        # One batch or timer sweep at a time, as they share engine objects
+        self._lock = threading.Lock()
+        self._operations: Dict[str, Callable[..., Any]] = {
+            "new_game": self.new_game,
+            "guess": self.guess,
+            "guess_batch": self.guess_batch,
+            "count": self.count,
+        }
+
+    def execute(self, batch: List[Request]) -> List[Result]:
+        """Run a batch of (operation, args) requests in order."""
+        results = []
+        with self._lock:
+            for operation, args in batch:
+                try:
+                    results.append((True, self._operations[operation](*args)))
+                except Exception as error:  # Reported back to the caller
+                    results.append((False, f"{type(error).__name__}: {error}"))
+        return results
+
+    def new_game(
+        self, game_id: str, level: str, seed: Optional[int] = None
+    ) -> Dict[str, Any]:
+        engine = GameEngine(level, seed)
+        self._restart_timer(game_id, engine)
+        self.store.set(game_id, engine)
+        return engine.get_game_state()
+
+    def guess(
+        self, game_id: str, letter: str, since: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        engine = self.store.get(game_id)
+        if engine is None:
+            return None
+
+        response = play_guess(engine, letter, since, self._check_timer(engine))
+        self._restart_timer(game_id, engine)
+        self.store.set(game_id, engine)
+        return response
+
+    def guess_batch(self, game_id: str, letters: List[str]) -> Optional[Dict[str, Any]]:
+        engine = self.store.get(game_id)
+        if engine is None:
+            return None
+
+        response = play_guesses(engine, letters, self._check_timer(engine))
+        self._restart_timer(game_id, engine)
+        self.store.set(game_id, engine)
+        return response
+
+    def count(self) -> int:
+        return len(self.store)
+
+    def run_timer(self):
+        """Expire overdue guesses once per tick, between batches."""
+        while True:
+            time.sleep(self.guess_timer.tick)
+            with self._lock:
+                self.guess_timer.expire()
+
+    def _check_timer(self, engine: GameEngine) -> Optional[Dict[str, Any]]:
+        if self.guess_timer is None:
+            return None
+        return engine.check_timeout(self.clock())
+
+    def _restart_timer(self, game_id: str, engine: GameEngine):
+        if self.guess_timer is not None:
+            engine.start_timer(self.clock())
+            self.guess_timer.watch(game_id, engine)
+
+
+def serve_shard(
+    address: str,
+    authkey: Optional[bytes] = None,
+    guess_timer: bool = False,
+    ready: Optional[Any] = None,
+):
+    """Serve one shard on a Unix socket until the process is stopped."""
+    shard = EngineShard(guess_timer)
+    if shard.guess_timer is not None:
+        threading.Thread(target=shard.run_timer, daemon=True).start()
+
+    with Listener(address, family="AF_UNIX", authkey=authkey) as listener:
+        if ready is not None:
+            ready.set()
+        while True:
+            try:
+                connection = listener.accept()
+            except (OSError, multiprocessing.AuthenticationError):
+                continue
+            threading.Thread(
+                target=_serve_connection, args=(shard, connection), daemon=True
+            ).start()
+
+
+def _serve_connection(shard: EngineShard, connection: Connection):
+    with connection:
+        while True:
+            try:
+                batch = connection.recv()
+            except (EOFError, OSError):
+                return
+            connection.send(shard.execute(batch))
+
+
+class _Call:
+    __slots__ = ("request", "result")
+
+    def __init__(self, request: Request):
+        self.request = request
+        self.result: Result = (False, "Shard connection lost")
+
+
+class ShardClient:
+    """
+    Connection to one shard, shared by the threads of a web worker.
+
+    A thread queues its request and then waits its turn to talk to the
+    shard; whoever gets the turn sends everything queued so far as one
+    batch, so under load each round trip serves many requests. A batch
+    that could not be sent, such as over a connection dropped by a shard
+    restart, is sent once more on a new connection; one lost after it
+    was sent is not, since the shard may already have applied it.
+    """
+
+    def __init__(self, address: str, authkey: Optional[bytes] = None):
+        self.address = address
+        self.authkey = authkey
+        self._connection: Optional[Connection] = None
+        self._pending: List[_Call] = []
+        self._pending_lock = threading.Lock()
+        self._io_lock = threading.Lock()
+
+    def call(self, operation: str, *args) -> Any:
+        call = _Call((operation, args))
+        with self._pending_lock:
+            self._pending.append(call)
+
+        with self._io_lock:
+            with self._pending_lock:
+                batch, self._pending = self._pending, []
+            # An empty batch means another thread already sent this call
+            if batch:
+                results = self._round_trip([queued.request for queued in batch])
+                for queued, result in zip(batch, results):
+                    queued.result = result
+
+        ok, value = call.result
+        if not ok:
+            raise EngineServiceError(value)
+        return value
+
+    def _connect(self) -> Connection:
+        return Client(self.address, family="AF_UNIX", authkey=self.authkey)
+
+    def _round_trip(self, requests: List[Request]) -> List[Result]:
+        """Send one batch and return its results."""
+        for attempt in range(2):
+            try:
+                if self._connection is None:
+                    self._connection = self._connect()
+                self._connection.send(requests)
+                break
+            except OSError as error:
+                # Nothing reached the shard, so the batch can be sent again
+                self.close()
+                if attempt:
+                    raise EngineServiceError("Shard unavailable") from error
+
+        try:
+            return self._connection.recv()
+        except (EOFError, OSError) as error:
+            # Guesses are not idempotent, so the batch is not sent again
+            self.close()
+            raise EngineServiceError("Shard connection lost") from error
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+class EngineServiceClient:
+    """
+    Routes game operations to the shard owning each game id.
+
+    Connections are opened on first use in each process.
+    """
+
+    def __init__(self, addresses: List[str], authkey: Optional[bytes] = None):
+        if not addresses:
+            raise ValueError("An engine service needs at least one shard")
+
+        self.addresses = list(addresses)
+        self.authkey = authkey
+        self._shards: Dict[int, ShardClient] = {}
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_socket_dir(
+        cls, socket_dir: str, authkey: Optional[bytes] = None
+    ) -> "EngineServiceClient":
+        """Connect to the shards serving from socket_dir."""
+        sockets = {}
+        for path in glob.glob(os.path.join(socket_dir, SOCKET_PATTERN.format("*"))):
+            match = _SOCKET_INDEX.search(path)
+            if match:
+                sockets[int(match.group(1))] = path
+        if sorted(sockets) != list(range(len(sockets))):
+            raise ValueError(f"Incomplete set of shard sockets in {socket_dir}")
+        return cls([sockets[index] for index in sorted(sockets)], authkey)
+
+    def shard_for(self, game_id: str) -> int:
+        return zlib.crc32(game_id.encode("utf-8")) % len(self.addresses)
+
+    def new_game(
+        self, game_id: str, level: str, seed: Optional[int] = None
+    ) -> Dict[str, Any]:
+        return self._call(game_id, "new_game", game_id, level, seed)
+
+    def guess(
+        self, game_id: str, letter: str, since: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        return self._call(game_id, "guess", game_id, letter, since)
+
+    def guess_batch(self, game_id: str, letters: List[str]) -> Optional[Dict[str, Any]]:
+        return self._call(game_id, "guess_batch", game_id, letters)
+
+    def game_counts(self) -> List[int]:
+        """Return the number of games held by each shard."""
+        return [
+            self._shard(index).call("count") for index in range(len(self.addresses))
+        ]
+
+    def close(self):
+        with self._lock:
+            for shard in self._shards.values():
+                shard.close()
+            self._shards = {}
+
+    def _call(self, game_id: str, operation: str, *args) -> Any:
+        return self._shard(self.shard_for(game_id)).call(operation, *args)
+
+    def _shard(self, index: int) -> ShardClient:
+        if self._pid != os.getpid():
+            # Forked: the parent's connections belong to the parent
+            self._shards = {}
+            self._pid = os.getpid()
+
+        shard = self._shards.get(index)
+        if shard is None:
+            with self._lock:
+                shard = self._shards.get(index)
+                if shard is None:
+                    shard = ShardClient(self.addresses[index], self.authkey)
+                    self._shards[index] = shard
+        return shard
+
+
+class EngineService:
+    """Starts and stops a pool of shard processes on this host."""
+
+    def __init__(
+        self,
+        shards: int,
+        socket_dir: Optional[str] = None,
+        authkey: Optional[bytes] = None,
+        guess_timer: bool = False,
+    ):
+        if shards < 1:
+            raise ValueError("An engine service needs at least one shard")
+
+        self.shards = shards
+        self.authkey = authkey
+        self.guess_timer = guess_timer
+        self._owns_socket_dir = socket_dir is None
+        self.socket_dir = socket_dir or tempfile.mkdtemp(prefix="hangman-engines-")
+        self.addresses = [
+            os.path.join(self.socket_dir, SOCKET_PATTERN.format(index))
+            for index in range(shards)
+        ]
+        self._processes: List[multiprocessing.Process] = []
+
+    def start(self):
+        os.makedirs(self.socket_dir, exist_ok=True)
+        for address in self.addresses:
+            if os.path.exists(address):
+                os.unlink(address)
+
+        events = []
+        for index, address in enumerate(self.addresses):
+            ready = multiprocessing.Event()
+            process = multiprocessing.Process(
+                target=serve_shard,
+                args=(address, self.authkey, self.guess_timer, ready),
+                name=f"hangman-engine-{index}",
+                daemon=True,
+            )
+            process.start()
+            self._processes.append(process)
+            events.append(ready)
+
+        for ready in events:
+            if not ready.wait(_START_TIMEOUT):
+                self.stop()
+                raise EngineServiceError("Engine shard did not start")
+
+    def join(self):
+        """Wait for the shard processes to exit."""
+        for process in self._processes:
+            process.join()
+
+    def stop(self):
+        for process in self._processes:
+            process.terminate()
+        for process in self._processes:
+            process.join()
+        self._processes = []
+
+        if self._owns_socket_dir:
+            shutil.rmtree(self.socket_dir, ignore_errors=True)
+        else:
+            for address in self.addresses:
+                if os.path.exists(address):
+                    os.unlink(address)
+
+    def client(self) -> EngineServiceClient:
+        return EngineServiceClient(self.addresses, self.authkey)
+
+
+def init_engine_service(app: Flask):
+    """
+    Route the app's games through an engine service when configured.
+
+    HANGMAN_ENGINE_SHARDS starts that many shard processes owned by this
+    app; otherwise HANGMAN_ENGINE_SOCKET_DIR connects to shards started
+    separately. Shards authenticate connections with the app's secret key.
+    Their games are not ranked or counted in daily challenge stats, which
+    is logged at startup. A shard that fails or cannot be reached answers
+    requests with 503.
+    """
+    authkey = app.config["SECRET_KEY"].encode("utf-8")
+    shards = os.environ.get("HANGMAN_ENGINE_SHARDS")
+    socket_dir = os.environ.get("HANGMAN_ENGINE_SOCKET_DIR")
+    if shards:
+        service = EngineService(
+            int(shards), authkey=authkey, guess_timer=app.config["GUESS_TIMER"]
+        )
+        service.start()
+        atexit.register(service.stop)
+        app.extensions["hangman_engine_service"] = service.client()
+    elif socket_dir:
+        app.extensions["hangman_engine_service"] = EngineServiceClient.from_socket_dir(
+            socket_dir, authkey
+        )
+    if "hangman_engine_service" in app.extensions:
+        app.logger.warning(
+            "Games run in engine shards are not ranked on the leaderboard "
+            "or counted in daily challenge stats"
+        )
+
+    def service_unavailable(error: EngineServiceError):
+        app.logger.warning("Engine service error: %s", error)
+        return jsonify({"error": "Game service unavailable"}), 503
+
+    app.register_error_handler(EngineServiceError, service_unavailable)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m src.web.engine_service",
+        description="Run game engine shards for the web workers on this host.",
+    )
+    parser.add_argument("--socket-dir", required=True)
+    parser.add_argument("--shards", type=int, default=os.cpu_count() or 1)
+    parser.add_argument(
+        "--guess-timer", action="store_true", help="enforce the per-guess time limit"
+    )
+    args = parser.parse_args(argv)
+
+    # Shards accept any worker holding the key, so there is no default
+    secret_key = os.environ.get("HANGMAN_SECRET_KEY")
+    if not secret_key:
+        parser.error("HANGMAN_SECRET_KEY must be set to the web workers' key")
+    authkey = secret_key.encode("utf-8")
+    service = EngineService(args.shards, args.socket_dir, authkey, args.guess_timer)
+    service.start()
+    print(f"Serving {args.shards} engine shards from {args.socket_dir}")
+    try:
+        service.join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Game Events
+
+Records the app's games to an event log (src.core.event_log) when
+HANGMAN_EVENT_LOG names a log directory. HANGMAN_EVENT_LOG_FSYNC sets
+when written events are forced to disk: "batch", "interval" (the
+default, at most once a second) or "never". The log cannot be combined
+with engine shards, whose games this process never sees.
+"""
+
+import atexit
+import os
+
+from flask import Flask
+
+from src.core.event_log import EventLog
+from src.core.game_engine import GameEngine
+
+
+def init_event_log(app: Flask):
+    """Open the event log configured for the app, if any."""
+    directory = os.environ.get("HANGMAN_EVENT_LOG")
+    if not directory:
+        return
+    if "hangman_engine_service" in app.extensions:
+        # Games in engine shards never pass through this process's engines
+        raise RuntimeError(
+            "HANGMAN_EVENT_LOG cannot record games run in engine shards; "
+            "unset HANGMAN_ENGINE_SHARDS and HANGMAN_ENGINE_SOCKET_DIR to log games"
+        )
+
+    event_log = EventLog(
+        directory, fsync=os.environ.get("HANGMAN_EVENT_LOG_FSYNC", "interval")
+    )
+    atexit.register(event_log.close)
+    app.extensions["hangman_event_log"] = event_log
+
+
+def record_game_events(app, game_id: str, engine: GameEngine, started: bool = False):
+    """
+    Record the game's changes from now on, if the app keeps an event log.
+
+    Called whenever a game is created or loaded from the session store,
+    since stores that encode games do not keep the recorder. started
+    records the start of a new game.
+    """
+    event_log = app.extensions.get("hangman_event_log")
+    if event_log is None:
+        return
+
+    if started:
+        event_log.game_started(game_id, engine)
+    engine.recorder = event_log.recorder(game_id)
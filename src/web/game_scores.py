@@ -0,0 +1,72 @@
+"""
+Game Scores
+
+Ranks the app's games on the leaderboard (src.core.leaderboard). A
+game's score is recorded when the game is lost, or when its player
+starts a new game before losing, which used to throw the score away.
+HANGMAN_LEADERBOARD_DB names a SQLite database the boards are
+snapshotted to; without it they only live in memory. The best scores
+are served at /leaderboard/<level>?window=day&limit=10.
+
+Games run in engine shards are not ranked.
+"""
+
+import atexit
+import os
+
+from flask import Flask, abort, jsonify, request
+
+from src.core.game_engine import GameEngine
+from src.core.leaderboard import LEADERBOARD_SIZE, WINDOWS, Leaderboard
+from src.utils.constants import DIFFICULTY_LEVELS
+
+
+def init_leaderboard(app: Flask):
+    """Open the app's leaderboard and register /leaderboard/<level>."""
+    db_path = os.environ.get("HANGMAN_LEADERBOARD_DB")
+    leaderboard = Leaderboard(db_path)
+    if db_path:
+        atexit.register(leaderboard.close)
+    app.extensions["hangman_leaderboard"] = leaderboard
+
+    def top_scores(level: str):
+        if level not in DIFFICULTY_LEVELS:
+            abort(404)
+        window = request.args.get("window", "all")
+        if window not in WINDOWS:
+            return jsonify({"error": "Invalid window"}), 400
+        limit = request.args.get("limit", LEADERBOARD_SIZE, type=int)
+        if not 1 <= limit <= LEADERBOARD_SIZE:
+            return jsonify({"error": "Invalid limit"}), 400
+
+        results = leaderboard.top(level, window, limit)
+        return jsonify(
+            {
+                "level": level,
+                "window": window,
+                "scores": [
+                    {"rank": rank, "score": score, "recorded_at": recorded_at}
+                    for rank, (score, recorded_at, _) in enumerate(results, 1)
+                ],
+            }
+        )
+
+    app.add_url_rule(
+        "/leaderboard/<level>", endpoint="leaderboard", view_func=top_scores
+    )
+
+
+def record_final_score(app, game_id: str, engine: GameEngine, replaced: bool = False):
+    """
+    Rank the game's score if it just ended.
+
+    Called after every change to a game; only lost games are ranked.
+    replaced marks a game its player is leaving for a new one, which is
+    ranked unless it was already lost (and so ranked then).
+    """
+    leaderboard = app.extensions.get("hangman_leaderboard")
+    if leaderboard is None:
+        return
+    if engine.check_game_over() == replaced:
+        return
+    leaderboard.record(game_id, engine.level, engine.score)
@@ -0,0 +1,176 @@
+"""
+Guess Timer
+
+Server-side enforcement of the per-guess time limit. One GuessTimer per
+worker keeps every live game's deadline in a shared TimerWheel, and a
+single daemon thread advances it once per tick, charging the timeout
+penalty to games whose deadline passed and notifying listeners.
+
+The wheel only says when to look: on expiry the game is reloaded from
+the session store and GameEngine.check_timeout() decides against the
+deadline stored with the game, so stale entries for games that moved on
+are harmless. Requests hold the same per-game lock as the timer while
+they load, guess and save a game, so a guess never races a timeout in
+the same worker. Timeouts are saved with SessionStore.update(), so one
+worker's timer cannot overwrite a guess another worker saved meanwhile.
+"""
+
+import asyncio
+import contextlib
+import functools
+import threading
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    ContextManager,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from src.core.game_engine import GameEngine
+from src.core.timer_wheel import TimerWheel
+from .session_store import SessionStore
+
+TimeoutListener = Callable[[str, GameEngine, Dict[str, Any]], None]
+
+# Games are spread over this many locks rather than holding one per game
+GAME_LOCK_STRIPES = 64
+
+
+class GuessTimer:
+    def __init__(
+        self,
+        store: SessionStore,
+        tick: float = 1.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.store = store
+        self.tick = tick
+        self.clock = clock
+        self._wheel = TimerWheel(tick, now=clock())
+        self._lock = threading.Lock()
+        self._game_locks = [threading.Lock() for _ in range(GAME_LOCK_STRIPES)]
+        self._listeners: List[TimeoutListener] = []
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self._wheel)
+
+    def add_listener(self, listener: TimeoutListener):
+        """Call listener(game_id, engine, result) whenever a game times out."""
+        self._listeners.append(listener)
+
+    def game_lock(self, game_id: str) -> threading.Lock:
+        """Return the lock serializing a game's timeouts and guesses."""
+        return self._game_locks[hash(game_id) % GAME_LOCK_STRIPES]
+
+    def watch(self, game_id: str, engine: GameEngine):
+        """Track the game's current deadline, or stop tracking it if none."""
+        with self._lock:
+            if engine.deadline is None:
+                self._wheel.cancel(game_id)
+            else:
+                self._wheel.schedule(game_id, engine.deadline)
+
+    def unwatch(self, game_id: str):
+        with self._lock:
+            self._wheel.cancel(game_id)
+
+    def expire(self, now: Optional[float] = None) -> List[Tuple[str, Dict[str, Any]]]:
+        """Apply timeouts to every game whose deadline passed by now."""
+        if now is None:
+            now = self.clock()
+        with self._lock:
+            expired = self._wheel.advance(now)
+
+        events = []
+        for game_id in expired:
+            with self.game_lock(game_id):
+                timed_out = self.store.update(
+                    game_id, functools.partial(self._check_timeout, game_id, now)
+                )
+                if timed_out is None:
+                    continue
+
+                engine, result = timed_out
+                events.append((game_id, result))
+                for listener in self._listeners:
+                    listener(game_id, engine, result)
+        return events
+
+    def _check_timeout(
+        self, game_id: str, now: float, engine: GameEngine
+    ) -> Optional[Tuple[GameEngine, Dict[str, Any]]]:
+        result = engine.check_timeout(now)
+        if engine.deadline is not None:
+            self.watch(game_id, engine)
+        return None if result is None else (engine, result)
+
+    def start(self):
+        if self._thread is not None:
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="guess-timer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop_event.wait(self.tick):
+            self.expire()
+
+
+def game_lock(app, game_id: str) -> ContextManager:
+    """Return the lock to hold while loading, guessing and saving a game."""
+    timer = app.extensions.get("hangman_guess_timer")
+    if timer is None:
+        return contextlib.nullcontext()
+    return timer.game_lock(game_id)
+
+
+@contextlib.asynccontextmanager
+async def hold_game_lock(app, game_id: str) -> AsyncIterator[None]:
+    """Hold game_lock() from async code without blocking the event loop."""
+    timer = app.extensions.get("hangman_guess_timer")
+    if timer is None:
+        yield
+        return
+
+    lock = timer.game_lock(game_id)
+    # Holders only keep it for one load, guess and save
+    while not lock.acquire(blocking=False):
+        await asyncio.sleep(0.001)
+    try:
+        yield
+    finally:
+        lock.release()
+
+
+def check_guess_timer(app, engine: GameEngine) -> Optional[Dict[str, Any]]:
+    """Apply any timeouts due before a guess, if the app enforces the timer."""
+    if not app.config.get("GUESS_TIMER"):
+        return None
+    return engine.check_timeout(time.time())
+
+
+def restart_guess_timer(app, game_id: str, engine: GameEngine):
+    """Start the next guess period after a game was created or guessed."""
+    if not app.config.get("GUESS_TIMER"):
+        return
+
+    engine.start_timer(time.time())
+    timer = app.extensions.get("hangman_guess_timer")
+    if timer is not None:
+        timer.watch(game_id, engine)
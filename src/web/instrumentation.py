@@ -0,0 +1,325 @@
+"""
+Instrumentation
+
+Opt-in request profiling, enabled with HANGMAN_METRICS=1. Every request's
+duration and the stages of a /guess request (parsing, loading the game,
+guess_letter, process_word_completion, get_game_state, saving it and
+jsonify) are recorded into histograms served at /metrics in the
+Prometheus text format.
+
+Histograms use fixed log-scale buckets, two per power of two from one
+microsecond, and each thread counts into its own buckets, so recording
+takes no lock. HANGMAN_PROFILE_RATE runs cProfile over that fraction of
+requests; /metrics/profile shows the combined profile and accepts a
+POST of {"rate": 0.05} to change the rate, which also clears it.
+
+With HANGMAN_METRICS_TOKEN set, both endpoints require the header
+"Authorization: Bearer <token>". Without it they are only readable from
+this host by clients not coming through a proxy, and the profile rate
+cannot be changed, since behind a reverse proxy every client looks
+local. The ASGI app records its native routes the same way.
+
+When disabled nothing is registered, and the routes' only cost is one
+dictionary lookup per request.
+"""
+
+import cProfile
+import hmac
+import io
+import math
+import os
+import pstats
+import random
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from flask import Flask, Response, abort, g, jsonify, request
+
+# Bucket upper bounds in seconds: 1 us * sqrt(2) ** n, the last one
+# catching everything from about 16 s up
+_MIN_VALUE = 1e-6
+_BUCKET_COUNT = 48
+BUCKET_BOUNDS = [_MIN_VALUE * 2 ** (index / 2) for index in range(_BUCKET_COUNT - 1)]
+_SQRT_HALF = math.sqrt(0.5)
+
+# Without a token only local clients may read metrics
+_LOCAL_ADDRESSES = ("127.0.0.1", "::1")
+_PROXY_HEADERS = ("X-Forwarded-For", "X-Real-IP", "Forwarded")
+
+# Functions listed per /metrics/profile report
+_PROFILE_LINES = 40
+
+
+def bucket_index(value: float) -> int:
+    """Return the histogram bucket holding value (in seconds)."""
+    if value <= _MIN_VALUE:
+        return 0
+    mantissa, exponent = math.frexp(value / _MIN_VALUE)
+    if mantissa == 0.5:
+        # Exactly a power of two, the upper bound of an even bucket
+        index = 2 * exponent - 2
+    elif mantissa <= _SQRT_HALF:
+        index = 2 * exponent - 1
+    else:
+        index = 2 * exponent
+    return min(index, _BUCKET_COUNT - 1)
+
+
+class Histogram:
+    """
+    Log-bucketed histogram of durations, recorded without locking.
+
+    Each thread counts into its own list of buckets, with the running sum
+    in the last slot; readers add the lists up.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards: List[list] = []
+        self._lock = threading.Lock()
+
+    def record(self, value: float):
+        try:
+            counts = self._local.counts
+        except AttributeError:
+            counts = self._local.counts = [0] * _BUCKET_COUNT + [0.0]
+            with self._lock:
+                self._shards.append(counts)
+        counts[bucket_index(value)] += 1
+        counts[-1] += value
+
+    def snapshot(self) -> Tuple[List[int], float]:
+        """Return the count in each bucket and the sum of all values."""
+        with self._lock:
+            shards = list(self._shards)
+        buckets = [0] * _BUCKET_COUNT
+        total = 0.0
+        for counts in shards:
+            for index in range(_BUCKET_COUNT):
+                buckets[index] += counts[index]
+            total += counts[-1]
+        return buckets, total
+
+    def quantile(self, q: float) -> float:
+        """Return the upper bound of the bucket holding the q-quantile."""
+        buckets, _ = self.snapshot()
+        rank = q * sum(buckets)
+        seen = 0
+        for index, count in enumerate(buckets):
+            seen += count
+            if count and seen >= rank:
+                return BUCKET_BOUNDS[index] if index < len(BUCKET_BOUNDS) else math.inf
+        return 0.0
+
+
+class StageTimer:
+    """Records the time since the previous mark against each stage."""
+
+    __slots__ = ("_instrumentation", "_last")
+
+    def __init__(self, instrumentation: "Instrumentation"):
+        self._instrumentation = instrumentation
+        self._last = time.perf_counter()
+
+    def mark(self, stage: str):
+        now = time.perf_counter()
+        self._instrumentation.stage_histogram(stage).record(now - self._last)
+        self._last = now
+
+
+class Instrumentation:
+    """Request and stage histograms, and sampled request profiles."""
+
+    def __init__(self, profile_rate: float = 0.0):
+        self.profile_rate = profile_rate
+        self.requests: Dict[str, Histogram] = {}
+        self.stages: Dict[str, Histogram] = {}
+        self._profile_stats: Optional[pstats.Stats] = None
+        self._profiled = 0
+        # Bumped when the rate changes, so requests already being
+        # profiled are left out of the new profile
+        self._profile_generation = 0
+        self._profile_lock = threading.Lock()
+        # cProfile cannot run in two threads at once
+        self._profiler_busy = threading.Lock()
+
+    def request_histogram(self, endpoint: str) -> Histogram:
+        histogram = self.requests.get(endpoint)
+        if histogram is None:
+            histogram = self.requests.setdefault(endpoint, Histogram())
+        return histogram
+
+    def stage_histogram(self, stage: str) -> Histogram:
+        histogram = self.stages.get(stage)
+        if histogram is None:
+            histogram = self.stages.setdefault(stage, Histogram())
+        return histogram
+
+    def start_profile(self) -> Optional[Tuple[cProfile.Profile, int]]:
+        """Start profiling the current request if it is sampled."""
+        if random.random() >= self.profile_rate:
+            return None
+        if not self._profiler_busy.acquire(blocking=False):
+            return None
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler, such as a debugger's, is already active
+            self._profiler_busy.release()
+            return None
+        return profiler, self._profile_generation
+
+    def finish_profile(self, sample: Tuple[cProfile.Profile, int]):
+        profiler, generation = sample
+        profiler.disable()
+        self._profiler_busy.release()
+        with self._profile_lock:
+            if generation != self._profile_generation:
+                return
+            if self._profile_stats is None:
+                self._profile_stats = pstats.Stats(profiler)
+            else:
+                self._profile_stats.add(profiler)
+            self._profiled += 1
+
+    def set_profile_rate(self, rate: float):
+        """Sample a new fraction of requests, dropping the profile so far."""
+        with self._profile_lock:
+            self.profile_rate = rate
+            self._profile_stats = None
+            self._profiled = 0
+            self._profile_generation += 1
+
+    def profile_report(self) -> str:
+        with self._profile_lock:
+            if self._profile_stats is None:
+                return f"No requests profiled (profile rate {self.profile_rate})\n"
+            stream = io.StringIO()
+            stream.write(
+                f"{self._profiled} requests profiled "
+                f"(profile rate {self.profile_rate})\n"
+            )
+            self._profile_stats.stream = stream
+            self._profile_stats.sort_stats("cumulative").print_stats(_PROFILE_LINES)
+            return stream.getvalue()
+
+    def render_metrics(self) -> str:
+        """Return every histogram in the Prometheus text format."""
+        lines: List[str] = []
+        for name, label, histograms, help_text in (
+            (
+                "hangman_request_duration_seconds",
+                "endpoint",
+                self.requests,
+                "Time to handle a request, by endpoint.",
+            ),
+            (
+                "hangman_guess_stage_duration_seconds",
+                "stage",
+                self.stages,
+                "Time spent in each stage of a /guess request.",
+            ),
+        ):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for value, histogram in sorted(histograms.items()):
+                _render_histogram(lines, name, f'{label}="{value}"', histogram)
+        return "\n".join(lines) + "\n"
+
+
+def _render_histogram(lines: List[str], name: str, labels: str, histogram: Histogram):
+    buckets, total = histogram.snapshot()
+    count = sum(buckets)
+    cumulative = 0
+    for bound, bucket in zip(BUCKET_BOUNDS, buckets):
+        cumulative += bucket
+        lines.append(f'{name}_bucket{{{labels},le="{bound:.6g}"}} {cumulative}')
+    lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {count}')
+    lines.append(f"{name}_sum{{{labels}}} {total:.9g}")
+    lines.append(f"{name}_count{{{labels}}} {count}")
+
+
+def guess_stages(app) -> Optional[StageTimer]:
+    """Start timing the stages of a /guess request, if instrumented."""
+    instrumentation = app.extensions.get("hangman_instrumentation")
+    if instrumentation is None:
+        return None
+    return StageTimer(instrumentation)
+
+
+def record_request_time(app, endpoint: str, start: float):
+    """Record a request served outside Flask, begun at perf_counter() start."""
+    instrumentation = app.extensions.get("hangman_instrumentation")
+    if instrumentation is not None:
+        instrumentation.request_histogram(endpoint).record(time.perf_counter() - start)
+
+
+def _authorized(token: Optional[str], change: bool) -> bool:
+    """Return whether the current request may use the metrics endpoints."""
+    if token:
+        supplied = request.headers.get("Authorization", "")
+        return hmac.compare_digest(supplied.encode(), f"Bearer {token}".encode())
+    if change:
+        return False
+    proxied = any(header in request.headers for header in _PROXY_HEADERS)
+    return request.remote_addr in _LOCAL_ADDRESSES and not proxied
+
+
+def init_instrumentation(app: Flask):
+    """Register request timing, profiling and /metrics when enabled."""
+    if os.environ.get("HANGMAN_METRICS") != "1":
+        return
+
+    instrumentation = Instrumentation(
+        profile_rate=float(os.environ.get("HANGMAN_PROFILE_RATE", "0"))
+    )
+    app.extensions["hangman_instrumentation"] = instrumentation
+    token = os.environ.get("HANGMAN_METRICS_TOKEN")
+
+    @app.before_request
+    def start_request_timer():
+        g.hangman_request_start = time.perf_counter()
+        g.hangman_profile = instrumentation.start_profile()
+
+    @app.teardown_request
+    def record_request(error=None):
+        start = g.pop("hangman_request_start", None)
+        if start is None:
+            return
+        endpoint = request.endpoint or "unmatched"
+        instrumentation.request_histogram(endpoint).record(time.perf_counter() - start)
+        sample = g.pop("hangman_profile", None)
+        if sample is not None:
+            instrumentation.finish_profile(sample)
+
+    def metrics() -> Response:
+        if not _authorized(token, change=False):
+            abort(403)
+        return Response(
+            instrumentation.render_metrics(),
+            content_type="text/plain; version=0.0.4; charset=utf-8",
+        )
+
+    def profile():
+        if not _authorized(token, change=request.method == "POST"):
+            abort(403)
+        if request.method == "POST":
+            rate = (request.get_json(silent=True) or {}).get("rate")
+            valid = isinstance(rate, (int, float)) and not isinstance(rate, bool)
+            if not valid or not 0 <= rate <= 1:
+                return jsonify({"error": "Invalid profile rate"}), 400
+            instrumentation.set_profile_rate(float(rate))
+            return jsonify({"profile_rate": instrumentation.profile_rate})
+        return Response(
+            instrumentation.profile_report(), content_type="text/plain; charset=utf-8"
+        )
+
+    app.add_url_rule("/metrics", endpoint="metrics", view_func=metrics)
+    app.add_url_rule(
+        "/metrics/profile",
+        endpoint="metrics_profile",
+        view_func=profile,
+        methods=["GET", "POST"],
+    )
@@ -0,0 +1,152 @@
+"""
+Realtime Game Connections
+
+Persistent WebSocket protocol for the ASGI app. Guesses flow upstream and
+state deltas plus server-authoritative timer ticks flow downstream over a
+single connection, so a guess costs one message instead of an HTTP
+request.
+
+Client messages:  {"type": "guess", "letter": "A"}
+Server messages:  {"type": "state", "state": {...}, "remaining": 15}
+                  {"type": "guess", "result", "word_completion", "delta"}
+                  {"type": "tick", "remaining": 4, "warning": true}
+                  {"type": "timeout", "result": {...}, "delta": {...}}
+                  {"type": "error", "error": "Invalid letter"}
+"""
+
+import asyncio
+import contextlib
+import json
+import math
+import time
+from typing import Any, AsyncContextManager, Awaitable, Callable, Dict
+
+from src.core.game_engine import GameEngine
+from src.utils.constants import TIMER_WARNING_THRESHOLD, VALID_LETTERS
+from .routes import play_guess
+
+# Close codes sent before the handshake completes
+CLOSE_POLICY_VIOLATION = 1008
+CLOSE_NO_ACTIVE_GAME = 4404
+
+
+class GameConnection:
+    """
+    One player's WebSocket session.
+
+    The connection remembers the last revision it pushed, so every
+    downstream update is a delta against what the client already has.
+    The guess deadline lives on the engine; the connection only reports
+    the time left and applies the timeout once it passes. Every change to
+    the engine and its save are made holding lock(), which the worker's
+    guess timer shares.
+    """
+
+    def __init__(
+        self,
+        engine: GameEngine,
+        send: Callable[[Dict[str, Any]], Awaitable[None]],
+        save: Callable[[GameEngine], Awaitable[None]],
+        tick_interval: float = 1.0,
+        clock: Callable[[], float] = time.time,
+        lock: Callable[[], AsyncContextManager] = contextlib.nullcontext,
+    ):
+        self.engine = engine
+        self._send = send
+        self._save = save
+        self._lock = lock
+        self.tick_interval = tick_interval
+        self.clock = clock
+        self.revision = engine.revision
+
+    @property
+    def remaining(self) -> int:
+        """Whole seconds left to make the next guess."""
+        if self.engine.deadline is None:
+            return 0
+        return max(0, math.ceil(self.engine.deadline - self.clock()))
+
+    async def send_message(self, message: Dict[str, Any]):
+        await self._send({"type": "websocket.send", "text": json.dumps(message)})
+
+    async def run(self, receive):
+        """Serve the connection until the client disconnects."""
+        async with self._lock():
+            self.engine.start_timer(self.clock())
+            await self._save(self.engine)
+        await self.send_message(
+            {
+                "type": "state",
+                "state": self.engine.get_game_state(),
+                "remaining": self.remaining,
+            }
+        )
+
+        timer = asyncio.ensure_future(self._run_timer())
+        try:
+            while True:
+                message = await receive()
+                if message["type"] == "websocket.disconnect":
+                    return
+                await self.handle_message(message)
+        finally:
+            timer.cancel()
+
+    async def _run_timer(self):
+        while True:
+            await asyncio.sleep(self.tick_interval)
+            await self.tick()
+
+    async def handle_message(self, message: Dict[str, Any]):
+        """Apply one client message and send the reply."""
+        try:
+            data = json.loads(message.get("text") or message.get("bytes") or b"")
+        except ValueError:
+            data = None
+        if not isinstance(data, dict) or data.get("type") != "guess":
+            await self.send_message({"type": "error", "error": "Invalid message"})
+            return
+
+        letter = str(data.get("letter", "")).upper()
+        if not letter or letter not in VALID_LETTERS:
+            await self.send_message({"type": "error", "error": "Invalid letter"})
+            return
+
+        async with self._lock():
+            # A guess that arrives after the deadline is charged the timeout first
+            timeout = self.engine.check_timeout(self.clock())
+            if timeout is None and self.engine.check_game_over():
+                response = None
+            else:
+                response = play_guess(self.engine, letter, self.revision, timeout)
+                self.revision = self.engine.revision
+                self.engine.start_timer(self.clock())
+                await self._save(self.engine)
+
+        if response is None:
+            await self.send_message({"type": "error", "error": "Game over"})
+        else:
+            await self.send_message({"type": "guess", **response})
+
+    async def tick(self):
+        """Report the time left on the guess timer, timing out at zero."""
+        async with self._lock():
+            result = self.engine.check_timeout(self.clock())
+            if result is not None:
+                delta = self.engine.get_state_delta(self.revision)
+                self.revision = self.engine.revision
+                await self._save(self.engine)
+
+        if result is None:
+            if self.engine.deadline is not None:
+                remaining = self.remaining
+                await self.send_message(
+                    {
+                        "type": "tick",
+                        "remaining": remaining,
+                        "warning": remaining <= TIMER_WARNING_THRESHOLD,
+                    }
+                )
+            return
+
+        await self.send_message({"type": "timeout", "result": result, "delta": delta})
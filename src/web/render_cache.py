@@ -0,0 +1,95 @@
+"""
+Render Cache
+
+In-memory cache of rendered pages for the web layer. Fully static pages
+are rendered once and served with ETag and Last-Modified validators, so
+repeat visits get a 304. The game page is cached as a shell split around
+the board fragment, and only the fragment is rendered per request.
+
+Caching is disabled while templates auto-reload (debug mode), so edited
+templates show up immediately during development.
+"""
+
+import hashlib
+import threading
+from datetime import datetime, timezone
+from typing import Callable, Dict, Hashable, NamedTuple, Tuple
+
+from flask import Response, current_app, request
+from markupsafe import Markup
+
+# Stands in for the board fragment while the game shell is rendered
+BOARD_MARKER = Markup("<!--hangman-board-->")
+
+
+class CachedPage(NamedTuple):
+    body: bytes
+    etag: str
+    last_modified: datetime
+
+
+class RenderCache:
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._pages: Dict[Hashable, CachedPage] = {}
+        self._shells: Dict[Hashable, Tuple[str, str]] = {}
+        self._lock = threading.Lock()
+
+    def page(self, key: Hashable, render: Callable[[], str]) -> CachedPage:
+        """Return the page cached under key, rendering it on first use."""
+        page = self._pages.get(key) if self.enabled else None
+        if page is None:
+            body = render().encode("utf-8")
+            page = CachedPage(
+                body=body,
+                etag=hashlib.sha1(body).hexdigest(),
+                # HTTP dates have one-second resolution
+                last_modified=datetime.now(timezone.utc).replace(microsecond=0),
+            )
+            if self.enabled:
+                with self._lock:
+                    page = self._pages.setdefault(key, page)
+        return page
+
+    def shell(self, key: Hashable, render: Callable[[], str]) -> Tuple[str, str]:
+        """
+        Return the cached (head, tail) of a page rendered with BOARD_MARKER.
+
+        The page is rendered once per key with the marker in place of its
+        dynamic fragment and split around it.
+        """
+        shell = self._shells.get(key) if self.enabled else None
+        if shell is None:
+            head, marker, tail = render().partition(BOARD_MARKER)
+            if not marker:
+                raise ValueError(f"Page shell {key!r} has no board marker")
+            shell = (head, tail)
+            if self.enabled:
+                with self._lock:
+                    shell = self._shells.setdefault(key, shell)
+        return shell
+
+    def clear(self):
+        with self._lock:
+            self._pages.clear()
+            self._shells.clear()
+
+
+def get_render_cache() -> RenderCache:
+    """Return the render cache configured on the current app."""
+    return current_app.extensions["hangman_render_cache"]
+
+
+def cached_response(key: Hashable, render: Callable[[], str]) -> Response:
+    """
+    Serve a static page from the render cache.
+
+    Clients must revalidate, and a matching If-None-Match or
+    If-Modified-Since is answered with 304 Not Modified.
+    """
+    page = get_render_cache().page(key, render)
+    response = Response(page.body, mimetype="text/html")
+    response.set_etag(page.etag)
+    response.last_modified = page.last_modified
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
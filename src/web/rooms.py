@@ -0,0 +1,353 @@
+"""
+Multiplayer Rooms
+
+Rooms where many players race to solve the same word while any number of
+spectators watch. Each room owns one authoritative GameEngine: players
+share its lives and score, and earn points of their own for every
+correct letter and for the guess that completes a word.
+
+Every update is serialized once and the same ASGI message is queued on
+each member's connection, so a guess costs one json.dumps however many
+members are watching. Each member drains its queue in its own writer
+task; one that falls MAX_BACKLOG messages behind has its queue replaced
+by a full state message instead of growing without bound.
+
+Lobby:            POST /rooms {"level": "basic"} -> {"room_id": ...}
+                  GET /rooms -> {"rooms": [...]}
+WebSocket:        /rooms/<room_id>/ws?role=player&name=Ann
+Client messages:  {"type": "guess", "letter": "A"}
+                  {"type": "new_game"}  (once the game is over)
+Server messages:  {"type": "state", "state": {...}, "points": {...},
+                   "spectators": 12}
+                  {"type": "guess", "player", "letter", "result",
+                   "word_completion", "delta", "points", "spectators"}
+                  {"type": "join" | "leave", "player": "Ann"}
+                  {"type": "error", "error": "Spectators cannot play"}
+
+Rooms live in the process that created them, so run the ASGI app with
+one worker (or route each room to its worker) when rooms are used.
+There is no guess timer in rooms.
+"""
+
+import asyncio
+import json
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+from urllib.parse import parse_qs
+
+from flask import Flask, jsonify, request
+
+from src.core.game_engine import GameEngine
+from src.utils.constants import DIFFICULTY_LEVELS, VALID_LETTERS
+from .realtime import CLOSE_NO_ACTIVE_GAME
+
+# Members allowed in one room, players and spectators together
+ROOM_CAPACITY = 10_000
+
+# Messages a member may fall behind before it is resynced
+MAX_BACKLOG = 256
+
+# Rooms left empty this long (seconds) are dropped
+ROOM_IDLE_TIMEOUT = 300.0
+
+# Close code for a room that is already full ("try again later")
+CLOSE_ROOM_FULL = 1013
+
+ROLE_PLAYER = "player"
+ROLE_SPECTATOR = "spectator"
+
+Message = Dict[str, Any]
+
+
+def encode_message(message: Dict[str, Any]) -> Message:
+    """Serialize message into the ASGI event sent to every recipient."""
+    return {"type": "websocket.send", "text": json.dumps(message)}
+
+
+class RoomMember:
+    """One connection in a room, with its queue of outgoing messages."""
+
+    __slots__ = ("name", "role", "_queue", "_ready")
+
+    def __init__(self, name: str, role: str = ROLE_PLAYER):
+        self.name = name
+        self.role = role
+        self._queue: Deque[Message] = deque()
+        self._ready = asyncio.Event()
+
+    @property
+    def is_player(self) -> bool:
+        return self.role == ROLE_PLAYER
+
+    @property
+    def backlog(self) -> int:
+        return len(self._queue)
+
+    def push(self, message: Message) -> bool:
+        """Queue an encoded message, or return False if too far behind."""
+        if len(self._queue) >= MAX_BACKLOG:
+            return False
+        self._queue.append(message)
+        self._ready.set()
+        return True
+
+    def resync(self, state_message: Message):
+        """Drop the queued messages in favour of a full state message."""
+        self._queue.clear()
+        self.push(state_message)
+
+    async def run_writer(self, send: Callable[[Message], Any]):
+        """Send queued messages until cancelled."""
+        while True:
+            await self._ready.wait()
+            self._ready.clear()
+            while self._queue:
+                await send(self._queue.popleft())
+
+
+class Room:
+    """
+    A shared game and the members watching it.
+
+    Rooms are only touched from the event loop, so guesses from different
+    members are applied one at a time without locking.
+    """
+
+    def __init__(self, room_id: str, level: str, seed: Optional[int] = None):
+        self.room_id = room_id
+        self.level = level
+        self.engine = GameEngine(level, seed)
+        self.members: Dict[RoomMember, None] = {}
+        self.points: Dict[str, int] = {}
+        self.spectators = 0
+        self.empty_since: Optional[float] = None
+        self._state_message: Optional[Message] = None
+
+    @property
+    def players(self) -> int:
+        return len(self.members) - self.spectators
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "room_id": self.room_id,
+            "level": self.level,
+            "players": self.players,
+            "spectators": self.spectators,
+        }
+
+    def state_message(self) -> Message:
+        """The encoded full state, shared by everyone joining or resyncing."""
+        if self._state_message is None:
+            self._state_message = encode_message(
+                {
+                    "type": "state",
+                    "state": self.engine.get_game_state(),
+                    "points": self.points,
+                    "spectators": self.spectators,
+                }
+            )
+        return self._state_message
+
+    def broadcast(self, message: Dict[str, Any]):
+        """Serialize message once and queue it for every member."""
+        encoded = encode_message(message)
+        for member in self.members:
+            if not member.push(encoded):
+                member.resync(self.state_message())
+
+    def join(self, name: str, role: str = ROLE_PLAYER) -> RoomMember:
+        """Add a member and queue the current state for it."""
+        if role == ROLE_PLAYER:
+            # Players are told apart by name in the points table
+            base, suffix = name, 2
+            while name in self.points:
+                name = f"{base} ({suffix})"
+                suffix += 1
+        member = RoomMember(name, role)
+        self.empty_since = None
+        self._state_message = None
+        if member.is_player:
+            self.points[name] = 0
+            self.broadcast({"type": "join", "player": name})
+        else:
+            self.spectators += 1
+        self.members[member] = None
+        member.push(self.state_message())
+        return member
+
+    def leave(self, member: RoomMember, now: float):
+        self.members.pop(member, None)
+        self._state_message = None
+        if member.is_player:
+            self.points.pop(member.name, None)
+            self.broadcast({"type": "leave", "player": member.name})
+        else:
+            self.spectators -= 1
+        if not self.members:
+            self.empty_since = now
+
+    def handle_message(self, member: RoomMember, data: Any):
+        """Apply one client message from member."""
+        kind = data.get("type") if isinstance(data, dict) else None
+        if kind not in ("guess", "new_game"):
+            self._reply(member, "Invalid message")
+        elif not member.is_player:
+            self._reply(member, "Spectators cannot play")
+        elif kind == "new_game":
+            self.new_game(member)
+        else:
+            self.guess(member, str(data.get("letter", "")).upper())
+
+    def guess(self, member: RoomMember, letter: str):
+        if not letter or letter not in VALID_LETTERS:
+            self._reply(member, "Invalid letter")
+            return
+        if self.engine.check_game_over():
+            self._reply(member, "Game over")
+            return
+
+        since = self.engine.revision
+        result = self.engine.guess_letter(letter)
+        if self.engine.revision == since:
+            # Already guessed: nothing changed for anyone else
+            member.push(
+                encode_message({"type": "guess", "letter": letter, "result": result})
+            )
+            return
+
+        word_completion = self.engine.process_word_completion()
+        points = self.points[member.name]
+        if result["correct"]:
+            points += 1
+        if word_completion["word_completed"]:
+            points += 1
+        self.points[member.name] = points
+        self._state_message = None
+        self.broadcast(
+            {
+                "type": "guess",
+                "player": member.name,
+                "letter": letter,
+                "result": result,
+                "word_completion": word_completion,
+                "delta": self.engine.get_state_delta(since),
+                "points": points,
+                "spectators": self.spectators,
+            }
+        )
+
+    def new_game(self, member: RoomMember):
+        if not self.engine.check_game_over():
+            self._reply(member, "Game in progress")
+            return
+        self.engine = GameEngine(self.level)
+        self.points = dict.fromkeys(self.points, 0)
+        self._state_message = None
+        self.broadcast_state()
+
+    def broadcast_state(self):
+        encoded = self.state_message()
+        for member in self.members:
+            if not member.push(encoded):
+                member.resync(encoded)
+
+    @staticmethod
+    def _reply(member: RoomMember, error: str):
+        member.push(encode_message({"type": "error", "error": error}))
+
+
+class RoomManager:
+    """The rooms hosted by this process, by id."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self._rooms: Dict[str, Room] = {}
+        # Lobby requests arrive on WSGI threads, sockets on the event loop
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._rooms)
+
+    def create(self, level: str) -> Room:
+        room = Room(uuid.uuid4().hex, level)
+        room.empty_since = self.clock()
+        with self._lock:
+            self._prune()
+            self._rooms[room.room_id] = room
+        return room
+
+    def get(self, room_id: str) -> Optional[Room]:
+        return self._rooms.get(room_id)
+
+    def list(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            self._prune()
+            rooms = list(self._rooms.values())
+        return [room.summary() for room in rooms]
+
+    def _prune(self):
+        cutoff = self.clock() - ROOM_IDLE_TIMEOUT
+        for room_id, room in list(self._rooms.items()):
+            if room.empty_since is not None and room.empty_since < cutoff:
+                del self._rooms[room_id]
+
+    async def serve(self, room_id: str, scope, receive, send):
+        """Serve one member's WebSocket in the room until it disconnects."""
+        message = await receive()
+        if message["type"] != "websocket.connect":
+            return
+
+        room = self.get(room_id)
+        if room is None:
+            await send({"type": "websocket.close", "code": CLOSE_NO_ACTIVE_GAME})
+            return
+        if len(room.members) >= ROOM_CAPACITY:
+            await send({"type": "websocket.close", "code": CLOSE_ROOM_FULL})
+            return
+
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        role = query.get("role", [ROLE_PLAYER])[0]
+        if role != ROLE_SPECTATOR:
+            role = ROLE_PLAYER
+        name = query.get("name", [""])[0][:32] or f"Player {room.players + 1}"
+
+        await send({"type": "websocket.accept"})
+        member = room.join(name, role)
+        writer = asyncio.ensure_future(member.run_writer(send))
+        try:
+            while True:
+                message = await receive()
+                if message["type"] == "websocket.disconnect":
+                    return
+                try:
+                    data = json.loads(
+                        message.get("text") or message.get("bytes") or b""
+                    )
+                except ValueError:
+                    data = None
+                room.handle_message(member, data)
+        finally:
+            room.leave(member, self.clock())
+            writer.cancel()
+
+
+def init_rooms(app: Flask):
+    """Host multiplayer rooms and register the lobby routes."""
+    rooms = RoomManager()
+    app.extensions["hangman_rooms"] = rooms
+
+    def lobby():
+        if request.method == "GET":
+            return jsonify({"rooms": rooms.list()})
+        level = (request.get_json(silent=True) or {}).get("level")
+        if not isinstance(level, str) or level not in DIFFICULTY_LEVELS:
+            return jsonify({"error": "Invalid level"}), 400
+        room = rooms.create(level)
+        return jsonify({"room_id": room.room_id, "level": level}), 201
+
+    app.add_url_rule(
+        "/rooms", endpoint="rooms", view_func=lobby, methods=["GET", "POST"]
+    )
@@ -2,13 +2,224 @@
 Web Routes for Hangman Game
 """
 
-from flask import Blueprint, render_template, abort, request, jsonify
-from src.utils.constants import DIFFICULTY_LEVELS, VALID_LETTERS
+import uuid
+from typing import Any, Dict, List, Optional
+
+from flask import (
+    Blueprint,
+    abort,
+    current_app,
+    jsonify,
+    render_template,
+    request,
+    session,
+)
+from src.utils.constants import DIFFICULTY_LEVELS, MAX_BATCH_GUESSES, VALID_LETTERS
 from src.core.game_engine import GameEngine
+from .daily import track_daily_game
+from .game_events import record_game_events
+from .game_scores import record_final_score
+from .guess_timer import check_guess_timer, game_lock, restart_guess_timer
+from .instrumentation import StageTimer, guess_stages
+from .render_cache import BOARD_MARKER, cached_response, get_render_cache
 
 # Create blueprint for web routes
 hangman_bp = Blueprint("hangman", __name__)
-global_game_engine = GameEngine("basic")
+
+
+def play_guess(
+    engine: GameEngine,
+    letter: str,
+    since: Optional[int] = None,
+    timeout: Optional[Dict[str, Any]] = None,
+    stages: Optional[StageTimer] = None,
+) -> Dict[str, Any]:
+    """
+    Apply one validated guess and build the /guess response payload.
+
+    With since set to the client's last seen revision, only the state
+    delta is returned in place of the full game state. timeout is the
+    result of a timer that ran out before the guess arrived. stages, when
+    given, times each step.
+    """
+    if timeout is not None and engine.check_game_over():
+        # The timer ended the game before this guess arrived
+        result = timeout
+        word_completion = {"word_completed": False}
+    else:
+        # Process the guess
+        result = engine.guess_letter(letter)
+        if stages is not None:
+            stages.mark("guess_letter")
+
+        # Check if word is completed
+        word_completion = engine.process_word_completion()
+        if stages is not None:
+            stages.mark("process_word_completion")
+
+    # Return updated game state
+    response = {
+        "success": True,
+        "result": result,
+        "word_completion": word_completion,
+    }
+    if timeout is not None:
+        response["timeout"] = timeout
+    if since is None:
+        response["game_state"] = engine.get_game_state()
+    else:
+        response["delta"] = engine.get_state_delta(since)
+    if stages is not None:
+        stages.mark("get_game_state")
+    return response
+
+
+def play_guesses(
+    engine: GameEngine, letters: List[str], timeout: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Apply validated batch guesses and build the /guess/batch response."""
+    steps = engine.guess_letters(letters)
+    response = {"success": True, "steps": steps, "game_state": engine.get_game_state()}
+    if timeout is not None:
+        response["timeout"] = timeout
+    return response
+
+
+def parse_since(data: Dict[str, Any]) -> Optional[int]:
+    """Return the revision a /guess request wants a delta from, if any."""
+    since = data.get("since")
+    if since is None:
+        return None
+    if isinstance(since, bool) or not isinstance(since, int):
+        raise ValueError("Invalid revision")
+    return since
+
+
+def parse_letters(data: Any) -> List[str]:
+    """Return the uppercased letters of a /guess/batch request body."""
+    if not isinstance(data, dict):
+        raise ValueError("Invalid JSON body")
+    letters = data.get("letters")
+    if isinstance(letters, str):
+        letters = list(letters)
+    if not isinstance(letters, list) or not all(
+        isinstance(letter, str) for letter in letters
+    ):
+        raise ValueError("Invalid letters")
+    if not letters or len(letters) > MAX_BATCH_GUESSES:
+        raise ValueError("Invalid batch size")
+    letters = [letter.upper() for letter in letters]
+    if any(letter not in VALID_LETTERS for letter in letters):
+        raise ValueError("Invalid letter")
+    return letters
+
+
+def render_game_page(level: str, game_state: Dict[str, Any]) -> str:
+    """
+    Render game.html from its cached shell and a fresh board fragment.
+
+    Only the word display and game data differ between new games, so the
+    rest of the page is cached per level, lives and score.
+    """
+    head, tail = get_render_cache().shell(
+        ("game", level, game_state["lives"], game_state["score"]),
+        lambda: render_template(
+            "game.html",
+            game_state=game_state,
+            valid_letters=VALID_LETTERS,
+            level=level,
+            board=BOARD_MARKER,
+        ),
+    )
+    board = current_app.jinja_env.get_template("game_board.html")
+    return head + board.render(game_state=game_state) + tail
+
+
+def _start_game(level: str, seed: Optional[int] = None) -> str:
+    """
+    Start the player's new game and render its page.
+
+    The game is stored under a new game id in the player's session. seed
+    fixes the game's word sequence, as for a daily challenge.
+    """
+    game_id = uuid.uuid4().hex
+    service = _get_engine_service()
+    if service is not None:
+        game_state = service.new_game(game_id, level, seed)
+    else:
+        store = _get_session_store()
+        # Rank the game being left before its score is dropped
+        previous_id = session.get("game_id")
+        previous = store.get(previous_id) if previous_id else None
+        if previous is not None:
+            record_final_score(current_app, previous_id, previous, replaced=True)
+
+        engine = GameEngine(level, seed)
+        record_game_events(current_app, game_id, engine, started=True)
+        restart_guess_timer(current_app, game_id, engine)
+        store.set(game_id, engine)
+        game_state = engine.get_game_state()
+    session["game_id"] = game_id
+
+    return render_game_page(level, game_state)
+
+
+def _guess_stored_game(
+    game_id: str, letter: str, since: Optional[int], stages: Optional[StageTimer]
+) -> Optional[Dict[str, Any]]:
+    """Apply a guess to a game in the session store and save it."""
+    store = _get_session_store()
+    engine = store.get(game_id)
+    if stages is not None:
+        stages.mark("load")
+    if engine is None:
+        return None
+
+    record_game_events(current_app, game_id, engine)
+    daily = track_daily_game(current_app, engine)
+    timeout = check_guess_timer(current_app, engine)
+    response = play_guess(engine, letter, since, timeout, stages)
+    if daily is not None:
+        daily.detach()
+    record_final_score(current_app, game_id, engine)
+    restart_guess_timer(current_app, game_id, engine)
+
+    # Persist updated game for the next request
+    store.set(game_id, engine)
+    if stages is not None:
+        stages.mark("save")
+    return response
+
+
+def _guess_stored_game_batch(
+    game_id: str, letters: List[str]
+) -> Optional[Dict[str, Any]]:
+    """Apply batch guesses to a game in the session store and save it."""
+    store = _get_session_store()
+    engine = store.get(game_id)
+    if engine is None:
+        return None
+
+    record_game_events(current_app, game_id, engine)
+    daily = track_daily_game(current_app, engine)
+    timeout = check_guess_timer(current_app, engine)
+    response = play_guesses(engine, letters, timeout)
+    if daily is not None:
+        daily.detach()
+    record_final_score(current_app, game_id, engine)
+    restart_guess_timer(current_app, game_id, engine)
+    store.set(game_id, engine)
+    return response
+
+
+def _get_session_store():
+    """Return the game session store configured on the current app."""
+    return current_app.extensions["hangman_session_store"]
+
+
+def _get_engine_service():
+    """Return the engine service client games run in, if one is configured."""
+    return current_app.extensions.get("hangman_engine_service")
 
 
 @hangman_bp.route("/")
@@ -18,7 +229,7 @@ def home():
 
     Displays the welcome message and provides navigation to start the game.
     """
-    return render_template("home.html")
+    return cached_response("home", lambda: render_template("home.html"))
 
 
 @hangman_bp.route("/select-level")
@@ -28,7 +239,12 @@ def select_level():
 
     Allows player to choose between Basic (words) and Intermediate (phrases).
     """
-    return render_template("select_level.html", DIFFICULTY_LEVELS=DIFFICULTY_LEVELS)
+    return cached_response(
+        "select_level",
+        lambda: render_template(
+            "select_level.html", DIFFICULTY_LEVELS=DIFFICULTY_LEVELS
+        ),
+    )
 
 
 @hangman_bp.route("/game/<level>")
@@ -37,46 +253,97 @@ def game(level):
     Main game interface.
 
     Creates a new GameEngine instance for the selected level.
-    Each page load starts a fresh game.
+    Each page load starts a fresh game stored under a new game id.
     """
     # Validate level
-    if level not in ["basic", "intermediate"]:
+    if level not in DIFFICULTY_LEVELS:
         abort(404)
 
-    # Create new game instance
-    global global_game_engine
-    global_game_engine = GameEngine(level)
-    game_state = global_game_engine.get_game_state()
+    return _start_game(level)
 
-    return render_template(
-        "game.html", game_state=game_state, valid_letters=VALID_LETTERS, level=level
-    )
+
+@hangman_bp.route("/daily/<level>")
+def daily_game(level):
+    """
+    Daily challenge.
+
+    Starts a game on the level's words of the day, drawn in the same
+    order for every player.
+    """
+    if level not in DIFFICULTY_LEVELS:
+        abort(404)
+
+    schedule = current_app.extensions["hangman_daily_schedule"]
+    return _start_game(level, schedule.todays_seed(level))
 
 
 @hangman_bp.route("/guess", methods=["POST"])
 def guess_letter():
     """
-    Process a letter guess using the GameEngine.
-    Game state is passed via request and returned updated.
+    Process a letter guess using the player's GameEngine.
+    The game is looked up by the game id in the player's session.
+    Sending "since" with the last seen revision returns a state delta.
     """
-    data = request.get_json()
-    letter = data.get("letter", "").upper()
+    stages = guess_stages(current_app)
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({"error": "Invalid JSON body"}), 400
+    letter = data.get("letter", "")
+    letter = letter.upper() if isinstance(letter, str) else ""
 
     if not letter or letter not in VALID_LETTERS:
         return jsonify({"error": "Invalid letter"}), 400
+    try:
+        since = parse_since(data)
+    except ValueError as error:
+        return jsonify({"error": str(error)}), 400
+    if stages is not None:
+        stages.mark("parse")
 
-    # Process the guess
-    result = global_game_engine.guess_letter(letter)
+    game_id = session.get("game_id")
+    service = _get_engine_service()
+    if service is not None:
+        response = service.guess(game_id, letter, since) if game_id else None
+        if stages is not None:
+            stages.mark("engine_service")
+    elif game_id:
+        with game_lock(current_app, game_id):
+            response = _guess_stored_game(game_id, letter, since, stages)
+    else:
+        response = None
 
-    # Check if word is completed
-    word_completion = global_game_engine.process_word_completion()
+    if response is None:
+        return jsonify({"error": "No active game"}), 404
+    body = jsonify(response)
+    if stages is not None:
+        stages.mark("jsonify")
+    return body
 
-    # Return updated game state
-    return jsonify(
-        {
-            "success": True,
-            "result": result,
-            "word_completion": word_completion,
-            "game_state": global_game_engine.get_game_state(),
-        }
-    )
+
+@hangman_bp.route("/guess/batch", methods=["POST"])
+def guess_letters():
+    """
+    Process a sequence of letter guesses in one request.
+
+    Accepts {"letters": "AEI"} or {"letters": ["A", "E", "I"]} with up to
+    MAX_BATCH_GUESSES letters and returns one compact result per applied
+    guess plus the final game state.
+    """
+    try:
+        letters = parse_letters(request.get_json(silent=True))
+    except ValueError as error:
+        return jsonify({"error": str(error)}), 400
+
+    game_id = session.get("game_id")
+    service = _get_engine_service()
+    if service is not None:
+        response = service.guess_batch(game_id, letters) if game_id else None
+    elif game_id:
+        with game_lock(current_app, game_id):
+            response = _guess_stored_game_batch(game_id, letters)
+    else:
+        response = None
+
+    if response is None:
+        return jsonify({"error": "No active game"}), 404
+    return jsonify(response)
@@ -0,0 +1,258 @@
+"""
+Game Session Store
+
+Pluggable storage for per-player GameEngine instances.
+Each player's game is kept under its own game id so concurrent
+players never share or overwrite each other's state.
+"""
+
+import os
+import sqlite3
+import struct
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple, TypeVar
+
+from flask import session
+
+from src.core.game_engine import GameEngine
+
+T = TypeVar("T")
+
+
+class SessionStore:
+    """Base interface for game session storage backends."""
+
+    # Whether get/set may block on I/O; async callers run blocking stores
+    # in a worker thread
+    blocking = False
+
+    def get(self, game_id: str) -> Optional[GameEngine]:
+        raise NotImplementedError
+
+    def set(self, game_id: str, engine: GameEngine):
+        raise NotImplementedError
+
+    def delete(self, game_id: str):
+        raise NotImplementedError
+
+    def update(
+        self, game_id: str, change: Callable[[GameEngine], Optional[T]]
+    ) -> Optional[T]:
+        """
+        Apply change to a stored game, saving it if change returns a result.
+
+        Returns change's result, or None if the game is not stored.
+        """
+        engine = self.get(game_id)
+        if engine is None:
+            return None
+        result = change(engine)
+        if result is not None:
+            self.set(game_id, engine)
+        return result
+
+
+class MemorySessionStore(SessionStore):
+    """
+    In-process LRU store with TTL eviction.
+
+    Suitable for a single worker process. Least recently used games are
+    evicted once max_games is exceeded, and idle games expire after ttl
+    seconds.
+    """
+
+    def __init__(self, max_games: int = 10000, ttl: float = 3600.0):
+        self.max_games = max_games
+        self.ttl = ttl
+        self._games: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, game_id: str) -> Optional[GameEngine]:
+        with self._lock:
+            entry = self._games.get(game_id)
+            if entry is None:
+                return None
+
+            engine, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._games[game_id]
+                return None
+
+            # Refresh recency and expiry on access
+            self._games.move_to_end(game_id)
+            self._games[game_id] = (engine, time.monotonic() + self.ttl)
+            return engine
+
+    def set(self, game_id: str, engine: GameEngine):
+        with self._lock:
+            self._games[game_id] = (engine, time.monotonic() + self.ttl)
+            self._games.move_to_end(game_id)
+            self._evict()
+
+    def delete(self, game_id: str):
+        with self._lock:
+            self._games.pop(game_id, None)
+
+    def __len__(self) -> int:
+        return len(self._games)
+
+    def _evict(self):
+        """Drop expired games, then least recently used ones over capacity."""
+        now = time.monotonic()
+        while self._games:
+            oldest_id = next(iter(self._games))
+            _, expires_at = self._games[oldest_id]
+            if expires_at > now and len(self._games) <= self.max_games:
+                break
+            del self._games[oldest_id]
+
+
+class SQLiteSessionStore(SessionStore):
+    """
+    Local SQLite store shared by every worker process on one host.
+
+    Lets several Gunicorn workers serve the same player, since any worker
+    can load the game by id. Expired games are purged on write. Each save
+    bumps the game's version, so update() can tell when another worker
+    saved the game after it was loaded.
+    """
+
+    blocking = True
+
+    def __init__(self, db_path: str, ttl: float = 3600.0):
+        self.db_path = db_path
+        self.ttl = ttl
+        self._local = threading.local()
+
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS games ("
+                "game_id TEXT PRIMARY KEY, state BLOB NOT NULL, "
+                "expires_at REAL NOT NULL, version INTEGER NOT NULL DEFAULT 0)"
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(games)")}
+            if "version" not in columns:
+                try:
+                    conn.execute(
+                        "ALTER TABLE games "
+                        "ADD COLUMN version INTEGER NOT NULL DEFAULT 0"
+                    )
+                except sqlite3.OperationalError:
+                    # Added by another worker starting at the same time
+                    pass
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, game_id: str) -> Optional[GameEngine]:
+        loaded = self._load(game_id)
+        return None if loaded is None else loaded[0]
+
+    def _load(self, game_id: str) -> Optional[Tuple[GameEngine, int]]:
+        """Return the stored game and its version."""
+        row = (
+            self._connection()
+            .execute(
+                "SELECT state, version FROM games "
+                "WHERE game_id = ? AND expires_at > ?",
+                (game_id, time.time()),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+        try:
+            return GameEngine.from_bytes(row[0]), row[1]
+        except ValueError:
+            # Encoded against a dictionary that is no longer loaded
+            return None
+
+    def set(self, game_id: str, engine: GameEngine):
+        now = time.time()
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT INTO games (game_id, state, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT (game_id) DO UPDATE SET state = excluded.state, "
+                "expires_at = excluded.expires_at, version = version + 1",
+                (game_id, engine.to_bytes(), now + self.ttl),
+            )
+            conn.execute("DELETE FROM games WHERE expires_at <= ?", (now,))
+
+    def update(
+        self, game_id: str, change: Callable[[GameEngine], Optional[T]]
+    ) -> Optional[T]:
+        """
+        Apply change to a stored game, saving it if change returns a result.
+
+        The game is only saved if no other worker saved it since it was
+        loaded; otherwise it is loaded again and change applied afresh.
+        """
+        while True:
+            loaded = self._load(game_id)
+            if loaded is None:
+                return None
+            engine, version = loaded
+            result = change(engine)
+            if result is None:
+                return None
+
+            with self._connection() as conn:
+                saved = conn.execute(
+                    "UPDATE games SET state = ?, expires_at = ?, "
+                    "version = version + 1 WHERE game_id = ? AND version = ?",
+                    (engine.to_bytes(), time.time() + self.ttl, game_id, version),
+                ).rowcount
+            if saved:
+                return result
+
+    def delete(self, game_id: str):
+        with self._connection() as conn:
+            conn.execute("DELETE FROM games WHERE game_id = ?", (game_id,))
+
+
+class CookieSessionStore(SessionStore):
+    """
+    Stateless store keeping the encoded game in the signed session cookie.
+
+    No server-side state is kept, so any worker can serve any request.
+    Must be used within a Flask request context.
+    """
+
+    def get(self, game_id: str) -> Optional[GameEngine]:
+        return self.load(session, game_id)
+
+    def set(self, game_id: str, engine: GameEngine):
+        self.save(session, game_id, engine)
+
+    @staticmethod
+    def load(session_data, game_id: str) -> Optional[GameEngine]:
+        """Decode the game from a session mapping outside Flask requests."""
+        if session_data.get("game_id") != game_id or "game_state" not in session_data:
+            return None
+        try:
+            return GameEngine.from_bytes(session_data["game_state"])
+        except (ValueError, IndexError, struct.error):
+            # Cookie from an incompatible format or dictionary
+            return None
+
+    @staticmethod
+    def save(session_data, game_id: str, engine: GameEngine):
+        """Encode the game into a session mapping outside Flask requests."""
+        session_data["game_id"] = game_id
+        session_data["game_state"] = engine.to_bytes()
+
+    def delete(self, game_id: str):
+        if session.get("game_id") == game_id:
+            session.pop("game_state", None)
@@ -0,0 +1,285 @@
+// Parse game data from JSON scripts
+const gameData = JSON.parse(document.getElementById("game-data").textContent);
+const level = gameData.level;
+
+let gameState = {
+  word: gameData.word,
+  word_display: gameData.word_display,
+  lives_display: gameData.lives_display,
+  guessedLetters: gameData.guessed_letters,
+  wrongGuesses: gameData.wrong_guesses,
+  lives: gameData.lives,
+  score: gameData.score,
+  gameOver: gameData.game_over,
+  level: level,
+  revision: gameData.revision,
+};
+
+function guessLetter(letter) {
+  // Check if game is over
+  if (gameState.gameOver) return;
+
+  // Check if letter already guessed
+  if (
+    gameState.guessedLetters.includes(letter) ||
+    gameState.wrongGuesses.includes(letter)
+  )
+    return;
+
+  // Disable the button immediately
+  const btn = document.querySelector(`[data-letter="${letter}"]`);
+  btn.disabled = true;
+  btn.classList.add("disabled");
+
+  // Realtime mode sends the guess over the open socket
+  if (socket && socket.readyState === WebSocket.OPEN) {
+    socket.send(JSON.stringify({ type: "guess", letter: letter }));
+    return;
+  }
+
+  // Send guess to backend
+  fetch("/guess", {
+    method: "POST",
+    headers: {
+      "Content-Type": "application/json",
+    },
+    body: JSON.stringify({
+      letter: letter,
+      since: gameState.revision,
+    }),
+  })
+    .then((response) => response.json())
+    .then((data) => {
+      if (data.success) {
+        handleGuessResponse(data);
+      } else {
+        // Re-enable button on error
+        btn.disabled = false;
+        btn.classList.remove("disabled");
+        showMessage(data.error, "error");
+      }
+    })
+    .catch((error) => {
+      console.error("Error:", error);
+      // Re-enable button on error
+      btn.disabled = false;
+      btn.classList.remove("disabled");
+      showMessage("Error processing guess", "error");
+    });
+}
+
+function updateGameStateFromBackend(newGameState) {
+  // Update local state from backend response
+  gameState.word = newGameState.word;
+  gameState.word_display = newGameState.word_display;
+  gameState.lives_display = newGameState.lives_display;
+  gameState.guessedLetters = newGameState.guessed_letters;
+  gameState.wrongGuesses = newGameState.wrong_guesses;
+  gameState.lives = newGameState.lives;
+  gameState.score = newGameState.score;
+  gameState.gameOver = newGameState.game_over;
+  gameState.revision = newGameState.revision;
+
+  // Update the display
+  updateGameDisplay();
+}
+
+function handleGuessResponse(data) {
+  // Update game state from the backend's delta
+  applyStateDelta(data.delta);
+
+  // Check if word was completed
+  if (data.word_completion.word_completed) {
+    showMessage(`Word completed! Score: +1`, "success");
+    // Re-enable all buttons since game state was reset
+    enableAllButtons();
+    return;
+  }
+
+  // Show result message
+  if (data.result.correct) {
+    showMessage(data.result.message, "success");
+  } else {
+    showMessage(data.result.message, "error");
+  }
+
+  // Check if game is over
+  if (gameState.gameOver) {
+    showGameOver();
+  }
+}
+
+// Realtime mode: when served by the ASGI app, guesses, state deltas and
+// the server's guess timer share one WebSocket. Without it the page
+// falls back to one POST per guess.
+let socket = null;
+
+function connectRealtime() {
+  if (!window.WebSocket) return;
+
+  const scheme = location.protocol === "https:" ? "wss" : "ws";
+  const ws = new WebSocket(`${scheme}://${location.host}/ws`);
+  ws.onopen = () => {
+    socket = ws;
+  };
+  ws.onclose = () => {
+    socket = null;
+    document.querySelector(".timer-display").hidden = true;
+  };
+  ws.onmessage = (event) => handleRealtimeMessage(JSON.parse(event.data));
+}
+
+function handleRealtimeMessage(message) {
+  switch (message.type) {
+    case "state":
+      updateGameStateFromBackend(message.state);
+      updateTimer(message.remaining, false);
+      break;
+    case "guess":
+      handleGuessResponse(message);
+      break;
+    case "tick":
+      updateTimer(message.remaining, message.warning);
+      break;
+    case "timeout":
+      applyStateDelta(message.delta);
+      showMessage(message.result.message, "error");
+      if (gameState.gameOver) showGameOver();
+      break;
+    case "error":
+      showMessage(message.error, "error");
+      break;
+  }
+}
+
+function updateTimer(remaining, warning) {
+  const timer = document.querySelector(".timer-display");
+  timer.hidden = gameState.gameOver;
+  timer.textContent = `Time: ${remaining}s`;
+  timer.classList.toggle("warning", warning);
+}
+
+function applyStateDelta(delta) {
+  // A reset carries the full state, e.g. after a word was completed
+  if (delta.reset) {
+    updateGameStateFromBackend(delta.state);
+    return;
+  }
+
+  const display = Array.from(gameState.word_display);
+  delta.revealed.forEach(([position, char]) => {
+    display[position] = char;
+  });
+  gameState.word_display = display.join("");
+  gameState.guessedLetters = gameState.guessedLetters.concat(delta.guessed);
+  gameState.wrongGuesses = gameState.wrongGuesses.concat(delta.wrong);
+  gameState.lives += delta.lives_delta;
+  gameState.score += delta.score_delta;
+  gameState.gameOver = delta.game_over;
+  gameState.revision = delta.revision;
+  if (delta.lives_display) gameState.lives_display = delta.lives_display;
+  if (delta.word) gameState.word = delta.word;
+
+  updateGameDisplay();
+}
+
+function updateGameDisplay() {
+  // Update displays using backend-provided formatted data
+  document.querySelector(".word-display").textContent =
+    gameState.word_display || "";
+  document.querySelector(
+    ".score-display"
+  ).textContent = `Score: ${gameState.score}`;
+  document.querySelector(".lives-display").textContent = `Lives: ${
+    gameState.lives_display || ""
+  }`;
+
+  // Update gallows based on lives
+  updateGallows(gameState.lives);
+}
+
+function updateGallows(lives) {
+  // Show hangman parts based on lives remaining
+  const parts = [
+    ".hangman-head",
+    ".hangman-body",
+    ".hangman-left-arm",
+    ".hangman-right-arm",
+    ".hangman-left-leg",
+    ".hangman-right-leg",
+  ];
+
+  parts.forEach((part, index) => {
+    const element = document.querySelector(part);
+    if (element) {
+      if (lives <= 5 - index) {
+        element.classList.add("visible");
+      } else {
+        element.classList.remove("visible");
+      }
+    }
+  });
+}
+
+function showMessage(message, type) {
+  // Create temporary message display
+  const messageDiv = document.createElement("div");
+  messageDiv.className = `message ${type}`;
+  messageDiv.textContent = message;
+  messageDiv.style.cssText = `
+    position: fixed;
+    bottom: 20px;
+    left: 50%;
+    transform: translateX(-50%);
+    padding: 15px 20px;
+    border-radius: 8px;
+    color: white;
+    font-weight: bold;
+    z-index: 1000;
+    background: ${
+      type === "success"
+        ? "#27ae60"
+        : type === "error"
+        ? "#e74c3c"
+        : "#3498db"
+    };
+    box-shadow: 0 4px 12px rgba(0, 0, 0, 0.3);
+    min-width: 200px;
+    text-align: center;
+  `;
+
+  document.body.appendChild(messageDiv);
+
+  setTimeout(() => {
+    if (messageDiv.parentNode) {
+      messageDiv.parentNode.removeChild(messageDiv);
+    }
+  }, 2000);
+}
+
+function showGameOver() {
+  // Show game over modal
+  const modal = document.createElement("div");
+  modal.className = "game-over";
+  modal.innerHTML = `
+    <div>
+      <h2>Game Over!</h2>
+      <p>Final Score: ${gameState.score}</p>
+      <p>The word was: <strong>${gameState.word}</strong></p>
+      <a href="/select-level" class="btn btn-primary">Play Again</a>
+    </div>
+  `;
+
+  document.body.appendChild(modal);
+}
+
+function enableAllButtons() {
+  // Re-enable all letter buttons (used when word is completed)
+  const allButtons = document.querySelectorAll(".letter-btn");
+  allButtons.forEach((btn) => {
+    btn.disabled = false;
+    btn.classList.remove("disabled");
+  });
+}
+
+connectRealtime();
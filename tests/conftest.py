@@ -0,0 +1,11 @@
+"""
+Shared Test Configuration
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def secret_key(monkeypatch):
+    """Give every app a secret key, as production requires with debug off."""
+    monkeypatch.setenv('HANGMAN_SECRET_KEY', 'test-secret')
@@ -0,0 +1,234 @@
+"""
+Tests for ASGI Application
+
+Tests the async entry point's native routes and its WSGI bridge.
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+from src.web.app import create_app
+from src.web.asgi import create_asgi_app
+from src.web.session_store import CookieSessionStore
+
+
+def call(app, method, path, body=b'', cookie=None):
+    """Send one HTTP request through the ASGI app and collect the response."""
+    headers = [(b'content-type', b'application/json')]
+    if cookie:
+        headers.append((b'cookie', cookie))
+    scope = {
+        'type': 'http',
+        'method': method,
+        'path': path,
+        'query_string': b'',
+        'headers': headers,
+    }
+    messages = [{'type': 'http.request', 'body': body}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    start = sent[0]
+    response_headers = dict(start['headers'])
+    return start['status'], response_headers, sent[1]['body']
+
+
+def session_cookie(headers):
+    return headers[b'set-cookie'].split(b';', 1)[0]
+
+
+class TestASGIApp:
+    @pytest.fixture
+    def app(self):
+        flask_app = create_app(debug=False)
+        flask_app.config['TESTING'] = True
+        return create_asgi_app(flask_app)
+
+    def test_game_page_starts_session(self, app):
+        """Test the native game route renders and sets the session cookie."""
+        status, headers, body = call(app, 'GET', '/game/basic')
+
+        assert status == 200
+        assert b'hangman-game' in body
+        assert b'set-cookie' in headers
+
+    def test_guess_uses_player_session(self, app):
+        """Test guesses are applied to the game started by the player."""
+        _, headers, _ = call(app, 'GET', '/game/basic')
+        cookie = session_cookie(headers)
+
+        status, _, body = call(
+            app, 'POST', '/guess', json.dumps({'letter': 'e'}).encode(), cookie
+        )
+
+        assert status == 200
+        assert 'E' in json.loads(body)['game_state']['guessed_letters']
+
+    def test_guess_records_stages(self, monkeypatch):
+        """Test native guesses are timed like the Flask route when enabled."""
+        monkeypatch.setenv('HANGMAN_METRICS', '1')
+        flask_app = create_app(debug=False)
+        app = create_asgi_app(flask_app)
+        _, headers, _ = call(app, 'GET', '/game/basic')
+        call(app, 'POST', '/guess', b'{"letter": "E"}', session_cookie(headers))
+
+        instrumentation = flask_app.extensions['hangman_instrumentation']
+        assert set(instrumentation.stages) == {
+            'parse',
+            'load',
+            'guess_letter',
+            'process_word_completion',
+            'get_game_state',
+            'save',
+            'jsonify',
+        }
+        histogram = instrumentation.requests['hangman.guess_letter']
+        assert sum(histogram.snapshot()[0]) == 1
+
+    def test_guess_without_game_returns_404(self, app):
+        """Test guessing without a session is rejected."""
+        status, _, _ = call(app, 'POST', '/guess', b'{"letter": "A"}')
+        assert status == 404
+
+    def test_guess_invalid_letter(self, app):
+        """Test non-letters are rejected before touching the store."""
+        status, _, _ = call(app, 'POST', '/guess', b'{"letter": "1"}')
+        assert status == 400
+
+    def test_other_routes_use_flask_app(self, app):
+        """Test pages without native handlers are served through WSGI."""
+        status, _, body = call(app, 'GET', '/')
+        assert status == 200
+        assert b'Start Game' in body
+
+        status, _, _ = call(app, 'GET', '/game/expert')
+        assert status == 404
+
+    def test_cookie_sessions(self):
+        """Test cookie-only sessions round-trip through the ASGI path."""
+        flask_app = create_app(session_store=CookieSessionStore(), debug=False)
+        app = create_asgi_app(flask_app)
+        _, headers, _ = call(app, 'GET', '/game/basic')
+
+        _, headers, _ = call(
+            app, 'POST', '/guess', b'{"letter": "Q"}', session_cookie(headers)
+        )
+        status, _, body = call(
+            app, 'POST', '/guess', b'{"letter": "Q"}', session_cookie(headers)
+        )
+
+        assert status == 200
+        assert json.loads(body)['result']['message'] == 'Letter already guessed!'
+
+    def test_lifespan(self, app):
+        """Test startup and shutdown events are acknowledged."""
+        events = [{'type': 'lifespan.startup'}, {'type': 'lifespan.shutdown'}]
+        sent = []
+
+        async def receive():
+            return events.pop(0)
+
+        async def send(message):
+            sent.append(message['type'])
+
+        asyncio.run(app({'type': 'lifespan'}, receive, send))
+        assert sent == ['lifespan.startup.complete', 'lifespan.shutdown.complete']
+
+
+async def open_socket(app, cookie):
+    """Connect to /ws and return the queues feeding and draining it."""
+    incoming = asyncio.Queue()
+    outgoing = asyncio.Queue()
+    scope = {'type': 'websocket', 'path': '/ws', 'headers': [(b'cookie', cookie)]}
+    await incoming.put({'type': 'websocket.connect'})
+    task = asyncio.ensure_future(app(scope, incoming.get, outgoing.put))
+    return incoming, outgoing, task
+
+
+async def next_message(outgoing):
+    message = await asyncio.wait_for(outgoing.get(), timeout=5)
+    return json.loads(message['text']) if 'text' in message else message
+
+
+def fast_clock(speedup=100):
+    """Return a clock that runs speedup times faster than real time."""
+    start = time.monotonic()
+    return lambda: time.time() + (time.monotonic() - start) * (speedup - 1)
+
+
+class TestWebSocket:
+    @pytest.fixture
+    def app(self):
+        flask_app = create_app(debug=False)
+        return create_asgi_app(flask_app, tick_interval=0.01, clock=fast_clock())
+
+    def test_guesses_return_deltas(self, app):
+        """Test guesses over the socket are answered with state deltas."""
+        _, headers, _ = call(app, 'GET', '/game/basic')
+
+        async def play():
+            incoming, outgoing, task = await open_socket(app, session_cookie(headers))
+            assert (await outgoing.get())['type'] == 'websocket.accept'
+            state = (await next_message(outgoing))['state']
+
+            guess = json.dumps({'type': 'guess', 'letter': 'q'})
+            await incoming.put({'type': 'websocket.receive', 'text': guess})
+            message = await next_message(outgoing)
+            while message['type'] == 'tick':
+                message = await next_message(outgoing)
+
+            await incoming.put({'type': 'websocket.disconnect'})
+            await task
+            return state, message
+
+        state, message = asyncio.run(play())
+
+        assert message['type'] == 'guess'
+        assert message['delta']['since'] == state['revision']
+        assert message['delta']['guessed'] == ['Q']
+
+    def test_timer_expires_on_server(self, app):
+        """Test the server counts down and charges a life on timeout."""
+        _, headers, _ = call(app, 'GET', '/game/basic')
+
+        async def wait_for_timeout():
+            incoming, outgoing, task = await open_socket(app, session_cookie(headers))
+            await outgoing.get()
+            await next_message(outgoing)
+
+            ticks = []
+            message = await next_message(outgoing)
+            while message['type'] == 'tick':
+                ticks.append(message['remaining'])
+                message = await next_message(outgoing)
+
+            await incoming.put({'type': 'websocket.disconnect'})
+            await task
+            return ticks, message
+
+        ticks, message = asyncio.run(wait_for_timeout())
+
+        assert ticks == sorted(ticks, reverse=True)
+        assert 0 < ticks[-1] <= 2
+        assert message['type'] == 'timeout'
+        assert message['result']['message'] == 'Time is up!'
+        assert message['delta']['state']['lives'] == 5
+
+    def test_rejects_socket_without_game(self, app):
+        """Test connecting without a started game closes the socket."""
+
+        async def connect():
+            _, outgoing, task = await open_socket(app, b'')
+            await task
+            return await outgoing.get()
+
+        message = asyncio.run(connect())
+        assert message == {'type': 'websocket.close', 'code': 4404}
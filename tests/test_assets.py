@@ -0,0 +1,162 @@
+"""
+Tests for Static Asset Pipeline
+
+Tests CSS minification, the fingerprinted build and serving built assets.
+"""
+
+import gzip
+import os
+import shutil
+
+import pytest
+from src.web import assets
+from src.web.app import create_app
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    """Copy the real static sources into a temporary directory."""
+    target = tmp_path / 'static'
+    for name in assets.ASSETS:
+        path = target / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(os.path.join(assets.STATIC_DIR, name), path)
+    return str(target)
+
+
+class TestMinifyCss:
+    def test_strips_comments_and_whitespace(self):
+        """Test comments, newlines and trailing semicolons are removed."""
+        css = '/* header */\n.a > .b {\n  color: red;\n  margin: 0 auto;\n}\n'
+
+        assert assets.minify_css(css) == '.a>.b{color:red;margin:0 auto}'
+
+    def test_keeps_quoted_strings(self):
+        """Test whitespace inside quoted strings is preserved."""
+        css = '.a { font-family: "Courier  New", monospace; content: \'a ,  b\'; }'
+
+        minified = assets.minify_css(css)
+
+        assert '"Courier  New"' in minified
+        assert "'a ,  b'" in minified
+
+    def test_keeps_descendant_pseudo_class_space(self):
+        """Test a space before a pseudo-class selector is kept."""
+        assert assets.minify_css('.a :hover { color: red; }') == '.a :hover{color:red}'
+
+
+class TestBuild:
+    def test_writes_fingerprinted_files_and_manifest(self, static_dir):
+        """Test every asset gets a hashed name, a gzip variant and a manifest."""
+        manifest = assets.build(static_dir)
+
+        assert set(manifest) == set(assets.ASSETS)
+        assert assets.load_manifest(static_dir) == manifest
+        for built_name in manifest.values():
+            path = os.path.join(static_dir, built_name)
+            with open(path, 'rb') as file:
+                content = file.read()
+            with open(path + '.gz', 'rb') as file:
+                assert gzip.decompress(file.read()) == content
+
+    def test_name_changes_with_content(self, static_dir):
+        """Test editing an asset changes its fingerprinted name."""
+        before = assets.build(static_dir)['js/game.js']
+        with open(os.path.join(static_dir, 'js/game.js'), 'a') as file:
+            file.write('\n// changed\n')
+
+        after = assets.build(static_dir)['js/game.js']
+
+        assert after != before
+        assert os.path.exists(os.path.join(static_dir, before))
+
+    def test_build_is_reproducible(self, static_dir):
+        """Test rebuilding unchanged sources produces identical output."""
+        manifest = assets.build(static_dir)
+        path = os.path.join(static_dir, manifest['css/game.css']) + '.gz'
+        with open(path, 'rb') as file:
+            first = file.read()
+
+        assets.build(static_dir)
+
+        with open(path, 'rb') as file:
+            assert file.read() == first
+
+
+class TestServing:
+    @pytest.fixture
+    def built_app(self, static_dir):
+        manifest = assets.build(static_dir)
+        app = create_app(debug=False)
+        app.config['TESTING'] = True
+        app.static_folder = static_dir
+        assets.init_assets(app, static_dir)
+        return app, manifest
+
+    def test_url_for_emits_fingerprinted_url(self, built_app):
+        """Test url_for rewrites built assets to their hashed names."""
+        app, manifest = built_app
+
+        with app.test_request_context():
+            from flask import url_for
+
+            assert url_for('static', filename='css/style.css') == (
+                '/static/' + manifest['css/style.css']
+            )
+            assert url_for('static', filename='favicon.ico') == '/static/favicon.ico'
+
+    def test_pages_link_fingerprinted_assets(self, built_app):
+        """Test rendered pages reference the built stylesheet and script."""
+        app, manifest = built_app
+
+        html = app.test_client().get('/game/basic').get_data(as_text=True)
+
+        assert '/static/' + manifest['css/style.css'] in html
+        assert '/static/' + manifest['js/game.js'] in html
+
+    def test_serves_gzip_with_immutable_caching(self, built_app):
+        """Test a gzip-capable client gets the precompressed variant."""
+        app, manifest = built_app
+
+        response = app.test_client().get(
+            '/static/' + manifest['css/game.css'],
+            headers={'Accept-Encoding': 'gzip'},
+        )
+
+        assert response.status_code == 200
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert response.headers['Cache-Control'] == assets.IMMUTABLE_CACHE_CONTROL
+        assert 'Accept-Encoding' in response.headers['Vary']
+        assert response.mimetype == 'text/css'
+        assert gzip.decompress(response.data).startswith(b'.hangman-game{')
+
+    def test_serves_identity_without_accept_encoding(self, built_app):
+        """Test clients that do not accept compression get the plain file."""
+        app, manifest = built_app
+
+        response = app.test_client().get('/static/' + manifest['js/game.js'])
+
+        assert response.status_code == 200
+        assert 'Content-Encoding' not in response.headers
+        assert b'gameData' in response.data
+
+    def test_manifest_is_not_served(self, built_app):
+        """Test the manifest itself is not exposed under /static/dist."""
+        app, _ = built_app
+
+        response = app.test_client().get('/static/dist/manifest.json')
+
+        assert response.status_code == 404
+
+    def test_without_manifest_urls_are_unchanged(self, static_dir):
+        """Test an app without a build serves the source files."""
+        app = create_app(debug=False)
+        assets.init_assets(app, static_dir)
+
+        with app.test_request_context():
+            from flask import url_for
+
+            assert url_for('static', filename='css/style.css') == (
+                '/static/css/style.css'
+            )
+        assert 'hangman_assets' not in app.extensions
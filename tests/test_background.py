@@ -0,0 +1,149 @@
+"""
+Tests for Background Flushing
+
+Tests the WAL connection setup and that a forked child of a leaderboard,
+event log or daily stats gets fresh locks and its own flush thread.
+"""
+
+import datetime
+import os
+import signal
+import threading
+import time
+
+import pytest
+from src.core.background import BackgroundFlusher, connect_wal
+from src.core.daily_challenge import DailyStats
+from src.core.event_log import EventLog, read_log
+from src.core.game_engine import EVENT_GUESS
+from src.core.leaderboard import Leaderboard
+
+fork_only = pytest.mark.skipif(not hasattr(os, 'fork'), reason='needs os.fork')
+
+
+def run_in_child(work):
+    """Fork, run work in the child and return its exit status."""
+    pid = os.fork()
+    if pid == 0:
+        try:
+            work()
+        except BaseException:
+            os._exit(1)
+        os._exit(0)
+    # A child stuck on a lock copied from the parent is killed
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        done, status = os.waitpid(pid, os.WNOHANG)
+        if done:
+            return os.waitstatus_to_exitcode(status)
+        time.sleep(0.01)
+    os.kill(pid, signal.SIGKILL)
+    os.waitpid(pid, 0)
+    return None
+
+
+class TestConnectWal:
+    def test_journal_mode_and_schema(self, tmp_path):
+        """Test the database is opened in WAL mode with its table created."""
+        conn = connect_wal(
+            str(tmp_path / 'test.db'), 'CREATE TABLE IF NOT EXISTS t (x INTEGER)'
+        )
+        try:
+            assert conn.execute('PRAGMA journal_mode').fetchone() == ('wal',)
+            assert conn.execute('SELECT COUNT(*) FROM t').fetchone() == (0,)
+        finally:
+            conn.close()
+
+
+class TestBackgroundFlusher:
+    def test_thread_survives_failed_flush(self):
+        """Test a flush that raises does not stop later flushes."""
+        flushed = threading.Event()
+
+        class Failing(BackgroundFlusher):
+            calls = 0
+
+            def flush(self):
+                self.calls += 1
+                if self.calls == 1:
+                    raise OSError('disk full')
+                flushed.set()
+
+        flusher = Failing(0.01, 'failing')
+        with flusher._lock:
+            flusher._start_flusher()
+
+        assert flushed.wait(5)
+        flusher._stop_flusher()
+
+
+@fork_only
+class TestAfterFork:
+    def test_leaderboard_lock_held_at_fork(self, tmp_path):
+        """Test a child can record while the parent holds the lock."""
+        leaderboard = Leaderboard(str(tmp_path / 'leaderboard.db'))
+        leaderboard.record('parent', 'basic', 3)
+
+        def child():
+            leaderboard.record('child', 'basic', 5)
+            leaderboard.close()
+
+        with leaderboard._lock:
+            status = run_in_child(child)
+        leaderboard.close()
+
+        assert status == 0
+        loaded = Leaderboard(str(tmp_path / 'leaderboard.db'))
+        assert [result.game_id for result in loaded.top('basic')] == [
+            'child',
+            'parent',
+        ]
+
+    def test_event_log_child_writes_own_segment(self, tmp_path):
+        """Test a child writes its own events, not those its parent buffered."""
+        event_log = EventLog(str(tmp_path), fsync='never')
+        event_log.append('parent', EVENT_GUESS, 'A')
+
+        def child():
+            event_log.append('child', EVENT_GUESS, 'B')
+            event_log.close()
+
+        with event_log._lock:
+            status = run_in_child(child)
+        event_log.close()
+
+        assert status == 0
+        events = sorted(event.game_id for event in read_log(str(tmp_path)))
+        assert events == ['child', 'parent']
+
+    def test_daily_stats_child_does_not_count_parent_twice(self, tmp_path):
+        """Test counters buffered before the fork are added only once."""
+        day = datetime.date(2024, 3, 6)
+        stats = DailyStats(str(tmp_path / 'daily.db'))
+        stats.record_failed(day, 'basic', 0)
+
+        def child():
+            stats.record_failed(day, 'basic', 0)
+            stats.close()
+
+        with stats._lock:
+            status = run_in_child(child)
+        stats.close()
+
+        assert status == 0
+        assert DailyStats(str(tmp_path / 'daily.db')).counters(day, 'basic')[1] == 2
+
+    def test_child_starts_its_own_thread(self, tmp_path):
+        """Test a child does not count on the parent's flush thread."""
+        leaderboard = Leaderboard(str(tmp_path / 'leaderboard.db'))
+        leaderboard.record('parent', 'basic', 3)
+        parent_thread = leaderboard._thread
+
+        def child():
+            leaderboard.record('child', 'basic', 5)
+            assert leaderboard._thread is not parent_thread
+            assert leaderboard._thread in threading.enumerate()
+            leaderboard.close()
+
+        assert run_in_child(child) == 0
+        leaderboard.close()
@@ -0,0 +1,234 @@
+"""
+Tests for Daily Challenge
+
+Tests the date-seeded word schedule, the streaming per-word stats and
+the /daily routes.
+"""
+
+import datetime
+import sqlite3
+
+import pytest
+from src.core.daily_challenge import (
+    DailySchedule,
+    DailyStats,
+    DailyTracker,
+    challenge_day,
+    daily_seed,
+)
+from src.core.game_engine import GameEngine
+from src.utils.constants import MAX_LIVES
+from src.web.app import create_app
+
+DAY = datetime.date(2024, 3, 6)
+# 2024-03-06 12:00 UTC
+NOON = 1709726400.0
+
+
+def solve_word(engine):
+    """Guess every letter of the current word, returning how many."""
+    letters = dict.fromkeys(char for char in engine.word if char.isalpha())
+    for letter in letters:
+        engine.guess_letter(letter)
+    engine.process_word_completion()
+    return len(letters)
+
+
+def lose_game(engine):
+    letters = 'QZXJKVWYFBGPMHUCDLTNRSIOAE'
+    wrong = [letter for letter in letters if letter not in engine.word]
+    for letter in wrong[:MAX_LIVES]:
+        engine.guess_letter(letter)
+
+
+class TestDailySchedule:
+    def test_seed_depends_on_day_level_and_secret(self):
+        """Test seeds are stable and differ between days, levels and secrets."""
+        seed = daily_seed(DAY, 'basic', b'secret')
+
+        assert daily_seed(DAY, 'basic', b'secret') == seed
+        assert daily_seed(DAY + datetime.timedelta(days=1), 'basic', b'secret') != seed
+        assert daily_seed(DAY, 'intermediate', b'secret') != seed
+        assert daily_seed(DAY, 'basic', b'other') != seed
+
+    def test_challenge_day_is_utc(self):
+        """Test the challenge day follows the UTC date."""
+        assert challenge_day(NOON) == DAY
+        assert challenge_day(NOON + 12 * 60 * 60) == DAY + datetime.timedelta(days=1)
+
+    def test_games_draw_the_schedule(self):
+        """Test a daily game plays the scheduled words in order."""
+        schedule = DailySchedule(b'secret', clock=lambda: NOON)
+        words = schedule.words(DAY, 'basic')
+        engine = schedule.new_game('basic')
+
+        played = [engine.word]
+        for _ in range(3):
+            solve_word(engine)
+            played.append(engine.word)
+
+        assert played == list(words[:4])
+        assert DailySchedule(b'secret').words(DAY, 'basic') == words
+
+    def test_day_of(self):
+        """Test daily games are recognised into the next day only."""
+        now = [NOON]
+        schedule = DailySchedule(b'secret', clock=lambda: now[0])
+        engine = schedule.new_game('basic')
+
+        assert schedule.day_of(engine) == DAY
+        assert schedule.day_of(GameEngine('basic')) is None
+        now[0] += 24 * 60 * 60
+        assert schedule.day_of(engine) == DAY
+        now[0] += 24 * 60 * 60
+        assert schedule.day_of(engine) is None
+
+    def test_precompute(self):
+        """Test the coming days are computed and past ones dropped."""
+        now = [NOON]
+        schedule = DailySchedule(b'secret', length=5, clock=lambda: now[0])
+        schedule.precompute(days=3)
+        assert {key[0] for key in schedule._words} == {
+            DAY + datetime.timedelta(days=offset) for offset in range(3)
+        }
+
+        now[0] += 3 * 24 * 60 * 60
+        schedule.precompute(days=1)
+        assert min(key[0] for key in schedule._words) == DAY + datetime.timedelta(2)
+
+
+class TestDailyStats:
+    def test_summary(self):
+        """Test solve rates and guess counts per scheduled word."""
+        stats = DailyStats(length=3)
+        stats.record_solved(DAY, 'basic', 0, 7)
+        stats.record_solved(DAY, 'basic', 0, 9)
+        stats.record_failed(DAY, 'basic', 0)
+        stats.record_solved(DAY, 'basic', 1, 9)
+        stats.record_failed(DAY, 'basic', 3)
+
+        words = stats.summary(DAY, 'basic')
+
+        assert words[0] == {
+            'position': 0,
+            'players': 3,
+            'solved': 2,
+            'solve_rate': pytest.approx(2 / 3),
+            'guesses': {7: 1, 9: 1},
+        }
+        assert [word['players'] for word in words] == [3, 1]
+
+    def test_memory_is_bounded(self):
+        """Test only the current and previous day are kept in memory."""
+        stats = DailyStats()
+        for offset in range(10):
+            stats.record_failed(DAY + datetime.timedelta(days=offset), 'basic', 0)
+
+        assert len(stats._pending) == 2
+        assert stats.summary(DAY, 'basic') == []
+
+    def test_workers_add_up(self, tmp_path):
+        """Test counters flushed by several workers are added together."""
+        db_path = str(tmp_path / 'daily.db')
+        first, second = DailyStats(db_path), DailyStats(db_path)
+        first.record_solved(DAY, 'basic', 0, 5)
+        second.record_solved(DAY, 'basic', 0, 5)
+        second.record_failed(DAY, 'basic', 0)
+        first.flush()
+        second.flush()
+        first.record_failed(DAY, 'basic', 0)
+
+        assert first.summary(DAY, 'basic')[0]['players'] == 4
+        assert second.summary(DAY, 'basic')[0]['guesses'] == {5: 2}
+
+    def test_failed_flush_keeps_counters(self, tmp_path, monkeypatch):
+        """Test counters are flushed again after a failed flush."""
+        db_path = str(tmp_path / 'daily.db')
+        stats = DailyStats(db_path)
+        stats.record_failed(DAY, 'basic', 0)
+        connect = stats._connect
+
+        def locked():
+            raise sqlite3.OperationalError('database is locked')
+
+        monkeypatch.setattr(stats, '_connect', locked)
+        with pytest.raises(sqlite3.OperationalError):
+            stats.flush()
+        stats.record_failed(DAY, 'basic', 0)
+        monkeypatch.setattr(stats, '_connect', connect)
+        stats.flush()
+
+        assert DailyStats(db_path).summary(DAY, 'basic')[0]['players'] == 2
+
+    def test_tracker(self):
+        """Test a tracked game counts its solved words and the word lost."""
+        stats = DailyStats()
+        engine = DailySchedule(b'secret').new_game('basic', DAY)
+        tracker = DailyTracker(stats, DAY, engine)
+
+        guesses = solve_word(engine)
+        lose_game(engine)
+        tracker.detach()
+
+        words = stats.summary(DAY, 'basic')
+        assert words[0]['guesses'] == {guesses: 1}
+        assert words[1]['solved'] == 0 and words[1]['players'] == 1
+        assert engine.recorder is None
+
+
+class TestDailyRoutes:
+    @pytest.fixture
+    def app(self):
+        app = create_app(debug=False)
+        app.config['TESTING'] = True
+        return app
+
+    def current_engine(self, app, client):
+        with client.session_transaction() as session:
+            game_id = session['game_id']
+        return app.extensions['hangman_session_store'].get(game_id)
+
+    def test_players_share_words(self, app):
+        """Test every player gets the same daily word."""
+        first, second = app.test_client(), app.test_client()
+
+        assert first.get('/daily/basic').status_code == 200
+        second.get('/daily/basic')
+
+        words = app.extensions['hangman_daily_schedule'].words(
+            datetime.datetime.now(datetime.timezone.utc).date(), 'basic'
+        )
+        assert self.current_engine(app, first).word == words[0]
+        assert self.current_engine(app, second).word == words[0]
+        assert app.test_client().get('/daily/expert').status_code == 404
+
+    def test_guesses_are_counted(self, app):
+        """Test solving a daily word shows up in the day's stats."""
+        client = app.test_client()
+        client.get('/daily/basic')
+        engine = self.current_engine(app, client)
+        letters = list(dict.fromkeys(c for c in engine.word if c.isalpha()))
+
+        client.post('/guess/batch', json={'letters': letters})
+
+        words = client.get('/daily/basic/stats').get_json()['words']
+        assert words[0]['solved'] == 1
+        assert words[0]['guesses'] == {str(len(letters)): 1}
+        assert 'word' not in words[0]
+
+    def test_stats_dates(self, app):
+        """Test past days reveal their words and future days are refused."""
+        client = app.test_client()
+        today = datetime.datetime.now(datetime.timezone.utc).date()
+        yesterday = today - datetime.timedelta(days=1)
+        schedule = app.extensions['hangman_daily_schedule']
+        app.extensions['hangman_daily_stats'].record_failed(yesterday, 'basic', 0)
+
+        response = client.get(f'/daily/basic/stats?date={yesterday.isoformat()}')
+        assert response.get_json()['words'][0]['word'] == schedule.words(
+            yesterday, 'basic'
+        )[0]
+
+        tomorrow = today + datetime.timedelta(days=1)
+        response = client.get(f'/daily/basic/stats?date={tomorrow.isoformat()}')
+        assert response.status_code == 400
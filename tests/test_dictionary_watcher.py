@@ -0,0 +1,136 @@
+"""
+Tests for Dictionary Watcher
+
+Tests hot reload of edited dictionary files.
+"""
+
+import os
+import time
+
+import pytest
+from src.core.dictionary_watcher import DictionaryWatcher
+from src.core.word_manager import WordManager
+
+
+@pytest.fixture
+def dictionary_dir(tmp_path):
+    (tmp_path / 'basic_words.txt').write_text('python\ncoding\n')
+    (tmp_path / 'intermediate_phrases.txt').write_text('break a leg\n')
+    return tmp_path
+
+
+def rewrite(path, content):
+    """Write new content with a strictly newer modification time."""
+    stat = os.stat(path)
+    path.write_text(content)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+class TestDictionaryWatcher:
+    def test_unchanged_files_are_not_reloaded(self, dictionary_dir):
+        """Test a poll without edits does nothing."""
+        manager = WordManager(dictionary_dir=str(dictionary_dir))
+        watcher = DictionaryWatcher(manager)
+
+        assert watcher.check() == []
+
+    def test_edited_file_is_reloaded(self, dictionary_dir):
+        """Test an edited dictionary is swapped in with reload stats."""
+        manager = WordManager(dictionary_dir=str(dictionary_dir))
+        watcher = DictionaryWatcher(manager)
+        reports = []
+        manager.add_reload_listener(reports.append)
+        assert manager.get_random_word('basic') in ('PYTHON', 'CODING')
+
+        rewrite(dictionary_dir / 'basic_words.txt', 'keyboard\n')
+        reloaded = watcher.check()
+
+        assert [stats.level for stats in reloaded] == ['basic']
+        assert reports == reloaded
+        assert reloaded[0].entries == 1
+        assert reloaded[0].duration >= 0
+        assert reloaded[0].peak_rss_kb > 0
+        assert manager.get_random_word('basic') == 'KEYBOARD'
+
+    def test_word_located_before_reload_still_resolves(self, dictionary_dir):
+        """Test in-flight games keep their word across a reload."""
+        manager = WordManager(dictionary_dir=str(dictionary_dir))
+        position, checksum = manager.locate_word('basic', 'CODING')
+
+        rewrite(dictionary_dir / 'basic_words.txt', 'keyboard\nmonitor\n')
+        manager.reload('basic')
+
+        assert manager.get_word_at('basic', position, checksum) == 'CODING'
+        assert manager.get_word_at('basic', position) == 'MONITOR'
+
+    def test_mapped_file_replaced_by_rename_still_resolves(self, dictionary_dir):
+        """Test a renamed-over mapped dictionary keeps the old one readable."""
+        manager = WordManager(dictionary_dir=str(dictionary_dir), use_mmap=True)
+        position, checksum = manager.locate_word('basic', 'CODING')
+
+        path = dictionary_dir / 'basic_words.txt'
+        replacement = dictionary_dir / 'basic_words.txt.new'
+        replacement.write_text('keyboard\nmonitor\n')
+        os.replace(replacement, path)
+        manager.reload('basic')
+
+        assert manager.get_word_at('basic', position, checksum) == 'CODING'
+        assert manager.get_word_at('basic', position) == 'MONITOR'
+
+    def test_mapped_file_edited_in_place_is_read_into_memory(self, dictionary_dir):
+        """Test the stale mapping of a file edited in place is not used."""
+        manager = WordManager(dictionary_dir=str(dictionary_dir), use_mmap=True)
+        position, checksum = manager.locate_word('basic', 'CODING')
+
+        rewrite(dictionary_dir / 'basic_words.txt', 'keyboard\nmonitor\n')
+        manager.reload('basic')
+
+        with pytest.raises(ValueError):
+            manager.get_word_at('basic', position, checksum)
+        assert manager.get_word_at('basic', position) == 'MONITOR'
+        assert isinstance(manager.get_index('basic').words, list)
+
+    def test_unknown_dictionary_generation_raises(self, dictionary_dir):
+        """Test positions from a dictionary no longer kept are rejected."""
+        manager = WordManager(dictionary_dir=str(dictionary_dir))
+        with pytest.raises(ValueError):
+            manager.get_word_at('basic', 0, checksum=12345)
+
+    def test_empty_file_keeps_previous_dictionary(self, dictionary_dir):
+        """Test an empty dictionary is rejected and the old one kept."""
+        manager = WordManager(dictionary_dir=str(dictionary_dir))
+        watcher = DictionaryWatcher(manager)
+        manager.get_random_word('basic')
+
+        rewrite(dictionary_dir / 'basic_words.txt', '')
+        with pytest.raises(ValueError):
+            watcher.check()
+
+        assert manager.get_random_word('basic') in ('PYTHON', 'CODING')
+        assert watcher.check() == []
+
+    def test_background_thread_survives_errors(self, dictionary_dir, monkeypatch):
+        """Test the polling thread logs a failed reload and keeps running."""
+        manager = WordManager(dictionary_dir=str(dictionary_dir))
+        watcher = DictionaryWatcher(manager, interval=0.01)
+        calls = []
+
+        def check():
+            calls.append(None)
+            raise RuntimeError('unexpected')
+
+        monkeypatch.setattr(watcher, 'check', check)
+        watcher.start()
+        deadline = time.monotonic() + 5
+        while len(calls) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        watcher.stop()
+
+        assert len(calls) >= 2
+
+    def test_background_thread_starts_and_stops(self, dictionary_dir):
+        """Test the polling thread can be started and stopped cleanly."""
+        manager = WordManager(dictionary_dir=str(dictionary_dir))
+        watcher = DictionaryWatcher(manager, interval=0.01)
+        watcher.start()
+        watcher.stop()
@@ -0,0 +1,171 @@
+"""
+Tests for Difficulty Scoring
+
+Tests solver-based entry scores, incremental rebuilds of the scores file
+and drawing words from difficulty percentiles.
+"""
+
+import os
+import random
+import string
+from array import array
+
+import pytest
+from src.core.difficulty import build_scores, main, score_level, score_word
+from src.core.difficulty_scores import DifficultyRanking, read_scores
+from src.core.solver import CandidateIndex, HangmanSolver
+from src.core.word_manager import WordManager
+
+BASIC = ['CART', 'CARD', 'CORD', 'WORD', 'FUZZ', 'JAZZ', 'PYTHON', 'CODING']
+
+
+@pytest.fixture
+def dictionary_dir(tmp_path):
+    (tmp_path / 'basic_words.txt').write_text('\n'.join(BASIC) + '\n')
+    (tmp_path / 'intermediate_phrases.txt').write_text(
+        'break a leg\npiece of cake\nhit the books\n'
+    )
+    return tmp_path
+
+
+class TestScoreWord:
+    def test_ambiguous_pattern_scores_harder(self):
+        """Test a word sharing its pattern with many others is harder."""
+        solver = HangmanSolver(
+            CandidateIndex(['BATS', 'CATS', 'HATS', 'MATS', 'RATS', 'ZEBRA'])
+        )
+
+        assert score_word(solver, 'ZEBRA') < score_word(solver, 'MATS')
+
+    def test_misses_dominate_guess_count(self):
+        """Test the whole-number part of a score counts wrong guesses."""
+        solver = HangmanSolver(CandidateIndex(['ONLY']))
+
+        score = score_word(solver, 'ONLY')
+
+        assert int(score) == 0
+        assert 0 < score < 1
+
+    def test_unknown_word_is_still_solved(self):
+        """Test words outside the index are scored by fallback guessing."""
+        solver = HangmanSolver(CandidateIndex(['CART']))
+
+        assert score_word(solver, 'QUIZ') > score_word(solver, 'CART')
+
+
+class TestScoreLevel:
+    def test_unchanged_groups_are_kept(self):
+        """Test only entries in changed length groups are re-scored."""
+        scored, rescored = score_level(BASIC, checksum=1)
+        assert rescored == len(BASIC)
+
+        edited = BASIC[:-1] + ['MODULE']
+        rescored_level, rescored = score_level(edited, checksum=2, previous=scored)
+
+        # Only the six-letter group changed
+        assert rescored == 2
+        assert list(rescored_level.scores[:6]) == list(scored.scores[:6])
+
+    def test_parallel_matches_serial(self):
+        """Test scoring across processes gives the same scores."""
+        rng = random.Random(4)
+        words = [
+            ''.join(rng.choices(string.ascii_uppercase, k=rng.randint(4, 6)))
+            for _ in range(600)
+        ]
+
+        serial, _ = score_level(words, checksum=0, processes=1)
+        parallel, _ = score_level(words, checksum=0, processes=2)
+
+        assert serial.scores == parallel.scores
+
+
+class TestDifficultyRanking:
+    def test_percentile_slice(self):
+        """Test percentile ranges map onto the ranked pool."""
+        ranking = DifficultyRanking(array('f', range(10)), array('I', range(10)))
+
+        assert ranking.percentile_slice(0, 100) == (0, 10)
+        assert ranking.percentile_slice(90, 100) == (9, 10)
+        assert ranking.percentile_slice(50, 50.1) == (5, 6)
+
+    def test_ranks_by_score(self):
+        """Test the ranking orders pool positions from easiest to hardest."""
+        ranking = DifficultyRanking(array('f', [3, 1, 2, 0]), array('I', [0, 1, 2]))
+
+        assert list(ranking.ranked) == [1, 2, 0]
+        assert ranking.random_position(70, 100) == 0
+
+    def test_invalid_range(self):
+        """Test empty or out-of-bounds ranges are rejected."""
+        ranking = DifficultyRanking(array('f', [0]), array('I', [0]))
+
+        with pytest.raises(ValueError, match='Invalid percentile range'):
+            ranking.percentile_slice(50, 50)
+        with pytest.raises(ValueError, match='Invalid percentile range'):
+            ranking.percentile_slice(0, 101)
+
+
+class TestPercentileWords:
+    def test_draws_from_percentile_range(self, dictionary_dir):
+        """Test words drawn from the top percentiles are the hardest ones."""
+        manager = WordManager(dictionary_dir=str(dictionary_dir))
+        build_scores(manager, processes=1)
+
+        ranking = manager.get_difficulty_ranking('basic')
+        index = manager.get_index('basic')
+        hardest = index.words[ranking.ranked[-1]]
+        easiest = index.words[ranking.ranked[0]]
+
+        assert manager.get_random_word('basic', percentile=(99, 100)) == hardest
+        assert manager.get_random_word('basic', percentile=(0, 1)) == easiest
+
+    def test_rebuild_reuses_scores(self, dictionary_dir):
+        """Test a rebuild of an unchanged dictionary scores nothing."""
+        manager = WordManager(dictionary_dir=str(dictionary_dir))
+        build_scores(manager, processes=1)
+
+        stats = build_scores(manager, processes=1)
+
+        assert [entry.rescored for entry in stats] == [0, 0]
+        assert set(read_scores(manager.scores_path)) == {'basic', 'intermediate'}
+
+    def test_missing_scores(self, dictionary_dir):
+        """Test percentile draws need a scores file."""
+        manager = WordManager(dictionary_dir=str(dictionary_dir))
+
+        assert manager.get_difficulty_ranking('basic') is None
+        with pytest.raises(ValueError, match='No current difficulty scores'):
+            manager.get_random_word('basic', percentile=(0, 50))
+        assert manager.get_random_word('basic') in BASIC
+
+    def test_stale_scores_are_ignored(self, dictionary_dir):
+        """Test scores built for an older dictionary are not used."""
+        build_scores(WordManager(dictionary_dir=str(dictionary_dir)), processes=1)
+        (dictionary_dir / 'basic_words.txt').write_text('keyboard\nmonitor\n')
+
+        manager = WordManager(dictionary_dir=str(dictionary_dir))
+
+        assert manager.get_difficulty_ranking('basic') is None
+        assert manager.get_difficulty_ranking('intermediate') is not None
+
+    def test_corrupt_scores_are_ignored(self, dictionary_dir):
+        """Test a scores file failing its checksum is treated as missing."""
+        manager = WordManager(dictionary_dir=str(dictionary_dir))
+        build_scores(manager, processes=1)
+        with open(manager.scores_path, 'r+b') as file:
+            file.seek(-1, os.SEEK_END)
+            file.write(b'!')
+
+        with pytest.raises(ValueError):
+            read_scores(manager.scores_path)
+        manager = WordManager(dictionary_dir=str(dictionary_dir))
+        assert manager.get_difficulty_ranking('basic') is None
+
+    def test_build_command(self, dictionary_dir, capsys):
+        """Test the build command reports each level."""
+        main(['build', '--dictionary-dir', str(dictionary_dir), '--processes', '1'])
+
+        output = capsys.readouterr().out
+        assert 'basic: 8 entries, 8 scored' in output
+        assert os.path.exists(dictionary_dir / 'difficulty.scores')
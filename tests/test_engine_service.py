@@ -0,0 +1,265 @@
+"""
+Tests for Engine Service
+
+Tests game operations in engine shards, routing games to shard processes
+over Unix sockets and serving the web routes from them.
+"""
+
+import threading
+from multiprocessing import AuthenticationError
+
+import pytest
+from src.web.app import create_app
+from src.web.engine_service import (
+    EngineService,
+    EngineServiceClient,
+    EngineServiceError,
+    EngineShard,
+    ShardClient,
+)
+
+
+class FakeConnection:
+    """Shard connection that fails to send, or to reply, when told to."""
+
+    def __init__(self, broken=False, reply=True):
+        self.broken = broken
+        self.reply = reply
+        self.sent = []
+
+    def send(self, requests):
+        if self.broken:
+            raise BrokenPipeError
+        self.sent.append(requests)
+
+    def recv(self):
+        if not self.reply:
+            raise EOFError
+        return [(True, 0) for _ in self.sent[-1]]
+
+    def close(self):
+        pass
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(scope='module')
+def service():
+    service = EngineService(shards=2, authkey=b'test')
+    service.start()
+    yield service
+    service.stop()
+
+
+class TestEngineShard:
+    def test_guess_on_new_game(self):
+        """Test a shard plays guesses against the games it created."""
+        shard = EngineShard()
+        state = shard.new_game('game', 'basic')
+
+        response = shard.guess('game', 'E', since=state['revision'])
+
+        assert response['success'] is True
+        assert response['delta']['guessed'] == ['E']
+        assert shard.count() == 1
+
+    def test_unknown_game(self):
+        """Test guesses for games the shard does not hold return None."""
+        shard = EngineShard()
+
+        assert shard.guess('missing', 'E') is None
+        assert shard.guess_batch('missing', ['E']) is None
+
+    def test_execute_reports_errors_per_request(self):
+        """Test a failing request does not fail the rest of its batch."""
+        shard = EngineShard()
+
+        results = shard.execute(
+            [('new_game', ('a', 'expert')), ('new_game', ('b', 'basic')), ('count', ())]
+        )
+
+        assert results[0][0] is False
+        assert 'Invalid level' in results[0][1]
+        assert results[1][0] is True
+        assert results[2] == (True, 1)
+
+    def test_guess_timer(self):
+        """Test shards charge timeouts when the guess timer is enabled."""
+        clock = FakeClock()
+        shard = EngineShard(guess_timer=True, clock=clock)
+        shard.new_game('game', 'basic')
+
+        clock.now += 16
+        response = shard.guess_batch('game', ['Q'])
+
+        assert response['timeout']['timeouts'] == 1
+        assert response['game_state']['lives'] <= 5
+
+
+class TestEngineService:
+    def test_games_are_sharded_by_id(self, service):
+        """Test each game lives only in the shard its id hashes to."""
+        client = service.client()
+        game_ids = [f'game-{index}' for index in range(20)]
+        for game_id in game_ids:
+            client.new_game(game_id, 'basic')
+
+        # Swapping the shards sends every game to the shard not holding it
+        swapped = EngineServiceClient(list(reversed(service.addresses)), b'test')
+        for game_id in game_ids:
+            assert swapped.guess(game_id, 'E') is None
+            assert client.guess(game_id, 'E')['success'] is True
+        assert all(count > 0 for count in client.game_counts())
+        swapped.close()
+        client.close()
+
+    def test_concurrent_calls_are_batched_correctly(self, service):
+        """Test threads sharing a connection each get their own result."""
+        client = service.client()
+        results = {}
+
+        def play(index):
+            game_id = f'thread-{index}'
+            state = client.new_game(game_id, 'intermediate')
+            results[index] = (state, client.guess_batch(game_id, ['A', 'E']))
+
+        threads = [threading.Thread(target=play, args=(index,)) for index in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 16
+        for state, response in results.values():
+            assert state['level'] == 'intermediate'
+            assert [step['letter'] for step in response['steps']] == ['A', 'E']
+        client.close()
+
+    def test_shard_errors_raise(self, service):
+        """Test a failed operation raises in the caller."""
+        client = service.client()
+
+        with pytest.raises(EngineServiceError, match='Invalid level'):
+            client.new_game('game', 'expert')
+        client.close()
+
+    def test_connect_from_socket_dir(self, service):
+        """Test clients find every shard from the socket directory."""
+        client = EngineServiceClient.from_socket_dir(service.socket_dir, b'test')
+
+        assert client.addresses == service.addresses
+        assert len(client.game_counts()) == 2
+        client.close()
+
+    def test_reconnects_after_shard_restart(self, tmp_path):
+        """Test a client keeps working once a killed shard is back."""
+        service = EngineService(shards=1, socket_dir=str(tmp_path), authkey=b'test')
+        service.start()
+        client = service.client()
+        client.new_game('game', 'basic')
+
+        service.stop()
+        with pytest.raises(EngineServiceError, match='unavailable'):
+            client.guess('game', 'E')
+        service.start()
+        try:
+            # The restarted shard starts without the old games
+            assert client.guess('game', 'E') is None
+            service.stop()
+            service.start()
+            assert client.new_game('again', 'basic')['level'] == 'basic'
+        finally:
+            client.close()
+            service.stop()
+
+    def test_batch_lost_after_sending_is_not_resent(self, monkeypatch):
+        """Test a guess the shard may have applied is not sent twice."""
+        lost = FakeConnection(reply=False)
+        connections = [FakeConnection(), lost]
+        client = ShardClient('unused')
+        monkeypatch.setattr(client, '_connect', connections.pop)
+
+        with pytest.raises(EngineServiceError, match='connection lost'):
+            client.call('guess', 'game', 'E', None)
+        assert len(lost.sent) == 1
+        assert len(connections) == 1
+
+    def test_batch_not_sent_is_sent_again(self, monkeypatch):
+        """Test a batch is sent on a new connection when sending failed."""
+        fresh = FakeConnection()
+        connections = [fresh, FakeConnection(broken=True)]
+        client = ShardClient('unused')
+        monkeypatch.setattr(client, '_connect', connections.pop)
+
+        assert client.call('count') == 0
+        assert len(fresh.sent) == 1
+
+    def test_wrong_authkey_is_rejected(self, service):
+        """Test shards refuse connections without the shared key."""
+        client = EngineServiceClient(service.addresses, b'wrong')
+
+        with pytest.raises(AuthenticationError):
+            client.game_counts()
+
+
+class TestEngineServiceRoutes:
+    @pytest.fixture
+    def client(self, service):
+        app = create_app(debug=False)
+        app.config['TESTING'] = True
+        app.extensions['hangman_engine_service'] = service.client()
+        return app.test_client()
+
+    def test_unreachable_shard_returns_503(self, tmp_path):
+        """Test a shard outage is reported as a JSON 503, not a 500."""
+        app = create_app(debug=False)
+        app.config['TESTING'] = True
+        app.extensions['hangman_engine_service'] = EngineServiceClient(
+            [str(tmp_path / 'missing.sock')], b'test'
+        )
+        client = app.test_client()
+        with client.session_transaction() as session:
+            session['game_id'] = 'game'
+
+        assert client.get('/game/basic').status_code == 503
+        for path, body in (
+            ('/guess', {'letter': 'E'}),
+            ('/guess/batch', {'letters': 'E'}),
+        ):
+            response = client.post(path, json=body)
+            assert response.status_code == 503
+            assert response.get_json()['error'] == 'Game service unavailable'
+
+    def test_event_log_is_refused(self, service, tmp_path, monkeypatch):
+        """Test an event log that could not see shard games stops startup."""
+        monkeypatch.setenv('HANGMAN_SECRET_KEY', 'test')
+        monkeypatch.setenv('HANGMAN_ENGINE_SOCKET_DIR', service.socket_dir)
+        monkeypatch.setenv('HANGMAN_EVENT_LOG', str(tmp_path))
+
+        with pytest.raises(RuntimeError, match='engine shards'):
+            create_app(debug=False)
+
+    def test_game_and_guess(self, client):
+        """Test the routes play games held by the engine shards."""
+        assert client.get('/game/basic').status_code == 200
+
+        response = client.post('/guess', json={'letter': 'E'})
+        batch = client.post('/guess/batch', json={'letters': 'AI'})
+
+        assert response.status_code == 200
+        assert response.get_json()['game_state']['guessed_letters'] == ['E']
+        assert batch.status_code == 200
+        assert batch.get_json()['game_state']['guessed_letters'][:1] == ['E']
+
+    def test_no_active_game(self, client):
+        """Test guesses without a game are rejected."""
+        response = client.post('/guess', json={'letter': 'E'})
+
+        assert response.status_code == 404
+        assert response.get_json()['error'] == 'No active game'
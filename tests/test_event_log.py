@@ -0,0 +1,188 @@
+"""
+Tests for Event Log
+
+Tests encoding game events, writing them through the buffered log,
+reading back torn segments and replaying games from their events.
+"""
+
+import itertools
+import json
+import os
+import threading
+import time
+
+import pytest
+from src.core.event_log import (
+    EVENT_GAME_STARTED,
+    Event,
+    EventLog,
+    decode_event,
+    encode_event,
+    main,
+    read_log,
+    read_segment,
+    replay,
+)
+from src.core.game_engine import EVENT_GUESS, EVENT_TIMEOUT, GameEngine
+from src.web.app import create_app
+from src.web.session_store import SQLiteSessionStore
+
+
+def play_word(engine):
+    """Guess every letter of the current word."""
+    for letter in dict.fromkeys(engine.word.replace(' ', '')):
+        engine.guess_letter(letter)
+    engine.process_word_completion()
+
+
+@pytest.fixture
+def event_log(tmp_path):
+    event_log = EventLog(str(tmp_path), fsync='never')
+    yield event_log
+    event_log.close()
+
+
+class TestEncoding:
+    @pytest.mark.parametrize(
+        'event, value',
+        [
+            (EVENT_GAME_STARTED, ('intermediate', 2**64 - 1, 'BREAK A LEG')),
+            (EVENT_GUESS, 'E'),
+            (EVENT_TIMEOUT, 3),
+        ],
+    )
+    def test_round_trip(self, event, value):
+        """Test every event type decodes to what was encoded."""
+        original = Event(event, 1234.5, 'game', value)
+
+        record = encode_event(original)
+
+        assert decode_event(record[8:]) == original
+
+
+class TestEventLog:
+    def test_replay_matches_live_game(self, event_log, tmp_path):
+        """Test replaying a game's events rebuilds its exact state."""
+        engine = GameEngine('basic')
+        event_log.game_started('game', engine)
+        engine.recorder = event_log.recorder('game')
+
+        play_word(engine)
+        engine.guess_letter('Q')
+        engine.apply_timeout()
+        event_log.close()
+
+        games = replay(read_log(str(tmp_path)))
+
+        assert engine.score == 1
+        assert games['game'].get_game_state() == engine.get_game_state()
+
+    def test_segment_in_timestamp_order(self, tmp_path):
+        """Test events from racing threads are written in timestamp order."""
+        calls = itertools.count()
+
+        def clock():
+            now = next(calls)
+            if now == 0:
+                # The first stamp is taken, then its thread stalls
+                time.sleep(0.1)
+            return float(now)
+
+        event_log = EventLog(str(tmp_path), fsync='never', clock=clock)
+        first = threading.Thread(
+            target=event_log.append, args=('first', EVENT_GUESS, 'A')
+        )
+        first.start()
+        time.sleep(0.02)
+        event_log.append('second', EVENT_GUESS, 'B')
+        first.join()
+        event_log.close()
+
+        timestamps = [event.timestamp for event in read_segment(event_log.path)]
+        assert timestamps == sorted(timestamps)
+
+    def test_writer_thread_flushes(self, tmp_path):
+        """Test buffered events reach disk without an explicit flush."""
+        event_log = EventLog(str(tmp_path), flush_interval=0.01, fsync='batch')
+        event_log.append('game', EVENT_GUESS, 'E')
+
+        for _ in range(100):
+            if event_log.path and list(read_segment(event_log.path)):
+                break
+            time.sleep(0.01)
+        event_log.close()
+
+        assert [event.value for event in read_log(str(tmp_path))] == ['E']
+
+    def test_torn_tail_is_ignored(self, event_log):
+        """Test reading stops before a partly written last record."""
+        for letter in 'ABC':
+            event_log.append('game', EVENT_GUESS, letter)
+        event_log.flush()
+        with open(event_log.path, 'r+b') as file:
+            file.truncate(os.path.getsize(event_log.path) - 1)
+
+        assert [event.value for event in read_segment(event_log.path)] == ['A', 'B']
+
+    def test_filter_by_game(self, event_log, tmp_path):
+        """Test a game's events can be read without decoding the others."""
+        event_log.append('game-1', EVENT_GUESS, 'A')
+        event_log.append('game-10', EVENT_GUESS, 'B')
+        event_log.append('game-1', EVENT_GUESS, 'C')
+        event_log.flush()
+
+        events = list(read_log(str(tmp_path), game_id='game-1'))
+
+        assert [event.value for event in events] == ['A', 'C']
+
+    def test_unsupported_segment(self, tmp_path):
+        """Test files that are not log segments are rejected."""
+        path = tmp_path / 'events-1.log'
+        path.write_bytes(b'NOPE' + bytes(8))
+
+        with pytest.raises(ValueError, match='Unsupported event log segment'):
+            list(read_segment(str(path)))
+
+    def test_invalid_fsync_policy(self, tmp_path):
+        """Test unknown fsync policies are rejected."""
+        with pytest.raises(ValueError, match='Invalid fsync policy'):
+            EventLog(str(tmp_path), fsync='sometimes')
+
+    def test_timer_listener_skips_recorded_games(self, event_log, tmp_path):
+        """Test timeouts are recorded once whether or not a recorder is set."""
+        recorded = GameEngine('basic')
+        recorded.recorder = event_log.recorder('recorded')
+
+        event_log.record_timeout('recorded', recorded, {'timeouts': 1})
+        event_log.record_timeout('loaded', GameEngine('basic'), {'timeouts': 2})
+        event_log.flush()
+
+        events = list(read_log(str(tmp_path)))
+        assert [(event.game_id, event.value) for event in events] == [('loaded', 2)]
+
+
+class TestRecordedRoutes:
+    @pytest.fixture
+    def app(self, tmp_path, monkeypatch):
+        monkeypatch.setenv('HANGMAN_EVENT_LOG', str(tmp_path / 'events'))
+        # Games are decoded afresh on every request
+        store = SQLiteSessionStore(str(tmp_path / 'sessions.db'))
+        app = create_app(session_store=store, debug=False)
+        app.config['TESTING'] = True
+        yield app
+        app.extensions['hangman_event_log'].close()
+
+    def test_replay_matches_routes(self, app, tmp_path, capsys):
+        """Test games played through the routes replay to the same state."""
+        client = app.test_client()
+        client.get('/game/basic')
+        client.post('/guess', json={'letter': 'E'})
+        state = client.post('/guess/batch', json={'letters': 'AIO'}).get_json()
+        with client.session_transaction() as session:
+            game_id = session['game_id']
+        app.extensions['hangman_event_log'].flush()
+
+        main(['replay', str(tmp_path / 'events'), '--game-id', game_id])
+
+        replayed = json.loads(capsys.readouterr().out)
+        assert replayed == {'game_id': game_id, **state['game_state']}
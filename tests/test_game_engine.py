@@ -64,6 +64,66 @@ class TestLetterGuessing:
         assert 'Z' in game.wrong_guesses
         assert game.lives == 5  # Life lost
 
+    def test_correct_guess_reveals_every_occurrence(self):
+        """Test a correct guess reveals all positions of the letter."""
+        game = GameEngine(level='intermediate')
+        game.word = 'HELLO WORLD'
+
+        game.guess_letter('L')
+        game.guess_letter('Z')
+
+        assert game.get_game_state()['word_display'] == '__LL_ ___L_'
+
+    def test_guess_duplicate_after_assigning_guessed_letters(self):
+        """Test duplicate detection follows directly assigned guesses."""
+        game = GameEngine(level='basic')
+        game.word = 'PYTHON'
+        game.guessed_letters = ['P']
+
+        result = game.guess_letter('p')
+
+        assert result['message'] == 'Letter already guessed!'
+        assert game.guessed_letters == ['P']
+
+
+class TestBatchGuessing:
+    """Test applying several guesses in one call."""
+
+    def test_guess_letters_returns_step_per_guess(self):
+        """Test each guess produces a compact step result."""
+        game = GameEngine(level='basic')
+        game.word = 'CAT'
+
+        steps = game.guess_letters(['c', 'x', 'C'])
+
+        assert steps == [
+            {'letter': 'C', 'correct': True, 'duplicate': False, 'lives': 6},
+            {'letter': 'X', 'correct': False, 'duplicate': False, 'lives': 5},
+            {'letter': 'C', 'correct': False, 'duplicate': True, 'lives': 5},
+        ]
+
+    def test_guess_letters_processes_word_completion(self):
+        """Test completing a word mid-batch scores and moves to a new word."""
+        game = GameEngine(level='basic')
+        game.word = 'CAT'
+
+        steps = game.guess_letters('CAT')
+
+        assert steps[-1]['completed_word'] == 'CAT'
+        assert game.score == 1
+        assert game.guessed_letters == []
+
+    def test_guess_letters_stops_at_game_over(self):
+        """Test guesses after the last life are not applied."""
+        game = GameEngine(level='basic')
+        game.word = 'CAT'
+
+        steps = game.guess_letters('BDEFGHIJ')
+
+        assert len(steps) == 6
+        assert game.lives == 0
+        assert game.game_over == True
+
 
 class TestScoringAndWordCompletion:
     """Test continuous scoring and word completion mechanics."""
@@ -137,6 +197,20 @@ class TestGameOverConditions:
         
         assert game.check_game_over() == False
 
+    def test_guess_after_game_over_is_rejected(self):
+        """Test a lost game takes no more guesses and keeps zero lives."""
+        game = GameEngine(level='basic')
+        game.word = 'CAT'
+        game.guess_letters('BDEFGH')
+
+        result = game.guess_letter('J')
+        game.apply_timeout()
+
+        assert not result['correct']
+        assert game.lives == 0
+        assert 'J' not in game.guessed_letters
+        assert GameEngine.from_bytes(game.to_bytes()).lives == 0
+
 
 class TestGameState:
     """Test game state information retrieval."""
@@ -203,4 +277,178 @@ class TestGameState:
         state = game.get_game_state()
         assert state['game_over'] == False
         assert state['lives'] == 6  # Reset
-        assert state['guessed_letters'] == []  # Reset
\ No newline at end of file
+        assert state['guessed_letters'] == []  # Reset
+
+
+class TestStateSerialization:
+    """Test compact byte encoding of game state."""
+
+    def test_round_trip_dictionary_word(self):
+        """Test a dictionary word round-trips through bytes."""
+        game = GameEngine(level='basic')
+        game.word = 'PYTHON'
+        game.guess_letter('P')
+        game.guess_letter('Z')
+        game.score = 4
+
+        restored = GameEngine.from_bytes(game.to_bytes())
+
+        assert restored.level == 'basic'
+        assert restored.word == 'PYTHON'
+        assert restored.guessed_letters == ['P', 'Z']
+        assert restored.wrong_guesses == ['Z']
+        assert restored.lives == 5
+        assert restored.score == 4
+        assert restored.get_game_state()['word_display'] == 'P_____'
+
+    def test_round_trip_word_not_in_dictionary(self):
+        """Test words outside the dictionary are stored inline."""
+        game = GameEngine(level='intermediate')
+        game.word = 'NOT IN THE LIST'
+        game.guess_letter('T')
+
+        restored = GameEngine.from_bytes(game.to_bytes())
+
+        assert restored.word == 'NOT IN THE LIST'
+        assert restored.level == 'intermediate'
+        assert restored.guessed_letters == ['T']
+
+    def test_encoded_state_is_compact(self):
+        """Test dictionary words encode to a fixed small size."""
+        game = GameEngine(level='intermediate')
+        game.word = 'BREAK A LEG'
+
+        assert len(game.to_bytes()) == 36
+
+
+class TestStateDelta:
+    """Test revisioned state deltas."""
+
+    def test_delta_lists_changes_since_revision(self):
+        """Test a delta only carries the guesses made after `since`."""
+        game = GameEngine(level='basic')
+        game.word = 'PYTHON'
+        game.guess_letter('P')
+        since = game.revision
+        game.guess_letter('O')
+        game.guess_letter('Z')
+
+        delta = game.get_state_delta(since)
+
+        assert delta['reset'] == False
+        assert delta['revision'] == since + 2
+        assert delta['guessed'] == ['O', 'Z']
+        assert delta['wrong'] == ['Z']
+        assert delta['revealed'] == [[4, 'O']]
+        assert delta['lives_delta'] == -1
+        assert delta['score_delta'] == 0
+
+    def test_duplicate_guess_keeps_revision(self):
+        """Test guesses that change nothing do not advance the revision."""
+        game = GameEngine(level='basic')
+        game.word = 'PYTHON'
+        game.guess_letter('P')
+        revision = game.revision
+
+        game.guess_letter('P')
+
+        assert game.revision == revision
+        assert game.get_state_delta(revision)['guessed'] == []
+
+    def test_delta_from_previous_word_is_reset(self):
+        """Test a revision from before a word change returns the full state."""
+        game = GameEngine(level='basic')
+        game.word = 'CAT'
+        since = game.revision
+        game.guess_letters('CAT')
+
+        delta = game.get_state_delta(since)
+
+        assert delta['reset'] == True
+        assert delta['state'] == game.get_game_state()
+        assert delta['state']['score'] == 1
+
+    def test_delta_survives_serialization(self):
+        """Test revisions and guess order round-trip through bytes."""
+        game = GameEngine(level='basic')
+        game.word = 'PYTHON'
+        game.guess_letter('Z')
+        since = game.revision
+        game.guess_letter('Y')
+
+        restored = GameEngine.from_bytes(game.to_bytes())
+
+        assert restored.revision == game.revision
+        assert restored.guessed_letters == ['Z', 'Y']
+        assert restored.get_state_delta(since) == game.get_state_delta(since)
+
+    def test_timeout_costs_life_and_resets_delta(self):
+        """Test a timeout charges a life and older revisions get a reset."""
+        game = GameEngine(level='basic')
+        game.word = 'PYTHON'
+        game.guess_letter('P')
+        since = game.revision
+
+        result = game.apply_timeout()
+
+        assert result['message'] == 'Time is up!'
+        assert game.lives == 5
+        assert game.get_state_delta(since)['reset'] == True
+
+    def test_delta_after_timeout_survives_serialization(self):
+        """Test guesses after a timeout round-trip as a delta."""
+        game = GameEngine(level='basic')
+        game.word = 'PYTHON'
+        game.guess_letter('P')
+        game.apply_timeout()
+        since = game.revision
+        game.guess_letter('Y')
+
+        restored = GameEngine.from_bytes(game.to_bytes())
+
+        assert restored.guessed_letters == ['P', 'Y']
+        assert restored.lives == 5
+        assert restored.get_state_delta(since) == game.get_state_delta(since)
+
+
+class TestGuessDeadline:
+    """Test server-side guess deadlines."""
+
+    def test_no_timeout_before_deadline(self):
+        """Test nothing is charged while the player still has time."""
+        game = GameEngine(level='basic')
+        game.start_timer(100.0)
+
+        assert game.check_timeout(114.9) is None
+        assert game.lives == 6
+
+    def test_timeout_charges_each_missed_period(self):
+        """Test every missed guess period costs a life and the timer rolls on."""
+        game = GameEngine(level='basic')
+        game.start_timer(100.0)
+
+        result = game.check_timeout(131.0)
+
+        assert result['timeouts'] == 2
+        assert game.lives == 4
+        assert game.deadline == 145.0
+
+    def test_timer_stops_at_game_over(self):
+        """Test timeouts never take lives below zero."""
+        game = GameEngine(level='basic')
+        game.start_timer(100.0)
+
+        result = game.check_timeout(1000.0)
+
+        assert result['timeouts'] == 6
+        assert game.lives == 0
+        assert game.deadline is None
+
+    def test_deadline_survives_serialization(self):
+        """Test the deadline is stored with the game."""
+        game = GameEngine(level='basic')
+        game.start_timer(1_700_000_000.0)
+
+        restored = GameEngine.from_bytes(game.to_bytes())
+
+        assert restored.deadline == 1_700_000_015.0
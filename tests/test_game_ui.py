@@ -81,3 +81,111 @@ class TestGameRoute:
         
         # Should show score 0
         assert 'Score: 0' in html_content
+
+
+class TestGuessRoute:
+    """Test the guess endpoint and per-player game isolation."""
+
+    @pytest.fixture
+    def app(self):
+        app = create_app()
+        app.config['TESTING'] = True
+        return app
+
+    def test_guess_without_game_returns_404(self, app):
+        """Test guessing before starting a game is rejected."""
+        client = app.test_client()
+        response = client.post('/guess', json={'letter': 'A'})
+        assert response.status_code == 404
+
+    def test_guess_invalid_letter(self, app):
+        """Test guessing a non-letter is rejected."""
+        client = app.test_client()
+        client.get('/game/basic')
+        response = client.post('/guess', json={'letter': '1'})
+        assert response.status_code == 400
+
+    def test_guess_rejects_malformed_bodies(self, app):
+        """Test bodies that are not an object with a string letter are rejected."""
+        client = app.test_client()
+        client.get('/game/basic')
+
+        for body in (['A'], None, 'A', {'letter': 5}, {'letter': None}):
+            response = client.post('/guess', json=body)
+            assert response.status_code == 400
+        response = client.post('/guess', data='letter=A')
+        assert response.status_code == 400
+
+    def test_players_do_not_share_game_state(self, app):
+        """Test guesses from one player never affect another player's game."""
+        player_one = app.test_client()
+        player_two = app.test_client()
+        player_one.get('/game/basic')
+        player_two.get('/game/basic')
+
+        response = player_one.post('/guess', json={'letter': 'Q'})
+        state_one = response.get_json()['game_state']
+        response = player_two.post('/guess', json={'letter': 'J'})
+        state_two = response.get_json()['game_state']
+
+        assert 'Q' in state_one['guessed_letters']
+        assert 'Q' not in state_two['guessed_letters']
+        assert 'J' not in state_one['guessed_letters']
+
+    def test_batch_guess(self, app):
+        """Test a batch of guesses returns per-step results and final state."""
+        client = app.test_client()
+        client.get('/game/basic')
+
+        response = client.post('/guess/batch', json={'letters': 'qjz'})
+        data = response.get_json()
+
+        assert response.status_code == 200
+        assert [step['letter'] for step in data['steps']] == ['Q', 'J', 'Z']
+        assert data['game_state']['guessed_letters'][-3:] == ['Q', 'J', 'Z']
+
+    def test_batch_guess_rejects_invalid_letters(self, app):
+        """Test a batch with any non-letter is rejected as a whole."""
+        client = app.test_client()
+        client.get('/game/basic')
+
+        response = client.post('/guess/batch', json={'letters': ['A', '1']})
+        assert response.status_code == 400
+        response = client.post('/guess/batch', json={'letters': []})
+        assert response.status_code == 400
+
+    def test_batch_guess_rejects_malformed_bodies(self, app):
+        """Test bodies without a string or list of strings are rejected."""
+        client = app.test_client()
+        client.get('/game/basic')
+
+        for body in ({'letters': 5}, {'letters': None}, {}, ['A'], 'A',
+                     {'letters': ['A', 5]}):
+            response = client.post('/guess/batch', json=body)
+            assert response.status_code == 400
+        response = client.post(
+            '/guess/batch', data='{', content_type='application/json'
+        )
+        assert response.status_code == 400
+
+    def test_guess_with_since_returns_delta(self, app):
+        """Test sending the last seen revision returns only a delta."""
+        client = app.test_client()
+        client.get('/game/basic')
+        state = client.post('/guess', json={'letter': 'Q'}).get_json()['game_state']
+
+        response = client.post(
+            '/guess', json={'letter': 'J', 'since': state['revision']}
+        )
+        data = response.get_json()
+
+        assert 'game_state' not in data
+        assert data['delta']['since'] == state['revision']
+        assert data['delta']['revision'] > state['revision']
+
+    def test_guess_with_invalid_since(self, app):
+        """Test a non-integer revision is rejected."""
+        client = app.test_client()
+        client.get('/game/basic')
+        response = client.post('/guess', json={'letter': 'A', 'since': 'x'})
+        assert response.status_code == 400
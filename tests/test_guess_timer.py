@@ -0,0 +1,204 @@
+"""
+Tests for Guess Timer
+
+Tests server-side enforcement of the per-guess time limit.
+"""
+
+import threading
+import time
+
+import pytest
+from src.core.game_engine import GameEngine
+from src.web.app import create_app
+from src.web.guess_timer import GuessTimer
+from src.web.session_store import MemorySessionStore, SQLiteSessionStore
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestGuessTimer:
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def store(self):
+        return MemorySessionStore()
+
+    def start_game(self, store, timer, clock, game_id='game'):
+        engine = GameEngine(level='basic')
+        engine.start_timer(clock())
+        store.set(game_id, engine)
+        timer.watch(game_id, engine)
+        return engine
+
+    def test_expired_game_loses_a_life(self, store, clock):
+        """Test the wheel charges a timeout once the deadline passes."""
+        timer = GuessTimer(store, clock=clock)
+        events = []
+        timer.add_listener(lambda game_id, engine, result: events.append(game_id))
+        engine = self.start_game(store, timer, clock)
+
+        clock.now += 14
+        assert timer.expire() == []
+
+        clock.now += 1
+        expired = timer.expire()
+
+        assert [game_id for game_id, _ in expired] == ['game']
+        assert expired[0][1]['message'] == 'Time is up!'
+        assert events == ['game']
+        assert store.get('game').lives == engine.lives == 5
+        assert len(timer) == 1  # Next guess period is scheduled
+
+    def test_guess_moves_deadline(self, store, clock):
+        """Test a stale wheel entry does nothing once the player guessed."""
+        timer = GuessTimer(store, clock=clock)
+        engine = self.start_game(store, timer, clock)
+
+        clock.now += 10
+        engine.start_timer(clock())
+        clock.now += 5
+
+        assert timer.expire() == []
+        assert engine.lives == 6
+
+    def test_game_over_stops_timer(self, store, clock):
+        """Test an abandoned game stops being tracked once out of lives."""
+        timer = GuessTimer(store, clock=clock)
+        engine = self.start_game(store, timer, clock)
+
+        clock.now += 15 * 6
+        timer.expire()
+
+        assert engine.lives == 0
+        assert engine.deadline is None
+        assert len(timer) == 0
+
+    def test_many_games_share_one_wheel(self, store, clock):
+        """Test only the games whose deadlines passed are expired."""
+        timer = GuessTimer(store, clock=clock)
+        for index in range(100):
+            self.start_game(store, timer, clock, f'game-{index}')
+            clock.now += 1
+
+        clock.now = 1_000_000.0 + 15 + 49
+        expired = timer.expire()
+
+        assert len(expired) == 50
+
+
+class TestGuessRouteTimer:
+    def test_late_guess_is_charged_timeout(self, monkeypatch):
+        """Test a guess after the deadline pays the timeout penalty first."""
+        monkeypatch.setenv('HANGMAN_GUESS_TIMER', '1')
+        app = create_app(debug=False)
+        app.extensions['hangman_guess_timer'].stop()
+        client = app.test_client()
+        client.get('/game/basic')
+
+        store = app.extensions['hangman_session_store']
+        with client.session_transaction() as session:
+            engine = store.get(session['game_id'])
+        engine.deadline -= 16
+
+        data = client.post('/guess', json={'letter': 'Q'}).get_json()
+
+        assert data['timeout']['timeouts'] == 1
+        assert 'Q' in data['game_state']['guessed_letters']
+        assert engine.deadline >= time.time() + 14
+
+    def test_guess_waits_for_expiring_timer(self, tmp_path, monkeypatch):
+        """Test a guess racing a timeout neither repeats nor overwrites it."""
+        monkeypatch.setenv('HANGMAN_GUESS_TIMER', '1')
+        store = SQLiteSessionStore(str(tmp_path / 'sessions.db'))
+        app = create_app(session_store=store, debug=False)
+        timer = app.extensions['hangman_guess_timer']
+        timer.stop()
+        client = app.test_client()
+        client.get('/game/basic')
+        with client.session_transaction() as session:
+            game_id = session['game_id']
+        engine = store.get(game_id)
+        engine.deadline -= 16
+        store.set(game_id, engine)
+        timer.watch(game_id, engine)
+
+        # Pause the timer between loading the game and saving its timeout
+        loaded, resume = threading.Event(), threading.Event()
+
+        class PausingStore:
+            def update(self, game_id, change):
+                def paused(engine):
+                    loaded.set()
+                    resume.wait(5)
+                    return change(engine)
+
+                return store.update(game_id, paused)
+
+        timer.store = PausingStore()
+        # Passed deadlines fire on the wheel's next tick
+        expiring = threading.Thread(target=lambda: timer.expire(time.time() + 1))
+        expiring.start()
+        loaded.wait(5)
+        responses = []
+        guessing = threading.Thread(
+            target=lambda: responses.append(
+                client.post('/guess', json={'letter': 'Q'}).get_json()
+            )
+        )
+        guessing.start()
+        time.sleep(0.2)
+        resume.set()
+        expiring.join()
+        guessing.join()
+
+        game_state = responses[0]['game_state']
+        wrong = 1 if 'Q' in game_state['wrong_guesses'] else 0
+        assert 'timeout' not in responses[0]
+        assert store.get(game_id).guessed_letters == ['Q']
+        assert store.get(game_id).lives == 6 - 1 - wrong
+
+    def test_other_worker_timer_does_not_overwrite_guess(self, tmp_path, monkeypatch):
+        """Test a timer in another worker reloads a game guessed meanwhile."""
+        monkeypatch.setenv('HANGMAN_GUESS_TIMER', '1')
+        db_path = str(tmp_path / 'sessions.db')
+        store = SQLiteSessionStore(db_path)
+        app = create_app(session_store=store, debug=False)
+        app.extensions['hangman_guess_timer'].stop()
+        client = app.test_client()
+        client.get('/game/basic')
+        with client.session_transaction() as session:
+            game_id = session['game_id']
+        engine = store.get(game_id)
+        engine.deadline -= 16
+        store.set(game_id, engine)
+
+        # The other worker's timer has its own locks and store connection
+        other_store = SQLiteSessionStore(db_path)
+        other_timer = GuessTimer(other_store)
+        other_timer.watch(game_id, engine)
+        checks = []
+        check_timeout = other_timer._check_timeout
+
+        def guess_between_load_and_save(game_id, now, engine):
+            if not checks:
+                client.post('/guess', json={'letter': 'Q'})
+            checks.append(engine.revision)
+            return check_timeout(game_id, now, engine)
+
+        other_timer._check_timeout = guess_between_load_and_save
+        expired = other_timer.expire(time.time() + 1)
+
+        saved = store.get(game_id)
+        wrong = 1 if 'Q' in saved.wrong_guesses else 0
+        assert len(checks) == 2
+        assert saved.guessed_letters == ['Q']
+        assert saved.lives == 6 - 1 - wrong
+        assert expired == []
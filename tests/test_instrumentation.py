@@ -0,0 +1,162 @@
+"""
+Tests for Instrumentation
+
+Tests the log-bucketed histograms, the /metrics endpoint and sampled
+request profiling.
+"""
+
+import threading
+
+import pytest
+from src.web.app import create_app
+from src.web.instrumentation import BUCKET_BOUNDS, Histogram, bucket_index
+
+
+class TestHistogram:
+    def test_bucket_bounds_are_inclusive(self):
+        """Test a value on a bucket bound falls into that bucket."""
+        for index, bound in enumerate(BUCKET_BOUNDS):
+            assert bucket_index(bound) == index
+            assert bucket_index(bound * 1.01) == index + 1
+
+    def test_out_of_range_values(self):
+        """Test tiny and huge values land in the first and last buckets."""
+        assert bucket_index(0.0) == 0
+        assert bucket_index(1e6) == len(BUCKET_BOUNDS)
+
+    def test_threads_record_separately(self):
+        """Test counts from every thread are included in a snapshot."""
+        histogram = Histogram()
+
+        def record():
+            for _ in range(1000):
+                histogram.record(0.001)
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        buckets, total = histogram.snapshot()
+        assert sum(buckets) == 4000
+        assert total == pytest.approx(4.0)
+
+    def test_quantile(self):
+        """Test quantiles resolve to the bucket holding them."""
+        histogram = Histogram()
+        for _ in range(99):
+            histogram.record(0.0001)
+        histogram.record(0.5)
+
+        assert histogram.quantile(0.5) == pytest.approx(0.0001, rel=0.42)
+        assert histogram.quantile(1.0) == pytest.approx(0.5, rel=0.42)
+
+
+class TestMetricsEndpoint:
+    @pytest.fixture
+    def app(self, monkeypatch):
+        monkeypatch.setenv('HANGMAN_METRICS', '1')
+        app = create_app(debug=False)
+        app.config['TESTING'] = True
+        return app
+
+    @pytest.fixture
+    def token_app(self, monkeypatch):
+        monkeypatch.setenv('HANGMAN_METRICS', '1')
+        monkeypatch.setenv('HANGMAN_METRICS_TOKEN', 'metrics-token')
+        app = create_app(debug=False)
+        app.config['TESTING'] = True
+        return app
+
+    def test_disabled_by_default(self):
+        """Test nothing is registered unless metrics are enabled."""
+        app = create_app(debug=False)
+
+        assert 'hangman_instrumentation' not in app.extensions
+        assert app.test_client().get('/metrics').status_code == 404
+
+    def test_guess_stages(self, app):
+        """Test a guess records its request time and every stage."""
+        client = app.test_client()
+        client.get('/game/basic')
+        client.post('/guess', json={'letter': 'E'})
+
+        response = client.get('/metrics')
+
+        assert response.status_code == 200
+        assert response.content_type.startswith('text/plain; version=0.0.4')
+        text = response.get_data(as_text=True)
+        assert (
+            'hangman_request_duration_seconds_count{endpoint="hangman.guess_letter"} 1'
+            in text
+        )
+        for stage in (
+            'parse',
+            'load',
+            'guess_letter',
+            'process_word_completion',
+            'get_game_state',
+            'save',
+            'jsonify',
+        ):
+            assert (
+                f'hangman_guess_stage_duration_seconds_count{{stage="{stage}"}} 1'
+                in text
+            )
+
+    def test_local_clients_only(self, app):
+        """Test metrics are refused to remote clients."""
+        client = app.test_client()
+
+        response = client.get('/metrics', environ_base={'REMOTE_ADDR': '10.0.0.1'})
+        assert response.status_code == 403
+
+        # Behind a local reverse proxy every client looks local
+        response = client.get('/metrics', headers={'X-Forwarded-For': '10.0.0.1'})
+        assert response.status_code == 403
+
+        response = client.post('/metrics/profile', json={'rate': 1})
+        assert response.status_code == 403
+
+    def test_token(self, token_app):
+        """Test a configured token is required from every client."""
+        client = token_app.test_client()
+
+        assert client.get('/metrics').status_code == 403
+        response = client.get('/metrics', headers={'Authorization': 'Bearer wrong'})
+        assert response.status_code == 403
+        response = client.get(
+            '/metrics',
+            headers={'Authorization': 'Bearer metrics-token'},
+            environ_base={'REMOTE_ADDR': '10.0.0.1'},
+        )
+        assert response.status_code == 200
+
+    def test_sampled_profile(self, token_app):
+        """Test profiling a fraction of requests and reading the report."""
+        client = token_app.test_client()
+        client.environ_base['HTTP_AUTHORIZATION'] = 'Bearer metrics-token'
+        client.get('/game/basic')
+
+        assert client.post('/metrics/profile', json={'rate': 1}).status_code == 200
+        client.post('/guess', json={'letter': 'E'})
+        client.post('/metrics/profile', json={'rate': 0})
+        assert 'No requests profiled' in client.get('/metrics/profile').text
+
+        client.post('/metrics/profile', json={'rate': 1.0})
+        client.post('/guess', json={'letter': 'A'})
+        report = client.get('/metrics/profile').text
+
+        assert 'requests profiled (profile rate 1.0)' in report
+        assert 'guess_letter' in report
+
+    def test_invalid_profile_rate(self, token_app):
+        """Test profile rates outside 0..1 are rejected."""
+        client = token_app.test_client()
+        client.environ_base['HTTP_AUTHORIZATION'] = 'Bearer metrics-token'
+
+        response = client.post('/metrics/profile', json={'rate': 2})
+
+        assert response.status_code == 400
+        assert response.get_json()['error'] == 'Invalid profile rate'
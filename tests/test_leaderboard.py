@@ -0,0 +1,174 @@
+"""
+Tests for Leaderboard
+
+Tests the bounded top-K boards, time windows, SQLite snapshots and the
+ranking of finished games by the web app.
+"""
+
+import sqlite3
+
+import pytest
+from src.core.leaderboard import Leaderboard, Result, TopK, period_key
+from src.web.app import create_app
+
+DAY = 24 * 60 * 60
+# 2024-03-06 12:00 UTC, a Wednesday
+NOW = 1709726400.0
+
+
+class TestTopK:
+    def test_keeps_best_results_in_order(self):
+        """Test only the best capacity results are kept, best first."""
+        board = TopK(capacity=3)
+        for index, score in enumerate([5, 1, 9, 3, 7]):
+            board.add(score, float(index), f'game-{index}')
+
+        assert [result.score for result in board.top()] == [9, 7, 5]
+        assert not board.add(4, 10.0, 'late')
+        assert len(board) == 3
+
+    def test_ties_go_to_earlier_scores(self):
+        """Test equal scores rank by when they were recorded."""
+        board = TopK(capacity=2)
+        board.add(4, 2.0, 'second')
+        board.add(4, 1.0, 'first')
+
+        assert not board.add(4, 3.0, 'third')
+        assert [result.game_id for result in board.top()] == ['first', 'second']
+
+    def test_game_holds_one_place(self):
+        """Test recording a game again keeps only its best result."""
+        board = TopK()
+        board.add(3, 1.0, 'game')
+
+        assert not board.add(3, 2.0, 'game')
+        assert board.add(6, 3.0, 'game')
+        assert board.top() == [Result(6, 3.0, 'game')]
+
+
+class TestLeaderboard:
+    def test_period_keys(self):
+        """Test each window's period of a timestamp."""
+        assert period_key('all', NOW) == ''
+        assert period_key('week', NOW) == '2024-W10'
+        assert period_key('day', NOW) == '2024-03-06'
+        with pytest.raises(ValueError):
+            period_key('month', NOW)
+
+    def test_windows_roll_over(self):
+        """Test the day board starts empty the next day, all time does not."""
+        now = [NOW]
+        leaderboard = Leaderboard(clock=lambda: now[0])
+        assert leaderboard.record('game', 'basic', 4)
+        assert not leaderboard.record('nothing', 'basic', 0)
+
+        assert leaderboard.top('basic', 'day') == [Result(4, NOW, 'game')]
+        now[0] += DAY
+        assert leaderboard.top('basic', 'day') == []
+        assert leaderboard.top('basic', 'week') == [Result(4, NOW, 'game')]
+        assert leaderboard.top('basic') == [Result(4, NOW, 'game')]
+        assert leaderboard.top('intermediate') == []
+
+    def test_snapshot_and_load(self, tmp_path):
+        """Test a snapshot is loaded back by a new leaderboard."""
+        db_path = str(tmp_path / 'leaderboard.db')
+        leaderboard = Leaderboard(db_path, clock=lambda: NOW)
+        leaderboard.record('a', 'basic', 2)
+        leaderboard.record('b', 'basic', 5)
+        leaderboard.close()
+
+        loaded = Leaderboard(db_path, clock=lambda: NOW)
+
+        assert [result.game_id for result in loaded.top('basic', 'day')] == ['b', 'a']
+        assert loaded.top('basic') == leaderboard.top('basic')
+
+    def test_workers_converge(self, tmp_path):
+        """Test snapshots from two workers merge into one leaderboard."""
+        db_path = str(tmp_path / 'leaderboard.db')
+        first = Leaderboard(db_path, size=2, clock=lambda: NOW)
+        second = Leaderboard(db_path, size=2, clock=lambda: NOW)
+        first.record('a', 'basic', 3)
+        second.record('b', 'basic', 7)
+        second.record('c', 'basic', 1)
+
+        first.snapshot()
+        second.snapshot()
+        first.record('d', 'basic', 2)
+        first.snapshot()
+
+        expected = [Result(7, NOW, 'b'), Result(3, NOW, 'a')]
+        assert first.top('basic') == expected
+        assert Leaderboard(db_path, size=2, clock=lambda: NOW).top('basic') == expected
+        first.close()
+        second.close()
+
+    def test_failed_snapshot_is_retried(self, tmp_path, monkeypatch):
+        """Test boards stay dirty when writing a snapshot fails."""
+        db_path = str(tmp_path / 'leaderboard.db')
+        leaderboard = Leaderboard(db_path, clock=lambda: NOW)
+        leaderboard.record('a', 'basic', 2)
+        connect = leaderboard._connect
+
+        def locked():
+            raise sqlite3.OperationalError('database is locked')
+
+        monkeypatch.setattr(leaderboard, '_connect', locked)
+        with pytest.raises(sqlite3.OperationalError):
+            leaderboard.snapshot()
+        monkeypatch.setattr(leaderboard, '_connect', connect)
+        leaderboard.snapshot()
+
+        loaded = Leaderboard(db_path, clock=lambda: NOW)
+        assert loaded.top('basic') == [Result(2, NOW, 'a')]
+
+
+class TestLeaderboardRoutes:
+    @pytest.fixture
+    def app(self):
+        app = create_app(debug=False)
+        app.config['TESTING'] = True
+        return app
+
+    def store_engine(self, app, client):
+        with client.session_transaction() as session:
+            game_id = session['game_id']
+        store = app.extensions['hangman_session_store']
+        return game_id, store, store.get(game_id)
+
+    def test_lost_game_is_ranked(self, app):
+        """Test a game's score is ranked when its last life is lost."""
+        client = app.test_client()
+        client.get('/game/basic')
+        game_id, store, engine = self.store_engine(app, client)
+        engine.score = 3
+        engine.lives = 1
+        store.set(game_id, engine)
+
+        wrong = next(letter for letter in 'QZXJKVWY' if letter not in engine.word)
+        client.post('/guess', json={'letter': wrong})
+
+        scores = client.get('/leaderboard/basic?window=day').get_json()['scores']
+        assert [(entry['rank'], entry['score']) for entry in scores] == [(1, 3)]
+
+    def test_replaced_game_is_ranked(self, app):
+        """Test starting a new game ranks the score of the one left behind."""
+        client = app.test_client()
+        client.get('/game/basic')
+        game_id, store, engine = self.store_engine(app, client)
+        engine.score = 2
+        store.set(game_id, engine)
+
+        client.get('/game/basic')
+
+        leaderboard = app.extensions['hangman_leaderboard']
+        assert [result.game_id for result in leaderboard.top('basic')] == [game_id]
+
+    def test_invalid_window(self, app):
+        """Test unknown windows and levels are rejected."""
+        client = app.test_client()
+
+        response = client.get('/leaderboard/basic?window=month')
+
+        assert response.status_code == 400
+        assert response.get_json()['error'] == 'Invalid window'
+        assert client.get('/leaderboard/expert').status_code == 404
@@ -0,0 +1,24 @@
+"""
+Tests for Letter Mask
+
+Tests for 26-bit letter set encoding.
+"""
+
+from src.utils.letter_mask import letter_bit, letters_to_mask, mask_to_letters
+
+
+class TestLetterMask:
+    def test_letter_bit_positions(self):
+        """Test A maps to the lowest bit and Z to bit 25."""
+        assert letter_bit('A') == 1
+        assert letter_bit('z') == 1 << 25
+
+    def test_non_letters_have_no_bit(self):
+        """Test spaces contribute nothing to a mask."""
+        assert letter_bit(' ') == 0
+        assert letters_to_mask('A A') == letter_bit('A')
+
+    def test_mask_round_trip_is_alphabetical(self):
+        """Test masks decode back to sorted letters."""
+        mask = letters_to_mask(['T', 'C', 'A'])
+        assert mask_to_letters(mask) == ['A', 'C', 'T']
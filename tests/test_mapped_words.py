@@ -0,0 +1,73 @@
+"""
+Tests for Memory-Mapped Word List
+
+Tests random access to dictionary files through line offsets.
+"""
+
+import os
+
+from src.core.mapped_words import MappedWordList
+from src.core.word_manager import WordManager
+
+
+class TestMappedWordList:
+    def test_entries_are_stripped_and_uppercased(self, tmp_path):
+        """Test entries skip blank lines and match the list loader."""
+        path = tmp_path / 'words.txt'
+        path.write_text('cat\n\n  break a leg  \ndog')
+
+        words = MappedWordList(str(path))
+
+        assert len(words) == 3
+        assert words[0] == 'CAT'
+        assert words[1] == 'BREAK A LEG'
+        assert words[-1] == 'DOG'
+        assert list(words) == ['CAT', 'BREAK A LEG', 'DOG']
+
+    def test_sidecar_index_is_written_and_reused(self, tmp_path):
+        """Test line offsets are cached next to the dictionary."""
+        path = tmp_path / 'words.txt'
+        path.write_text('cat\ndog\n')
+
+        MappedWordList(str(path))
+        assert os.path.exists(str(path) + '.idx')
+
+        words = MappedWordList(str(path))
+        assert list(words) == ['CAT', 'DOG']
+
+    def test_stale_sidecar_is_rebuilt(self, tmp_path):
+        """Test a changed dictionary does not reuse old offsets."""
+        path = tmp_path / 'words.txt'
+        path.write_text('cat\ndog\n')
+        MappedWordList(str(path))
+
+        path.write_text('goose\n')
+        os.utime(path, ns=(1, 1))
+
+        assert list(MappedWordList(str(path))) == ['GOOSE']
+
+    def test_empty_file(self, tmp_path):
+        """Test an empty dictionary maps to an empty sequence."""
+        path = tmp_path / 'words.txt'
+        path.write_text('')
+
+        assert len(MappedWordList(str(path))) == 0
+
+
+class TestMappedWordManager:
+    def test_random_word_from_mapped_dictionary(self):
+        """Test memory-mapped mode selects valid uppercase words."""
+        word_manager = WordManager(use_mmap=True)
+        word = word_manager.get_random_word('basic')
+
+        assert word.isupper()
+        assert 4 <= len(word) <= 15
+
+    def test_word_lookup_matches_list_mode(self):
+        """Test dictionary positions agree between loading modes."""
+        mapped = WordManager(use_mmap=True)
+        listed = WordManager()
+
+        position = listed.get_word_index('intermediate', 'PIECE OF CAKE')
+        assert mapped.get_word_index('intermediate', 'PIECE OF CAKE') == position
+        assert mapped.get_word_at('intermediate', position) == 'PIECE OF CAKE'
@@ -0,0 +1,83 @@
+"""
+Tests for Render Cache
+
+Tests cached static pages, conditional requests and the game page shell.
+"""
+
+import json
+import re
+
+import pytest
+from src.web.app import create_app
+from src.web.render_cache import RenderCache
+
+
+def game_data(html):
+    """Extract the embedded game state JSON from a game page."""
+    match = re.search(r'id="game-data">(.*?)</script>', html, re.S)
+    return json.loads(match.group(1))
+
+
+class TestStaticPages:
+    @pytest.fixture
+    def client(self):
+        app = create_app(debug=False)
+        app.config['TESTING'] = True
+        return app.test_client()
+
+    def test_static_page_has_validators(self, client):
+        """Test cached pages carry an ETag and Last-Modified."""
+        response = client.get('/')
+
+        assert response.status_code == 200
+        assert response.headers['ETag']
+        assert response.headers['Last-Modified']
+        assert 'no-cache' in response.headers['Cache-Control']
+
+    def test_matching_etag_returns_304(self, client):
+        """Test a revalidation with the current ETag has no body."""
+        etag = client.get('/select-level').headers['ETag']
+
+        response = client.get('/select-level', headers={'If-None-Match': etag})
+
+        assert response.status_code == 304
+        assert response.data == b''
+
+    def test_if_modified_since_returns_304(self, client):
+        """Test a revalidation by date is answered without a body."""
+        modified = client.get('/').headers['Last-Modified']
+
+        response = client.get('/', headers={'If-Modified-Since': modified})
+
+        assert response.status_code == 304
+
+
+class TestGamePageShell:
+    def test_games_share_shell_with_own_board(self):
+        """Test each new game gets its own board inside the cached shell."""
+        app = create_app(debug=False)
+        client = app.test_client()
+
+        first = client.get('/game/basic').get_data(as_text=True)
+        second = client.get('/game/basic').get_data(as_text=True)
+
+        assert 'hangman-board' not in first
+        assert game_data(first)['word_display'] in first
+        assert game_data(first)['level'] == 'basic'
+        head = first[: first.index('<div class="word-display">')]
+        assert second.startswith(head)
+
+    def test_cache_disabled_in_debug(self):
+        """Test templates are re-rendered while debugging."""
+        cache = RenderCache(enabled=False)
+        renders = []
+
+        cache.page('home', lambda: renders.append(1) or 'page')
+        cache.page('home', lambda: renders.append(1) or 'page')
+
+        assert len(renders) == 2
+
+    def test_shell_requires_marker(self):
+        """Test a shell rendered without the board marker is rejected."""
+        with pytest.raises(ValueError):
+            RenderCache().shell('game', lambda: '<html></html>')
@@ -0,0 +1,200 @@
+"""
+Tests for Multiplayer Rooms
+
+Tests the lobby routes, room broadcasts over the ASGI app's WebSockets
+and how rooms treat players, spectators and slow connections.
+"""
+
+import asyncio
+import json
+
+import pytest
+from src.utils.constants import MAX_LIVES
+from src.web.app import create_app
+from src.web.asgi import create_asgi_app
+from src.web.rooms import MAX_BACKLOG, ROOM_IDLE_TIMEOUT, Room, RoomManager
+
+
+def decode(message):
+    return json.loads(message['text'])
+
+
+def drain(member):
+    """Return the decoded messages queued for a member."""
+    messages = []
+    while member.backlog:
+        messages.append(decode(member._queue.popleft()))
+    return messages
+
+
+def correct_letter(room):
+    return next(char for char in room.engine.word if char.isalpha())
+
+
+async def join_socket(app, room_id, query):
+    """Connect to a room and return the queues feeding and draining it."""
+    incoming = asyncio.Queue()
+    outgoing = asyncio.Queue()
+    scope = {
+        'type': 'websocket',
+        'path': f'/rooms/{room_id}/ws',
+        'query_string': query,
+        'headers': [],
+    }
+    await incoming.put({'type': 'websocket.connect'})
+    task = asyncio.ensure_future(app(scope, incoming.get, outgoing.put))
+    return incoming, outgoing, task
+
+
+async def next_raw(outgoing):
+    return await asyncio.wait_for(outgoing.get(), timeout=5)
+
+
+class TestLobby:
+    @pytest.fixture
+    def client(self):
+        app = create_app(debug=False)
+        app.config['TESTING'] = True
+        return app.test_client()
+
+    def test_create_and_list_rooms(self, client):
+        """Test a created room is listed with no members."""
+        response = client.post('/rooms', json={'level': 'basic'})
+
+        assert response.status_code == 201
+        room_id = response.get_json()['room_id']
+        rooms = client.get('/rooms').get_json()['rooms']
+        assert rooms == [
+            {'room_id': room_id, 'level': 'basic', 'players': 0, 'spectators': 0}
+        ]
+
+    def test_invalid_level(self, client):
+        """Test rooms cannot be created for unknown levels."""
+        response = client.post('/rooms', json={'level': 'expert'})
+
+        assert response.status_code == 400
+        assert response.get_json()['error'] == 'Invalid level'
+
+
+class TestRoomSockets:
+    @pytest.fixture
+    def app(self):
+        return create_asgi_app(create_app(debug=False))
+
+    def test_guess_is_broadcast_once(self, app):
+        """Test every member receives the same serialized guess."""
+        rooms = app.flask_app.extensions['hangman_rooms']
+        room = rooms.create('basic')
+
+        async def play():
+            sockets = [
+                await join_socket(app, room.room_id, b'name=Ann'),
+                await join_socket(app, room.room_id, b'role=spectator'),
+                await join_socket(app, room.room_id, b'role=spectator'),
+            ]
+            for _, outgoing, _ in sockets:
+                assert (await next_raw(outgoing))['type'] == 'websocket.accept'
+                assert decode(await next_raw(outgoing))['type'] == 'state'
+
+            guess = json.dumps({'type': 'guess', 'letter': correct_letter(room)})
+            await sockets[0][0].put({'type': 'websocket.receive', 'text': guess})
+            received = [await next_raw(outgoing) for _, outgoing, _ in sockets]
+
+            for incoming, _, task in sockets:
+                await incoming.put({'type': 'websocket.disconnect'})
+                await task
+            return received
+
+        received = asyncio.run(play())
+
+        assert all(message is received[0] for message in received)
+        message = decode(received[0])
+        assert message['type'] == 'guess'
+        assert message['player'] == 'Ann'
+        assert message['result']['correct']
+        assert message['points'] >= 1
+        assert message['spectators'] == 2
+        assert len(rooms) == 1 and not room.members
+
+    def test_unknown_room(self, app):
+        """Test joining a room that does not exist closes the socket."""
+
+        async def connect():
+            _, outgoing, task = await join_socket(app, 'missing', b'')
+            await task
+            return await outgoing.get()
+
+        assert asyncio.run(connect()) == {'type': 'websocket.close', 'code': 4404}
+
+
+class TestRoom:
+    @pytest.fixture
+    def room(self):
+        return Room('test', 'basic', seed=7)
+
+    def test_spectators_cannot_play(self, room):
+        """Test a spectator's guess is refused and nothing is broadcast."""
+        player = room.join('Ann')
+        spectator = room.join('Bob', 'spectator')
+        drain(player)
+        drain(spectator)
+
+        room.handle_message(spectator, {'type': 'guess', 'letter': 'E'})
+
+        assert drain(spectator) == [
+            {'type': 'error', 'error': 'Spectators cannot play'}
+        ]
+        assert drain(player) == []
+        assert room.engine.guessed_letters == []
+
+    def test_player_names_are_unique(self, room):
+        """Test a player joining under a taken name gets a suffix."""
+        first = room.join('Ann')
+        second = room.join('Ann')
+
+        assert (first.name, second.name) == ('Ann', 'Ann (2)')
+        assert drain(first)[-1] == {'type': 'join', 'player': 'Ann (2)'}
+
+    def test_slow_member_is_resynced(self, room):
+        """Test a member too far behind gets the full state instead."""
+        player = room.join('Ann')
+        slow = room.join('Bob', 'spectator')
+        for _ in range(MAX_BACKLOG):
+            slow.push({'type': 'websocket.send', 'text': '{}'})
+
+        room.handle_message(player, {'type': 'guess', 'letter': correct_letter(room)})
+
+        messages = drain(slow)
+        assert len(messages) == 1
+        assert messages[0]['type'] == 'state'
+        assert messages[0]['state']['guessed_letters'] == [correct_letter(room)]
+        assert messages[0]['points'] == {'Ann': 1}
+
+    def test_new_game_only_when_over(self, room):
+        """Test a new game cannot replace one still being played."""
+        player = room.join('Ann')
+        engine = room.engine
+        drain(player)
+
+        room.handle_message(player, {'type': 'new_game'})
+        assert drain(player) == [{'type': 'error', 'error': 'Game in progress'}]
+
+        engine.lives = 0
+        room.handle_message(player, {'type': 'new_game'})
+        assert room.engine is not engine
+        assert drain(player)[0]['state']['lives'] == MAX_LIVES
+
+
+class TestRoomManager:
+    def test_idle_rooms_are_dropped(self):
+        """Test rooms left empty past the idle timeout are pruned."""
+        now = [0.0]
+        rooms = RoomManager(clock=lambda: now[0])
+        idle = rooms.create('basic')
+        busy = rooms.create('basic')
+        busy.join('Ann')
+
+        now[0] = ROOM_IDLE_TIMEOUT + 1
+
+        assert [room['room_id'] for room in rooms.list()] == [busy.room_id]
+        assert rooms.get(idle.room_id) is None
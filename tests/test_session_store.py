@@ -0,0 +1,165 @@
+"""
+Tests for Game Session Store
+
+Tests per-player game storage backends.
+"""
+
+import sqlite3
+
+import pytest
+from src.core.game_engine import GameEngine
+from src.web.app import create_app
+from src.web.session_store import (
+    CookieSessionStore,
+    MemorySessionStore,
+    SQLiteSessionStore,
+)
+
+
+class TestMemorySessionStore:
+    def test_set_and_get_game(self):
+        """Test a stored game can be loaded by its id."""
+        store = MemorySessionStore()
+        engine = GameEngine(level='basic')
+        store.set('game-1', engine)
+
+        assert store.get('game-1') is engine
+        assert store.get('missing') is None
+
+    def test_delete_game(self):
+        """Test deleted games are no longer returned."""
+        store = MemorySessionStore()
+        store.set('game-1', GameEngine(level='basic'))
+        store.delete('game-1')
+
+        assert store.get('game-1') is None
+
+    def test_least_recently_used_game_is_evicted(self):
+        """Test store evicts the least recently used game over capacity."""
+        store = MemorySessionStore(max_games=2)
+        store.set('a', GameEngine(level='basic'))
+        store.set('b', GameEngine(level='basic'))
+        store.get('a')  # 'b' is now least recently used
+        store.set('c', GameEngine(level='basic'))
+
+        assert store.get('a') is not None
+        assert store.get('b') is None
+        assert store.get('c') is not None
+
+    def test_expired_game_is_not_returned(self):
+        """Test games idle longer than the TTL expire."""
+        store = MemorySessionStore(ttl=0)
+        store.set('game-1', GameEngine(level='basic'))
+
+        assert store.get('game-1') is None
+
+
+class TestSQLiteSessionStore:
+    def test_games_are_shared_between_store_instances(self, tmp_path):
+        """Test a game written by one worker can be read by another."""
+        db_path = str(tmp_path / 'sessions.db')
+        writer = SQLiteSessionStore(db_path)
+        reader = SQLiteSessionStore(db_path)
+
+        engine = GameEngine(level='basic')
+        engine.word = 'PYTHON'
+        engine.guess_letter('P')
+        writer.set('game-1', engine)
+
+        loaded = reader.get('game-1')
+        assert loaded.word == 'PYTHON'
+        assert loaded.guessed_letters == ['P']
+
+    def test_delete_game(self, tmp_path):
+        """Test deleted games are no longer returned."""
+        store = SQLiteSessionStore(str(tmp_path / 'sessions.db'))
+        store.set('game-1', GameEngine(level='basic'))
+        store.delete('game-1')
+
+        assert store.get('game-1') is None
+
+    def test_update_reloads_game_saved_meanwhile(self, tmp_path):
+        """Test update() retries instead of overwriting another worker's save."""
+        db_path = str(tmp_path / 'sessions.db')
+        store = SQLiteSessionStore(db_path)
+        other = SQLiteSessionStore(db_path)
+        engine = GameEngine(level='basic')
+        engine.word = 'PYTHON'
+        store.set('game-1', engine)
+        seen = []
+
+        def change(loaded):
+            if not seen:
+                engine.guess_letter('P')
+                other.set('game-1', engine)
+            seen.append(list(loaded.guessed_letters))
+            loaded.guess_letter('Y')
+            return True
+
+        assert store.update('game-1', change) is True
+        assert seen == [[], ['P']]
+        assert store.get('game-1').guessed_letters == ['P', 'Y']
+
+    def test_version_column_added_to_existing_table(self, tmp_path):
+        """Test a table created without versions still takes updates."""
+        db_path = str(tmp_path / 'sessions.db')
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            'CREATE TABLE games (game_id TEXT PRIMARY KEY, state BLOB NOT NULL, '
+            'expires_at REAL NOT NULL)'
+        )
+        conn.close()
+        store = SQLiteSessionStore(db_path)
+        store.set('game-1', GameEngine(level='basic'))
+
+        assert store.update('game-1', lambda engine: engine) is not None
+
+
+class TestCookieSessionStore:
+    def test_game_round_trips_through_cookie(self):
+        """Test the game is kept entirely in the signed session cookie."""
+        app = create_app(session_store=CookieSessionStore())
+        app.config['TESTING'] = True
+        client = app.test_client()
+        client.get('/game/basic')
+
+        response = client.post('/guess', json={'letter': 'E'})
+        assert response.status_code == 200
+        response = client.post('/guess', json={'letter': 'E'})
+        assert response.get_json()['result']['message'] == 'Letter already guessed!'
+
+    def test_secret_key_required_with_debug_off(self, monkeypatch):
+        """Test cookies are never signed with the development key in production."""
+        monkeypatch.delenv('HANGMAN_SECRET_KEY')
+
+        with pytest.raises(RuntimeError):
+            create_app(debug=False)
+        assert create_app(debug=True).config['SECRET_KEY'] == 'dev'
+
+
+class TestGuessAfterGameOver:
+    @pytest.fixture(params=['cookie', 'sqlite'])
+    def client(self, request, tmp_path):
+        if request.param == 'cookie':
+            store = CookieSessionStore()
+        else:
+            store = SQLiteSessionStore(str(tmp_path / 'sessions.db'))
+        app = create_app(session_store=store)
+        app.config['TESTING'] = True
+        return app.test_client()
+
+    def test_guess_after_loss(self, client):
+        """Test guessing on a lost game is answered instead of failing."""
+        client.get('/game/basic')
+        word = client.post('/guess/batch', json={'letters': ['Q']}).get_json()[
+            'game_state'
+        ]['word']
+        wrong = [letter for letter in 'ZXJKVWYFBGPMHUE' if letter not in word]
+        client.post('/guess/batch', json={'letters': wrong[:6]})
+
+        response = client.post('/guess', json={'letter': wrong[6]})
+
+        assert response.status_code == 200
+        game_state = response.get_json()['game_state']
+        assert game_state['lives'] == 0
+        assert game_state['game_over']
@@ -0,0 +1,169 @@
+"""
+Tests for Hangman Solver
+
+Tests bitset candidate filtering, guess selection and game simulation.
+"""
+
+import pytest
+from src.core.game_engine import GameEngine
+from src.core.solver import (
+    CandidateIndex,
+    HangmanSolver,
+    main,
+    play_game,
+    simulate,
+)
+
+WORDS = ['CART', 'CARD', 'CORD', 'WORD', 'LEAP', 'ABBA', 'BREAK A LEG', 'ZEBRA']
+
+
+class TestCandidateIndex:
+    @pytest.fixture
+    def index(self):
+        return CandidateIndex(WORDS)
+
+    def test_blank_display_matches_length(self, index):
+        """Test an unrevealed display matches every word of its length."""
+        candidates = index.candidates('____')
+
+        assert sorted(candidates.words()) == [
+            'ABBA', 'CARD', 'CART', 'CORD', 'LEAP', 'WORD'
+        ]
+
+    def test_revealed_letters_and_wrong_letters(self, index):
+        """Test revealed positions must match and wrong letters are excluded."""
+        candidates = index.candidates('_OR_', wrong_letters='W')
+
+        assert candidates.words() == ['CORD']
+
+    def test_hidden_positions_exclude_revealed_letters(self, index):
+        """Test a revealed letter cannot also hide at another position."""
+        # ABBA would have shown both Bs
+        assert index.candidates('_B__').words() == []
+        assert index.candidates('_BB_').words() == ['ABBA']
+
+    def test_spaces_must_line_up(self, index):
+        """Test phrases only match displays with spaces in the same places."""
+        assert index.candidates('_____ _ ___').words() == ['BREAK A LEG']
+        assert index.candidates('___________').words() == []
+
+    def test_unknown_length_is_empty(self, index):
+        """Test a display longer than every word has no candidates."""
+        candidates = index.candidates('_' * 30)
+
+        assert len(candidates) == 0
+        assert candidates.letter_counts() == {}
+
+    def test_refine_matches_fresh_filter(self, index):
+        """Test narrowing after a guess equals filtering the new display."""
+        candidates = index.candidates('____')
+
+        hit = candidates.refine('R', '__R_')
+        miss = hit.refine('O', '__R_')
+
+        assert hit.words() == index.candidates('__R_').words()
+        assert miss.words() == index.candidates('__R_', 'O').words()
+        assert sorted(miss.words()) == ['CARD', 'CART']
+
+    def test_letter_counts(self, index):
+        """Test counts are per candidate word, not per occurrence."""
+        counts = index.candidates('____').letter_counts(exclude='C')
+
+        assert counts['A'] == 4
+        assert counts['B'] == 1
+        assert 'C' not in counts
+        assert 'Z' not in counts
+
+    def test_for_level_indexes_the_game_pool(self):
+        """Test every word a game can draw is a candidate at the start."""
+        index = CandidateIndex.for_level('basic')
+        engine = GameEngine('basic', seed=11)
+
+        candidates = index.candidates(engine.word_display)
+
+        assert engine.word in candidates.words()
+
+
+class TestHangmanSolver:
+    @pytest.fixture
+    def solver(self):
+        return HangmanSolver(CandidateIndex(WORDS))
+
+    def test_guesses_most_common_letter(self, solver):
+        """Test the frequency strategy picks the letter most words contain."""
+        candidates = solver.candidates('____')
+
+        assert solver.next_guess(candidates, []) == 'A'
+        assert solver.next_guess(candidates, ['A']) == 'R'
+
+    def test_never_repeats_a_guess(self, solver):
+        """Test letters already guessed are never suggested again."""
+        candidates = solver.candidates('C_R_', 'A')
+
+        assert solver.next_guess(candidates, ['A', 'C', 'R']) == 'O'
+
+    def test_falls_back_to_english_order(self, solver):
+        """Test a display no word fits still gets a sensible guess."""
+        candidates = solver.candidates('_' * 30)
+
+        assert solver.next_guess(candidates, ['E']) == 'T'
+
+    def test_entropy_prefers_splitting_letter(self):
+        """Test the entropy strategy favours a letter that splits candidates."""
+        words = ['BATS', 'CATS', 'HATS', 'MATS', 'BAND']
+        frequency = HangmanSolver(CandidateIndex(words))
+        entropy = HangmanSolver(CandidateIndex(words), strategy='entropy')
+        candidates = frequency.candidates('_A__')
+
+        # T and S are in four words each but tell nothing apart from BAND
+        assert frequency.next_guess(candidates, ['A']) == 'T'
+        assert entropy.next_guess(candidates, ['A']) in 'BCHM'
+
+    def test_invalid_strategy(self):
+        """Test unknown strategies are rejected."""
+        with pytest.raises(ValueError, match='Invalid strategy'):
+            HangmanSolver(CandidateIndex(WORDS), strategy='random')
+
+
+class TestSimulation:
+    @pytest.mark.parametrize('level', ['basic', 'intermediate'])
+    def test_play_game_solves_dictionary_words(self, level):
+        """Test the solver completes words drawn from the game's dictionary."""
+        solver = HangmanSolver.for_level(level)
+
+        result = play_game(solver, level, seed=5, max_words=10)
+
+        assert result.score == 10
+        assert not result.lost
+        assert result.guesses >= 10
+
+    def test_play_game_is_reproducible(self):
+        """Test the same seed plays the same game."""
+        solver = HangmanSolver.for_level('basic')
+
+        assert play_game(solver, 'basic', seed=3) == play_game(solver, 'basic', seed=3)
+
+    def test_simulate_totals(self):
+        """Test simulation totals add up across games."""
+        stats = simulate('basic', games=6, processes=1, max_words=3)
+
+        assert stats.games == 6
+        assert stats.words == stats.words_won + stats.words_lost
+        assert stats.words_won == 18
+        assert 0 < stats.win_rate <= 1
+        assert stats.guesses_per_word > 1
+
+    def test_simulate_is_independent_of_process_count(self):
+        """Test a process pool plays the same games as a single process."""
+        single = simulate('basic', games=8, processes=1, seed=100, max_words=2)
+        pooled = simulate('basic', games=8, processes=2, seed=100, max_words=2)
+
+        assert single._replace(duration=0) == pooled._replace(duration=0)
+
+    def test_guess_command(self, capsys):
+        """Test the guess command prints the candidates and next letter."""
+        main(['guess', 'intermediate', '_____ _ ___'])
+
+        output = capsys.readouterr().out
+        assert 'BREAK A LEG' in output
+        assert 'Next guess:' in output
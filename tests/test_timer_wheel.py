@@ -0,0 +1,76 @@
+"""
+Tests for Timer Wheel
+
+Tests hierarchical deadline scheduling and expiry.
+"""
+
+import random
+
+import pytest
+from src.core.timer_wheel import TimerWheel
+
+
+class TestTimerWheel:
+    def test_expires_at_deadline(self):
+        """Test a key expires on the first advance past its deadline."""
+        wheel = TimerWheel(tick=1.0)
+        wheel.schedule('game', 15)
+
+        assert wheel.advance(14.9) == []
+        assert wheel.advance(15) == ['game']
+        assert len(wheel) == 0
+
+    def test_deadline_is_rounded_up_to_a_tick(self):
+        """Test nothing expires before its deadline."""
+        wheel = TimerWheel(tick=1.0)
+        wheel.schedule('game', 2.5)
+
+        assert wheel.advance(2.9) == []
+        assert wheel.advance(3) == ['game']
+
+    def test_past_deadline_fires_on_next_tick(self):
+        """Test a deadline already behind the wheel is not lost."""
+        wheel = TimerWheel(tick=1.0, now=100)
+        wheel.schedule('game', 50)
+
+        assert wheel.advance(101) == ['game']
+
+    def test_reschedule_and_cancel(self):
+        """Test rescheduling replaces the deadline and cancel removes it."""
+        wheel = TimerWheel(tick=1.0)
+        wheel.schedule('a', 5)
+        wheel.schedule('b', 5)
+        wheel.schedule('a', 10)
+        wheel.cancel('b')
+
+        assert wheel.advance(9) == []
+        assert 'a' in wheel
+        assert wheel.advance(10) == ['a']
+
+    def test_long_deadlines_cascade(self):
+        """Test deadlines on higher levels and beyond the range expire exactly."""
+        wheel = TimerWheel(tick=1.0, slot_bits=2, levels=2)
+        deadlines = {key: random.Random(key).randint(1, 200) for key in range(100)}
+        for key, deadline in deadlines.items():
+            wheel.schedule(key, deadline)
+
+        fired = {}
+        for now in range(1, 201):
+            for key in wheel.advance(now):
+                fired[key] = now
+
+        assert fired == deadlines
+
+    def test_idle_wheel_skips_ahead(self):
+        """Test advancing an empty wheel far ahead keeps later deadlines right."""
+        wheel = TimerWheel(tick=1.0)
+        wheel.advance(1_000_000)
+        wheel.schedule('game', 1_000_015)
+
+        assert wheel.advance(1_000_014) == []
+        assert wheel.advance(1_000_015) == ['game']
+
+    def test_invalid_tick(self):
+        """Test a non-positive tick is rejected."""
+        with pytest.raises(ValueError):
+            TimerWheel(tick=0)
@@ -4,8 +4,13 @@ Tests for Word Manager
 Tests for loading and managing word dictionaries.
 """
 
+import random
+import sys
+
 import pytest
-from src.core.word_manager import WordManager
+from src.core import word_manager
+from src.core.word_manager import MAX_CACHED_POOLS, WordIndex, WordManager
+from src.utils.letter_mask import letters_to_mask
 
 
 class TestWordManager:
@@ -53,3 +58,110 @@ class TestWordManager:
         with pytest.raises(ValueError) as exc_info:
             word_manager.get_random_word('invalid')
         assert "Invalid level" in str(exc_info.value)
+
+    def test_random_word_respects_level_limits(self):
+        """Test selected words obey the level's declared limits."""
+        word_manager = WordManager()
+        for _ in range(50):
+            word = word_manager.get_random_word('basic')
+            assert 4 <= len(word) <= 15
+            phrase = word_manager.get_random_word('intermediate')
+            assert 2 <= len(phrase.split()) <= 4
+
+
+class TestWordIndex:
+    def test_entries_are_uppercased_in_file_order(self):
+        """Test the index keeps uppercased entries in order."""
+        index = WordIndex(['cat', 'Break a leg'])
+        assert index.words == ['CAT', 'BREAK A LEG']
+        assert index.position_of('break a leg') == 1
+        assert index.position_of('dog') is None
+
+    def test_bucket_sizes(self):
+        """Test entries are bucketed by length, words and distinct letters."""
+        index = WordIndex(['cat', 'dog', 'goose', 'a b'])
+        assert index.bucket_sizes('length') == {3: 3, 5: 1}
+        assert index.bucket_sizes('words') == {1: 3, 2: 1}
+        assert index.bucket_sizes('letters') == {2: 1, 3: 2, 4: 1}
+
+    def test_pool_filters_by_constraints(self):
+        """Test pools only contain entries matching every constraint."""
+        index = WordIndex(['cat', 'goose', 'banana', 'piece of cake'])
+
+        assert list(index.pool(min_length=5, max_words=1)) == [1, 2]
+        assert list(index.pool(max_distinct_letters=3)) == [0, 2]
+        assert list(index.pool(excluded_letters=letters_to_mask('A'))) == [1]
+        assert list(index.pool(required_letters=letters_to_mask('CE'))) == [3]
+
+    def test_pool_is_cached(self):
+        """Test the same constraints return the same pool object."""
+        index = WordIndex(['cat', 'goose'])
+        assert index.pool(min_length=4) is index.pool(min_length=4)
+
+    def test_pool_from_buckets_matches_full_scan(self):
+        """Test pools built from buckets hold every matching entry in order."""
+        rng = random.Random(7)
+        words = [
+            ' '.join(
+                ''.join(rng.choice('ABCDEFGHIJ') for _ in range(rng.randint(2, 8)))
+                for _ in range(rng.randint(1, 3))
+            )
+            for _ in range(500)
+        ]
+        index = WordIndex(words)
+        constraints = {
+            'min_length': 4,
+            'max_length': 12,
+            'max_words': 2,
+            'min_distinct_letters': 3,
+            'excluded_letters': letters_to_mask('J'),
+        }
+
+        expected = [
+            position
+            for position, word in enumerate(index.words)
+            if 4 <= len(word) <= 12
+            and len(word.split()) <= 2
+            and len(set(word.replace(' ', ''))) >= 3
+            and 'J' not in word
+        ]
+        assert list(index.pool(**constraints)) == expected
+
+    def test_pool_cache_is_bounded(self):
+        """Test only the most recently used pools are kept."""
+        index = WordIndex(['cat', 'goose'])
+        kept = index.pool(min_length=0)
+        dropped = index.pool(min_length=1)
+        for length in range(2, MAX_CACHED_POOLS + 10):
+            index.pool(min_length=length)
+            index.pool(min_length=0)
+
+        assert len(index._pools) == MAX_CACHED_POOLS
+        assert index.pool(min_length=0) is kept
+        assert index.pool(min_length=1) is not dropped
+
+    def test_unknown_constraint_raises(self):
+        """Test unsupported constraints are rejected."""
+        index = WordIndex(['cat'])
+        with pytest.raises(ValueError):
+            index.pool(max_vowels=2)
+
+    def test_random_word_with_no_matches_raises(self):
+        """Test selecting from an empty pool raises ValueError."""
+        index = WordIndex(['cat'])
+        with pytest.raises(ValueError):
+            index.random_word(min_length=10)
+
+
+class TestPeakRss:
+    def test_without_resource_module(self, monkeypatch):
+        """Test the peak is reported as 0 where resource is unavailable."""
+        monkeypatch.setitem(sys.modules, 'resource', None)
+        assert word_manager._peak_rss_kb() == 0
+
+    def test_macos_reports_bytes(self, monkeypatch):
+        """Test the peak is converted from bytes to KiB on macOS."""
+        resource = pytest.importorskip('resource')
+        monkeypatch.setattr(word_manager.sys, 'platform', 'darwin')
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        assert word_manager._peak_rss_kb() == peak // 1024
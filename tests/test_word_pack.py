@@ -0,0 +1,85 @@
+"""
+Tests for Word Pack
+
+Tests compiling dictionaries into the binary pack and loading from it.
+"""
+
+import os
+
+import pytest
+from src.core.word_manager import WordManager, main
+from src.core.word_pack import PackedWordList, read_pack
+
+
+@pytest.fixture
+def dictionary_dir(tmp_path):
+    (tmp_path / 'basic_words.txt').write_text('python\ncoding\nPython\n')
+    (tmp_path / 'intermediate_phrases.txt').write_text('break a leg\n')
+    return tmp_path
+
+
+class TestWordPack:
+    def test_build_uppercases_in_file_order(self, dictionary_dir):
+        """Test packed entries are the uppercased lines of the file."""
+        path = WordManager(dictionary_dir=str(dictionary_dir)).build_pack()
+        levels = read_pack(path)
+
+        assert list(levels['basic'].words) == ['PYTHON', 'CODING', 'PYTHON']
+        assert list(levels['intermediate'].words) == ['BREAK A LEG']
+
+    def test_manager_loads_from_pack(self, dictionary_dir):
+        """Test levels are served from the pack when it is current."""
+        WordManager(dictionary_dir=str(dictionary_dir)).build_pack()
+        manager = WordManager(dictionary_dir=str(dictionary_dir))
+
+        index = manager.get_index('basic')
+        assert isinstance(index.words, PackedWordList)
+        assert manager.get_random_word('basic') in ('PYTHON', 'CODING')
+        assert manager.get_word_index('basic', 'coding') == 1
+        assert manager.get_basic_words() == ['PYTHON', 'CODING', 'PYTHON']
+
+    def test_pack_and_text_agree(self, dictionary_dir):
+        """Test a level has the same checksum and positions either way."""
+        text = WordManager(dictionary_dir=str(dictionary_dir), use_pack=False)
+        WordManager(dictionary_dir=str(dictionary_dir)).build_pack()
+        packed = WordManager(dictionary_dir=str(dictionary_dir))
+        assert isinstance(packed.get_index('basic').words, PackedWordList)
+
+        for level in ('basic', 'intermediate'):
+            assert packed.get_index(level).checksum == text.get_index(level).checksum
+            assert list(packed.get_index(level).words) == list(
+                text.get_index(level).words
+            )
+        position, checksum = text.locate_word('basic', 'CODING')
+        assert packed.get_word_at('basic', position, checksum) == 'CODING'
+
+    def test_stale_pack_falls_back_to_text(self, dictionary_dir):
+        """Test edits to a text file after the build bypass the pack."""
+        WordManager(dictionary_dir=str(dictionary_dir)).build_pack()
+        path = dictionary_dir / 'basic_words.txt'
+        path.write_text('keyboard\n')
+        os.utime(path, ns=(1, 1))
+
+        manager = WordManager(dictionary_dir=str(dictionary_dir))
+        assert manager.get_random_word('basic') == 'KEYBOARD'
+
+    def test_corrupt_pack_falls_back_to_text(self, dictionary_dir):
+        """Test a pack failing its checksum is ignored."""
+        path = WordManager(dictionary_dir=str(dictionary_dir)).build_pack()
+        with open(path, 'r+b') as file:
+            file.seek(-1, os.SEEK_END)
+            file.write(b'!')
+
+        with pytest.raises(ValueError):
+            read_pack(path)
+        manager = WordManager(dictionary_dir=str(dictionary_dir))
+        assert manager.get_basic_words() == ['python', 'coding', 'Python']
+
+    def test_build_command(self, dictionary_dir, capsys):
+        """Test the build CLI writes the pack."""
+        output = dictionary_dir / 'out.pack'
+        main(['build', '--dictionary-dir', str(dictionary_dir),
+              '--output', str(output)])
+
+        assert output.exists()
+        assert 'basic: 3 entries' in capsys.readouterr().out
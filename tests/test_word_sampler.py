@@ -0,0 +1,84 @@
+"""
+Tests for Word Sampler
+
+Tests non-repeating shuffle-bag sampling of dictionary positions.
+"""
+
+import pytest
+from src.core.game_engine import GameEngine
+from src.core.word_sampler import ShuffleBag
+
+
+class TestShuffleBag:
+    @pytest.mark.parametrize('size', [1, 2, 7, 100, 1000])
+    def test_no_repeats_until_pool_exhausted(self, size):
+        """Test every position is drawn exactly once per pass."""
+        bag = ShuffleBag(size, seed=42)
+        first_pass = [bag.next_index() for _ in range(size)]
+        second_pass = [bag.next_index() for _ in range(size)]
+
+        assert sorted(first_pass) == list(range(size))
+        assert sorted(second_pass) == list(range(size))
+
+    def test_reproducible_from_seed(self):
+        """Test the same seed yields the same sequence."""
+        first = ShuffleBag(500, seed=7)
+        second = ShuffleBag(500, seed=7)
+        assert [first.next_index() for _ in range(50)] == [
+            second.next_index() for _ in range(50)
+        ]
+
+    def test_resume_from_cursor(self):
+        """Test a bag rebuilt from seed and cursor continues the sequence."""
+        bag = ShuffleBag(50, seed=3)
+        for _ in range(20):
+            bag.next_index()
+
+        resumed = ShuffleBag(50, seed=bag.seed, cursor=bag.cursor)
+        assert [resumed.next_index() for _ in range(10)] == [
+            bag.next_index() for _ in range(10)
+        ]
+
+    def test_different_seeds_give_different_orders(self):
+        """Test seeds actually shuffle the pool."""
+        first = ShuffleBag(100, seed=1)
+        second = ShuffleBag(100, seed=2)
+        assert [first.next_index() for _ in range(100)] != [
+            second.next_index() for _ in range(100)
+        ]
+
+    def test_empty_pool_raises(self):
+        """Test a bag needs at least one entry."""
+        with pytest.raises(ValueError):
+            ShuffleBag(0)
+
+
+class TestEngineWordBag:
+    def test_continuous_play_does_not_repeat_words(self):
+        """Test completed words are not drawn again within a pass."""
+        game = GameEngine(level='basic', seed=99)
+        pool_size = game.word_bag.size
+        seen = set()
+        for _ in range(pool_size):
+            assert game.word not in seen
+            seen.add(game.word)
+            game.guessed_letters = list(set(game.word))
+            game.process_word_completion()
+
+    def test_seed_makes_word_sequence_reproducible(self):
+        """Test two games with the same seed draw the same words."""
+        first = GameEngine(level='intermediate', seed=5)
+        second = GameEngine(level='intermediate', seed=5)
+        assert first.word == second.word
+
+    def test_word_bag_survives_serialization(self):
+        """Test the next word is the same after a bytes round trip."""
+        game = GameEngine(level='basic', seed=11)
+        restored = GameEngine.from_bytes(game.to_bytes())
+
+        game.guessed_letters = list(set(game.word))
+        restored.guessed_letters = list(set(restored.word))
+        game.process_word_completion()
+        restored.process_word_completion()
+
+        assert restored.word == game.word